@@ -56,6 +56,7 @@ config = {
         "binance": {
             "api_key": "BINANCE_API_KEY",        # value is the environment variable name
             "api_secret": "BINANCE_API_SECRET",  # value is the environment variable name
+            "snapshot_path": "instruments/",  # cache instrument snapshots for fast startup
         },
     },
 
@@ -56,6 +56,7 @@ config = {
         "oanda": {
             "api_token": "OANDA_API_TOKEN",    # value is the environment variable name
             "account_id": "OANDA_ACCOUNT_ID",  # value is the environment variable name
+            "snapshot_path": "instruments/",  # cache instrument snapshots for fast startup
         },
     },
 
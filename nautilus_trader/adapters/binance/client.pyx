@@ -22,6 +22,8 @@ from nautilus_trader.adapters.binance.feedhandler import FeedHandler
 from nautilus_trader.common.clock cimport LiveClock
 from nautilus_trader.common.logging cimport LiveLogger
 from nautilus_trader.live.data cimport LiveDataEngine
+from nautilus_trader.live.snapshot cimport InstrumentSnapshotCache
+from nautilus_trader.model.identifiers cimport Venue
 
 
 cdef class BinanceDataClientFactory:
@@ -65,10 +67,20 @@ cdef class BinanceDataClientFactory:
 
         client_feed = FeedHandler()
 
+        # Cache instrument snapshots if configured
+        snapshot_cache = None
+        if config.get("snapshot_path") is not None:
+            snapshot_cache = InstrumentSnapshotCache(
+                path=config["snapshot_path"],
+                venue=Venue("BINANCE"),
+                logger=logger,
+            )
+
         return BinanceDataClient(
             client_rest=client_rest,
             client_feed=client_feed,
             engine=data_engine,
             clock=clock,
             logger=logger,
+            snapshot_cache=snapshot_cache,
         )
@@ -20,6 +20,7 @@ from cpython.datetime cimport datetime
 from nautilus_trader.adapters.binance.providers cimport BinanceInstrumentProvider
 from nautilus_trader.core.uuid cimport UUID
 from nautilus_trader.live.data cimport LiveDataClient
+from nautilus_trader.live.snapshot cimport InstrumentSnapshotCache
 from nautilus_trader.model.bar cimport Bar
 from nautilus_trader.model.bar cimport BarType
 from nautilus_trader.model.identifiers cimport Symbol
@@ -33,7 +34,7 @@ cdef class BinanceDataClient(LiveDataClient):
     cdef object _client_feed
     cdef object _feed_loop
     cdef BinanceInstrumentProvider _instrument_provider
-    cdef bint _is_connected
+    cdef InstrumentSnapshotCache _snapshot_cache
     cdef bint _is_feed_running
 
     cdef set _subscribed_instruments
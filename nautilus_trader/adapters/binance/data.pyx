@@ -35,6 +35,7 @@ from nautilus_trader.core.datetime cimport to_posix_ms
 from nautilus_trader.core.uuid cimport UUID
 from nautilus_trader.live.data cimport LiveDataClient
 from nautilus_trader.live.data cimport LiveDataEngine
+from nautilus_trader.live.snapshot cimport InstrumentSnapshotCache
 from nautilus_trader.model.c_enums.bar_aggregation cimport BarAggregation
 from nautilus_trader.model.c_enums.bar_aggregation cimport BarAggregationParser
 from nautilus_trader.model.c_enums.order_side cimport OrderSide
@@ -67,6 +68,7 @@ cdef class BinanceDataClient(LiveDataClient):
         LiveDataEngine engine not None,
         LiveClock clock not None,
         Logger logger not None,
+        InstrumentSnapshotCache snapshot_cache=None,
     ):
         """
         Initialize a new instance of the `BinanceDataClient` class.
@@ -83,6 +85,9 @@ cdef class BinanceDataClient(LiveDataClient):
             The clock for the client.
         logger : Logger
             The logger for the client.
+        snapshot_cache : InstrumentSnapshotCache, optional
+            The cache for instrument snapshots, if given then instruments are
+            served from the snapshot while being refreshed from the venue.
 
         Raises
         ------
@@ -98,19 +103,21 @@ cdef class BinanceDataClient(LiveDataClient):
             logger,
             config={
                 "unavailable_methods": [
+                    self.subscribe_order_book.__name__,
                     self.request_quote_ticks.__name__,
                 ],
             }
         )
 
-        self._is_connected = False
         self._is_feed_running = False
         self._client_rest = client_rest
         self._client_feed = client_feed
         self._feed_loop = asyncio.new_event_loop()
+        self._snapshot_cache = snapshot_cache
         self._instrument_provider = BinanceInstrumentProvider(
             client=client_rest,
             load_all=False,
+            snapshot_cache=self._snapshot_cache,
         )
 
         # Subscriptions
@@ -148,18 +155,6 @@ cdef class BinanceDataClient(LiveDataClient):
         """
         return sorted(list(self._feeds_trade_ticks.keys()))
 
-    cpdef bint is_connected(self) except *:
-        """
-        Return a value indicating whether the client is connected.
-
-        Returns
-        -------
-        bool
-            True if connected, else False.
-
-        """
-        return self._is_connected
-
     cpdef void connect(self) except *:
         """
         Connect the client.
@@ -175,7 +170,7 @@ cdef class BinanceDataClient(LiveDataClient):
         except RuntimeError as ex:
             self._log.error(str(ex))
 
-        self._is_connected = True
+        self._set_connected(True)
         self._log.info("Connected.")
 
     cpdef void disconnect(self) except *:
@@ -212,7 +207,7 @@ cdef class BinanceDataClient(LiveDataClient):
         if stop_tasks:
             await asyncio.gather(*stop_tasks)
 
-        self._is_connected = False
+        self._set_connected(False)
         self._log.info("Disconnected.")
 
     cpdef void reset(self) except *:
@@ -223,6 +218,7 @@ cdef class BinanceDataClient(LiveDataClient):
         self._instrument_provider = BinanceInstrumentProvider(
             client=self._client_rest,
             load_all=False,
+            snapshot_cache=self._snapshot_cache,
         )
 
         self._subscribed_instruments = set()
@@ -313,6 +309,20 @@ cdef class BinanceDataClient(LiveDataClient):
 
         # TODO: Implement
 
+    cpdef void subscribe_order_book(self, Symbol symbol) except *:
+        """
+        Subscribe to `OrderBookDelta` data for the given symbol.
+
+        Parameters
+        ----------
+        symbol : Symbol
+            The order book symbol to subscribe to.
+
+        """
+        Condition.not_none(symbol, "symbol")
+
+        self._log.error(f"`subscribe_order_book` was called when not supported by the brokerage.")
+
     cpdef void unsubscribe_instrument(self, Symbol symbol) except *:
         """
         Unsubscribe from `Instrument` data for the given symbol.
@@ -378,6 +388,20 @@ cdef class BinanceDataClient(LiveDataClient):
 
         # TODO: Implement
 
+    cpdef void unsubscribe_order_book(self, Symbol symbol) except *:
+        """
+        Unsubscribe from `OrderBookDelta` data for the given symbol.
+
+        Parameters
+        ----------
+        symbol : Symbol
+            The order book symbol to unsubscribe from.
+
+        """
+        Condition.not_none(symbol, "symbol")
+
+        self._log.error(f"`unsubscribe_order_book` was called when not supported by the brokerage.")
+
 # -- REQUESTS --------------------------------------------------------------------------------------
 
     cpdef void request_instrument(self, Symbol symbol, UUID correlation_id) except *:
@@ -549,12 +573,25 @@ cdef class BinanceDataClient(LiveDataClient):
             self._log.error(f"Could not find instrument {symbol.code}.")
 
     cpdef void _request_instruments(self, UUID correlation_id) except *:
+        cdef dict snapshot
+        if self._instrument_provider.load_snapshot():
+            # Respond from the snapshot, then reconcile with the venue
+            snapshot = self._instrument_provider.get_all()
+            self._loop.call_soon_threadsafe(self._handle_instruments_py, list(snapshot.values()), correlation_id)
+
+            self._log.info(f"Loaded {len(snapshot)} instruments from snapshot.")
+            self._set_initialized()
+
+            self._instrument_provider.load_all()
+            self._reconcile_instruments(snapshot, self._instrument_provider.get_all())
+            return
+
         self._instrument_provider.load_all()
         cdef list instruments = list(self._instrument_provider.get_all().values())
         self._loop.call_soon_threadsafe(self._handle_instruments_py, instruments, correlation_id)
 
         self._log.info(f"Updated {len(instruments)} instruments.")
-        self.initialized = True
+        self._set_initialized()
 
     cpdef void _subscribed_instruments_update(self) except *:
         self._loop.run_in_executor(None, self._subscribed_instruments_load_and_send)
@@ -724,6 +761,7 @@ cdef class BinanceDataClient(LiveDataClient):
         price: Decimal,
         double receipt_timestamp,
     ) except *:
+        cdef long long recv_ns = self._recv_stamp()
         cdef Symbol symbol = Symbol(pair.replace('-', '/', 1), self.venue)
         cdef Instrument instrument = self._instrument_provider.get(symbol)
         cdef TradeTick tick = TradeTick(
@@ -734,6 +772,7 @@ cdef class BinanceDataClient(LiveDataClient):
             TradeMatchId(str(order_id)),
             from_posix_ms(<long>(timestamp * 1000))
         )
+        tick.recv_ns = recv_ns
 
         self._handle_trade_tick_py(tick)
 
@@ -17,8 +17,11 @@ from datetime import datetime
 from decimal import Decimal
 
 import ccxt
+import pytz
 
 from nautilus_trader.core.correctness cimport Condition
+from nautilus_trader.live.providers cimport LiveInstrumentProvider
+from nautilus_trader.live.snapshot cimport InstrumentSnapshotCache
 from nautilus_trader.model.c_enums.asset_class cimport AssetClass
 from nautilus_trader.model.c_enums.asset_type cimport AssetTypeParser
 from nautilus_trader.model.c_enums.currency_type cimport CurrencyType
@@ -31,12 +34,12 @@ from nautilus_trader.model.objects cimport Price
 from nautilus_trader.model.objects cimport Quantity
 
 
-cdef class BinanceInstrumentProvider:
+cdef class BinanceInstrumentProvider(LiveInstrumentProvider):
     """
     Provides a means of loading Binance `Instrument` objects.
     """
 
-    def __init__(self, client not None: ccxt.binance, bint load_all=False):
+    def __init__(self, client not None: ccxt.binance, bint load_all=False, InstrumentSnapshotCache snapshot_cache=None):
         """
         Initialize a new instance of the `BinanceInstrumentProvider` class.
 
@@ -46,6 +49,9 @@ cdef class BinanceInstrumentProvider:
             The client for the provider.
         load_all : bool, optional
             If all instruments should be loaded at instantiation.
+        snapshot_cache : InstrumentSnapshotCache, optional
+            The cache to load instrument snapshots from, and to save a
+            snapshot to whenever all instruments are loaded.
 
         Raises
         ------
@@ -55,9 +61,8 @@ cdef class BinanceInstrumentProvider:
         """
         Condition.true(client.name == "Binance", "client.name == `Binance`")
 
-        self.venue = Venue("BINANCE")
-        self.count = 0
-        self._instruments = {}  # type: dict[Symbol: Instrument]
+        super().__init__(venue=Venue("BINANCE"), snapshot_cache=snapshot_cache)
+
         self._client = client
 
         if load_all:
@@ -77,34 +82,11 @@ cdef class BinanceInstrumentProvider:
         self._client.load_markets(reload=True)
         self._load_instruments()
 
-    cpdef dict get_all(self):
-        """
-        Return all loaded instruments.
-
-        If no instruments loaded, will return an empty dict.
-
-        Returns
-        -------
-        dict[Symbol, Instrument]
-
-        """
-        return self._instruments.copy()
-
-    cpdef Instrument get(self, Symbol symbol):
-        """
-        Return the instrument for the given symbol (if found).
-
-        Returns
-        -------
-        Instrument or None
-
-        """
-        return self._instruments.get(symbol)
-
     cdef void _load_instruments(self) except *:
         if self._client.markets is None:
             return  # No markets
 
+        cdef dict loaded = {}  # type: dict[Symbol: Instrument]
         cdef str k
         cdef dict v
         cdef Symbol symbol
@@ -113,9 +95,9 @@ cdef class BinanceInstrumentProvider:
             symbol = Symbol(k, self.venue)
             instrument = self._parse_instrument(symbol, v)
 
-            self._instruments[symbol] = instrument
+            loaded[symbol] = instrument
 
-        self.count = len(self._instruments)
+        self._set_instruments(loaded)
 
     cdef Instrument _parse_instrument(self, Symbol symbol, dict values):
         # Precisions
@@ -192,6 +174,6 @@ cdef class BinanceInstrumentProvider:
             maker_fee=maker_fee,
             taker_fee=taker_fee,
             financing={},
-            timestamp=datetime.utcnow(),
+            timestamp=datetime.now(tz=pytz.utc),
             info=values,
         )
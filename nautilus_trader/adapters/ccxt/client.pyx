@@ -20,6 +20,8 @@ from nautilus_trader.adapters.ccxt.data cimport CCXTDataClient
 from nautilus_trader.common.clock cimport LiveClock
 from nautilus_trader.common.logging cimport LiveLogger
 from nautilus_trader.live.data cimport LiveDataEngine
+from nautilus_trader.live.snapshot cimport InstrumentSnapshotCache
+from nautilus_trader.model.identifiers cimport Venue
 
 try:
     import ccxtpro
@@ -75,9 +77,19 @@ cdef class CCXTDataClientFactory:
             "asyncio_loop": data_engine.get_event_loop(),
         })
 
+        # Cache instrument snapshots if configured
+        snapshot_cache = None
+        if config.get("snapshot_path") is not None:
+            snapshot_cache = InstrumentSnapshotCache(
+                path=config["snapshot_path"],
+                venue=Venue(client.name.upper()),
+                logger=logger,
+            )
+
         return CCXTDataClient(
             client=client,
             engine=data_engine,
             clock=clock,
             logger=logger,
+            snapshot_cache=snapshot_cache,
         )
@@ -16,6 +16,7 @@
 
 from nautilus_trader.adapters.ccxt.providers cimport CCXTInstrumentProvider
 from nautilus_trader.live.data cimport LiveDataClient
+from nautilus_trader.live.snapshot cimport InstrumentSnapshotCache
 from nautilus_trader.model.bar cimport Bar
 from nautilus_trader.model.bar cimport BarSpecification
 from nautilus_trader.model.bar cimport BarType
@@ -26,14 +27,30 @@ from nautilus_trader.model.tick cimport TradeTick
 cdef class CCXTDataClient(LiveDataClient):
     cdef object _client
     cdef CCXTInstrumentProvider _instrument_provider
-    cdef bint _is_connected
+    cdef InstrumentSnapshotCache _snapshot_cache
     cdef object _update_instruments_task
 
     cdef set _subscribed_instruments
-    cdef dict _subscribed_quote_ticks
-    cdef dict _subscribed_trade_ticks
+    cdef set _subscribed_quote_ticks
+    cdef set _subscribed_trade_ticks
     cdef dict _subscribed_bars
 
+    cdef object _watch_quotes_task
+    cdef object _watch_trades_task
+    cdef object _watch_bars_task
+    cdef object _subscriptions_changed
+    cdef dict _watch_symbols
+    cdef dict _last_quotes
+    cdef dict _last_bar_timestamps
+
+    cdef void _on_subscriptions_changed(self) except *
+    cpdef set _quote_watch_keys(self)
+    cpdef set _trade_watch_keys(self)
+    cpdef set _bar_watch_keys(self)
+    cpdef void _on_order_book(self, key, order_book, list batch, long long recv_ns) except *
+    cpdef void _on_trades(self, key, trades, list batch, long long recv_ns) except *
+    cpdef void _on_ohlcv(self, BarType bar_type, bars, list batch, long long recv_ns) except *
+
     cdef inline void _on_quote_tick(
         self,
         Symbol symbol,
@@ -44,6 +61,8 @@ cdef class CCXTDataClient(LiveDataClient):
         long timestamp,
         int price_precision,
         int size_precision,
+        long long recv_ns,
+        list batch,
     ) except *
 
     cdef inline void _on_trade_tick(
@@ -57,6 +76,8 @@ cdef class CCXTDataClient(LiveDataClient):
         long timestamp,
         int price_precision,
         int size_precision,
+        long long recv_ns,
+        list batch,
     ) except *
 
     cdef inline void _on_bar(
@@ -70,6 +91,7 @@ cdef class CCXTDataClient(LiveDataClient):
         long timestamp,
         int price_precision,
         int size_precision,
+        list batch,
     ) except *
 
     cdef inline TradeTick _parse_trade_tick(
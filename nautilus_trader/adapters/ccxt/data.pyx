@@ -27,12 +27,14 @@ from nautilus_trader.core.datetime cimport to_posix_ms
 from nautilus_trader.core.uuid cimport UUID
 from nautilus_trader.live.data cimport LiveDataClient
 from nautilus_trader.live.data cimport LiveDataEngine
+from nautilus_trader.live.snapshot cimport InstrumentSnapshotCache
 from nautilus_trader.model.c_enums.bar_aggregation cimport BarAggregation
 from nautilus_trader.model.c_enums.bar_aggregation cimport BarAggregationParser
 from nautilus_trader.model.c_enums.order_side cimport OrderSide
 from nautilus_trader.model.c_enums.price_type cimport PriceType
 from nautilus_trader.model.c_enums.price_type cimport PriceTypeParser
 from nautilus_trader.model.bar cimport Bar
+from nautilus_trader.model.bar cimport BarData
 from nautilus_trader.model.bar cimport BarSpecification
 from nautilus_trader.model.bar cimport BarType
 from nautilus_trader.model.identifiers cimport Symbol
@@ -45,6 +47,7 @@ from nautilus_trader.model.tick cimport QuoteTick
 from nautilus_trader.model.tick cimport TradeTick
 
 cdef int _SECONDS_IN_HOUR = 60 * 60
+cdef double _WATCH_RETRY_DELAY = 1.0  # Seconds before re-arming a failed watch
 
 
 cdef class CCXTDataClient(LiveDataClient):
@@ -58,6 +61,7 @@ cdef class CCXTDataClient(LiveDataClient):
         LiveDataEngine engine not None,
         LiveClock clock not None,
         Logger logger not None,
+        InstrumentSnapshotCache snapshot_cache=None,
     ):
         """
         Initialize a new instance of the `CCXTDataClient` class.
@@ -72,6 +76,9 @@ cdef class CCXTDataClient(LiveDataClient):
             The clock for the client.
         logger : Logger
             The logger for the client.
+        snapshot_cache : InstrumentSnapshotCache, optional
+            The cache for instrument snapshots, if given then instruments are
+            served from the snapshot while being refreshed from the venue.
 
         Raises
         ------
@@ -87,23 +94,34 @@ cdef class CCXTDataClient(LiveDataClient):
             config={
                 "name": f"CCXTDataClient-{client.name.upper()}",
                 "unavailable_methods": [
+                    self.subscribe_order_book.__name__,
                     self.request_quote_ticks.__name__,
                 ],
             }
         )
 
-        self._is_connected = False
         self._client = client
+        self._snapshot_cache = snapshot_cache
         self._instrument_provider = CCXTInstrumentProvider(
             client=client,
             load_all=False,
+            snapshot_cache=self._snapshot_cache,
         )
 
         # Subscriptions
         self._subscribed_instruments = set()   # type: set[Symbol]
-        self._subscribed_quote_ticks = {}      # type: dict[Symbol, asyncio.Task]
-        self._subscribed_trade_ticks = {}      # type: dict[Symbol, asyncio.Task]
-        self._subscribed_bars = {}             # type: dict[BarType, asyncio.Task]
+        self._subscribed_quote_ticks = set()   # type: set[Symbol]
+        self._subscribed_trade_ticks = set()   # type: set[Symbol]
+        self._subscribed_bars = {}             # type: dict[BarType, str]
+
+        # Watchers (one task per data type multiplexes all its subscriptions)
+        self._watch_quotes_task = None         # type: asyncio.Task
+        self._watch_trades_task = None         # type: asyncio.Task
+        self._watch_bars_task = None           # type: asyncio.Task
+        self._subscriptions_changed = self._loop.create_future()
+        self._watch_symbols = {}               # type: dict[str, Symbol]
+        self._last_quotes = {}                 # type: dict[str, tuple]
+        self._last_bar_timestamps = {}         # type: dict[BarType, int]
 
         # Schedule subscribed instruments update
         delay = _SECONDS_IN_HOUR
@@ -141,7 +159,7 @@ cdef class CCXTDataClient(LiveDataClient):
         list[Symbol]
 
         """
-        return sorted(list(self._subscribed_quote_ticks.keys()))
+        return sorted(list(self._subscribed_quote_ticks))
 
     @property
     def subscribed_trade_ticks(self):
@@ -153,7 +171,7 @@ cdef class CCXTDataClient(LiveDataClient):
         list[Symbol]
 
         """
-        return sorted(list(self._subscribed_trade_ticks.keys()))
+        return sorted(list(self._subscribed_trade_ticks))
 
     @property
     def subscribed_bars(self):
@@ -167,25 +185,13 @@ cdef class CCXTDataClient(LiveDataClient):
         """
         return sorted(list(self._subscribed_bars.keys()))
 
-    cpdef bint is_connected(self) except *:
-        """
-        Return a value indicating whether the client is connected.
-
-        Returns
-        -------
-        bool
-            True if connected, else False.
-
-        """
-        return self._is_connected
-
     cpdef void connect(self) except *:
         """
         Connect the client.
         """
         self._log.info("Connecting...")
 
-        self._is_connected = True
+        self._set_connected(True)
 
         self._log.info("Connected.")
 
@@ -203,8 +209,8 @@ cdef class CCXTDataClient(LiveDataClient):
             self._update_instruments_task.cancel()
 
         # Cancel residual tasks
-        for task in self._subscribed_trade_ticks.values():
-            if not task.cancelled():
+        for task in (self._watch_quotes_task, self._watch_trades_task, self._watch_bars_task):
+            if task is not None and not task.done():
                 self._log.debug(f"Cancelling {task}...")
                 task.cancel()
 
@@ -212,7 +218,7 @@ cdef class CCXTDataClient(LiveDataClient):
         self._log.info("Closing exchange...")
         await self._client.close()
 
-        self._is_connected = False
+        self._set_connected(False)
 
         self._log.info("Disconnected.")
 
@@ -230,15 +236,20 @@ cdef class CCXTDataClient(LiveDataClient):
         self._instrument_provider = CCXTInstrumentProvider(
             client=self._client,
             load_all=False,
+            snapshot_cache=self._snapshot_cache,
         )
 
         self._subscribed_instruments = set()
 
-        # Check all tasks have been popped and cancelled
+        # Check all subscriptions have been removed
         assert len(self._subscribed_quote_ticks) == 0
         assert len(self._subscribed_trade_ticks) == 0
         assert len(self._subscribed_bars) == 0
 
+        self._watch_symbols = {}
+        self._last_quotes = {}
+        self._last_bar_timestamps = {}
+
         # Schedule subscribed instruments update
         delay = _SECONDS_IN_HOUR
         update = self._run_after_delay(delay, self._subscribed_instruments_update(delay))
@@ -295,11 +306,15 @@ cdef class CCXTDataClient(LiveDataClient):
 
         if symbol in self._subscribed_quote_ticks:
             # TODO: Only call if not already subscribed
-            self._log.debug(f"Already subscribed {symbol.code} <TradeTick> data.")
+            self._log.debug(f"Already subscribed {symbol.code} <QuoteTick> data.")
             return
 
-        task = self._loop.create_task(self._watch_quotes(symbol))
-        self._subscribed_quote_ticks[symbol] = task
+        self._subscribed_quote_ticks.add(symbol)
+        self._watch_symbols[symbol.code] = symbol
+        if self._watch_quotes_task is None or self._watch_quotes_task.done():
+            self._watch_quotes_task = self._loop.create_task(self._watch_quotes())
+        else:
+            self._on_subscriptions_changed()
 
         self._log.info(f"Subscribed to {symbol.code} <QuoteTick> data.")
 
@@ -325,8 +340,12 @@ cdef class CCXTDataClient(LiveDataClient):
             self._log.debug(f"Already subscribed {symbol.code} <TradeTick> data.")
             return
 
-        task = self._loop.create_task(self._watch_trades(symbol))
-        self._subscribed_trade_ticks[symbol] = task
+        self._subscribed_trade_ticks.add(symbol)
+        self._watch_symbols[symbol.code] = symbol
+        if self._watch_trades_task is None or self._watch_trades_task.done():
+            self._watch_trades_task = self._loop.create_task(self._watch_trades())
+        else:
+            self._on_subscriptions_changed()
 
         self._log.info(f"Subscribed to {symbol.code} <TradeTick> data.")
 
@@ -358,11 +377,33 @@ cdef class CCXTDataClient(LiveDataClient):
             self._log.debug(f"Already subscribed {bar_type} <Bar> data.")
             return
 
-        task = self._loop.create_task(self._watch_ohlcv(bar_type))
-        self._subscribed_bars[bar_type] = task
+        cdef str timeframe = self._make_timeframe(bar_type.spec)
+        self._subscribed_bars[bar_type] = timeframe
+        if timeframe is None:
+            self._log.warning(f"Subscribing to bars with BarAggregation."
+                              f"{BarAggregationParser.to_str(bar_type.spec.aggregation)} "
+                              f"not currently supported in this version.")
+        elif self._watch_bars_task is None or self._watch_bars_task.done():
+            self._watch_bars_task = self._loop.create_task(self._watch_bars())
+        else:
+            self._on_subscriptions_changed()
 
         self._log.info(f"Subscribed to {bar_type} <Bar> data.")
 
+    cpdef void subscribe_order_book(self, Symbol symbol) except *:
+        """
+        Subscribe to `OrderBookDelta` data for the given symbol.
+
+        Parameters
+        ----------
+        symbol : Symbol
+            The order book symbol to subscribe to.
+
+        """
+        Condition.not_none(symbol, "symbol")
+
+        self._log.error(f"`subscribe_order_book` was called when not supported by the brokerage.")
+
     cpdef void unsubscribe_instrument(self, Symbol symbol) except *:
         """
         Unsubscribe from `Instrument` data for the given symbol.
@@ -394,9 +435,9 @@ cdef class CCXTDataClient(LiveDataClient):
             self._log.debug(f"Not subscribed to {symbol.code} <QuoteTick> data.")
             return
 
-        task = self._subscribed_quote_ticks.pop(symbol)
-        task.cancel()
-        self._log.debug(f"Cancelled {task}.")
+        self._subscribed_quote_ticks.discard(symbol)
+        self._last_quotes.pop(symbol.code, None)
+        self._on_subscriptions_changed()
         self._log.info(f"Unsubscribed from {symbol.code} <QuoteTick> data.")
 
     cpdef void unsubscribe_trade_ticks(self, Symbol symbol) except *:
@@ -416,9 +457,8 @@ cdef class CCXTDataClient(LiveDataClient):
             self._log.debug(f"Not subscribed to {symbol.code} <TradeTick> data.")
             return
 
-        task = self._subscribed_trade_ticks.pop(symbol)
-        task.cancel()
-        self._log.debug(f"Cancelled {task}.")
+        self._subscribed_trade_ticks.discard(symbol)
+        self._on_subscriptions_changed()
         self._log.info(f"Unsubscribed from {symbol.code} <TradeTick> data.")
 
     cpdef void unsubscribe_bars(self, BarType bar_type) except *:
@@ -438,11 +478,25 @@ cdef class CCXTDataClient(LiveDataClient):
             self._log.debug(f"Not subscribed to {bar_type} <Bar> data.")
             return
 
-        task = self._subscribed_bars.pop(bar_type)
-        task.cancel()
-        self._log.debug(f"Cancelled {task}.")
+        self._subscribed_bars.pop(bar_type)
+        self._last_bar_timestamps.pop(bar_type, None)
+        self._on_subscriptions_changed()
         self._log.info(f"Unsubscribed from {bar_type} <Bar> data.")
 
+    cpdef void unsubscribe_order_book(self, Symbol symbol) except *:
+        """
+        Unsubscribe from `OrderBookDelta` data for the given symbol.
+
+        Parameters
+        ----------
+        symbol : Symbol
+            The order book symbol to unsubscribe from.
+
+        """
+        Condition.not_none(symbol, "symbol")
+
+        self._log.error(f"`unsubscribe_order_book` was called when not supported by the brokerage.")
+
 # -- REQUESTS --------------------------------------------------------------------------------------
 
     cpdef void request_instrument(self, Symbol symbol, UUID correlation_id) except *:
@@ -601,54 +655,142 @@ cdef class CCXTDataClient(LiveDataClient):
 
 # -- INTERNAL --------------------------------------------------------------------------------------
 
-    async def _watch_quotes(self, Symbol symbol):
-        cdef Instrument instrument = self._instrument_provider.get(symbol)
-        if instrument is None:
-            self._log.error(f"Cannot subscribe to quote ticks (no instrument for {symbol.code}).")
-            return
-
-        # Setup precisions
-        cdef int price_precision = instrument.price_precision
-        cdef int size_precision = instrument.size_precision
-
-        cdef list best_bid
-        cdef list best_ask
-        cdef bint exiting = False  # Flag to stop loop
+    cdef void _on_subscriptions_changed(self) except *:
+        # Wakes the watchers so they resynchronize with the subscriptions
+        if not self._subscriptions_changed.done():
+            self._subscriptions_changed.set_result(True)
+
+    async def _watch(self, str name, keys, watch, on_update):
+        # Multiplexes the watch calls for the keys returned by `keys` over this
+        # single task, each wake-up handles every update received and hands the
+        # resulting data to the engine as one batch. A watch which fails is
+        # logged and re-armed for its key alone.
+        cdef dict pending = {}  # type: dict[object, asyncio.Task]
+        cdef set wanted
+        cdef list batch
+        cdef long long recv_ns
         try:
             while True:
-                try:
-                    order_book = await self._client.watch_order_book(symbol.code, limit=5)
-                except TypeError:
-                    # Temporary workaround for testing
-                    order_book = self._client.watch_order_book
-                    exiting = True
-
-                best_bid = order_book["bids"][0]
-                best_ask = order_book["asks"][0]
-                timestamp = order_book["timestamp"]
-                if timestamp is None:  # Compiled to fast C check
-                    # First quote timestamp often None
-                    timestamp = self._client.milliseconds()
-                self._on_quote_tick(
-                    symbol,
-                    best_bid[0],
-                    best_ask[0],
-                    best_bid[1],
-                    best_ask[1],
-                    timestamp,
-                    price_precision,
-                    size_precision,
+                changed = self._subscriptions_changed
+                if changed.done():
+                    changed = self._loop.create_future()
+                    self._subscriptions_changed = changed
+
+                wanted = keys()
+                for key in list(pending):
+                    if key not in wanted:
+                        pending.pop(key).cancel()
+                for key in wanted:
+                    if key not in pending:
+                        pending[key] = self._loop.create_task(watch(key))
+                if not pending:
+                    return  # No subscriptions
+
+                done, _ = await asyncio.wait(
+                    [changed] + list(pending.values()),
+                    return_when=asyncio.FIRST_COMPLETED,
                 )
-
-                if exiting:
-                    break
-        except asyncio.CancelledError as ex:
-            self._log.debug(f"Cancelled `_watch_ticker` for {symbol.code}.")
+                recv_ns = self._recv_stamp()
+
+                batch = []
+                for key, task in list(pending.items()):
+                    if task not in done:
+                        continue
+                    del pending[key]
+                    try:
+                        on_update(key, task.result(), batch, recv_ns)
+                    except Exception as ex:
+                        # Re-arm the watch for this key only, so that one
+                        # failing symbol does not stop the watch for the others
+                        self._log.error(f"Error in `{name}` for {key}, re-arming in {_WATCH_RETRY_DELAY}s: {ex!r}")
+                        pending[key] = self._loop.create_task(self._watch_after_delay(watch, key))
+                if batch:
+                    await self._handle_data_batch(batch)
+        except asyncio.CancelledError:
+            self._log.debug(f"Cancelled `{name}`.")
         except Exception as ex:
             self._log.exception(ex)
         finally:
-            # Finally close stream
-            await self._client.close()
+            for task in pending.values():
+                task.cancel()
+
+    async def _watch_after_delay(self, watch, key):
+        await asyncio.sleep(_WATCH_RETRY_DELAY)
+        return await watch(key)
+
+    async def _watch_quotes(self):
+        await self._watch(
+            "_watch_quotes",
+            self._quote_watch_keys,
+            self._watch_order_book,
+            self._on_order_book,
+        )
+
+    cpdef set _quote_watch_keys(self):
+        if not self._subscribed_quote_ticks:
+            return set()
+        if self._client.has.get("watchOrderBookForSymbols"):
+            # One combined stream, keyed by all the subscribed symbol codes
+            return {tuple(sorted([symbol.code for symbol in self._subscribed_quote_ticks]))}
+        return {symbol.code for symbol in self._subscribed_quote_ticks}
+
+    async def _watch_order_book(self, key):
+        if isinstance(key, tuple):
+            return await self._client.watch_order_book_for_symbols(list(key), limit=5)
+        return await self._client.watch_order_book(key, limit=5)
+
+    cpdef void _on_order_book(self, key, order_book, list batch, long long recv_ns) except *:
+        cdef str code = order_book["symbol"] if isinstance(key, tuple) else key
+        cdef Symbol symbol = self._watch_symbols.get(code)
+        if symbol is None or symbol not in self._subscribed_quote_ticks:
+            return  # Unsubscribed since the watch was made
+
+        bids = order_book["bids"]
+        asks = order_book["asks"]
+        if not bids or not asks:
+            return  # No top of book
+
+        cdef list best_bid = bids[0]
+        cdef list best_ask = asks[0]
+        cdef double bid = best_bid[0]
+        cdef double ask = best_ask[0]
+        cdef double bid_size = best_bid[1]
+        cdef double ask_size = best_ask[1]
+
+        # Skip creating a tick if the top of book is unchanged
+        cdef tuple last = self._last_quotes.get(code)
+        if (
+            last is not None
+            and <double>last[0] == bid
+            and <double>last[1] == ask
+            and <double>last[2] == bid_size
+            and <double>last[3] == ask_size
+        ):
+            return
+        self._last_quotes[code] = (bid, ask, bid_size, ask_size)
+
+        cdef Instrument instrument = self._instrument_provider.get(symbol)
+        if instrument is None:
+            self._log.error(f"Cannot handle quote ticks (no instrument for {symbol.code}).")
+            return
+
+        timestamp = order_book["timestamp"]
+        if timestamp is None:  # Compiled to fast C check
+            # First quote timestamp often None
+            timestamp = self._client.milliseconds()
+
+        self._on_quote_tick(
+            symbol,
+            bid,
+            ask,
+            bid_size,
+            ask_size,
+            timestamp,
+            instrument.price_precision,
+            instrument.size_precision,
+            recv_ns,
+            batch,
+        )
 
     cdef inline void _on_quote_tick(
         self,
@@ -660,6 +802,8 @@ cdef class CCXTDataClient(LiveDataClient):
         long timestamp,
         int price_precision,
         int size_precision,
+        long long recv_ns,
+        list batch,
     ) except *:
         cdef QuoteTick tick = QuoteTick(
             symbol,
@@ -669,52 +813,61 @@ cdef class CCXTDataClient(LiveDataClient):
             Quantity(best_ask_size, size_precision),
             from_posix_ms(timestamp),
         )
+        tick.recv_ns = recv_ns
 
-        self._handle_quote_tick(tick)
+        batch.append(tick)
 
-    async def _watch_trades(self, Symbol symbol):
-        cdef Instrument instrument = self._instrument_provider.get(symbol)
-        if instrument is None:
-            self._log.error(f"Cannot subscribe to trade ticks (no instrument for {symbol.code}).")
-            return
-
-        cdef int price_precision = instrument.price_precision
-        cdef int size_precision = instrument.size_precision
+    async def _watch_trades(self):
+        await self._watch(
+            "_watch_trades",
+            self._trade_watch_keys,
+            self._watch_trades_for,
+            self._on_trades,
+        )
 
-        cdef trades  # TODO: Type ArrayCache
+    cpdef set _trade_watch_keys(self):
+        if not self._subscribed_trade_ticks:
+            return set()
+        if self._client.has.get("watchTradesForSymbols"):
+            # One combined stream, keyed by all the subscribed symbol codes
+            return {tuple(sorted([symbol.code for symbol in self._subscribed_trade_ticks]))}
+        return {symbol.code for symbol in self._subscribed_trade_ticks}
+
+    async def _watch_trades_for(self, key):
+        if isinstance(key, tuple):
+            return await self._client.watch_trades_for_symbols(list(key))
+        return await self._client.watch_trades(key)
+
+    cpdef void _on_trades(self, key, trades, list batch, long long recv_ns) except *:
+        cdef bint combined = isinstance(key, tuple)
+        cdef str code
+        cdef Symbol symbol
+        cdef Instrument instrument
         cdef dict trade
-        cdef bint exiting = False  # Flag to stop loop
-        try:
-            while True:
-                try:
-                    trades = await self._client.watch_trades(symbol.code)
-                except TypeError:
-                    # Temporary workaround for testing
-                    trades = self._client.watch_trades
-                    exiting = True
-
-                for trade in trades:
-                    self._on_trade_tick(
-                        symbol,
-                        trade["price"],
-                        trade["amount"],
-                        trade["side"],
-                        trade["takerOrMaker"],
-                        trade["id"],
-                        trade["timestamp"],
-                        price_precision,
-                        size_precision,
-                    )
-
-                if exiting:
-                    break
-        except asyncio.CancelledError as ex:
-            self._log.debug(f"Cancelled `_watch_trades` for {symbol.code}.")
-        except Exception as ex:
-            self._log.exception(ex)
-        finally:
-            # Finally close stream
-            await self._client.close()
+        for trade in trades:
+            code = trade["symbol"] if combined else key
+            symbol = self._watch_symbols.get(code)
+            if symbol is None or symbol not in self._subscribed_trade_ticks:
+                continue  # Unsubscribed since the watch was made
+
+            instrument = self._instrument_provider.get(symbol)
+            if instrument is None:
+                self._log.error(f"Cannot handle trade ticks (no instrument for {symbol.code}).")
+                continue
+
+            self._on_trade_tick(
+                symbol,
+                trade["price"],
+                trade["amount"],
+                trade["side"],
+                trade["takerOrMaker"],
+                trade["id"],
+                trade["timestamp"],
+                instrument.price_precision,
+                instrument.size_precision,
+                recv_ns,
+                batch,
+            )
 
     cdef inline void _on_trade_tick(
         self,
@@ -727,6 +880,8 @@ cdef class CCXTDataClient(LiveDataClient):
         long timestamp,
         int price_precision,
         int size_precision,
+        long long recv_ns,
+        list batch,
     ) except *:
         # Determine liquidity side
         cdef OrderSide side = OrderSide.BUY if order_side == "buy" else OrderSide.SELL
@@ -741,73 +896,59 @@ cdef class CCXTDataClient(LiveDataClient):
             TradeMatchId(trade_match_id),
             from_posix_ms(timestamp),
         )
+        tick.recv_ns = recv_ns
 
-        self._handle_trade_tick(tick)
+        batch.append(tick)
+
+    async def _watch_bars(self):
+        await self._watch(
+            "_watch_bars",
+            self._bar_watch_keys,
+            self._watch_ohlcv,
+            self._on_ohlcv,
+        )
+
+    cpdef set _bar_watch_keys(self):
+        return {bar_type for bar_type, timeframe in self._subscribed_bars.items() if timeframe is not None}
 
     async def _watch_ohlcv(self, BarType bar_type):
+        return await self._client.watch_ohlcv(
+            bar_type.symbol.code,
+            timeframe=self._subscribed_bars[bar_type],
+            limit=1,
+        )
+
+    cpdef void _on_ohlcv(self, BarType bar_type, bars, list batch, long long recv_ns) except *:
+        if bar_type not in self._subscribed_bars:
+            return  # Unsubscribed since the watch was made
+
         cdef Instrument instrument = self._instrument_provider.get(bar_type.symbol)
         if instrument is None:
-            self._log.error(f"Cannot subscribe to bars (no instrument for {bar_type.symbol}).")
+            self._log.error(f"Cannot handle bars (no instrument for {bar_type.symbol}).")
             return
 
-        # Build timeframe
-        cdef str timeframe = self._make_timeframe(bar_type.spec)
-        if timeframe is None:
-            self._log.warning(f"Requesting bars with BarAggregation."
-                              f"{BarAggregationParser.to_str(bar_type.spec.aggregation)} "
-                              f"not currently supported in this version.")
+        bar = bars[0]  # Last closed bar
+        cdef long this_timestamp = bar[0]
+        cdef long last_timestamp = self._last_bar_timestamps.get(bar_type, 0)
+        if this_timestamp == last_timestamp:
             return
+        self._last_bar_timestamps[bar_type] = this_timestamp
+        if last_timestamp == 0:
+            return  # Initialize last timestamp
 
-        # Setup symbol constant and precisions
-        cdef Symbol symbol = bar_type.symbol
-        cdef int price_precision = instrument.price_precision
-        cdef int size_precision = instrument.size_precision
-
-        cdef long last_timestamp = 0
-        cdef long this_timestamp = 0
-        cdef bars  # TODO: Type ArrayCache
-        cdef bar   # TODO: Type ArrayCache
-        cdef bint exiting = False  # Flag to stop loop
-        try:
-            while True:
-                try:
-                    bars = await self._client.watch_ohlcv(symbol.code, timeframe=timeframe, limit=1)
-                except TypeError:
-                    # Temporary workaround for testing
-                    bars = self._client.watch_ohlvc
-                    exiting = True
-
-                bar = bars[0]  # Last closed bar
-                this_timestamp = bar[0]
-                if last_timestamp == 0:
-                    # Initialize last timestamp
-                    last_timestamp = this_timestamp
-                    continue
-                elif this_timestamp != last_timestamp:
-                    last_timestamp = this_timestamp
-
-                    # Create new bar
-                    self._on_bar(
-                        bar_type,
-                        bar[1],
-                        bar[2],
-                        bar[3],
-                        bar[4],
-                        bar[5],
-                        this_timestamp,
-                        price_precision,
-                        size_precision,
-                    )
-
-                if exiting:
-                    break
-        except asyncio.CancelledError as ex:
-            self._log.debug(f"Cancelled `_watch_ohlcv` for {symbol.code}.")
-        except Exception as ex:
-            self._log.exception(ex)
-        finally:
-            # Finally close stream
-            await self._client.close()
+        # Create new bar
+        self._on_bar(
+            bar_type,
+            bar[1],
+            bar[2],
+            bar[3],
+            bar[4],
+            bar[5],
+            this_timestamp,
+            instrument.price_precision,
+            instrument.size_precision,
+            batch,
+        )
 
     cdef inline void _on_bar(
         self,
@@ -820,6 +961,7 @@ cdef class CCXTDataClient(LiveDataClient):
         long timestamp,
         int price_precision,
         int size_precision,
+        list batch,
     ) except *:
         cdef Bar bar = Bar(
             Price(open_price, price_precision),
@@ -830,7 +972,7 @@ cdef class CCXTDataClient(LiveDataClient):
             from_posix_ms(timestamp),
         )
 
-        self._handle_bar(bar_type, bar)
+        batch.append(BarData(bar_type, bar))
 
     async def _request_instrument(self, Symbol symbol, UUID correlation_id):
         await self._instrument_provider.load_all_async()
@@ -841,12 +983,25 @@ cdef class CCXTDataClient(LiveDataClient):
             self._log.error(f"Could not find instrument {symbol.code}.")
 
     async def _request_instruments(self, correlation_id):
+        cdef dict snapshot
+        if self._instrument_provider.load_snapshot():
+            # Respond from the snapshot, then reconcile with the venue
+            snapshot = self._instrument_provider.get_all()
+            self._handle_instruments(list(snapshot.values()), correlation_id)
+
+            self._log.info(f"Loaded {len(snapshot)} instruments from snapshot.")
+            self._set_initialized()
+
+            await self._instrument_provider.load_all_async()
+            self._reconcile_instruments(snapshot, self._instrument_provider.get_all())
+            return
+
         await self._instrument_provider.load_all_async()
         cdef list instruments = list(self._instrument_provider.get_all().values())
         self._handle_instruments(instruments, correlation_id)
 
         self._log.info(f"Updated {len(instruments)} instruments.")
-        self.initialized = True
+        self._set_initialized()
 
     async def _subscribed_instruments_update(self, delay):
         await self._instrument_provider.load_all_async()
@@ -17,7 +17,10 @@ from datetime import datetime
 from decimal import Decimal
 
 import ccxt
+import pytz
 
+from nautilus_trader.live.providers cimport LiveInstrumentProvider
+from nautilus_trader.live.snapshot cimport InstrumentSnapshotCache
 from nautilus_trader.model.c_enums.asset_class cimport AssetClass
 from nautilus_trader.model.c_enums.asset_type cimport AssetType
 from nautilus_trader.model.c_enums.asset_type cimport AssetTypeParser
@@ -31,12 +34,12 @@ from nautilus_trader.model.objects cimport Price
 from nautilus_trader.model.objects cimport Quantity
 
 
-cdef class CCXTInstrumentProvider:
+cdef class CCXTInstrumentProvider(LiveInstrumentProvider):
     """
     Provides a means of loading `Instrument` objects from a unified CCXT exchange.
     """
 
-    def __init__(self, client not None: ccxt.Exchange, bint load_all=False):
+    def __init__(self, client not None: ccxt.Exchange, bint load_all=False, InstrumentSnapshotCache snapshot_cache=None):
         """
         Initialize a new instance of the `CCXTInstrumentProvider` class.
 
@@ -46,11 +49,13 @@ cdef class CCXTInstrumentProvider:
             The client for the provider.
         load_all : bool, optional
             If all instruments should be loaded at instantiation.
+        snapshot_cache : InstrumentSnapshotCache, optional
+            The cache to load instrument snapshots from, and to save a
+            snapshot to whenever all instruments are loaded.
 
         """
-        self.venue = Venue(client.name.upper())
-        self.count = 0
-        self._instruments = {}  # type: dict[Symbol: Instrument]
+        super().__init__(venue=Venue(client.name.upper()), snapshot_cache=snapshot_cache)
+
         self._client = client
 
         if load_all:
@@ -70,34 +75,11 @@ cdef class CCXTInstrumentProvider:
         self._client.load_markets(reload=True)
         self._load_instruments()
 
-    cpdef dict get_all(self):
-        """
-        Return all loaded instruments.
-
-        If no instruments loaded, will return an empty dict.
-
-        Returns
-        -------
-        dict[Symbol, Instrument]
-
-        """
-        return self._instruments.copy()
-
-    cpdef Instrument get(self, Symbol symbol):
-        """
-        Return the instrument for the given symbol (if found).
-
-        Returns
-        -------
-        Instrument or None
-
-        """
-        return self._instruments.get(symbol)
-
     cdef void _load_instruments(self) except *:
         if self._client.markets is None:
             return  # No markets
 
+        cdef dict loaded = {}  # type: dict[Symbol: Instrument]
         cdef str k
         cdef dict v
         cdef Symbol symbol
@@ -106,9 +88,9 @@ cdef class CCXTInstrumentProvider:
             symbol = Symbol(k, self.venue)
             instrument = self._parse_instrument(symbol, v)
 
-            self._instruments[symbol] = instrument
+            loaded[symbol] = instrument
 
-        self.count = len(self._instruments)
+        self._set_instruments(loaded)
 
     cdef Instrument _parse_instrument(self, Symbol symbol, dict values):
         # Precisions
@@ -187,6 +169,6 @@ cdef class CCXTInstrumentProvider:
             maker_fee=maker_fee,
             taker_fee=taker_fee,
             financing={},
-            timestamp=datetime.utcnow(),
+            timestamp=datetime.now(tz=pytz.utc),
             info=values,
         )
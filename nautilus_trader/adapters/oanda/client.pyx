@@ -21,6 +21,8 @@ from nautilus_trader.adapters.oanda.data cimport OandaDataClient
 from nautilus_trader.data.engine cimport DataEngine
 from nautilus_trader.common.clock cimport LiveClock
 from nautilus_trader.common.logging cimport LiveLogger
+from nautilus_trader.live.snapshot cimport InstrumentSnapshotCache
+from nautilus_trader.model.identifiers cimport Venue
 
 
 cdef class OandaDataClientFactory:
@@ -61,10 +63,20 @@ cdef class OandaDataClientFactory:
         # Create client
         client = oandapyV20.API(access_token=oanda_api_token)
 
+        # Cache instrument snapshots if configured
+        snapshot_cache = None
+        if config.get("snapshot_path") is not None:
+            snapshot_cache = InstrumentSnapshotCache(
+                path=config["snapshot_path"],
+                venue=Venue("OANDA"),
+                logger=logger,
+            )
+
         return OandaDataClient(
             client=client,
             account_id=oanda_account_id,
             engine=data_engine,
             clock=clock,
             logger=logger,
+            snapshot_cache=snapshot_cache,
         )
@@ -17,8 +17,10 @@ from cpython.datetime cimport datetime
 import threading
 
 from nautilus_trader.adapters.oanda.providers cimport OandaInstrumentProvider
+from nautilus_trader.core.cache cimport ObjectCache
 from nautilus_trader.core.uuid cimport UUID
 from nautilus_trader.live.data cimport LiveDataClient
+from nautilus_trader.live.snapshot cimport InstrumentSnapshotCache
 from nautilus_trader.model.bar cimport Bar
 from nautilus_trader.model.bar cimport BarType
 from nautilus_trader.model.c_enums.price_type cimport PriceType
@@ -31,10 +33,14 @@ from nautilus_trader.model.tick cimport TradeTick
 cdef class OandaDataClient(LiveDataClient):
     cdef object _client
     cdef str _account_id
-    cdef bint _is_connected
     cdef set _subscribed_instruments
-    cdef dict _subscribed_quote_ticks
+    cdef set _subscribed_quote_ticks
+    cdef object _stream_event
+    cdef object _stream_future
+    cdef bint _stream_resubscribe
+    cdef ObjectCache _price_cache
     cdef OandaInstrumentProvider _instrument_provider
+    cdef InstrumentSnapshotCache _snapshot_cache
     cdef object _update_instruments_handle
 
     cpdef void _request_instrument(self, Symbol symbol, UUID correlation_id) except *
@@ -49,8 +55,12 @@ cdef class OandaDataClient(LiveDataClient):
         int limit,
         UUID correlation_id,
     ) except *
-    cpdef void _stream_prices(self, Symbol symbol, event: threading.Event) except *
+    cdef void _update_price_stream(self) except *
+    cdef void _start_price_stream(self) except *
+    cdef void _stop_price_stream(self) except *
+    cpdef void _stream_prices(self, event: threading.Event) except *
     cdef inline QuoteTick _parse_quote_tick(self, Symbol symbol, dict values)
+    cdef inline datetime _parse_timestamp(self, str value)
     cdef inline Bar _parse_bar(self, Instrument instrument, dict values, PriceType price_type)
 
 # -- PYTHON WRAPPERS -------------------------------------------------------------------------------
@@ -15,22 +15,27 @@
 
 import asyncio
 from cpython.datetime cimport datetime
+from cpython.datetime cimport datetime_new
+from cpython.datetime cimport import_datetime
 import threading
 
 import pandas as pd
 import oandapyV20
 from oandapyV20.endpoints.instruments import InstrumentsCandles
 from oandapyV20.endpoints.pricing import PricingStream
+import pytz
 
 from nautilus_trader.adapters.oanda.providers import OandaInstrumentProvider
 from nautilus_trader.common.clock cimport LiveClock
 from nautilus_trader.common.logging cimport Logger
+from nautilus_trader.core.cache cimport ObjectCache
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.core.constants cimport *  # str constants only
 from nautilus_trader.core.datetime cimport format_iso8601
 from nautilus_trader.core.uuid cimport UUID
 from nautilus_trader.live.data cimport LiveDataClient
 from nautilus_trader.live.data cimport LiveDataEngine
+from nautilus_trader.live.snapshot cimport InstrumentSnapshotCache
 from nautilus_trader.model.c_enums.bar_aggregation cimport BarAggregation
 from nautilus_trader.model.c_enums.bar_aggregation cimport BarAggregationParser
 from nautilus_trader.model.c_enums.price_type cimport PriceType
@@ -45,7 +50,11 @@ from nautilus_trader.model.objects cimport Price
 from nautilus_trader.model.objects cimport Quantity
 from nautilus_trader.model.tick cimport QuoteTick
 
+# Initialize the datetime C API (required for datetime_new)
+import_datetime()
+
 cdef int _SECONDS_IN_HOUR = 60 * 60
+cdef object _UTC = pytz.utc
 
 
 cdef class OandaDataClient(LiveDataClient):
@@ -60,6 +69,7 @@ cdef class OandaDataClient(LiveDataClient):
         LiveDataEngine engine not None,
         LiveClock clock not None,
         Logger logger not None,
+        InstrumentSnapshotCache snapshot_cache=None,
     ):
         """
         Initialize a new instance of the `OandaDataClient` class.
@@ -76,6 +86,9 @@ cdef class OandaDataClient(LiveDataClient):
             The clock for the client.
         logger : Logger
             The logger for the client.
+        snapshot_cache : InstrumentSnapshotCache, optional
+            The cache for instrument snapshots, if given then instruments are
+            served from the snapshot while being refreshed from the venue.
 
         """
         super().__init__(
@@ -85,6 +98,7 @@ cdef class OandaDataClient(LiveDataClient):
             logger,
             config={
                 "unavailable_methods": [
+                    self.subscribe_order_book.__name__,
                     self.subscribe_trade_ticks.__name__,
                     self.request_quote_ticks.__name__,
                     self.request_trade_ticks.__name__,
@@ -92,18 +106,25 @@ cdef class OandaDataClient(LiveDataClient):
             }
         )
 
-        self._is_connected = False
         self._client = client
         self._account_id = account_id
+        self._snapshot_cache = snapshot_cache
         self._instrument_provider = OandaInstrumentProvider(
             client=self._client,
             account_id=self._account_id,
             load_all=False,
+            snapshot_cache=self._snapshot_cache,
         )
 
         # Subscriptions
         self._subscribed_instruments = set()
-        self._subscribed_quote_ticks = {}  # type: dict[Symbol, (threading.Event, asyncio.Future)]
+        self._subscribed_quote_ticks = set()  # type: set[Symbol]
+
+        # Price stream (one stream multiplexes all quote tick subscriptions)
+        self._stream_event = None         # type: threading.Event
+        self._stream_future = None        # type: asyncio.Future
+        self._stream_resubscribe = False
+        self._price_cache = ObjectCache(Price, Price)
 
         self._update_instruments_handle: asyncio.Handle = None
 
@@ -132,19 +153,7 @@ cdef class OandaDataClient(LiveDataClient):
         list[Symbol]
 
         """
-        return sorted(list(self._subscribed_quote_ticks.keys()))
-
-    cpdef bint is_connected(self) except *:
-        """
-        Return a value indicating whether the client is connected.
-
-        Returns
-        -------
-        bool
-            True if connected, else False.
-
-        """
-        return self._is_connected
+        return sorted(list(self._subscribed_quote_ticks))
 
     cpdef void connect(self) except *:
         """
@@ -152,8 +161,8 @@ cdef class OandaDataClient(LiveDataClient):
         """
         self._log.info("Connecting...")
 
-        for symbol in self._subscribed_quote_ticks.copy():
-            self.subscribe_quote_ticks(symbol)
+        if self._subscribed_quote_ticks:
+            self._start_price_stream()
 
         # Schedule subscribed instruments update
         self._update_instruments_handle: asyncio.Handle = self._loop.call_later(
@@ -161,7 +170,7 @@ cdef class OandaDataClient(LiveDataClient):
             callback=self._subscribed_instruments_update,
         )
 
-        self._is_connected = True
+        self._set_connected(True)
         self._log.info("Connected.")
 
     cpdef void disconnect(self) except *:
@@ -177,7 +186,7 @@ cdef class OandaDataClient(LiveDataClient):
             self._update_instruments_handle.cancel()
             self._log.debug(f"{self._update_instruments_handle}")
 
-        self._is_connected = False
+        self._set_connected(False)
         self._log.info("Disconnected.")
 
     cpdef void reset(self) except *:
@@ -189,10 +198,12 @@ cdef class OandaDataClient(LiveDataClient):
             client=self._client,
             account_id=self._account_id,
             load_all=False,
+            snapshot_cache=self._snapshot_cache,
         )
 
         self._subscribed_instruments = set()
-        self._subscribed_quote_ticks = {}
+        self._subscribed_quote_ticks = set()
+        self._price_cache.clear()
 
     cpdef void dispose(self) except *:
         """
@@ -232,9 +243,8 @@ cdef class OandaDataClient(LiveDataClient):
         Condition.not_none(symbol, "symbol")
 
         if symbol not in self._subscribed_quote_ticks:
-            event = threading.Event()
-            future = self._loop.run_in_executor(None, self._stream_prices, symbol, event)
-            self._subscribed_quote_ticks[symbol] = (event, future)
+            self._subscribed_quote_ticks.add(symbol)
+            self._update_price_stream()
 
             self._log.debug(f"Subscribed to quote ticks for {symbol}.")
 
@@ -267,6 +277,20 @@ cdef class OandaDataClient(LiveDataClient):
         self._log.error(f"`subscribe_bars` was called when not supported by the brokerage "
                         f"(use internal aggregation).")
 
+    cpdef void subscribe_order_book(self, Symbol symbol) except *:
+        """
+        Subscribe to `OrderBookDelta` data for the given symbol.
+
+        Parameters
+        ----------
+        symbol : Symbol
+            The order book symbol to subscribe to.
+
+        """
+        Condition.not_none(symbol, "symbol")
+
+        self._log.error(f"`subscribe_order_book` was called when not supported by the brokerage.")
+
     cpdef void unsubscribe_instrument(self, Symbol symbol) except *:
         """
         Unsubscribe from `Instrument` data for the given symbol.
@@ -294,9 +318,8 @@ cdef class OandaDataClient(LiveDataClient):
         Condition.not_none(symbol, "symbol")
 
         if symbol in self._subscribed_quote_ticks:
-            event, future = self._subscribed_quote_ticks.pop(symbol)
-            event.set()
-            future.cancel()
+            self._subscribed_quote_ticks.discard(symbol)
+            self._update_price_stream()
 
             self._log.debug(f"Unsubscribed from quote ticks for {symbol}.")
 
@@ -329,6 +352,20 @@ cdef class OandaDataClient(LiveDataClient):
         self._log.error(f"`unsubscribe_bars` was called when not supported by the brokerage "
                         f"(use internal aggregation).")
 
+    cpdef void unsubscribe_order_book(self, Symbol symbol) except *:
+        """
+        Unsubscribe from `OrderBookDelta` data for the given symbol.
+
+        Parameters
+        ----------
+        symbol : Symbol
+            The order book symbol to unsubscribe from.
+
+        """
+        Condition.not_none(symbol, "symbol")
+
+        self._log.error(f"`unsubscribe_order_book` was called when not supported by the brokerage.")
+
 # -- REQUESTS --------------------------------------------------------------------------------------
 
     cpdef void request_instrument(self, Symbol symbol, UUID correlation_id) except *:
@@ -487,12 +524,25 @@ cdef class OandaDataClient(LiveDataClient):
             self._log.error(f"Could not find instrument {symbol.code}.")
 
     cpdef void _request_instruments(self, UUID correlation_id) except *:
+        cdef dict snapshot
+        if self._instrument_provider.load_snapshot():
+            # Respond from the snapshot, then reconcile with the venue
+            snapshot = self._instrument_provider.get_all()
+            self._loop.call_soon_threadsafe(self._handle_instruments_py, list(snapshot.values()), correlation_id)
+
+            self._log.info(f"Loaded {len(snapshot)} instruments from snapshot.")
+            self._set_initialized()
+
+            self._instrument_provider.load_all()
+            self._reconcile_instruments(snapshot, self._instrument_provider.get_all())
+            return
+
         self._instrument_provider.load_all()
         cdef list instruments = list(self._instrument_provider.get_all().values())
         self._loop.call_soon_threadsafe(self._handle_instruments_py, instruments, correlation_id)
 
         self._log.info(f"Updated {len(instruments)} instruments.")
-        self.initialized = True
+        self._set_initialized()
 
     cpdef void _subscribed_instruments_update(self) except *:
         self._loop.run_in_executor(None, self._subscribed_instruments_load_and_send)
@@ -631,27 +681,62 @@ cdef class OandaDataClient(LiveDataClient):
             correlation_id,
         )
 
-    cpdef void _stream_prices(self, Symbol symbol, event: threading.Event) except *:
+    cdef void _update_price_stream(self) except *:
+        if not self._subscribed_quote_ticks:
+            self._stop_price_stream()
+        elif self._stream_future is None or self._stream_future.done():
+            self._start_price_stream()
+        else:
+            # The running stream reconnects for the new instruments on its next line
+            self._stream_resubscribe = True
+
+    cdef void _start_price_stream(self) except *:
+        self._stream_resubscribe = False
+        self._stream_event = threading.Event()
+        self._stream_future = self._loop.run_in_executor(None, self._stream_prices, self._stream_event)
+
+    cdef void _stop_price_stream(self) except *:
+        if self._stream_event is not None:
+            self._stream_event.set()
+            self._stream_future.cancel()
+        self._stream_event = None
+        self._stream_future = None
+
+    cpdef void _stream_prices(self, event: threading.Event) except *:
+        cdef dict symbols  # type: dict[str, Symbol]
+        cdef Symbol symbol
         cdef dict res
-        cdef dict best_bid
-        cdef dict best_ask
+        cdef long long recv_ns
         cdef QuoteTick tick
         try:
-            params = {
-                "instruments": symbol.code.replace('/', '_', 1),
-                "sessionId": f"{symbol.code}-001",
-            }
-
-            req = PricingStream(accountID=self._account_id, params=params)
-
-            while True:
+            while not event.is_set():
+                # Copy on the stream thread as subscriptions change on the loop
+                self._stream_resubscribe = False
+                symbols = {
+                    symbol.code.replace('/', '_', 1): symbol
+                    for symbol in self._subscribed_quote_ticks.copy()
+                }
+                if not symbols:
+                    return
+
+                params = {"instruments": ",".join(sorted(symbols))}
+                req = PricingStream(accountID=self._account_id, params=params)
+
+                self._log.debug(f"Streaming prices for {params['instruments']}...")
                 for res in self._client.request(req):
                     if event.is_set():
                         raise asyncio.CancelledError("Price stream stopped")
+                    if self._stream_resubscribe:
+                        break  # Reconnect with the current subscriptions
                     if res["type"] != "PRICE":
                         # Heartbeat
                         continue
+                    symbol = symbols.get(res["instrument"])
+                    if symbol is None:
+                        continue
+                    recv_ns = self._recv_stamp()
                     tick = self._parse_quote_tick(symbol, res)
+                    tick.recv_ns = recv_ns
                     self._handle_quote_tick_py(tick)
         except asyncio.CancelledError:
             pass  # Expected cancellation
@@ -661,11 +746,28 @@ cdef class OandaDataClient(LiveDataClient):
     cdef inline QuoteTick _parse_quote_tick(self, Symbol symbol, dict values):
         return QuoteTick(
             symbol,
-            Price(values["bids"][0]["price"]),
-            Price(values["asks"][0]["price"]),
+            self._price_cache.get(values["bids"][0]["price"]),
+            self._price_cache.get(values["asks"][0]["price"]),
             Quantity(1),
             Quantity(1),
-            pd.to_datetime(values["time"]),
+            self._parse_timestamp(values["time"]),
+        )
+
+    cdef inline datetime _parse_timestamp(self, str value):
+        # RFC 3339 timestamps e.g. "2021-01-18T06:11:40.912749766Z"
+        cdef int microsecond = 0
+        if len(value) > 20 and value[19] == ".":
+            microsecond = int(value[20:-1][:6].ljust(6, "0"))
+
+        return datetime_new(
+            int(value[0:4]),
+            int(value[5:7]),
+            int(value[8:10]),
+            int(value[11:13]),
+            int(value[14:16]),
+            int(value[17:19]),
+            microsecond,
+            _UTC,
         )
 
     cdef inline Bar _parse_bar(self, Instrument instrument, dict values, PriceType price_type):
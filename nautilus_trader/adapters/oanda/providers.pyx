@@ -18,7 +18,10 @@ from decimal import Decimal
 
 import oandapyV20
 from oandapyV20.endpoints.accounts import AccountInstruments
+import pytz
 
+from nautilus_trader.live.providers cimport LiveInstrumentProvider
+from nautilus_trader.live.snapshot cimport InstrumentSnapshotCache
 from nautilus_trader.model.c_enums.asset_type cimport AssetType
 from nautilus_trader.model.c_enums.asset_class cimport AssetClass
 from nautilus_trader.model.c_enums.asset_class cimport AssetClassParser
@@ -30,7 +33,7 @@ from nautilus_trader.model.instrument cimport Instrument
 from nautilus_trader.model.objects cimport Quantity
 
 
-cdef class OandaInstrumentProvider:
+cdef class OandaInstrumentProvider(LiveInstrumentProvider):
     """
     Provides a means of loading Oanda `Instrument` objects.
     """
@@ -40,6 +43,7 @@ cdef class OandaInstrumentProvider:
         client not None: oandapyV20.API,
         str account_id not None,
         bint load_all=False,
+        InstrumentSnapshotCache snapshot_cache=None,
     ):
         """
         Initialize a new instance of the `OandaInstrumentProvider` class.
@@ -52,11 +56,13 @@ cdef class OandaInstrumentProvider:
             The Oanda account identifier.
         load_all : bool, optional
             If all instruments should be loaded at instantiation.
+        snapshot_cache : InstrumentSnapshotCache, optional
+            The cache to load instrument snapshots from, and to save a
+            snapshot to whenever all instruments are loaded.
 
         """
-        self.venue = Venue("OANDA")
-        self.count = 0
-        self._instruments = {}  # type: dict[Symbol: Instrument]
+        super().__init__(venue=Venue("OANDA"), snapshot_cache=snapshot_cache)
+
         self._client = client
         self._account_id = account_id
 
@@ -71,37 +77,14 @@ cdef class OandaInstrumentProvider:
         res = self._client.request(req)
 
         cdef list instruments = res.get("instruments", {})
+        cdef dict loaded = {}  # type: dict[Symbol: Instrument]
         cdef dict values
         cdef Instrument instrument
         for values in instruments:
             instrument = self._parse_instrument(values)
-            self._instruments[instrument.symbol] = instrument
-
-        self.count = len(self._instruments)
-
-    cpdef dict get_all(self):
-        """
-        Return all loaded instruments.
-
-        If no instruments loaded, will return an empty dict.
-
-        Returns
-        -------
-        dict[Symbol, Instrument]
+            loaded[instrument.symbol] = instrument
 
-        """
-        return self._instruments.copy()
-
-    cpdef Instrument get(self, Symbol symbol):
-        """
-        Return the instrument for the given symbol (if found).
-
-        Returns
-        -------
-        Instrument or None
-
-        """
-        return self._instruments.get(symbol)
+        self._set_instruments(loaded)
 
     cdef Instrument _parse_instrument(self, dict values):
         cdef str oanda_name = values["name"]
@@ -157,6 +140,6 @@ cdef class OandaInstrumentProvider:
             maker_fee=maker_fee,
             taker_fee=taker_fee,
             financing=values.get("financing", {}),
-            timestamp=datetime.utcnow(),
+            timestamp=datetime.now(tz=pytz.utc),
             info=values,
         )
@@ -57,7 +57,7 @@ cdef class ReportProvider:
         cdef list orders_all = [self._order_to_dict(o) for o in orders]
 
         report = pd.DataFrame(data=orders_all).set_index("cl_ord_id")
-        report.sort_values("timestamp", inplace=True)
+        report.sort_values("timestamp", kind="mergesort", inplace=True)
         return report
 
     cpdef object generate_order_fills_report(self, list orders):
@@ -87,7 +87,7 @@ cdef class ReportProvider:
             return pd.DataFrame()
 
         report = pd.DataFrame(data=filled_orders).set_index("cl_ord_id")
-        report.sort_values("timestamp", inplace=True)
+        report.sort_values("timestamp", kind="mergesort", inplace=True)
         return report
 
     cpdef object generate_positions_report(self, list positions):
@@ -115,7 +115,7 @@ cdef class ReportProvider:
             return pd.DataFrame()
 
         report = pd.DataFrame(data=trades).set_index("position_id")
-        report.sort_values("opened_time", inplace=True)
+        report.sort_values("opened_time", kind="mergesort", inplace=True)
         return report
 
     cpdef object generate_account_report(self, Account account):
@@ -145,7 +145,7 @@ cdef class ReportProvider:
             return pd.DataFrame()
 
         report = pd.DataFrame(data=account_events).set_index("timestamp")
-        report.sort_index(inplace=True)
+        report.sort_index(kind="mergesort", inplace=True)
         return report
 
     cdef dict _order_to_dict(self, Order order):
@@ -203,6 +203,24 @@ cdef class BacktestDataClient(DataClient):
         self._log.error(f"Cannot subscribe to externally aggregated bars "
                         f"(backtesting only supports internal aggregation at this stage).")
 
+    cpdef void subscribe_order_book(self, Symbol symbol) except *:
+        """
+        Subscribe to `OrderBookDelta` data for the given symbol.
+
+        Parameters
+        ----------
+        symbol : Symbol
+            The order book symbol to subscribe to.
+
+        """
+        Condition.not_none(symbol, "symbol")
+
+        if not self._is_connected:  # Simulate connection behaviour
+            self._log.error(f"Cannot subscribe to order book for {symbol} (not connected).")
+            return
+
+        # Do nothing else for backtest
+
     cpdef void unsubscribe_instrument(self, Symbol symbol) except *:
         """
         Unsubscribe from `Instrument` data for the given symbol.
@@ -278,6 +296,24 @@ cdef class BacktestDataClient(DataClient):
 
         # Do nothing else for backtest
 
+    cpdef void unsubscribe_order_book(self, Symbol symbol) except *:
+        """
+        Unsubscribe from `OrderBookDelta` data for the given symbol.
+
+        Parameters
+        ----------
+        symbol : Symbol
+            The order book symbol to unsubscribe from.
+
+        """
+        Condition.not_none(symbol, "symbol")
+
+        if not self._is_connected:  # Simulate connection behaviour
+            self._log.error(f"Cannot unsubscribe from order book for {symbol} (not connected).")
+            return
+
+        # Do nothing else for backtest
+
 # -- REQUESTS --------------------------------------------------------------------------------------
 
     cpdef void request_instrument(self, Symbol symbol, UUID correlation_id) except *:
@@ -25,14 +25,17 @@ cdef class BacktestDataContainer:
     cdef readonly dict instruments
     cdef readonly dict quote_ticks
     cdef readonly dict trade_ticks
+    cdef readonly dict order_book_deltas
     cdef readonly dict bars_bid
     cdef readonly dict bars_ask
 
     cpdef void add_instrument(self, Instrument instrument) except *
     cpdef void add_quote_ticks(self, Symbol symbol, data) except *
     cpdef void add_trade_ticks(self, Symbol symbol, data) except *
+    cpdef void add_order_book_deltas(self, Symbol symbol, data) except *
     cpdef void add_bars(self, Symbol symbol, BarAggregation aggregation, PriceType price_type, data) except *
     cpdef void check_integrity(self) except *
     cpdef bint has_quote_data(self, Symbol symbol) except *
     cpdef bint has_trade_data(self, Symbol symbol) except *
+    cpdef bint has_order_book_data(self, Symbol symbol) except *
     cpdef long total_data_size(self)
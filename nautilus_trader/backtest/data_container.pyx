@@ -42,13 +42,14 @@ cdef class BacktestDataContainer:
         """
         Initialize a new instance of the `BacktestDataContainer` class.
         """
-        self.venues = set()    # type: set[Venue]
-        self.symbols = set()   # type: set[Instrument]
-        self.instruments = {}  # type: dict[Symbol, Instrument]
-        self.quote_ticks = {}  # type: dict[Symbol, pd.DataFrame]
-        self.trade_ticks = {}  # type: dict[Symbol, pd.DataFrame]
-        self.bars_bid = {}     # type: dict[Symbol, dict[BarAggregation, pd.DataFrame]]
-        self.bars_ask = {}     # type: dict[Symbol, dict[BarAggregation, pd.DataFrame]]
+        self.venues = set()          # type: set[Venue]
+        self.symbols = set()         # type: set[Instrument]
+        self.instruments = {}        # type: dict[Symbol, Instrument]
+        self.quote_ticks = {}        # type: dict[Symbol, pd.DataFrame]
+        self.trade_ticks = {}        # type: dict[Symbol, pd.DataFrame]
+        self.order_book_deltas = {}  # type: dict[Symbol, pd.DataFrame]
+        self.bars_bid = {}           # type: dict[Symbol, dict[BarAggregation, pd.DataFrame]]
+        self.bars_ask = {}           # type: dict[Symbol, dict[BarAggregation, pd.DataFrame]]
 
     cpdef void add_instrument(self, Instrument instrument) except *:
         """
@@ -120,6 +121,33 @@ cdef class BacktestDataContainer:
         self.trade_ticks[symbol] = data
         self.trade_ticks = dict(sorted(self.trade_ticks.items()))
 
+    cpdef void add_order_book_deltas(self, Symbol symbol, data: pd.DataFrame) except *:
+        """
+        Add the L2 order book delta data to the container.
+
+        The format of the dataframe is expected to be a DateTimeIndex (times are
+        assumed to be UTC, and are converted to tz-aware in pre-processing).
+
+        With index column named 'timestamp', and 'side' ('BUY' for bids, 'SELL'
+        for asks), 'price', 'size' data columns. Each row sets the total size
+        resting at the price level, a zero size removes the level.
+
+        Parameters
+        ----------
+        symbol : Symbol
+            The symbol for the order book delta data.
+        data : pd.DataFrame
+            The order book delta data to add.
+
+        """
+        Condition.not_none(symbol, "symbol")
+        Condition.not_none(data, "data")
+        Condition.type(data, pd.DataFrame, "data")
+
+        self.symbols.add(symbol)
+        self.order_book_deltas[symbol] = data
+        self.order_book_deltas = dict(sorted(self.order_book_deltas.items()))
+
     cpdef void add_bars(
         self,
         Symbol symbol,
@@ -232,6 +260,24 @@ cdef class BacktestDataContainer:
         Condition.not_none(symbol, "symbol")
         return symbol in self.trade_ticks
 
+    cpdef bint has_order_book_data(self, Symbol symbol) except *:
+        """
+        Return a value indicating whether the container has order book delta
+        data for the given symbol.
+
+        Parameters
+        ----------
+        symbol : Symbol
+            The query symbol.
+
+        Returns
+        -------
+        bool
+
+        """
+        Condition.not_none(symbol, "symbol")
+        return symbol in self.order_book_deltas
+
     cpdef long total_data_size(self):
         """
         Return the total memory size of the data in the container.
@@ -245,6 +291,7 @@ cdef class BacktestDataContainer:
         cdef long size = 0
         size += get_size_of(self.quote_ticks)
         size += get_size_of(self.trade_ticks)
+        size += get_size_of(self.order_book_deltas)
         size += get_size_of(self.bars_bid)
         size += get_size_of(self.bars_ask)
         return size
@@ -19,6 +19,8 @@ from nautilus_trader.backtest.data_container cimport BacktestDataContainer
 from nautilus_trader.common.clock cimport Clock
 from nautilus_trader.common.logging cimport LoggerAdapter
 from nautilus_trader.data.engine cimport DataEngine
+from nautilus_trader.model.bar cimport BarData
+from nautilus_trader.model.order_book cimport OrderBookDelta
 from nautilus_trader.model.tick cimport Tick
 from nautilus_trader.model.tick cimport QuoteTick
 from nautilus_trader.model.tick cimport TradeTick
@@ -31,6 +33,8 @@ cdef class BacktestDataProducer:
     cdef BacktestDataContainer _data
     cdef object _quote_tick_data
     cdef object _trade_tick_data
+    cdef object _order_book_data
+    cdef object _bar_data
     cdef dict _symbol_index
     cdef bint _is_connected
 
@@ -39,7 +43,7 @@ cdef class BacktestDataProducer:
     cdef str[:] _quote_asks
     cdef str[:] _quote_bid_sizes
     cdef str[:] _quote_ask_sizes
-    cdef datetime[:] _quote_timestamps
+    cdef long long[:] _quote_timestamps
     cdef int _quote_index
     cdef int _quote_index_last
     cdef QuoteTick _next_quote_tick
@@ -49,11 +53,31 @@ cdef class BacktestDataProducer:
     cdef str[:] _trade_sizes
     cdef str[:] _trade_match_ids
     cdef str[:] _trade_sides
-    cdef datetime[:] _trade_timestamps
+    cdef long long[:] _trade_timestamps
     cdef int _trade_index
     cdef int _trade_index_last
     cdef TradeTick _next_trade_tick
 
+    cdef unsigned short[:] _delta_symbols
+    cdef str[:] _delta_sides
+    cdef str[:] _delta_prices
+    cdef str[:] _delta_sizes
+    cdef long long[:] _delta_timestamps
+    cdef int _delta_index
+    cdef int _delta_index_last
+    cdef OrderBookDelta _next_delta
+
+    cdef dict _bar_types_bid
+    cdef dict _bar_types_ask
+    cdef unsigned short[:] _bar_symbols
+    cdef str[:, :] _bar_values
+    cdef long long[:] _bar_timestamps
+    cdef int _bar_index
+    cdef int _bar_index_last
+    cdef BarData _next_bid_bar
+    cdef BarData _next_ask_bar
+
+    cdef readonly bint bar_execution
     cdef readonly list execution_resolutions
     cdef readonly datetime min_timestamp
     cdef readonly datetime max_timestamp
@@ -62,8 +86,14 @@ cdef class BacktestDataProducer:
     cpdef void setup(self, datetime start, datetime stop) except *
     cpdef void reset(self) except *
     cdef Tick next_tick(self)
+    cdef bint is_next_bars(self) except *
+    cdef tuple next_bars(self)
 
     cdef inline QuoteTick _generate_quote_tick(self, int index)
     cdef inline TradeTick _generate_trade_tick(self, int index)
+    cdef inline OrderBookDelta _generate_delta(self, int index)
+    cdef inline void _generate_bars(self, int index) except *
     cdef inline void _iterate_quote_ticks(self) except *
     cdef inline void _iterate_trade_ticks(self) except *
+    cdef inline void _iterate_deltas(self) except *
+    cdef inline void _iterate_bars(self) except *
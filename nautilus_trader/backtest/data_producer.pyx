@@ -32,14 +32,21 @@ from nautilus_trader.core.functions cimport format_bytes
 from nautilus_trader.core.functions cimport get_size_of
 from nautilus_trader.core.functions cimport slice_dataframe
 from nautilus_trader.data.engine cimport DataEngine
+from nautilus_trader.data.wrangling cimport OrderBookDeltaDataWrangler
 from nautilus_trader.data.wrangling cimport QuoteTickDataWrangler
 from nautilus_trader.data.wrangling cimport TradeTickDataWrangler
+from nautilus_trader.model.bar cimport Bar
+from nautilus_trader.model.bar cimport BarData
+from nautilus_trader.model.bar cimport BarSpecification
+from nautilus_trader.model.bar cimport BarType
 from nautilus_trader.model.c_enums.bar_aggregation cimport BarAggregation
 from nautilus_trader.model.c_enums.bar_aggregation cimport BarAggregationParser
 from nautilus_trader.model.c_enums.order_side cimport OrderSideParser
+from nautilus_trader.model.c_enums.price_type cimport PriceType
 from nautilus_trader.model.identifiers cimport TradeMatchId
 from nautilus_trader.model.objects cimport Price
 from nautilus_trader.model.objects cimport Quantity
+from nautilus_trader.model.order_book cimport OrderBookDelta
 from nautilus_trader.model.tick cimport QuoteTick
 
 
@@ -54,6 +61,7 @@ cdef class BacktestDataProducer:
         DataEngine engine not None,
         Clock clock not None,
         Logger logger not None,
+        bint bar_execution=False,
     ):
         """
         Initialize a new instance of the `BacktestDataProducer` class.
@@ -66,11 +74,15 @@ cdef class BacktestDataProducer:
             The clock for the component.
         logger : Logger
             The logger for the component.
+        bar_execution : bool, optional
+            If symbols with only bar data should produce bid and ask bars
+            directly, rather than expanding each bar into four quote ticks.
 
         """
         self._clock = clock
         self._log = LoggerAdapter(type(self).__name__, logger)
         self._data_engine = engine
+        self.bar_execution = bar_execution
 
         # Check data integrity
         data.check_integrity()
@@ -86,8 +98,14 @@ cdef class BacktestDataProducer:
         # Prepare data
         self._quote_tick_data = pd.DataFrame()
         self._trade_tick_data = pd.DataFrame()
+        self._order_book_data = pd.DataFrame()
+        self._bar_data = pd.DataFrame()
+        self._bar_types_bid = {}
+        self._bar_types_ask = {}
         cdef list quote_tick_frames = []
         cdef list trade_tick_frames = []
+        cdef list order_book_frames = []
+        cdef list bar_frames = []
         self.execution_resolutions = []
 
         timing_start_total = datetime.utcnow()
@@ -99,9 +117,37 @@ cdef class BacktestDataProducer:
 
             execution_resolution = None
 
+            # Process bar data for bar execution
+            # ----------------------------------
+            if self.bar_execution and data.has_quote_data(symbol) and symbol not in data.quote_ticks:
+                timing_start = datetime.utcnow()  # Time data processing
+                bar_wrangler = QuoteTickDataWrangler(
+                    instrument=instrument,
+                    data_bars_bid=self._data.bars_bid.get(symbol),
+                    data_bars_ask=self._data.bars_ask.get(symbol),
+                )
+
+                # noinspection PyUnresolvedReferences
+                bar_wrangler.pre_process_bars(symbol_counter)
+                bar_frames.append(bar_wrangler.processed_data)
+
+                self._bar_types_bid[symbol_counter] = BarType(
+                    symbol,
+                    BarSpecification(1, bar_wrangler.resolution, PriceType.BID),
+                )
+                self._bar_types_ask[symbol_counter] = BarType(
+                    symbol,
+                    BarSpecification(1, bar_wrangler.resolution, PriceType.ASK),
+                )
+
+                execution_resolution = BarAggregationParser.to_str(bar_wrangler.resolution)
+                self._log.info(f"Prepared {len(bar_wrangler.processed_data):,} {symbol} bar rows in "
+                               f"{round((datetime.utcnow() - timing_start).total_seconds(), 2)}s.")
+                del bar_wrangler  # Dump processing artifact
+
             # Process quote tick data
             # -----------------------
-            if data.has_quote_data(symbol):
+            elif data.has_quote_data(symbol):
                 timing_start = datetime.utcnow()  # Time data processing
                 quote_wrangler = QuoteTickDataWrangler(
                     instrument=instrument,
@@ -137,6 +183,24 @@ cdef class BacktestDataProducer:
                                f"{round((datetime.utcnow() - timing_start).total_seconds(), 2)}s.")
                 del trade_wrangler  # Dump processing artifact
 
+            # Process order book delta data
+            # -----------------------------
+            if data.has_order_book_data(symbol):
+                timing_start = datetime.utcnow()  # Time data processing
+                delta_wrangler = OrderBookDeltaDataWrangler(
+                    instrument=instrument,
+                    data=self._data.order_book_deltas.get(symbol),
+                )
+
+                # noinspection PyUnresolvedReferences
+                delta_wrangler.pre_process(symbol_counter)
+                order_book_frames.append(delta_wrangler.processed_data)
+
+                execution_resolution = BarAggregationParser.to_str(BarAggregation.TICK)
+                self._log.info(f"Prepared {len(delta_wrangler.processed_data):,} {symbol} order book delta rows in "
+                               f"{round((datetime.utcnow() - timing_start).total_seconds(), 2)}s.")
+                del delta_wrangler  # Dump processing artifact
+
             if execution_resolution is None:
                 self._log.warning(f"No execution level data for {symbol}.")
 
@@ -155,24 +219,26 @@ cdef class BacktestDataProducer:
             self._trade_tick_data = pd.concat(trade_tick_frames)
             self._trade_tick_data.sort_index(axis=0, kind="mergesort", inplace=True)
 
+        if order_book_frames:
+            self._order_book_data = pd.concat(order_book_frames)
+            self._order_book_data.sort_index(axis=0, kind="mergesort", inplace=True)
+
+        if bar_frames:
+            self._bar_data = pd.concat(bar_frames)
+            self._bar_data.sort_index(axis=0, kind="mergesort", inplace=True)
+
         # Set min and max timestamps
         self.min_timestamp = None
         self.max_timestamp = None
 
-        if not self._quote_tick_data.empty:
-            self.min_timestamp = self._quote_tick_data.index.min()
-            self.max_timestamp = self._quote_tick_data.index.max()
-
-        if not self._trade_tick_data.empty:
-            if self.min_timestamp is None:
-                self.min_timestamp = self._trade_tick_data.index.min()
-            else:
-                self.min_timestamp = max(self._quote_tick_data.index, self._trade_tick_data.index)
-
-            if self.max_timestamp is None:
-                self.max_timestamp = self._trade_tick_data.index.max()
-            else:
-                self.max_timestamp = min(self._quote_tick_data.index, self._trade_tick_data.index)
+        # The common range is where every non-empty data stream is available
+        for stream_data in (self._quote_tick_data, self._trade_tick_data, self._order_book_data, self._bar_data):
+            if stream_data.empty:
+                continue
+            if self.min_timestamp is None or stream_data.index.min() > self.min_timestamp:
+                self.min_timestamp = stream_data.index.min()
+            if self.max_timestamp is None or stream_data.index.max() < self.max_timestamp:
+                self.max_timestamp = stream_data.index.max()
 
         # Initialize backing fields
         self._quote_symbols = None
@@ -195,11 +261,30 @@ cdef class BacktestDataProducer:
         self._trade_index_last = 0
         self._next_trade_tick = None
 
+        self._delta_symbols = None
+        self._delta_sides = None
+        self._delta_prices = None
+        self._delta_sizes = None
+        self._delta_timestamps = None
+        self._delta_index = 0
+        self._delta_index_last = 0
+        self._next_delta = None
+
+        self._bar_symbols = None
+        self._bar_values = None
+        self._bar_timestamps = None
+        self._bar_index = 0
+        self._bar_index_last = 0
+        self._next_bid_bar = None
+        self._next_ask_bar = None
+
         self.has_tick_data = False
 
         processing_time = round((datetime.utcnow() - timing_start_total).total_seconds(), 2)
-        self._log.info(f"Prepared {len(self._quote_tick_data) + len(self._trade_tick_data):,} "
-                       f"total tick rows in {processing_time}s.")
+        cdef int total_rows = len(self._quote_tick_data) + len(self._trade_tick_data) + len(self._order_book_data)
+        self._log.info(f"Prepared {total_rows:,} total tick rows in {processing_time}s.")
+        if not self._bar_data.empty:
+            self._log.info(f"Prepared {len(self._bar_data):,} total bar rows for bar execution.")
 
         gc.collect()  # Garbage collection to remove redundant processing artifacts
 
@@ -236,7 +321,7 @@ cdef class BacktestDataProducer:
             self._quote_asks = quote_ticks_slice["ask"].values
             self._quote_bid_sizes = quote_ticks_slice["bid_size"].values
             self._quote_ask_sizes = quote_ticks_slice["ask_size"].values
-            self._quote_timestamps = np.asarray([<datetime>dt for dt in quote_ticks_slice.index])
+            self._quote_timestamps = quote_ticks_slice.index.asi8
 
             # Calculate cumulative data size
             total_size += get_size_of(self._quote_symbols)
@@ -263,7 +348,7 @@ cdef class BacktestDataProducer:
             self._trade_sizes = trade_ticks_slice["quantity"].values
             self._trade_match_ids = trade_ticks_slice["match_id"].values
             self._trade_sides = trade_ticks_slice["side"].values
-            self._trade_timestamps = np.asarray([<datetime>dt for dt in trade_ticks_slice.index])
+            self._trade_timestamps = trade_ticks_slice.index.asi8
 
             # Calculate cumulative data size
             total_size += get_size_of(self._trade_symbols)
@@ -280,12 +365,67 @@ cdef class BacktestDataProducer:
             # Prepare initial tick
             self._iterate_trade_ticks()
 
+        # Build order book delta data stream
+        if not self._order_book_data.empty:
+            # See slice_dataframe function comments on why [:] isn't used
+            deltas_slice = slice_dataframe(self._order_book_data, start, stop)
+
+            self._delta_symbols = deltas_slice["symbol"].to_numpy(dtype=np.ushort)
+            self._delta_sides = deltas_slice["side"].values
+            self._delta_prices = deltas_slice["price"].values
+            self._delta_sizes = deltas_slice["size"].values
+            self._delta_timestamps = deltas_slice.index.asi8
+
+            # Calculate cumulative data size
+            total_size += get_size_of(self._delta_symbols)
+            total_size += get_size_of(self._delta_sides)
+            total_size += get_size_of(self._delta_prices)
+            total_size += get_size_of(self._delta_sizes)
+            total_size += get_size_of(self._delta_timestamps)
+
+            # Set indexing
+            self._delta_index = 0
+            self._delta_index_last = len(deltas_slice) - 1
+
+            # Prepare initial delta
+            self._iterate_deltas()
+
+        # Build bar data stream
+        if not self._bar_data.empty:
+            # See slice_dataframe function comments on why [:] isn't used
+            bars_slice = slice_dataframe(self._bar_data, start, stop)
+
+            self._bar_symbols = bars_slice["symbol"].to_numpy(dtype=np.ushort)
+            self._bar_values = bars_slice.drop(columns="symbol").to_numpy(dtype=object)
+            self._bar_timestamps = bars_slice.index.asi8
+
+            # Calculate cumulative data size
+            total_size += get_size_of(self._bar_symbols)
+            total_size += get_size_of(self._bar_values)
+            total_size += get_size_of(self._bar_timestamps)
+
+            # Set indexing
+            self._bar_index = 0
+            self._bar_index_last = len(bars_slice) - 1
+
+            # Prepare initial bars
+            self._iterate_bars()
+
         self.has_tick_data = True
 
         self._log.info(f"Data stream size: {format_bytes(total_size)}")
 
     cdef Tick next_tick(self):
         cdef Tick next_tick
+        # Order book deltas are only emitted ahead of strictly later ticks, so
+        # that for equal timestamps quotes and trades are processed first
+        if self._next_delta is not None:
+            if (self._next_quote_tick is None or self._next_delta.timestamp_ns < self._next_quote_tick.timestamp_ns) \
+                    and (self._next_trade_tick is None or self._next_delta.timestamp_ns < self._next_trade_tick.timestamp_ns):
+                next_tick = self._next_delta
+                self._iterate_deltas()
+                return next_tick
+
         # Quote ticks only
         if self._next_trade_tick is None:
             next_tick = self._next_quote_tick
@@ -298,7 +438,7 @@ cdef class BacktestDataProducer:
             return next_tick
 
         # Mixture of quote and trade ticks
-        if self._next_quote_tick.timestamp <= self._next_trade_tick.timestamp:
+        if self._next_quote_tick.timestamp_ns <= self._next_trade_tick.timestamp_ns:
             next_tick = self._next_quote_tick
             self._iterate_quote_ticks()
             return next_tick
@@ -307,6 +447,27 @@ cdef class BacktestDataProducer:
             self._iterate_trade_ticks()
             return next_tick
 
+    cdef bint is_next_bars(self) except *:
+        # Return a value indicating whether the next data in time order is a
+        # pair of bid and ask bars. For equal timestamps ticks are processed first.
+        if self._next_bid_bar is None:
+            return False
+
+        cdef long long timestamp_ns = self._next_bid_bar.bar.timestamp_ns
+        if self._next_quote_tick is not None and self._next_quote_tick.timestamp_ns <= timestamp_ns:
+            return False
+        if self._next_trade_tick is not None and self._next_trade_tick.timestamp_ns <= timestamp_ns:
+            return False
+        if self._next_delta is not None and self._next_delta.timestamp_ns <= timestamp_ns:
+            return False
+
+        return True
+
+    cdef tuple next_bars(self):
+        cdef tuple next_bars = (self._next_bid_bar, self._next_ask_bar)
+        self._iterate_bars()
+        return next_bars
+
     cdef inline QuoteTick _generate_quote_tick(self, int index):
         return QuoteTick(
             self._symbol_index[self._quote_symbols[index]],
@@ -314,7 +475,7 @@ cdef class BacktestDataProducer:
             Price(self._quote_asks[index]),
             Quantity(self._quote_bid_sizes[index]),
             Quantity(self._quote_ask_sizes[index]),
-            self._quote_timestamps[index],
+            timestamp_ns=self._quote_timestamps[index],
         )
 
     cdef inline TradeTick _generate_trade_tick(self, int index):
@@ -324,7 +485,45 @@ cdef class BacktestDataProducer:
             Quantity(self._trade_sizes[index]),
             OrderSideParser.from_str(self._trade_sides[index]),
             TradeMatchId(self._trade_match_ids[index]),
-            self._trade_timestamps[index],
+            timestamp_ns=self._trade_timestamps[index],
+        )
+
+    cdef inline OrderBookDelta _generate_delta(self, int index):
+        return OrderBookDelta(
+            self._symbol_index[self._delta_symbols[index]],
+            OrderSideParser.from_str(self._delta_sides[index]),
+            Price(self._delta_prices[index]),
+            Quantity(self._delta_sizes[index]),
+            timestamp_ns=self._delta_timestamps[index],
+        )
+
+    cdef inline void _generate_bars(self, int index) except *:
+        cdef unsigned short symbol_index = self._bar_symbols[index]
+        cdef str[:] values = self._bar_values[index]
+        cdef long long timestamp_ns = self._bar_timestamps[index]
+
+        # Values are [bid OHLC, ask OHLC, bid volume, ask volume]
+        self._next_bid_bar = BarData(
+            self._bar_types_bid[symbol_index],
+            Bar(
+                Price(values[0]),
+                Price(values[1]),
+                Price(values[2]),
+                Price(values[3]),
+                Quantity(values[8]),
+                timestamp_ns=timestamp_ns,
+            ),
+        )
+        self._next_ask_bar = BarData(
+            self._bar_types_ask[symbol_index],
+            Bar(
+                Price(values[4]),
+                Price(values[5]),
+                Price(values[6]),
+                Price(values[7]),
+                Quantity(values[9]),
+                timestamp_ns=timestamp_ns,
+            ),
         )
 
     cdef inline void _iterate_quote_ticks(self) except *:
@@ -333,7 +532,7 @@ cdef class BacktestDataProducer:
             self._quote_index += 1
         else:
             self._next_quote_tick = None
-            if self._next_trade_tick is None:
+            if self._next_trade_tick is None and self._next_delta is None and self._next_bid_bar is None:
                 self.has_tick_data = False
 
     cdef inline void _iterate_trade_ticks(self) except *:
@@ -342,7 +541,26 @@ cdef class BacktestDataProducer:
             self._trade_index += 1
         else:
             self._next_trade_tick = None
-            if self._next_quote_tick is None:
+            if self._next_quote_tick is None and self._next_delta is None and self._next_bid_bar is None:
+                self.has_tick_data = False
+
+    cdef inline void _iterate_deltas(self) except *:
+        if self._delta_index <= self._delta_index_last:
+            self._next_delta = self._generate_delta(self._delta_index)
+            self._delta_index += 1
+        else:
+            self._next_delta = None
+            if self._next_quote_tick is None and self._next_trade_tick is None and self._next_bid_bar is None:
+                self.has_tick_data = False
+
+    cdef inline void _iterate_bars(self) except *:
+        if self._bar_index <= self._bar_index_last:
+            self._generate_bars(self._bar_index)
+            self._bar_index += 1
+        else:
+            self._next_bid_bar = None
+            self._next_ask_bar = None
+            if self._next_quote_tick is None and self._next_trade_tick is None and self._next_delta is None:
                 self.has_tick_data = False
 
     cpdef void reset(self) except *:
@@ -371,6 +589,22 @@ cdef class BacktestDataProducer:
         self._trade_index = 0
         self._trade_index_last = len(self._quote_tick_data) - 1
 
+        self._delta_symbols = None
+        self._delta_sides = None
+        self._delta_prices = None
+        self._delta_sizes = None
+        self._delta_timestamps = None
+        self._delta_index = 0
+        self._delta_index_last = len(self._order_book_data) - 1
+
+        self._bar_symbols = None
+        self._bar_values = None
+        self._bar_timestamps = None
+        self._bar_index = 0
+        self._bar_index_last = len(self._bar_data) - 1
+        self._next_bid_bar = None
+        self._next_ask_bar = None
+
         self.has_tick_data = False
 
         self._log.info("Reset.")
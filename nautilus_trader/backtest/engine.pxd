@@ -19,7 +19,9 @@ from cpython.datetime cimport timedelta
 from nautilus_trader.analysis.performance cimport PerformanceAnalyzer
 from nautilus_trader.backtest.data_producer cimport BacktestDataProducer
 from nautilus_trader.backtest.models cimport FillModel
+from nautilus_trader.backtest.models cimport LatencyModel
 from nautilus_trader.common.clock cimport Clock
+from nautilus_trader.common.latency cimport LatencyRecorder
 from nautilus_trader.common.logging cimport Logger
 from nautilus_trader.common.logging cimport LoggerAdapter
 from nautilus_trader.common.uuid cimport UUIDFactory
@@ -27,6 +29,7 @@ from nautilus_trader.data.engine cimport DataEngine
 from nautilus_trader.execution.engine cimport ExecutionEngine
 from nautilus_trader.model.c_enums.oms_type cimport OMSType
 from nautilus_trader.model.identifiers cimport Venue
+from nautilus_trader.risk.engine cimport RiskEngine
 from nautilus_trader.trading.portfolio cimport Portfolio
 from nautilus_trader.trading.trader cimport Trader
 
@@ -50,7 +53,9 @@ cdef class BacktestEngine:
     cdef readonly timedelta time_to_initialize
     cdef readonly int iteration
     cdef readonly Portfolio portfolio
+    cdef readonly RiskEngine risk_engine
     cdef readonly PerformanceAnalyzer analyzer
+    cdef readonly LatencyRecorder latency_recorder
 
     cpdef void add_exchange(
         self,
@@ -61,8 +66,11 @@ cdef class BacktestEngine:
         bint generate_position_ids=*,
         list modules=*,
         FillModel fill_model=*,
+        bint fill_on_depth=*,
+        LatencyModel latency_model=*,
     ) except *
     cpdef void print_log_store(self) except *
+    cpdef dict get_latency_report(self)
     cpdef void reset(self) except *
     cpdef void dispose(self) except *
     cpdef void change_fill_model(self, Venue venue, FillModel model) except *
@@ -72,8 +80,10 @@ cdef class BacktestEngine:
         datetime stop=*,
         list strategies=*,
         bint print_log_store=*,
+        bint clamp_to_data=*,
     ) except *
 
+    cdef void _process_inflight(self, datetime until) except *
     cdef void _advance_time(self, datetime timestamp) except *
     cdef void _backtest_memory(self) except *
     cdef void _backtest_header(
@@ -25,10 +25,12 @@ from nautilus_trader.backtest.data_client cimport BacktestDataClient
 from nautilus_trader.backtest.exchange cimport SimulatedExchange
 from nautilus_trader.backtest.execution cimport BacktestExecClient
 from nautilus_trader.backtest.models cimport FillModel
+from nautilus_trader.backtest.models cimport LatencyModel
 from nautilus_trader.backtest.modules cimport SimulationModule
 from nautilus_trader.common.c_enums.component_state cimport ComponentState
 from nautilus_trader.common.clock cimport LiveClock
 from nautilus_trader.common.clock cimport TestClock
+from nautilus_trader.common.latency cimport LatencyRecorder
 from nautilus_trader.common.logging cimport LogLevel
 from nautilus_trader.common.logging cimport LoggerAdapter
 from nautilus_trader.common.logging cimport nautilus_header
@@ -43,12 +45,14 @@ from nautilus_trader.core.functions cimport get_size_of
 from nautilus_trader.core.functions cimport pad_string
 from nautilus_trader.execution.database cimport BypassExecutionDatabase
 from nautilus_trader.execution.engine cimport ExecutionEngine
+from nautilus_trader.model.bar cimport BarData
 from nautilus_trader.model.c_enums.oms_type cimport OMSType
 from nautilus_trader.model.identifiers cimport AccountId
 from nautilus_trader.model.identifiers cimport TraderId
 from nautilus_trader.model.identifiers cimport Venue
 from nautilus_trader.model.tick cimport Tick
 from nautilus_trader.redis.execution cimport RedisExecutionDatabase
+from nautilus_trader.risk.engine cimport RiskEngine
 from nautilus_trader.serialization.serializers cimport MsgPackCommandSerializer
 from nautilus_trader.serialization.serializers cimport MsgPackEventSerializer
 from nautilus_trader.trading.portfolio cimport Portfolio
@@ -78,6 +82,9 @@ cdef class BacktestEngine:
         bint log_thread=False,
         bint log_to_file=False,
         str log_file_path not None="backtests/",
+        dict exec_engine_config=None,
+        bint bar_execution=False,
+        bint latency_stats=False,
     ):
         """
         Initialize a new instance of the `BacktestEngine` class.
@@ -114,6 +121,18 @@ cdef class BacktestEngine:
             If log messages should log to a file.
         log_file_path : str, optional
             The name of the log file (cannot be None if log_to_file is True).
+        exec_engine_config : dict[str, object], optional
+            The configuration options for the execution engine (including the
+            execution cache retention options).
+        bar_execution : bool, optional
+            If symbols with only bar data should be executed directly against
+            the bid and ask bars, rather than expanding each bar into four quote
+            ticks. The bars are sent straight to strategies subscribed to the
+            bar types of the data (e.g. 1-MINUTE-BID and 1-MINUTE-ASK), and are
+            not aggregated into other bar types.
+        latency_stats : bool, optional
+            If the wall clock latency of each stage from a tick entering the
+            data engine to an order being sent should be recorded.
 
         Raises
         ------
@@ -222,6 +241,7 @@ cdef class BacktestEngine:
             engine=self._data_engine,
             clock=self._test_clock,
             logger=self._test_logger,
+            bar_execution=bar_execution,
         )
 
         # Create data client per venue
@@ -246,10 +266,26 @@ cdef class BacktestEngine:
             portfolio=self.portfolio,
             clock=self._test_clock,
             logger=self._test_logger,
+            config=exec_engine_config,
         )
 
         self._exec_engine.load_cache()
 
+        self.risk_engine = RiskEngine(
+            cache=self._data_engine.cache,
+            portfolio=self.portfolio,
+            clock=self._test_clock,
+            logger=self._test_logger,
+        )
+
+        self._exec_engine.register_risk_engine(self.risk_engine)
+
+        self.latency_recorder = None
+        if latency_stats:
+            self.latency_recorder = LatencyRecorder()
+            self._data_engine.register_latency_recorder(self.latency_recorder)
+            self._exec_engine.register_latency_recorder(self.latency_recorder)
+
         self.trader = Trader(
             trader_id=trader_id,
             strategies=strategies,
@@ -278,6 +314,8 @@ cdef class BacktestEngine:
         bint generate_position_ids=True,
         list modules=None,
         FillModel fill_model=None,
+        bint fill_on_depth=False,
+        LatencyModel latency_model=None,
     ) except *:
         """
         Add a `SimulatedExchange` with the given parameters to the backtest engine.
@@ -299,6 +337,12 @@ cdef class BacktestEngine:
             The simulation modules to load into the exchange.
         fill_model : FillModel, optional
             The fill model for the exchange (if None then no probabilistic fills).
+        fill_on_depth : bool, optional
+            If orders should be filled against order book depth, where order
+            book delta data has been added for the symbol.
+        latency_model : LatencyModel, optional
+            The latency model for order routing between the execution client
+            and the exchange (if None then no latency).
 
         Raises
         ------
@@ -319,6 +363,7 @@ cdef class BacktestEngine:
         Condition.not_empty(starting_balances, "starting_balances")
         Condition.list_type(modules, SimulationModule, "modules")
         Condition.type_or_none(fill_model, FillModel, "fill_model")
+        Condition.type_or_none(latency_model, LatencyModel, "latency_model")
 
         account_id = AccountId(venue.value, "001")
 
@@ -341,6 +386,7 @@ cdef class BacktestEngine:
             fill_model=fill_model,
             clock=self._test_clock,
             logger=self._test_logger,
+            fill_on_depth=fill_on_depth,
         )
 
         self._exchanges[venue] = exchange
@@ -352,6 +398,7 @@ cdef class BacktestEngine:
             engine=self._exec_engine,
             clock=self._test_clock,
             logger=self._test_logger,
+            latency_model=latency_model,
         )
 
         exchange.register_client(exec_client)
@@ -374,6 +421,21 @@ cdef class BacktestEngine:
             for message in self._test_logger.get_log_store():
                 print(message)
 
+    cpdef dict get_latency_report(self):
+        """
+        Return the report of the latency statistics recorded by the engine.
+
+        Returns
+        -------
+        dict[str, dict] or None
+            None if latency statistics are not enabled.
+
+        """
+        if self.latency_recorder is None:
+            return None
+
+        return self.latency_recorder.report()
+
     cpdef void reset(self) except *:
         """
         Reset the backtest engine.
@@ -397,6 +459,9 @@ cdef class BacktestEngine:
         for exchange in self._exchanges.values():
             exchange.reset()
 
+        if self.latency_recorder is not None:
+            self.latency_recorder.reset()
+
         self._logger.clear_log_store()
         self._test_logger.clear_log_store()
 
@@ -444,7 +509,8 @@ cdef class BacktestEngine:
         datetime start=None,
         datetime stop=None,
         list strategies=None,
-        bint print_log_store=True
+        bint print_log_store=True,
+        bint clamp_to_data=True,
     ) except *:
         """
         Run a backtest from the start datetime to the stop datetime.
@@ -459,29 +525,40 @@ cdef class BacktestEngine:
             The strategies for the backtest run (if None will use previous).
         print_log_store : bool
             If the log store should be printed at the end of the run.
+        clamp_to_data : bool
+            If the start and stop should be clamped to the range of the data. If
+            False then the clocks start from the start (which may be before the
+            data), and are advanced to the stop before the trader is stopped.
 
         Raises
         ------
         ValueError
             If the stop is >= the start datetime.
+        ValueError
+            If the start is after the end of the data, or (when not clamped) the
+            stop is before the start of the data.
 
         """
         # Setup start datetime
         if start is None:
             start = self._data_producer.min_timestamp
-        else:
+        elif clamp_to_data:
             start = max(as_utc_timestamp(start), self._data_producer.min_timestamp)
+        else:
+            start = as_utc_timestamp(start)
 
         # Setup stop datetime
         if stop is None:
             stop = self._data_producer.max_timestamp
-        else:
+        elif clamp_to_data:
             stop = min(as_utc_timestamp(stop), self._data_producer.max_timestamp)
+        else:
+            stop = as_utc_timestamp(stop)
 
         Condition.equal(start.tz, pytz.utc, "start.tz", "UTC")
         Condition.equal(stop.tz, pytz.utc, "stop.tz", "UTC")
-        Condition.true(start >= self._data_producer.min_timestamp, "start >= data_client.min_timestamp")
-        Condition.true(start <= self._data_producer.max_timestamp, "stop <= data_client.max_timestamp")
+        Condition.true(start <= self._data_producer.max_timestamp, "start <= data_client.max_timestamp")
+        Condition.true(stop >= self._data_producer.min_timestamp, "stop >= data_client.min_timestamp")
         Condition.true(start < stop, "start < stop")
         if strategies:
             Condition.not_empty(strategies, "strategies")
@@ -527,21 +604,72 @@ cdef class BacktestEngine:
         self.trader.start()
 
         cdef Tick tick
+        cdef BarData bid_data
+        cdef BarData ask_data
         # -- MAIN BACKTEST LOOP -----------------------------------------------#
         while self._data_producer.has_tick_data:
+            if self._data_producer.is_next_bars():
+                bid_data, ask_data = self._data_producer.next_bars()
+                self._process_inflight(bid_data.bar.timestamp)
+                self._advance_time(bid_data.bar.timestamp)
+                self._exchanges[bid_data.bar_type.symbol.venue].process_bars(
+                    bid_data.bar_type.symbol,
+                    bid_data.bar,
+                    ask_data.bar,
+                )
+                self._data_engine.process(bid_data)
+                self._data_engine.process(ask_data)
+                self.iteration += 1
+                continue
+
             tick = self._data_producer.next_tick()
+            self._process_inflight(tick.timestamp)
             self._advance_time(tick.timestamp)
             self._exchanges[tick.symbol.venue].process_tick(tick)
             self._data_engine.process(tick)
             self.iteration += 1
         # ---------------------------------------------------------------------#
 
+        if not clamp_to_data and stop > self._test_clock.utc_now():
+            # Run the clocks on to the stop after the last data point
+            self._process_inflight(stop)
+            self._advance_time(stop)
+
+        self._process_inflight(None)  # Deliver any messages still in flight
         self.trader.stop()
+        self._process_inflight(None)  # Deliver any messages sent on stop
 
         self._backtest_footer(run_started, self._clock.utc_now(), start, stop)
         if print_log_store:
             self.print_log_store()
 
+    cdef void _process_inflight(self, datetime until) except *:
+        # Deliver all messages in flight between the execution clients and
+        # exchanges which arrive at or before the given time (if None then
+        # deliver all), in arrival order across clients.
+        cdef SimulatedExchange exchange
+        cdef BacktestExecClient client
+        cdef BacktestExecClient next_client
+        cdef datetime arrival
+        cdef datetime next_arrival
+        while True:
+            next_client = None
+            next_arrival = None
+            for exchange in self._exchanges.values():
+                client = exchange.exec_client
+                if not client.has_inflight():
+                    continue
+                arrival = client.next_inflight_time()
+                if next_arrival is None or arrival < next_arrival:
+                    next_client = client
+                    next_arrival = arrival
+
+            if next_client is None or (until is not None and next_arrival > until):
+                return  # Nothing further in flight before the given time
+
+            self._advance_time(next_arrival)
+            next_client.process_next_inflight()
+
     cdef void _advance_time(self, datetime timestamp) except *:
         cdef TradingStrategy strategy
         cdef TimeEventHandler event_handler
@@ -13,14 +13,18 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+from cpython.datetime cimport datetime
+
 from nautilus_trader.backtest.execution cimport BacktestExecClient
 from nautilus_trader.backtest.models cimport FillModel
 from nautilus_trader.common.clock cimport Clock
 from nautilus_trader.common.logging cimport LoggerAdapter
 from nautilus_trader.common.uuid cimport UUIDFactory
 from nautilus_trader.execution.cache cimport ExecutionCache
+from nautilus_trader.model.bar cimport Bar
 from nautilus_trader.model.c_enums.liquidity_side cimport LiquiditySide
 from nautilus_trader.model.c_enums.oms_type cimport OMSType
+from nautilus_trader.model.c_enums.order_side cimport OrderSide
 from nautilus_trader.model.c_enums.price_type cimport PriceType
 from nautilus_trader.model.commands cimport CancelOrder
 from nautilus_trader.model.commands cimport ModifyOrder
@@ -36,10 +40,12 @@ from nautilus_trader.model.identifiers cimport Symbol
 from nautilus_trader.model.identifiers cimport Venue
 from nautilus_trader.model.objects cimport Money
 from nautilus_trader.model.objects cimport Price
+from nautilus_trader.model.objects cimport Quantity
 from nautilus_trader.model.order cimport LimitOrder
 from nautilus_trader.model.order cimport MarketOrder
 from nautilus_trader.model.order cimport Order
 from nautilus_trader.model.order cimport PassiveOrder
+from nautilus_trader.model.order_book cimport OrderBook
 from nautilus_trader.model.tick cimport Tick
 from nautilus_trader.trading.calculators cimport ExchangeRateCalculator
 
@@ -66,12 +72,17 @@ cdef class SimulatedExchange:
 
     cdef readonly ExchangeRateCalculator xrate_calculator
     cdef readonly FillModel fill_model
+    cdef readonly bint fill_on_depth
     cdef readonly list modules
 
     cdef readonly dict instruments
     cdef readonly dict data_ticks
     cdef dict _market_bids
     cdef dict _market_asks
+    cdef dict _order_books
+    cdef dict _queue_ahead
+    cdef dict _order_ids
+    cdef dict _filled_qty
     cdef dict _slippages
 
     cdef dict _working_orders
@@ -88,6 +99,7 @@ cdef class SimulatedExchange:
     cpdef void set_fill_model(self, FillModel fill_model) except *
     cpdef void initialize_account(self) except *
     cpdef void process_tick(self, Tick tick) except *
+    cpdef void process_bars(self, Symbol symbol, Bar bid_bar, Bar ask_bar) except *
     cpdef void check_residuals(self) except *
     cpdef void reset(self) except *
 
@@ -120,6 +132,7 @@ cdef class SimulatedExchange:
     cdef inline void _reject_order(self, Order order, str reason) except *
     cdef inline void _cancel_reject_order(self, ClientOrderId order_id, str response, str reason) except *
     cdef inline void _expire_order(self, PassiveOrder order) except *
+    cdef inline void _process_working_orders(self, Symbol symbol, Tick tick, Price bid, Price ask, datetime now) except *
     cdef inline void _process_order(self, Order order) except *
     cdef inline void _process_market_order(self, MarketOrder order, Price market_bid, Price market_ask) except *
     cdef inline void _process_limit_order(self, LimitOrder order, Price market_bid, Price market_ask) except *
@@ -131,9 +144,17 @@ cdef class SimulatedExchange:
     cdef inline void _auction_sell_order(self, PassiveOrder order, Price market) except *
     cdef inline void _auction_sell_stop_order(self, PassiveOrder order, Price market) except *
     cdef inline void _auction_sell_limit_order(self, PassiveOrder order, Price market) except *
+    cdef inline void _auction_limit_order_on_depth(self, PassiveOrder order, Tick tick, Price market_bid, Price market_ask) except *
+    cdef inline void _fill_order_on_depth(self, Order order, Price limit_price) except *
+    cdef inline OrderId _order_id(self, Order order)
+    cdef inline Quantity _order_filled_qty(self, Order order)
+    cdef inline bint _has_order_book(self, Symbol symbol) except *
+    cdef inline bint _has_depth(self, Symbol symbol, OrderSide side) except *
+    cdef inline object _level_qty_ahead(self, PassiveOrder order)
+    cdef inline void _update_market_from_book(self, OrderBook order_book) except *
     cdef inline bint _is_marginal_limit_fill(self, Price order_price, Price market) except *
     cdef inline bint _is_marginal_stop_fill(self, Price order_price, Price market) except *
-    cdef inline void _fill_order(self, Order order, Price fill_price, LiquiditySide liquidity_side) except *
+    cdef inline void _fill_order(self, Order order, Price fill_price, LiquiditySide liquidity_side, Quantity fill_qty=*) except *
     cdef inline void _clean_up_child_orders(self, ClientOrderId order_id) except *
     cdef inline void _check_oco_order(self, ClientOrderId order_id) except *
     cdef inline void _reject_oco_order(self, PassiveOrder order, ClientOrderId oco_order_id) except *
@@ -24,6 +24,7 @@ from nautilus_trader.common.logging cimport TestLogger
 from nautilus_trader.common.uuid cimport UUIDFactory
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.execution.cache cimport ExecutionCache
+from nautilus_trader.model.bar cimport Bar
 from nautilus_trader.model.c_enums.liquidity_side cimport LiquiditySide
 from nautilus_trader.model.c_enums.oms_type cimport OMSType
 from nautilus_trader.model.c_enums.order_side cimport OrderSide
@@ -58,9 +59,12 @@ from nautilus_trader.model.objects cimport Quantity
 from nautilus_trader.model.order cimport LimitOrder
 from nautilus_trader.model.order cimport MarketOrder
 from nautilus_trader.model.order cimport PassiveOrder
+from nautilus_trader.model.order_book cimport OrderBook
+from nautilus_trader.model.order_book cimport OrderBookDelta
 from nautilus_trader.model.position cimport Position
 from nautilus_trader.model.tick cimport Tick
 from nautilus_trader.model.tick cimport QuoteTick
+from nautilus_trader.model.tick cimport TradeTick
 from nautilus_trader.trading.calculators cimport ExchangeRateCalculator
 
 
@@ -82,6 +86,7 @@ cdef class SimulatedExchange:
         FillModel fill_model not None,
         TestClock clock not None,
         TestLogger logger not None,
+        bint fill_on_depth=False,
     ):
         """
         Initialize a new instance of the `SimulatedExchange` class.
@@ -106,6 +111,11 @@ cdef class SimulatedExchange:
             The clock for the component.
         logger : TestLogger
             The logger for the component.
+        fill_on_depth : bool
+            If orders should be filled against order book depth. Market and
+            marketable limit orders walk the opposite side of the book, and
+            resting limit orders track their queue position at their price
+            level. Only applies to symbols with order book delta data.
 
         """
         Condition.not_empty(instruments, "instruments")
@@ -136,6 +146,7 @@ cdef class SimulatedExchange:
 
         self.xrate_calculator = ExchangeRateCalculator()
         self.fill_model = fill_model
+        self.fill_on_depth = fill_on_depth
 
         # Load modules
         self.modules = []
@@ -155,6 +166,10 @@ cdef class SimulatedExchange:
         self._slippages = self._get_tick_sizes()
         self._market_bids = {}          # type: dict[Symbol, Price]
         self._market_asks = {}          # type: dict[Symbol, Price]
+        self._order_books = {}          # type: dict[Symbol, OrderBook]
+        self._queue_ahead = {}          # type: dict[ClientOrderId, Decimal]
+        self._order_ids = {}            # type: dict[ClientOrderId, OrderId]
+        self._filled_qty = {}           # type: dict[ClientOrderId, Quantity]
 
         self._working_orders = {}       # type: dict[ClientOrderId, Order]
         self._position_index = {}       # type: dict[ClientOrderId, PositionId]
@@ -227,7 +242,8 @@ cdef class SimulatedExchange:
         Parameters
         ----------
         tick : Tick
-            The tick data to process with. Can be `QuoteTick` or `TradeTick`.
+            The tick data to process with. Can be `QuoteTick`, `TradeTick` or
+            `OrderBookDelta`.
 
         """
         Condition.not_none(tick, "tick")
@@ -239,7 +255,19 @@ cdef class SimulatedExchange:
         # Update market bid and ask
         cdef Price bid
         cdef Price ask
-        if isinstance(tick, QuoteTick):
+        cdef OrderBook order_book
+        if isinstance(tick, OrderBookDelta):
+            order_book = self._order_books.get(symbol)
+            if order_book is None:
+                order_book = OrderBook(symbol)
+                self._order_books[symbol] = order_book
+            order_book.apply(tick)
+            self._update_market_from_book(order_book)
+            bid = self._market_bids.get(symbol)
+            ask = self._market_asks.get(symbol)
+            if bid is None or ask is None:
+                return  # Market not yet initialized
+        elif isinstance(tick, QuoteTick):
             bid = tick.bid
             ask = tick.ask
             self._market_bids[symbol] = bid
@@ -262,23 +290,98 @@ cdef class SimulatedExchange:
 
         cdef datetime now = self._clock.utc_now()
 
-        # Iterate through modules
+        # Iterate through modules (order book deltas are not market prices)
         cdef SimulationModule module
-        for module in self.modules:
-            module.process(tick, now)
+        if not isinstance(tick, OrderBookDelta):
+            for module in self.modules:
+                module.process(tick, now)
+
+        self._process_working_orders(symbol, tick, bid, ask, now)
+
+    cpdef void process_bars(self, Symbol symbol, Bar bid_bar, Bar ask_bar) except *:
+        """
+        Process the exchanges market for the given symbol with the given bid
+        and ask bars, without expanding them into ticks.
+
+        Working orders are matched against each bars range in a single step,
+        by walking a deterministic intrabar path through the open, high, low
+        and close prices. Where the bid bar closes at or above its open the
+        low is assumed to trade before the high, otherwise the high is assumed
+        to trade before the low.
+
+        Parameters
+        ----------
+        symbol : Symbol
+            The symbol for the bars.
+        bid_bar : Bar
+            The bid bar to process with.
+        ask_bar : Bar
+            The ask bar to process with.
 
+        """
+        Condition.not_none(symbol, "symbol")
+        Condition.not_none(bid_bar, "bid_bar")
+        Condition.not_none(ask_bar, "ask_bar")
+
+        self._clock.set_time(bid_bar.timestamp)
+
+        cdef datetime now = self._clock.utc_now()
+
+        cdef list bid_path
+        cdef list ask_path
+        if bid_bar.close >= bid_bar.open:
+            bid_path = [bid_bar.open, bid_bar.low, bid_bar.high, bid_bar.close]
+            ask_path = [ask_bar.open, ask_bar.low, ask_bar.high, ask_bar.close]
+        else:
+            bid_path = [bid_bar.open, bid_bar.high, bid_bar.low, bid_bar.close]
+            ask_path = [ask_bar.open, ask_bar.high, ask_bar.low, ask_bar.close]
+
+        cdef int i
+        cdef Price bid
+        cdef Price ask
+        for i in range(4):
+            bid = bid_path[i]
+            ask = ask_path[i]
+            self._market_bids[symbol] = bid
+            self._market_asks[symbol] = ask
+            self._process_working_orders(symbol, None, bid, ask, now)
+
+        # Iterate through modules with the closing prices
+        cdef QuoteTick tick
+        cdef SimulationModule module
+        if self.modules:
+            tick = QuoteTick(
+                symbol,
+                bid_bar.close,
+                ask_bar.close,
+                bid_bar.volume,
+                ask_bar.volume,
+                bid_bar.timestamp,
+            )
+            for module in self.modules:
+                module.process(tick, now)
+
+    cdef inline void _process_working_orders(
+        self,
+        Symbol symbol,
+        Tick tick,
+        Price bid,
+        Price ask,
+        datetime now,
+    ) except *:
+        # Simulate market dynamics against the working orders for the symbol,
+        # the tick is None when processing bars.
         cdef PassiveOrder order
-        cdef Instrument instrument
         for order in self._working_orders.copy().values():  # Copy dict for safe loop
-            if order.symbol != tick.symbol:
+            if order.symbol != symbol:
                 continue  # Order is for a different symbol
-            if not order.is_working_c():
-                continue  # Orders state has changed since the loop started
-
-            instrument = self.instruments[order.symbol]
+            if order.cl_ord_id not in self._working_orders:
+                continue  # Order is no longer working since the loop started
 
             # Check for order fill
-            if order.side == OrderSide.BUY:
+            if order.type == OrderType.LIMIT and tick is not None and self._has_order_book(order.symbol):
+                self._auction_limit_order_on_depth(order, tick, bid, ask)
+            elif order.side == OrderSide.BUY:
                 self._auction_buy_order(order, ask)
             elif order.side == OrderSide.SELL:
                 self._auction_sell_order(order, bid)
@@ -288,6 +391,8 @@ cdef class SimulatedExchange:
             # Check for order expiry
             if order.expire_time and now >= order.expire_time:
                 self._working_orders.pop(order.cl_ord_id, None)
+                self._queue_ahead.pop(order.cl_ord_id, None)
+                self._filled_qty.pop(order.cl_ord_id, None)
                 self._expire_order(order)
 
     cpdef void check_residuals(self) except *:
@@ -323,6 +428,10 @@ cdef class SimulatedExchange:
 
         self._market_bids.clear()
         self._market_asks.clear()
+        self._order_books.clear()
+        self._queue_ahead.clear()
+        self._order_ids.clear()
+        self._filled_qty.clear()
         self._working_orders.clear()
         self._position_index.clear()
         self._child_orders.clear()
@@ -389,6 +498,9 @@ cdef class SimulatedExchange:
 
         # Remove from working orders (checked it was in dictionary above)
         del self._working_orders[command.cl_ord_id]
+        self._queue_ahead.pop(command.cl_ord_id, None)
+        self._filled_qty.pop(command.cl_ord_id, None)
+        self._order_ids.pop(command.cl_ord_id, None)
 
         self.exec_client.handle_event(cancelled)
         self._check_oco_order(command.cl_ord_id)
@@ -452,7 +564,7 @@ cdef class SimulatedExchange:
         cdef OrderModified modified = OrderModified(
             command.account_id,
             order.cl_ord_id,
-            order.id,
+            self._order_id(order),
             command.quantity,
             command.price,
             self._clock.utc_now(),
@@ -462,6 +574,10 @@ cdef class SimulatedExchange:
 
         self.exec_client.handle_event(modified)
 
+        if order.type == OrderType.LIMIT and self._has_order_book(order.symbol):
+            # Modified orders lose their queue priority
+            self._queue_ahead[order.cl_ord_id] = self._level_qty_ahead(order)
+
 # --------------------------------------------------------------------------------------------------
 
     cpdef void adjust_account(self, Money adjustment) except *:
@@ -566,11 +682,13 @@ cdef class SimulatedExchange:
 
     cdef inline void _accept_order(self, Order order) except *:
         # Generate event
+        cdef OrderId order_id = self._generate_order_id(order.symbol)
+        self._order_ids[order.cl_ord_id] = order_id
 
         cdef OrderAccepted accepted = OrderAccepted(
             self.exec_client.account_id,
             order.cl_ord_id,
-            self._generate_order_id(order.symbol),
+            order_id,
             self._clock.utc_now(),
             self._uuid_factory.generate(),
             self._clock.utc_now(),
@@ -579,7 +697,9 @@ cdef class SimulatedExchange:
         self.exec_client.handle_event(accepted)
 
     cdef inline void _reject_order(self, Order order, str reason) except *:
-        if order.state_c() != OrderState.SUBMITTED:
+        # The exchanges own view of the order is checked, as the orders state
+        # may lag behind the exchange where events are in flight.
+        if order.cl_ord_id in self._working_orders or order.is_completed_c():
             self._log.error(f"Cannot reject order, state was {order.state_string_c()}.")
             return
 
@@ -620,11 +740,12 @@ cdef class SimulatedExchange:
         cdef OrderExpired expired = OrderExpired(
             self.exec_client.account_id,
             order.cl_ord_id,
-            order.id,
+            self._order_id(order),
             order.expire_time,
             self._uuid_factory.generate(),
             self._clock.utc_now(),
         )
+        self._order_ids.pop(order.cl_ord_id, None)  # Order no longer working
 
         self.exec_client.handle_event(expired)
 
@@ -676,6 +797,10 @@ cdef class SimulatedExchange:
     cdef inline void _process_market_order(self, MarketOrder order, Price market_bid, Price market_ask) except *:
         self._accept_order(order)
 
+        if self._has_depth(order.symbol, Order.opposite_side_c(order.side)):
+            self._fill_order_on_depth(order, None)
+            return  # Filled against the order book
+
         if order.side == OrderSide.BUY:
             if self.fill_model.is_slipped():
                 self._fill_order(
@@ -698,6 +823,16 @@ cdef class SimulatedExchange:
             raise RuntimeError(f"Invalid order side, was {OrderSideParser.to_str(order.side)}")
 
     cdef inline void _process_limit_order(self, LimitOrder order, Price market_bid, Price market_ask) except *:
+        if not order.is_post_only and self._has_depth(order.symbol, Order.opposite_side_c(order.side)):
+            if (order.side == OrderSide.BUY and order.price >= market_ask) \
+                    or (order.side == OrderSide.SELL and order.price <= market_bid):
+                # Marketable limit order takes liquidity up to its price, any
+                # remainder then rests in the book.
+                self._accept_order(order)
+                self._work_order(order)
+                self._fill_order_on_depth(order, order.price)
+                return
+
         if order.side == OrderSide.BUY:
             if order.price >= market_ask:
                 if order.is_post_only:
@@ -743,11 +878,15 @@ cdef class SimulatedExchange:
         # Order now becomes working
         self._working_orders[order.cl_ord_id] = order
 
+        if order.type == OrderType.LIMIT and self._has_order_book(order.symbol):
+            # Order joins the back of the queue at its price level
+            self._queue_ahead[order.cl_ord_id] = self._level_qty_ahead(order)
+
         # Generate event
         cdef OrderWorking working = OrderWorking(
             self.exec_client.account_id,
             order.cl_ord_id,
-            order.id,
+            self._order_id(order),
             order.symbol,
             order.side,
             order.type,
@@ -828,6 +967,116 @@ cdef class SimulatedExchange:
                 LiquiditySide.MAKER,
             )
 
+    cdef inline void _auction_limit_order_on_depth(
+        self,
+        PassiveOrder order,
+        Tick tick,
+        Price market_bid,
+        Price market_ask,
+    ) except *:
+        # Check whether the market has traded through or crossed the order
+        if order.side == OrderSide.BUY:
+            if market_ask <= order.price or (isinstance(tick, TradeTick) and tick.price < order.price):
+                self._fill_order(order, order.price, LiquiditySide.MAKER)
+                return  # Filled
+        else:
+            if market_bid >= order.price or (isinstance(tick, TradeTick) and tick.price > order.price):
+                self._fill_order(order, order.price, LiquiditySide.MAKER)
+                return  # Filled
+
+        queue_ahead = self._queue_ahead.get(order.cl_ord_id, Decimal())
+        if isinstance(tick, OrderBookDelta):
+            # Cancellations at the level are assumed to be from behind the order,
+            # unless the level becomes smaller than the queue ahead of it.
+            if tick.side == order.side and tick.price == order.price and tick.size < queue_ahead:
+                self._queue_ahead[order.cl_ord_id] = tick.size.as_decimal()
+        elif isinstance(tick, TradeTick) and tick.price == order.price:
+            # Trades at the level consume the queue ahead before filling the order
+            traded = tick.size.as_decimal()
+            if traded <= queue_ahead:
+                self._queue_ahead[order.cl_ord_id] = queue_ahead - traded
+                return  # Order still queued
+
+            self._queue_ahead[order.cl_ord_id] = Decimal()
+            leaves = order.quantity - self._order_filled_qty(order)
+            self._fill_order(
+                order,
+                order.price,
+                LiquiditySide.MAKER,
+                Quantity(min(traded - queue_ahead, leaves)),
+            )
+
+    cdef inline void _fill_order_on_depth(self, Order order, Price limit_price) except *:
+        # Walk the opposite side of the order book (up to any limit price)
+        # filling at each level, depleting the exchanges copy of the book.
+        cdef OrderBook order_book = self._order_books[order.symbol]
+        cdef OrderSide book_side = Order.opposite_side_c(order.side)
+        cdef list levels = order_book.asks() if order.side == OrderSide.BUY else order_book.bids()
+
+        leaves = order.quantity - self._order_filled_qty(order)
+        cdef Price price = None
+        cdef Quantity size
+        for price, size in levels:
+            if leaves <= 0:
+                break
+            if limit_price is not None:
+                if (order.side == OrderSide.BUY and price > limit_price) \
+                        or (order.side == OrderSide.SELL and price < limit_price):
+                    break  # Remaining levels are beyond the limit price
+            fill_qty = min(leaves, size.as_decimal())
+            leaves -= fill_qty
+            order_book.update(book_side, price, Quantity(size - fill_qty))
+            self._fill_order(order, price, LiquiditySide.TAKER, Quantity(fill_qty))
+
+        if leaves > 0 and limit_price is None:
+            # Book exhausted, assume the remainder fills at the last level price
+            self._fill_order(order, price, LiquiditySide.TAKER, Quantity(leaves))
+
+        self._update_market_from_book(order_book)
+
+    cdef inline OrderId _order_id(self, Order order):
+        # The exchanges own record of the order identifier is used, as the
+        # order may not yet have applied its accepted event where events are
+        # in flight.
+        cdef OrderId order_id = self._order_ids.get(order.cl_ord_id)
+        if order_id is not None:
+            return order_id
+        if order.id is not None:
+            return order.id
+
+        return self._generate_order_id(order.symbol)
+
+    cdef inline Quantity _order_filled_qty(self, Order order):
+        # The exchanges own record of the filled quantity is used, as the
+        # order may not yet have applied its fill events where events are
+        # in flight.
+        return self._filled_qty.get(order.cl_ord_id, order.filled_qty)
+
+    cdef inline bint _has_order_book(self, Symbol symbol) except *:
+        return self.fill_on_depth and symbol in self._order_books
+
+    cdef inline bint _has_depth(self, Symbol symbol, OrderSide side) except *:
+        if not self._has_order_book(symbol):
+            return False
+
+        cdef OrderBook order_book = self._order_books[symbol]
+        return (order_book.bid_depth() if side == OrderSide.BUY else order_book.ask_depth()) > 0
+
+    cdef inline object _level_qty_ahead(self, PassiveOrder order):
+        cdef OrderBook order_book = self._order_books.get(order.symbol)
+        if order_book is None:
+            return Decimal()
+
+        return order_book.level_qty(order.side, order.price).as_decimal()
+
+    cdef inline void _update_market_from_book(self, OrderBook order_book) except *:
+        cdef Price best_bid = order_book.best_bid_price()
+        cdef Price best_ask = order_book.best_ask_price()
+        if best_bid is not None:
+            self._market_bids[order_book.symbol] = best_bid
+        if best_ask is not None:
+            self._market_asks[order_book.symbol] = best_ask
+
     cdef inline bint _is_marginal_stop_fill(self, Price order_price, Price market) except *:
         return market == order_price and self.fill_model.is_stop_filled()
 
@@ -839,7 +1088,26 @@ cdef class SimulatedExchange:
             Order order,
             Price fill_price,
             LiquiditySide liquidity_side,
+            Quantity fill_qty=None,
     ) except *:
+        # Fill the orders leaves quantity unless a partial fill quantity is given
+        cdef Quantity filled_qty = self._order_filled_qty(order)
+        cdef Quantity cum_qty
+        cdef Quantity leaves_qty
+        if fill_qty is None or filled_qty + fill_qty >= order.quantity:
+            if fill_qty is None:
+                fill_qty = order.quantity if filled_qty == 0 else Quantity(order.quantity - filled_qty)
+            cum_qty = order.quantity
+            leaves_qty = Quantity()
+            # Order is completely filled so no longer working
+            self._working_orders.pop(order.cl_ord_id, None)
+            self._queue_ahead.pop(order.cl_ord_id, None)
+            self._filled_qty.pop(order.cl_ord_id, None)
+        else:
+            cum_qty = Quantity(filled_qty + fill_qty)
+            leaves_qty = Quantity(order.quantity - cum_qty)
+            self._filled_qty[order.cl_ord_id] = cum_qty
+
         # Query if there is an existing position for this order
         cdef PositionId position_id = self._position_index.get(order.cl_ord_id)
         # position_id could be None here
@@ -849,8 +1117,8 @@ cdef class SimulatedExchange:
             position_id = self._generate_position_id(order.symbol)
             self._position_index[order.cl_ord_id] = position_id
         else:
+            # Position may not yet exist where the opening fill is in flight
             position = self.exec_cache.position(position_id)
-            position_id = position.id
 
         # Calculate commission
         cdef Instrument instrument = self.instruments.get(order.symbol)
@@ -858,7 +1126,7 @@ cdef class SimulatedExchange:
             raise RuntimeError(f"Cannot run backtest, no instrument data for {order.symbol}")
 
         cdef Money commission = instrument.calculate_commission(
-            order.quantity,
+            fill_qty,
             fill_price,
             liquidity_side,
         )
@@ -867,15 +1135,15 @@ cdef class SimulatedExchange:
         cdef OrderFilled filled = OrderFilled(
             self.exec_client.account_id,
             order.cl_ord_id,
-            order.id if order.id is not None else self._generate_order_id(order.symbol),
+            self._order_id(order),
             self._generate_execution_id(),
             position_id,
             order.strategy_id,
             order.symbol,
             order.side,
-            order.quantity,
-            order.quantity,
-            Quantity(),  # Not modeling partial fills yet
+            fill_qty,
+            cum_qty,
+            leaves_qty,
             fill_price,
             instrument.quote_currency,
             instrument.is_inverse,
@@ -885,6 +1153,8 @@ cdef class SimulatedExchange:
             self._uuid_factory.generate(),
             self._clock.utc_now(),
         )
+        if leaves_qty == 0:
+            self._order_ids.pop(order.cl_ord_id, None)  # Order no longer working
 
         # Calculate potential P&L
         cdef Money pnl = None
@@ -893,7 +1163,7 @@ cdef class SimulatedExchange:
             pnl = position.calculate_pnl(
                 avg_open=position.avg_open,
                 avg_close=fill_price,
-                quantity=order.quantity,
+                quantity=fill_qty,
             )
 
         cdef Currency currency  # Settlement currency
@@ -928,10 +1198,12 @@ cdef class SimulatedExchange:
             self.total_commissions[currency] = Money(total_commissions, currency)
 
         self.exec_client.handle_event(filled)
-        self._check_oco_order(order.cl_ord_id)
+
+        if leaves_qty == 0:
+            self._check_oco_order(order.cl_ord_id)
 
         # Work any bracket child orders
-        if order.cl_ord_id in self._child_orders:
+        if leaves_qty == 0 and order.cl_ord_id in self._child_orders:
             for child_order in self._child_orders[order.cl_ord_id]:
                 if not child_order.is_completed:  # The order may already be cancelled or rejected
                     self._process_order(child_order)
@@ -1008,13 +1280,14 @@ cdef class SimulatedExchange:
         cdef OrderCancelled event = OrderCancelled(
             self.exec_client.account_id,
             order.cl_ord_id,
-            order.id,
+            self._order_id(order),
             self._clock.utc_now(),
             self._uuid_factory.generate(),
             self._clock.utc_now(),
         )
 
         self._log.debug(f"Cancelling {order.cl_ord_id} OCO order from {oco_order_id}.")
+        self._order_ids.pop(order.cl_ord_id, None)
         self.exec_client.handle_event(event)
 
     cdef inline void _cancel_order(self, PassiveOrder order) except *:
@@ -1026,11 +1299,15 @@ cdef class SimulatedExchange:
         cdef OrderCancelled event = OrderCancelled(
             self.exec_client.account_id,
             order.cl_ord_id,
-            order.id,
+            self._order_id(order),
             self._clock.utc_now(),
             self._uuid_factory.generate(),
             self._clock.utc_now(),
         )
 
         self._log.debug(f"Cancelling {order.cl_ord_id} as linked position closed.")
+        self._working_orders.pop(order.cl_ord_id, None)
+        self._queue_ahead.pop(order.cl_ord_id, None)
+        self._filled_qty.pop(order.cl_ord_id, None)
+        self._order_ids.pop(order.cl_ord_id, None)
         self.exec_client.handle_event(event)
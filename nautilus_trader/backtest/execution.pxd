@@ -13,15 +13,35 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
-from nautilus_trader.core.message cimport Event
+from cpython.datetime cimport datetime
+from cpython.datetime cimport timedelta
+
 from nautilus_trader.backtest.exchange cimport SimulatedExchange
+from nautilus_trader.backtest.models cimport LatencyModel
+from nautilus_trader.core.message cimport Command
+from nautilus_trader.core.message cimport Event
 from nautilus_trader.execution.client cimport ExecutionClient
 
 
 cdef class BacktestExecClient(ExecutionClient):
     cdef SimulatedExchange _exchange
     cdef bint _is_connected
+    cdef list _inflight
+    cdef long _inflight_count
+    cdef datetime _last_event_arrival
+
+    cdef readonly LatencyModel latency_model
 
 # -- EVENT HANDLERS --------------------------------------------------------------------------------
 
     cdef void handle_event(self, Event event) except *
+
+# -- INFLIGHT MESSAGES -----------------------------------------------------------------------------
+
+    cpdef bint has_inflight(self) except *
+    cpdef int inflight_count(self) except *
+    cpdef datetime next_inflight_time(self)
+    cpdef void process_next_inflight(self) except *
+
+    cdef inline void _send_inflight(self, Command command, timedelta delay) except *
+    cdef inline void _push_inflight(self, datetime arrival, message) except *
@@ -13,9 +13,16 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import heapq
+
+from cpython.datetime cimport datetime
+from cpython.datetime cimport timedelta
+
 from nautilus_trader.backtest.exchange cimport SimulatedExchange
+from nautilus_trader.backtest.models cimport LatencyModel
 from nautilus_trader.common.clock cimport TestClock
 from nautilus_trader.common.logging cimport TestLogger
+from nautilus_trader.core.message cimport Command
 from nautilus_trader.core.message cimport Event
 from nautilus_trader.execution.client cimport ExecutionClient
 from nautilus_trader.execution.engine cimport ExecutionEngine
@@ -38,6 +45,7 @@ cdef class BacktestExecClient(ExecutionClient):
         ExecutionEngine engine not None,
         TestClock clock not None,
         TestLogger logger not None,
+        LatencyModel latency_model=None,
     ):
         """
         Initialize a new instance of the `BacktestExecClient` class.
@@ -54,6 +62,9 @@ cdef class BacktestExecClient(ExecutionClient):
             The clock for the component.
         logger : TestLogger
             The logger for the component.
+        latency_model : LatencyModel, optional
+            The latency model for commands sent to the exchange and events
+            sent back to the execution engine (if None then no latency).
 
         """
         super().__init__(
@@ -66,6 +77,11 @@ cdef class BacktestExecClient(ExecutionClient):
 
         self._exchange = exchange
         self._is_connected = False
+        self._inflight = []                # type: list[tuple[datetime, int, Message]]
+        self._inflight_count = 0
+        self._last_event_arrival = None
+
+        self.latency_model = latency_model
         self.initialized = True
 
     cpdef bint is_connected(self) except *:
@@ -108,7 +124,9 @@ cdef class BacktestExecClient(ExecutionClient):
         """
         self._log.info(f"Resetting...")
 
-        # Nothing to do
+        self._inflight.clear()
+        self._inflight_count = 0
+        self._last_event_arrival = None
 
         self._log.info("Reset.")
 
@@ -129,6 +147,10 @@ cdef class BacktestExecClient(ExecutionClient):
             self._log.error(f"Cannot send command (not connected), {command}.")
             return
 
+        if self.latency_model is not None:
+            self._send_inflight(command, self.latency_model.insert_delay())
+            return
+
         self._exchange.handle_submit_order(command)
 
     cpdef void submit_bracket_order(self, SubmitBracketOrder command) except *:
@@ -136,6 +158,10 @@ cdef class BacktestExecClient(ExecutionClient):
             self._log.error(f"Cannot send command (not connected), {command}.")
             return
 
+        if self.latency_model is not None:
+            self._send_inflight(command, self.latency_model.insert_delay())
+            return
+
         self._exchange.handle_submit_bracket_order(command)
 
     cpdef void cancel_order(self, CancelOrder command) except *:
@@ -143,6 +169,10 @@ cdef class BacktestExecClient(ExecutionClient):
             self._log.error(f"Cannot send command (not connected), {command}.")
             return
 
+        if self.latency_model is not None:
+            self._send_inflight(command, self.latency_model.cancel_delay())
+            return
+
         self._exchange.handle_cancel_order(command)
 
     cpdef void modify_order(self, ModifyOrder command) except *:
@@ -150,9 +180,95 @@ cdef class BacktestExecClient(ExecutionClient):
             self._log.error(f"Cannot send command (not connected), {command}.")
             return
 
+        if self.latency_model is not None:
+            self._send_inflight(command, self.latency_model.modify_delay())
+            return
+
         self._exchange.handle_modify_order(command)
 
 # -- EVENT HANDLERS --------------------------------------------------------------------------------
 
     cdef void handle_event(self, Event event) except *:
-        self._handle_event(event)
+        if self.latency_model is None:
+            self._handle_event(event)
+            return
+
+        cdef datetime arrival = self._clock.utc_now() + self.latency_model.event_delay()
+        if self._last_event_arrival is not None and arrival < self._last_event_arrival:
+            # Events are delivered in the order they were generated
+            arrival = self._last_event_arrival
+        self._last_event_arrival = arrival
+
+        self._push_inflight(arrival, event)
+
+# -- INFLIGHT MESSAGES -----------------------------------------------------------------------------
+
+    cpdef bint has_inflight(self) except *:
+        """
+        Return a value indicating whether there are messages in flight between
+        the client and the exchange.
+
+        Returns
+        -------
+        bool
+
+        """
+        return len(self._inflight) > 0
+
+    cpdef int inflight_count(self) except *:
+        """
+        Return the count of messages in flight between the client and the exchange.
+
+        Returns
+        -------
+        int
+
+        """
+        return len(self._inflight)
+
+    cpdef datetime next_inflight_time(self):
+        """
+        Return the arrival time of the next message in flight.
+
+        Returns
+        -------
+        datetime or None
+
+        """
+        if not self._inflight:
+            return None
+
+        return self._inflight[0][0]
+
+    cpdef void process_next_inflight(self) except *:
+        """
+        Deliver the next message in flight, commands to the exchange and events
+        to the execution engine.
+
+        The clock is expected to have been advanced to the messages arrival time.
+        """
+        if not self._inflight:
+            return  # Nothing in flight
+
+        message = heapq.heappop(self._inflight)[2]
+        if isinstance(message, Event):
+            self._handle_event(message)
+        elif isinstance(message, SubmitOrder):
+            self._exchange.handle_submit_order(message)
+        elif isinstance(message, SubmitBracketOrder):
+            self._exchange.handle_submit_bracket_order(message)
+        elif isinstance(message, CancelOrder):
+            self._exchange.handle_cancel_order(message)
+        elif isinstance(message, ModifyOrder):
+            self._exchange.handle_modify_order(message)
+        else:
+            self._log.error(f"Cannot deliver message, unrecognized {message}.")
+
+    cdef inline void _send_inflight(self, Command command, timedelta delay) except *:
+        self._push_inflight(self._clock.utc_now() + delay, command)
+
+    cdef inline void _push_inflight(self, datetime arrival, message) except *:
+        # The sequence number breaks ties so messages with the same arrival
+        # time are delivered in the order they were sent.
+        self._inflight_count += 1
+        heapq.heappush(self._inflight, (arrival, self._inflight_count, message))
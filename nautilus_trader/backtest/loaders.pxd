@@ -20,3 +20,15 @@ cdef class CSVTickDataLoader:
 
 cdef class CSVBarDataLoader:
     pass
+
+
+cdef class NumpyDataLoader:
+    pass
+
+
+cdef class ParquetDataLoader:
+    pass
+
+
+cdef class CSVDataConverter:
+    pass
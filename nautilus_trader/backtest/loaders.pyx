@@ -13,9 +13,14 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+from cpython.datetime cimport datetime
+
+import numpy as np
 import pandas as pd
 
 from nautilus_trader.core.correctness cimport Condition
+from nautilus_trader.core.datetime cimport as_utc_index
+from nautilus_trader.core.datetime cimport as_utc_timestamp
 
 
 cdef class CSVTickDataLoader:
@@ -74,3 +79,250 @@ cdef class CSVBarDataLoader:
             index_col="timestamp",
             parse_dates=True,
         )
+
+
+cdef class NumpyDataLoader:
+    """
+    Provides a means of loading tick and bar data pandas DataFrames from NumPy
+    binary (.npy) files.
+
+    Each file holds the data for a single symbol as a structured array, sorted
+    by a `timestamp` field of UNIX nanoseconds. The file is memory mapped and
+    the time range located with a binary search, so only the rows within the
+    range are read from disk.
+    """
+
+    @staticmethod
+    def load(str file_path, datetime start=None, datetime stop=None) -> pd.DataFrame:
+        """
+        Return the pandas.DataFrame loaded from the given npy file.
+
+        Parameters
+        ----------
+        file_path : str
+            The absolute path to the npy file.
+        start : datetime, optional
+            The start (inclusive) of the time range to load.
+        stop : datetime, optional
+            The stop (inclusive) of the time range to load.
+
+        Returns
+        -------
+        pd.DataFrame
+
+        """
+        Condition.not_none(file_path, "file_path")
+
+        array = np.load(file_path, mmap_mode="r")
+        timestamps = array["timestamp"]
+
+        cdef Py_ssize_t start_index = 0
+        cdef Py_ssize_t stop_index = len(array)
+        if start is not None:
+            start_index = np.searchsorted(timestamps, as_utc_timestamp(start).value, side="left")
+        if stop is not None:
+            stop_index = np.searchsorted(timestamps, as_utc_timestamp(stop).value, side="right")
+
+        rows = np.array(array[start_index:stop_index])  # Copy out of the memory map
+
+        return pd.DataFrame(
+            {name: rows[name] for name in rows.dtype.names if name != "timestamp"},
+            index=pd.DatetimeIndex(pd.to_datetime(rows["timestamp"], utc=True), name="timestamp"),
+        )
+
+    @staticmethod
+    def write(data: pd.DataFrame, str file_path) -> None:
+        """
+        Write the given data to a npy file which can be loaded with `load`.
+
+        Numeric columns keep their dtype, all other columns are written as
+        fixed width strings.
+
+        Parameters
+        ----------
+        data : pd.DataFrame
+            The data to write, indexed by timestamp in ascending order.
+        file_path : str
+            The absolute path to the npy file.
+
+        Raises
+        ------
+        ValueError
+            If data index is not in ascending order.
+
+        """
+        Condition.not_none(data, "data")
+        Condition.not_none(file_path, "file_path")
+
+        if not isinstance(data.index, pd.DatetimeIndex):
+            data = data.set_axis(pd.to_datetime(data.index, utc=True), axis=0)
+        data = as_utc_index(data)
+        Condition.true(data.index.is_monotonic_increasing, "data index is in ascending order")
+
+        cdef list fields = [("timestamp", "<i8")]
+        cdef dict values = {}
+        for name, column in data.items():
+            if column.dtype.kind in "biuf":
+                values[name] = column.to_numpy()
+            else:
+                values[name] = column.to_numpy(dtype=str)
+            fields.append((str(name), values[name].dtype))
+
+        array = np.empty(len(data), dtype=fields)
+        array["timestamp"] = data.index.asi8
+        for name, value in values.items():
+            array[str(name)] = value
+
+        np.save(file_path, array, allow_pickle=False)
+
+
+cdef class ParquetDataLoader:
+    """
+    Provides a means of loading tick and bar data pandas DataFrames from Parquet
+    files, or directories of Parquet files.
+
+    The time range and symbol are pushed down to the Parquet reader, which then
+    skips any row groups outside of them. Requires the `pyarrow` package.
+    """
+
+    @staticmethod
+    def load(
+        str file_path,
+        datetime start=None,
+        datetime stop=None,
+        str symbol=None,
+        list columns=None,
+    ) -> pd.DataFrame:
+        """
+        Return the pandas.DataFrame loaded from the given Parquet file or directory.
+
+        Parameters
+        ----------
+        file_path : str
+            The absolute path to the Parquet file or directory.
+        start : datetime, optional
+            The start (inclusive) of the time range to load.
+        stop : datetime, optional
+            The stop (inclusive) of the time range to load.
+        symbol : str, optional
+            The symbol to load, for data written with a `symbol` column.
+        columns : list[str], optional
+            The columns to load (if None then all columns).
+
+        Returns
+        -------
+        pd.DataFrame
+
+        Raises
+        ------
+        ImportError
+            If pyarrow is not installed.
+
+        """
+        Condition.not_none(file_path, "file_path")
+
+        cdef list filters = []
+        if symbol is not None:
+            filters.append(("symbol", "==", symbol))
+        if start is not None:
+            filters.append(("timestamp", ">=", as_utc_timestamp(start)))
+        if stop is not None:
+            filters.append(("timestamp", "<=", as_utc_timestamp(stop)))
+
+        data = pd.read_parquet(
+            file_path,
+            engine="pyarrow",
+            columns=columns,
+            filters=filters if filters else None,
+        )
+
+        if "symbol" in data.columns:
+            data = data.drop(columns="symbol")
+
+        return data.sort_index()
+
+    @staticmethod
+    def write(data: pd.DataFrame, str file_path, str symbol=None, int row_group_size=100_000) -> None:
+        """
+        Write the given data to a Parquet file which can be loaded with `load`.
+
+        Parameters
+        ----------
+        data : pd.DataFrame
+            The data to write, indexed by timestamp.
+        file_path : str
+            The absolute path to the Parquet file.
+        symbol : str, optional
+            The symbol to add as a `symbol` column, so several symbols can be
+            written to the same directory and filtered on load.
+        row_group_size : int, optional
+            The number of rows per row group (the unit of predicate pushdown).
+
+        Raises
+        ------
+        ImportError
+            If pyarrow is not installed.
+
+        """
+        Condition.not_none(data, "data")
+        Condition.not_none(file_path, "file_path")
+        Condition.positive_int(row_group_size, "row_group_size")
+
+        if not isinstance(data.index, pd.DatetimeIndex):
+            data = data.set_axis(pd.to_datetime(data.index, utc=True), axis=0)
+        data = as_utc_index(data).rename_axis("timestamp")
+
+        if symbol is not None:
+            data = data.assign(symbol=symbol)
+
+        data.to_parquet(file_path, engine="pyarrow", row_group_size=row_group_size)
+
+
+cdef class CSVDataConverter:
+    """
+    Provides a means of converting tick and bar data CSV files to binary files
+    for the `NumpyDataLoader` and `ParquetDataLoader`.
+    """
+
+    @staticmethod
+    def to_numpy(str csv_path, str file_path) -> None:
+        """
+        Convert the given CSV file to a npy file.
+
+        Parameters
+        ----------
+        csv_path : str
+            The absolute path to the CSV file.
+        file_path : str
+            The absolute path to the npy file.
+
+        """
+        Condition.not_none(csv_path, "csv_path")
+        Condition.not_none(file_path, "file_path")
+
+        NumpyDataLoader.write(CSVTickDataLoader.load(csv_path), file_path)
+
+    @staticmethod
+    def to_parquet(str csv_path, str file_path, str symbol=None) -> None:
+        """
+        Convert the given CSV file to a Parquet file.
+
+        Parameters
+        ----------
+        csv_path : str
+            The absolute path to the CSV file.
+        file_path : str
+            The absolute path to the Parquet file.
+        symbol : str, optional
+            The symbol to add as a `symbol` column.
+
+        Raises
+        ------
+        ImportError
+            If pyarrow is not installed.
+
+        """
+        Condition.not_none(csv_path, "csv_path")
+        Condition.not_none(file_path, "file_path")
+
+        ParquetDataLoader.write(CSVTickDataLoader.load(csv_path), file_path, symbol)
@@ -13,6 +13,8 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+from cpython.datetime cimport timedelta
+
 
 cdef class FillModel:
     cdef readonly double prob_fill_at_limit
@@ -24,3 +26,19 @@ cdef class FillModel:
     cpdef bint is_slipped(self) except *
 
     cdef inline bint _event_success(self, double probability) except *
+
+
+cdef class LatencyModel:
+    cdef readonly timedelta base_latency
+    cdef readonly timedelta insert_latency
+    cdef readonly timedelta modify_latency
+    cdef readonly timedelta cancel_latency
+    cdef readonly timedelta event_latency
+    cdef readonly timedelta jitter
+
+    cpdef timedelta insert_delay(self)
+    cpdef timedelta modify_delay(self)
+    cpdef timedelta cancel_delay(self)
+    cpdef timedelta event_delay(self)
+
+    cdef inline timedelta _delay(self, timedelta latency)
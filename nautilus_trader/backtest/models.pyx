@@ -13,6 +13,8 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+from cpython.datetime cimport timedelta
+
 from nautilus_trader.core.correctness cimport Condition
 
 
@@ -112,3 +114,120 @@ cdef class FillModel:
             return True
         else:
             return probability >= drand48()
+
+
+cdef class LatencyModel:
+    """
+    Provides a latency model for simulated order routing between the execution
+    client and the exchange.
+
+    Each delay is the base latency plus the latency for the message type, plus
+    a random jitter drawn uniformly from [0, jitter).
+    """
+
+    def __init__(
+        self,
+        timedelta base_latency not None=timedelta(0),
+        timedelta insert_latency not None=timedelta(0),
+        timedelta modify_latency not None=timedelta(0),
+        timedelta cancel_latency not None=timedelta(0),
+        timedelta event_latency not None=timedelta(0),
+        timedelta jitter not None=timedelta(0),
+        random_seed=None,
+    ):
+        """
+        Initialize a new instance of the `LatencyModel` class.
+
+        Parameters
+        ----------
+        base_latency : timedelta
+            The latency added to every command and event.
+        insert_latency : timedelta
+            The additional latency for submit order commands to arrive at the exchange.
+        modify_latency : timedelta
+            The additional latency for modify order commands to arrive at the exchange.
+        cancel_latency : timedelta
+            The additional latency for cancel order commands to arrive at the exchange.
+        event_latency : timedelta
+            The additional latency for exchange events to arrive back at the
+            execution engine.
+        jitter : timedelta
+            The upper bound of the uniformly distributed random jitter added
+            to each delay.
+        random_seed : int, optional
+            The random seed (if None then no random seed).
+
+        Raises
+        ------
+        ValueError
+            If any latency argument is negative.
+        TypeError
+            If random_seed is not None and not of type int.
+
+        """
+        Condition.true(base_latency >= timedelta(0), "base_latency was negative")
+        Condition.true(insert_latency >= timedelta(0), "insert_latency was negative")
+        Condition.true(modify_latency >= timedelta(0), "modify_latency was negative")
+        Condition.true(cancel_latency >= timedelta(0), "cancel_latency was negative")
+        Condition.true(event_latency >= timedelta(0), "event_latency was negative")
+        Condition.true(jitter >= timedelta(0), "jitter was negative")
+        if random_seed:
+            Condition.type(random_seed, int, "random_seed")
+            srand48(random_seed)
+
+        self.base_latency = base_latency
+        self.insert_latency = insert_latency
+        self.modify_latency = modify_latency
+        self.cancel_latency = cancel_latency
+        self.event_latency = event_latency
+        self.jitter = jitter
+
+    cpdef timedelta insert_delay(self):
+        """
+        Return a sampled delay for a submit order command.
+
+        Returns
+        -------
+        timedelta
+
+        """
+        return self._delay(self.insert_latency)
+
+    cpdef timedelta modify_delay(self):
+        """
+        Return a sampled delay for a modify order command.
+
+        Returns
+        -------
+        timedelta
+
+        """
+        return self._delay(self.modify_latency)
+
+    cpdef timedelta cancel_delay(self):
+        """
+        Return a sampled delay for a cancel order command.
+
+        Returns
+        -------
+        timedelta
+
+        """
+        return self._delay(self.cancel_latency)
+
+    cpdef timedelta event_delay(self):
+        """
+        Return a sampled delay for an exchange event.
+
+        Returns
+        -------
+        timedelta
+
+        """
+        return self._delay(self.event_latency)
+
+    cdef inline timedelta _delay(self, timedelta latency):
+        if not self.jitter:
+            return self.base_latency + latency
+
+        return self.base_latency + latency + self.jitter * drand48()
@@ -33,9 +33,14 @@ cdef class SimulationModule:
 cdef class FXRolloverInterestModule(SimulationModule):
     cdef RolloverInterestCalculator _calculator
     cdef object _rollover_spread
-    cdef datetime _rollover_time
+    cdef object _rollover_schedule
+    cdef object _rollover_weekdays
+    cdef long long _next_day_ns
+    cdef long long _rollover_ns
+    cdef int _rollover_weekday
     cdef bint _rollover_applied
     cdef dict _rollover_totals
-    cdef int _day_number
 
+    cdef void _set_rollover_for_day(self, datetime now, long long now_ns) except *
+    cdef void _build_rollover_schedule(self, datetime now) except *
     cdef void _apply_rollover_interest(self, datetime timestamp, int iso_week_day) except *
@@ -16,10 +16,12 @@
 from cpython.datetime cimport datetime
 from decimal import Decimal
 
+import numpy as np
 import pandas as pd
 import pytz
 
 from nautilus_trader.core.correctness cimport Condition
+from nautilus_trader.core.datetime cimport to_unix_nanos
 from nautilus_trader.core.functions cimport pad_string
 from nautilus_trader.backtest.exchange cimport SimulatedExchange
 from nautilus_trader.model.c_enums.asset_class cimport AssetClass
@@ -78,10 +80,17 @@ cdef class SimulationModule:
 
 
 _TZ_US_EAST = pytz.timezone("US/Eastern")
+_NANOS_IN_DAY = 86400 * 1000000000
+_NANOS_AFTER_ROLLOVER = 7 * 3600 * 1000000000  # From 17:00 to local midnight
+_ROLLOVER_SCHEDULE_DAYS = 366
 
 cdef class FXRolloverInterestModule(SimulationModule):
     """
     Provides an FX rollover interest simulation module.
+
+    The daily rollover times (17:00 US/Eastern) are precomputed as a sorted
+    schedule of UNIX nanoseconds, so the per tick check is an integer
+    comparison.
     """
 
     def __init__(self, rate_data not None: pd.DataFrame):
@@ -96,10 +105,13 @@ cdef class FXRolloverInterestModule(SimulationModule):
         """
         super().__init__()
         self._calculator = RolloverInterestCalculator(data=rate_data)
-        self._rollover_time = None  # Initialized at first rollover
+        self._rollover_schedule = None  # Initialized at first rollover
+        self._rollover_weekdays = None  # Initialized at first rollover
+        self._next_day_ns = 0
+        self._rollover_ns = 0
+        self._rollover_weekday = 0
         self._rollover_applied = False
         self._rollover_totals = {}
-        self._day_number = 0
 
     cpdef void process(self, QuoteTick tick, datetime now) except *:
         """
@@ -116,25 +128,45 @@ cdef class FXRolloverInterestModule(SimulationModule):
         Condition.not_none(tick, "tick")
         Condition.not_none(now, "now")
 
-        cdef datetime rollover_local
-        if self._day_number != now.day:
+        cdef long long now_ns = to_unix_nanos(now)
+        if self._rollover_schedule is None or now_ns >= self._next_day_ns:
             # Set account statistics for new day
-            self._day_number = now.day
-            self._rollover_applied = False
-
-            rollover_local = now.astimezone(_TZ_US_EAST)
-            self._rollover_time = _TZ_US_EAST.localize(datetime(
-                rollover_local.year,
-                rollover_local.month,
-                rollover_local.day,
-                17),
-            ).astimezone(pytz.utc)
+            self._set_rollover_for_day(now, now_ns)
 
         # Check for and apply any rollover interest
-        if not self._rollover_applied and now >= self._rollover_time:
-            self._apply_rollover_interest(now, self._rollover_time.isoweekday())
+        if not self._rollover_applied and now_ns >= self._rollover_ns:
+            self._apply_rollover_interest(now, self._rollover_weekday)
             self._rollover_applied = True
 
+    cdef void _set_rollover_for_day(self, datetime now, long long now_ns) except *:
+        self._next_day_ns = (now_ns // _NANOS_IN_DAY + 1) * _NANOS_IN_DAY
+        self._rollover_applied = False
+
+        # The rollover time is 17:00 on the current US/Eastern date
+        cdef int index = 0
+        if self._rollover_schedule is not None:
+            index = np.searchsorted(self._rollover_schedule, now_ns - _NANOS_AFTER_ROLLOVER, side="right")
+        if index == 0 or index >= len(self._rollover_schedule):
+            self._build_rollover_schedule(now)
+            index = np.searchsorted(self._rollover_schedule, now_ns - _NANOS_AFTER_ROLLOVER, side="right")
+
+        self._rollover_ns = self._rollover_schedule[index]
+        self._rollover_weekday = self._rollover_weekdays[index]
+
+    cdef void _build_rollover_schedule(self, datetime now) except *:
+        # Daily rollover times starting from the day before the current
+        # US/Eastern date, as UTC nanoseconds and ISO weekdays (UTC).
+        start = pd.Timestamp(now).tz_convert(_TZ_US_EAST).tz_localize(None).normalize()
+        days = pd.date_range(
+            start=start - pd.Timedelta(days=1),
+            periods=_ROLLOVER_SCHEDULE_DAYS,
+            freq="D",
+        )
+        rollovers = (days + pd.Timedelta(hours=17)).tz_localize(_TZ_US_EAST).tz_convert(pytz.utc)
+
+        self._rollover_schedule = rollovers.asi8
+        self._rollover_weekdays = rollovers.dayofweek.values + 1
+
     cdef void _apply_rollover_interest(self, datetime timestamp, int iso_week_day) except *:
         cdef list open_positions = self._exchange.exec_cache.positions_open()
 
@@ -204,7 +236,10 @@ cdef class FXRolloverInterestModule(SimulationModule):
         log.info(f"Rollover interest (totals):  {rollover_interest}")
 
     cpdef void reset(self) except *:
-        self._rollover_time = None  # Initialized at first rollover
+        self._rollover_schedule = None  # Initialized at first rollover
+        self._rollover_weekdays = None  # Initialized at first rollover
+        self._next_day_ns = 0
+        self._rollover_ns = 0
+        self._rollover_weekday = 0
         self._rollover_applied = False
         self._rollover_totals = {}
-        self._day_number = 0
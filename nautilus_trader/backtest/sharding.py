@@ -0,0 +1,390 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2021 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from datetime import datetime
+import multiprocessing
+import os
+from typing import Dict, List
+
+import pandas as pd
+
+from nautilus_trader.backtest.data_container import BacktestDataContainer
+from nautilus_trader.backtest.engine import BacktestEngine
+from nautilus_trader.core.correctness import PyCondition
+from nautilus_trader.model.enums import OMSType
+from nautilus_trader.model.enums import PriceType
+from nautilus_trader.model.identifiers import Symbol
+from nautilus_trader.model.identifiers import Venue
+from nautilus_trader.model.objects import Money
+from nautilus_trader.trading.strategy import TradingStrategy
+
+
+class BacktestShard:
+    """
+    Represents an independent partition of a backtest, being a set of symbols
+    and the strategies which trade them.
+    """
+
+    def __init__(
+        self,
+        symbols: List[Symbol],
+        strategies: List[TradingStrategy],
+    ):
+        """
+        Initialize a new instance of the `BacktestShard` class.
+
+        Parameters
+        ----------
+        symbols : list[Symbol]
+            The symbols for the shard.
+        strategies : list[TradingStrategy]
+            The strategies for the shard (must only trade the shards symbols).
+
+        Raises
+        ------
+        ValueError
+            If symbols is empty.
+        ValueError
+            If strategies is empty.
+
+        """
+        PyCondition.not_empty(symbols, "symbols")
+        PyCondition.list_type(symbols, Symbol, "symbols")
+        PyCondition.not_empty(strategies, "strategies")
+        PyCondition.list_type(strategies, TradingStrategy, "strategies")
+
+        self.symbols = symbols
+        self.strategies = strategies
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(symbols={[s.value for s in self.symbols]})"
+
+
+class ShardedBacktestEngine:
+    """
+    Provides a backtest engine which runs independent shards of a backtest in
+    parallel worker processes, and merges their results.
+
+    Each shard is run by its own `BacktestEngine` over the data for its
+    symbols only. Where the strategies of different shards do not interact, the
+    merged orders, order fills and positions reports are identical to those of
+    a single `BacktestEngine` run over all the data with all the strategies.
+
+    Account reports for a venue whose symbols are split across shards are
+    merged by summing the balance changes of each shard onto the starting
+    balances (only the monetary columns are summed). This is exact where the shards do not need each other's prices to
+    convert PnL into the account currency.
+
+    Worker processes are forked, so the shards do not need to be pickled.
+    """
+
+    def __init__(
+        self,
+        data: BacktestDataContainer,
+        shards: List[BacktestShard],
+        engine_config: Dict[str, object]=None,
+        processes: int=None,
+    ):
+        """
+        Initialize a new instance of the `ShardedBacktestEngine` class.
+
+        Parameters
+        ----------
+        data : BacktestDataContainer
+            The data for all shards of the backtest.
+        shards : list[BacktestShard]
+            The independent shards of the backtest.
+        engine_config : dict[str, object], optional
+            The keyword arguments for each shards `BacktestEngine`.
+        processes : int, optional
+            The number of worker processes (if None then the number of shards,
+            up to the CPU count). If 1 then the shards are run sequentially in
+            this process.
+
+        Raises
+        ------
+        ValueError
+            If shards is empty.
+        KeyError
+            If a symbol is in more than one shard.
+        KeyError
+            If a shards symbol has no instrument in the data.
+        ValueError
+            If processes is not positive (> 0).
+
+        """
+        if engine_config is None:
+            engine_config = {}
+        if processes is None:
+            processes = min(len(shards), os.cpu_count() or 1)
+        PyCondition.not_none(data, "data")
+        PyCondition.not_empty(shards, "shards")
+        PyCondition.list_type(shards, BacktestShard, "shards")
+        PyCondition.positive_int(processes, "processes")
+
+        symbols = set()
+        for shard in shards:
+            for symbol in shard.symbols:
+                PyCondition.not_in(symbol, symbols, "symbol", "symbols")
+                PyCondition.is_in(symbol, data.instruments, "symbol", "data.instruments")
+                symbols.add(symbol)
+
+        self._data = data
+        self._shards = shards
+        self._engine_config = engine_config
+        self._processes = processes
+        self._exchanges = {}  # type: dict[Venue, dict[str, object]]
+        self._results = []    # type: list[dict[str, object]]
+
+        self.iteration = 0
+
+    def add_exchange(
+        self,
+        venue: Venue,
+        oms_type: OMSType,
+        starting_balances: List[Money],
+        **kwargs,
+    ):
+        """
+        Add a `SimulatedExchange` with the given parameters to each shard
+        trading the venue.
+
+        Parameters
+        ----------
+        venue : Venue
+            The venue for the exchange.
+        oms_type : OMSType
+            The order management system type for the exchange.
+        starting_balances : list[Money]
+            The starting account balances (specify one for a single asset account).
+        kwargs : dict
+            The further keyword arguments for `BacktestEngine.add_exchange`.
+
+        Raises
+        ------
+        KeyError
+            If an exchange of venue is already registered with the engine.
+
+        """
+        PyCondition.not_none(venue, "venue")
+        PyCondition.not_in(venue, self._exchanges, "venue", "self._exchanges")
+        PyCondition.not_empty(starting_balances, "starting_balances")
+
+        self._exchanges[venue] = dict(
+            venue=venue,
+            oms_type=oms_type,
+            starting_balances=starting_balances,
+            **kwargs,
+        )
+
+    def run(self, start: datetime, stop: datetime):
+        """
+        Run the shards of the backtest from the start datetime to the stop
+        datetime.
+
+        The range is given explicitly so every shard runs its clocks over the
+        same range, regardless of where its own data starts and stops.
+
+        Parameters
+        ----------
+        start : datetime
+            The start (UTC) for the backtest run.
+        stop : datetime
+            The stop (UTC) for the backtest run.
+
+        Raises
+        ------
+        KeyError
+            If there is no exchange for a venue of the shards symbols.
+
+        """
+        PyCondition.not_none(start, "start")
+        PyCondition.not_none(stop, "stop")
+        for shard in self._shards:
+            for symbol in shard.symbols:
+                PyCondition.is_in(symbol.venue, self._exchanges, "venue", "self._exchanges")
+
+        self._run_start = start
+        self._run_stop = stop
+
+        if self._processes == 1:
+            self._results = [self._run_shard(i) for i in range(len(self._shards))]
+        else:
+            context = multiprocessing.get_context("fork")
+            with context.Pool(
+                processes=self._processes,
+                initializer=_init_worker,
+                initargs=(self,),
+            ) as pool:
+                # Results are returned in shard order regardless of completion order
+                self._results = pool.map(_run_shard, range(len(self._shards)), chunksize=1)
+
+        self.iteration = sum(result["iteration"] for result in self._results)
+
+    def generate_orders_report(self) -> pd.DataFrame:
+        """
+        Generate an orders report merged across all shards.
+
+        Returns
+        -------
+        pd.DataFrame
+
+        """
+        return _merge_reports([r["orders"] for r in self._results], "timestamp")
+
+    def generate_order_fills_report(self) -> pd.DataFrame:
+        """
+        Generate an order fills report merged across all shards.
+
+        Returns
+        -------
+        pd.DataFrame
+
+        """
+        return _merge_reports([r["order_fills"] for r in self._results], "timestamp")
+
+    def generate_positions_report(self) -> pd.DataFrame:
+        """
+        Generate a positions report merged across all shards.
+
+        Returns
+        -------
+        pd.DataFrame
+
+        """
+        return _merge_reports([r["positions"] for r in self._results], "opened_time")
+
+    def generate_account_report(self, venue: Venue) -> pd.DataFrame:
+        """
+        Generate an account report for the given venue merged across all
+        shards trading the venue.
+
+        Parameters
+        ----------
+        venue : Venue
+            The venue for the report.
+
+        Returns
+        -------
+        pd.DataFrame
+
+        """
+        reports = [r["accounts"][venue] for r in self._results if venue in r["accounts"]]
+        return _merge_account_reports(reports)
+
+    def _run_shard(self, index: int) -> Dict[str, object]:
+        shard = self._shards[index]
+
+        data = BacktestDataContainer()
+        for symbol in shard.symbols:
+            data.add_instrument(self._data.instruments[symbol])
+            if symbol in self._data.quote_ticks:
+                data.add_quote_ticks(symbol, self._data.quote_ticks[symbol])
+            if symbol in self._data.trade_ticks:
+                data.add_trade_ticks(symbol, self._data.trade_ticks[symbol])
+            if symbol in self._data.order_book_deltas:
+                data.add_order_book_deltas(symbol, self._data.order_book_deltas[symbol])
+            for aggregation, bars in self._data.bars_bid.get(symbol, {}).items():
+                data.add_bars(symbol, aggregation, PriceType.BID, bars)
+            for aggregation, bars in self._data.bars_ask.get(symbol, {}).items():
+                data.add_bars(symbol, aggregation, PriceType.ASK, bars)
+
+        engine = BacktestEngine(
+            data=data,
+            strategies=shard.strategies,
+            **self._engine_config,
+        )
+
+        for venue in sorted(data.venues):
+            engine.add_exchange(**self._exchanges[venue])
+
+        engine.run(self._run_start, self._run_stop, print_log_store=False, clamp_to_data=False)
+
+        result = {
+            "iteration": engine.iteration,
+            "orders": engine.trader.generate_orders_report(),
+            "order_fills": engine.trader.generate_order_fills_report(),
+            "positions": engine.trader.generate_positions_report(),
+            "accounts": {v: engine.trader.generate_account_report(v) for v in data.venues},
+        }
+
+        engine.dispose()
+
+        return result
+
+
+# Set in each forked worker process by the pool initializer
+_WORKER_ENGINE = None
+
+
+def _init_worker(engine: ShardedBacktestEngine):
+    global _WORKER_ENGINE
+    _WORKER_ENGINE = engine
+
+
+def _run_shard(index: int) -> Dict[str, object]:
+    return _WORKER_ENGINE._run_shard(index)
+
+
+def _merge_reports(reports: List[pd.DataFrame], sort_column: str) -> pd.DataFrame:
+    reports = [r for r in reports if not r.empty]
+    if not reports:
+        return pd.DataFrame()
+
+    merged = pd.concat(reports)
+    # Stable sort so ties keep shard order and the merge is deterministic
+    merged.sort_values(sort_column, kind="mergesort", inplace=True)
+    return merged
+
+
+def _merge_account_reports(reports: List[pd.DataFrame]) -> pd.DataFrame:
+    reports = [r for r in reports if not r.empty]
+    if not reports:
+        return pd.DataFrame()
+    if len(reports) == 1:
+        return reports[0]
+
+    # Each shard starts from the same initial account state
+    initial = reports[0].iloc[0]
+    columns = list(reports[0].columns)
+    money_columns = {column for column in columns if isinstance(initial[column], Money)}
+
+    updates = []  # type: list[tuple]
+    for shard_index, report in enumerate(reports):
+        for timestamp, row in report.iloc[1:].iterrows():
+            updates.append((timestamp, shard_index, row))
+    updates.sort(key=lambda update: (update[0], update[1]))
+
+    current = [report.iloc[0] for report in reports]
+    timestamps = [reports[0].index[0]]
+    rows = [initial.to_dict()]
+    for timestamp, shard_index, row in updates:
+        current[shard_index] = row
+        merged_row = {}
+        for column in columns:
+            if column not in money_columns:
+                # Only balances are merged, other values are the latest update
+                merged_row[column] = row[column]
+                continue
+            start_balance = initial[column]
+            total = start_balance.as_decimal()
+            for state in current:
+                total += state[column] - start_balance
+            merged_row[column] = Money(total, start_balance.currency)
+        timestamps.append(timestamp)
+        rows.append(merged_row)
+
+    merged = pd.DataFrame(data=rows, index=pd.Index(timestamps, name=reports[0].index.name))
+    return merged
@@ -15,6 +15,9 @@
 
 from nautilus_trader.core.cache cimport ObjectCache
 from nautilus_trader.model.identifiers cimport AccountId
+from nautilus_trader.model.identifiers cimport ClientOrderId
+from nautilus_trader.model.identifiers cimport ExecutionId
+from nautilus_trader.model.identifiers cimport PositionId
 from nautilus_trader.model.identifiers cimport StrategyId
 from nautilus_trader.model.identifiers cimport Symbol
 from nautilus_trader.model.identifiers cimport TraderId
@@ -25,8 +28,22 @@ cdef class IdentifierCache:
     cdef ObjectCache _cached_account_ids
     cdef ObjectCache _cached_strategy_ids
     cdef ObjectCache _cached_symbols
+    cdef ObjectCache _cached_cl_ord_ids
+    cdef ObjectCache _cached_position_ids
+    cdef ObjectCache _cached_execution_ids
 
     cpdef TraderId get_trader_id(self, str value)
     cpdef AccountId get_account_id(self, str value)
     cpdef StrategyId get_strategy_id(self, str value)
     cpdef Symbol get_symbol(self, str value)
+    cpdef ClientOrderId get_cl_ord_id(self, str value)
+    cpdef PositionId get_position_id(self, str value)
+    cpdef ExecutionId get_execution_id(self, str value)
+    cpdef void prewarm(
+        self,
+        list trader_ids=*,
+        list account_ids=*,
+        list strategy_ids=*,
+        list symbols=*,
+    ) except *
+    cpdef dict stats(self)
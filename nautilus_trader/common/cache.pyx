@@ -19,16 +19,33 @@ from nautilus_trader.core.correctness cimport Condition
 cdef class IdentifierCache:
     """
     Provides an identifier cache.
+
+    Each identifier type is held in its own size capped (least recently used)
+    object cache.
     """
 
-    def __init__(self):
+    def __init__(self, int capacity=10000):
         """
         Initialize a new instance of the `IdentifierCache` class.
+
+        Parameters
+        ----------
+        capacity : int, optional
+            The maximum number of identifiers to hold for each identifier type.
+
+        Raises
+        ------
+        ValueError
+            If capacity is not positive (> 0).
+
         """
-        self._cached_trader_ids = ObjectCache(TraderId, TraderId.from_str_c)
-        self._cached_account_ids = ObjectCache(AccountId, AccountId.from_str_c)
-        self._cached_strategy_ids = ObjectCache(StrategyId, StrategyId.from_str_c)
-        self._cached_symbols = ObjectCache(Symbol, Symbol.from_str_c)
+        self._cached_trader_ids = ObjectCache(TraderId, TraderId.from_str_c, capacity)
+        self._cached_account_ids = ObjectCache(AccountId, AccountId.from_str_c, capacity)
+        self._cached_strategy_ids = ObjectCache(StrategyId, StrategyId.from_str_c, capacity)
+        self._cached_symbols = ObjectCache(Symbol, Symbol.from_str_c, capacity)
+        self._cached_cl_ord_ids = ObjectCache(ClientOrderId, ClientOrderId, capacity)
+        self._cached_position_ids = ObjectCache(PositionId, PositionId, capacity)
+        self._cached_execution_ids = ObjectCache(ExecutionId, ExecutionId, capacity)
 
     cpdef TraderId get_trader_id(self, str value):
         """
@@ -119,3 +136,133 @@ cdef class IdentifierCache:
         Condition.valid_string(value, "value")
 
         return self._cached_symbols.get(value)
+
+    cpdef ClientOrderId get_cl_ord_id(self, str value):
+        """
+        Return the cached client order identifier.
+
+        Parameters
+        ----------
+        value : str
+            The value to be parsed to a client order identifier.
+
+        Returns
+        -------
+        ClientOrderId or None
+
+        Raises
+        ------
+        ValueError
+            If value is not a valid string.
+
+        """
+        Condition.valid_string(value, "value")
+
+        return self._cached_cl_ord_ids.get(value)
+
+    cpdef PositionId get_position_id(self, str value):
+        """
+        Return the cached position identifier.
+
+        Parameters
+        ----------
+        value : str
+            The value to be parsed to a position identifier.
+
+        Returns
+        -------
+        PositionId or None
+
+        Raises
+        ------
+        ValueError
+            If value is not a valid string.
+
+        """
+        Condition.valid_string(value, "value")
+
+        return self._cached_position_ids.get(value)
+
+    cpdef ExecutionId get_execution_id(self, str value):
+        """
+        Return the cached execution identifier.
+
+        Parameters
+        ----------
+        value : str
+            The value to be parsed to an execution identifier.
+
+        Returns
+        -------
+        ExecutionId or None
+
+        Raises
+        ------
+        ValueError
+            If value is not a valid string.
+
+        """
+        Condition.valid_string(value, "value")
+
+        return self._cached_execution_ids.get(value)
+
+    cpdef void prewarm(
+        self,
+        list trader_ids=None,
+        list account_ids=None,
+        list strategy_ids=None,
+        list symbols=None,
+    ) except *:
+        """
+        Parse and cache the given identifier values ahead of use.
+
+        Parameters
+        ----------
+        trader_ids : list[str], optional
+            The trader identifier values to cache.
+        account_ids : list[str], optional
+            The account identifier values to cache.
+        strategy_ids : list[str], optional
+            The strategy identifier values to cache.
+        symbols : list[str], optional
+            The symbol values to cache.
+
+        """
+        if trader_ids:
+            self._cached_trader_ids.prewarm(trader_ids)
+        if account_ids:
+            self._cached_account_ids.prewarm(account_ids)
+        if strategy_ids:
+            self._cached_strategy_ids.prewarm(strategy_ids)
+        if symbols:
+            self._cached_symbols.prewarm(symbols)
+
+    cpdef dict stats(self):
+        """
+        Return the hit, miss and eviction counts for each identifier cache.
+
+        Returns
+        -------
+        dict[str, dict[str, int]]
+
+        """
+        cdef dict caches = {
+            "trader_ids": self._cached_trader_ids,
+            "account_ids": self._cached_account_ids,
+            "strategy_ids": self._cached_strategy_ids,
+            "symbols": self._cached_symbols,
+            "cl_ord_ids": self._cached_cl_ord_ids,
+            "position_ids": self._cached_position_ids,
+            "execution_ids": self._cached_execution_ids,
+        }
+
+        cdef str name
+        cdef ObjectCache cache
+        return {
+            name: {
+                "size": len(cache.keys()),
+                "hits": cache.hits,
+                "misses": cache.misses,
+                "evictions": cache.evictions,
+            } for name, cache in caches.items()
+        }
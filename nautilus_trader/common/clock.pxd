@@ -18,6 +18,7 @@ from cpython.datetime cimport timedelta
 from cpython.datetime cimport tzinfo
 
 from nautilus_trader.common.timer cimport LiveTimer
+from nautilus_trader.common.timer cimport LoopTimer
 from nautilus_trader.common.timer cimport TimeEvent
 from nautilus_trader.common.timer cimport Timer
 from nautilus_trader.common.uuid cimport UUIDFactory
@@ -38,10 +39,13 @@ cdef class Clock:
     """The number of timers active in the clock.\n\n:returns: `int`"""
     cdef readonly datetime next_event_time
     """The timestamp of the next time event.\n\n:returns: `datetime`"""
+    cdef readonly long long next_event_time_ns
+    """The UNIX timestamp (nanoseconds) of the next time event.\n\n:returns: `int`"""
     cdef readonly str next_event_name
     """The name of the next time event.\n\n:returns: `str`"""
 
     cpdef datetime utc_now(self)
+    cpdef long long timestamp_ns(self) except *
     cpdef datetime local_now(self, tzinfo tz)
     cpdef timedelta delta(self, datetime time)
     cpdef list timer_names(self)
@@ -76,6 +80,7 @@ cdef class Clock:
 
 cdef class TestClock(Clock):
     cdef datetime _time
+    cdef long long _time_ns
     cdef dict _pending_events
 
     cpdef void set_time(self, datetime to_time) except *
@@ -83,6 +88,16 @@ cdef class TestClock(Clock):
 
 
 cdef class LiveClock(Clock):
+    cdef list _heap
+    cdef long _heap_seq
+    cdef object _handle
+    cdef long long _handle_time_ns
+
+    cdef readonly object loop
+    """The event loop driving the clocks timers (if None then timers run on threads).\n\n:returns: `AbstractEventLoop` or `None`"""
+
     cpdef void _raise_time_event(self, LiveTimer timer) except *
 
     cdef inline void _handle_time_event(self, TimeEvent event) except *
+    cdef inline void _push_timer(self, LoopTimer timer) except *
+    cdef inline void _schedule_next(self) except *
@@ -13,6 +13,9 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import heapq
+import time
+
 import cython
 import numpy as np
 import pytz
@@ -21,11 +24,13 @@ from cpython.datetime cimport datetime
 from cpython.datetime cimport timedelta
 from cpython.datetime cimport tzinfo
 
+from nautilus_trader.common.timer cimport LoopTimer
 from nautilus_trader.common.timer cimport TestTimer
 from nautilus_trader.common.timer cimport TimeEventHandler
 from nautilus_trader.common.uuid cimport UUIDFactory
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.core.datetime cimport UNIX_EPOCH
+from nautilus_trader.core.datetime cimport to_unix_nanos
 
 
 cdef class Clock:
@@ -49,6 +54,7 @@ cdef class Clock:
 
         self.timer_count = 0
         self.next_event_time = None
+        self.next_event_time_ns = 0
         self.next_event_name = None
 
     cpdef datetime utc_now(self):
@@ -56,6 +62,11 @@ cdef class Clock:
         # As the method implies, this should return a tz-aware UTC datetime
         raise NotImplementedError("method must be implemented in the subclass")
 
+    cpdef long long timestamp_ns(self) except *:
+        """Abstract method (implement in subclass)."""
+        # As the method implies, this should return the UNIX time in nanoseconds
+        raise NotImplementedError("method must be implemented in the subclass")
+
     cpdef datetime local_now(self, tzinfo tz):
         """
         Calculate the current datetime of the clock in the given local timezone.
@@ -348,20 +359,19 @@ cdef class Clock:
     cdef inline void _update_timing(self) except *:
         if self.timer_count == 0:
             self.next_event_time = None
-            return
-        elif self.timer_count == 1:
-            self.next_event_time = self._stack[0].next_time
+            self.next_event_time_ns = 0
             return
 
-        cdef datetime next_time = self._stack[0].next_time
-        cdef datetime observed
+        cdef Timer next_timer = self._stack[0]
+        cdef Timer observed
         cdef int i
-        for i in range(self.timer_count - 1):
-            observed = self._stack[i + 1].next_time
-            if observed < next_time:
-                next_time = observed
+        for i in range(1, self.timer_count):
+            observed = self._stack[i]
+            if observed.next_time_ns < next_timer.next_time_ns:
+                next_timer = observed
 
-        self.next_event_time = next_time
+        self.next_event_time = next_timer.next_time
+        self.next_event_time_ns = next_timer.next_time_ns
 
 
 cdef class TestClock(Clock):
@@ -383,6 +393,7 @@ cdef class TestClock(Clock):
         super().__init__()
 
         self._time = initial_time
+        self._time_ns = to_unix_nanos(initial_time)
         self.is_test_clock = True
 
     cpdef datetime utc_now(self):
@@ -395,6 +406,16 @@ cdef class TestClock(Clock):
         """
         return self._time
 
+    cpdef long long timestamp_ns(self) except *:
+        """
+        Returns
+        -------
+        int
+            The current UNIX time of the clock in nanoseconds.
+
+        """
+        return self._time_ns
+
     cpdef void set_time(self, datetime to_time) except *:
         """
         Set the clocks datetime to the given time (UTC).
@@ -408,6 +429,7 @@ cdef class TestClock(Clock):
         Condition.not_none(to_time, "to_time")
 
         self._time = to_time
+        self._time_ns = to_unix_nanos(to_time)
 
     cpdef list advance_time(self, datetime to_time):
         """
@@ -430,19 +452,21 @@ cdef class TestClock(Clock):
 
         """
         Condition.not_none(to_time, "to_time")
-        Condition.true(to_time >= self._time, "to_time >= self._time")  # Ensure monotonic
+        cdef long long to_time_ns = to_unix_nanos(to_time)
+        Condition.true(to_time_ns >= self._time_ns, "to_time >= self._time")  # Ensure monotonic
 
         cdef list event_handlers = []
 
-        if self.timer_count == 0 or to_time < self.next_event_time:
+        if self.timer_count == 0 or to_time_ns < self.next_event_time_ns:
             self._time = to_time
+            self._time_ns = to_time_ns
             return event_handlers  # No timer events to iterate
 
         # Iterate timer events
         cdef TestTimer timer
         cdef TimeEvent event
         for timer in self._stack:
-            for event in timer.advance(to_time):
+            for event in timer.advance_ns(to_time_ns):
                 event_handlers.append(TimeEventHandler(event, timer.callback))
 
         # Remove expired timers
@@ -452,6 +476,7 @@ cdef class TestClock(Clock):
 
         self._update_timing()
         self._time = to_time
+        self._time_ns = to_time_ns
         return sorted(event_handlers)
 
     cdef Timer _create_timer(
@@ -475,14 +500,38 @@ cdef class TestClock(Clock):
 cdef class LiveClock(Clock):
     """
     Provides a clock for live trading. All times are timezone aware UTC.
+
+    By default each timer fires from its own timer thread. If an event loop is
+    passed then all timers are held in a single heap ordered by next time, with
+    one `loop.call_at` handle scheduled for the earliest deadline, and time
+    events are handled on the event loop thread.
     """
 
-    def __init__(self):
+    def __init__(self, loop=None):
         """
         Initialize a new instance of the `LiveClock` class.
+
+        Parameters
+        ----------
+        loop : asyncio.AbstractEventLoop, optional
+            The event loop to drive the clocks timers (if None then each timer
+            runs on its own thread).
+
+        Notes
+        -----
+        When driven by an event loop, timers should only be set and cancelled
+        from the event loop thread.
+
         """
         super().__init__()
 
+        self._heap = []    # type: list[(int, int, LoopTimer)]
+        self._heap_seq = 0
+        self._handle = None
+        self._handle_time_ns = 0
+
+        self.loop = loop
+
     cpdef datetime utc_now(self):
         """
         Returns
@@ -501,6 +550,43 @@ cdef class LiveClock(Clock):
         # by humans.
         return datetime.now(tz=pytz.utc)
 
+    cpdef long long timestamp_ns(self) except *:
+        """
+        Returns
+        -------
+        int
+            The current UNIX time of the clock in nanoseconds.
+
+        """
+        return time.time_ns()
+
+    cpdef void cancel_timer(self, str name) except *:
+        """
+        Cancel the timer corresponding to the given label.
+
+        Parameters
+        ----------
+        name : str
+            The name for the timer to cancel.
+
+        Notes
+        -----
+        Logs a warning if a timer with the given name is not found (it may have
+        already been cancelled).
+
+        """
+        Clock.cancel_timer(self, name)
+
+        if self.loop is None:
+            return
+
+        # Cancelled timers are removed from the heap lazily, compact the heap
+        # once stale entries outnumber the active timers.
+        if len(self._heap) > 2 * self.timer_count + 8:
+            self._heap = [item for item in self._heap if self._timers.get(item[2].name) is item[2]]
+            heapq.heapify(self._heap)
+        self._schedule_next()
+
     cdef Timer _create_timer(
         self,
         str name,
@@ -510,14 +596,27 @@ cdef class LiveClock(Clock):
         datetime start_time,
         datetime stop_time,
     ):
-        return LiveTimer(
+        if self.loop is None:
+            return LiveTimer(
+                name=name,
+                callback=self._raise_time_event,
+                interval=interval,
+                now=now,
+                start_time=start_time,
+                stop_time=stop_time,
+            )
+
+        cdef LoopTimer timer = LoopTimer(
             name=name,
-            callback=self._raise_time_event,
+            callback=callback,
             interval=interval,
-            now=now,
             start_time=start_time,
             stop_time=stop_time,
         )
+        self._push_timer(timer)
+        self._schedule_next()
+
+        return timer
 
     cpdef void _raise_time_event(self, LiveTimer timer) except *:
         cdef datetime now = self.utc_now()
@@ -535,3 +634,54 @@ cdef class LiveClock(Clock):
         handler = self._handlers.get(event.name)
         if handler is not None:
             handler(event)
+
+    cdef inline void _push_timer(self, LoopTimer timer) except *:
+        # The sequence number breaks ties between equal deadlines so timers
+        # themselves are never compared.
+        self._heap_seq += 1
+        heapq.heappush(self._heap, (timer.next_time_ns, self._heap_seq, timer))
+
+    cdef inline void _schedule_next(self) except *:
+        if not self._heap:
+            if self._handle is not None:
+                self._handle.cancel()
+                self._handle = None
+            return
+
+        cdef long long deadline_ns = self._heap[0][0]
+        if self._handle is not None:
+            if self._handle_time_ns == deadline_ns:
+                return  # Already scheduled
+            self._handle.cancel()
+
+        cdef double delay = max(0, deadline_ns - time.time_ns()) / 1_000_000_000
+        self._handle = self.loop.call_at(self.loop.time() + delay, self._fire_timers)
+        self._handle_time_ns = deadline_ns
+
+    def _fire_timers(self):
+        # Called by the event loop at the earliest timer deadline
+        self._handle = None
+
+        cdef long long now_ns = time.time_ns()
+        cdef LoopTimer timer
+        cdef TimeEvent event
+        try:
+            while self._heap and self._heap[0][0] <= now_ns:
+                timer = heapq.heappop(self._heap)[2]
+                if timer.expired or self._timers.get(timer.name) is not timer:
+                    continue  # Timer was cancelled or replaced
+
+                event = timer.pop_event(self._uuid_factory.generate())
+                timer._iterate_next_time_ns(now_ns)
+                try:
+                    self._handle_time_event(event)
+                finally:
+                    if timer.expired:
+                        self._remove_timer(timer)
+                    else:  # Continue timing
+                        self._push_timer(timer)
+                        self._update_timing()
+        finally:
+            # A raising handler propagates to the loops exception handler,
+            # any other due timers fire on the next (immediate) callback.
+            self._schedule_next()
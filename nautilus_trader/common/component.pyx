@@ -26,6 +26,7 @@ from nautilus_trader.common.c_enums.component_trigger cimport ComponentTrigger
 from nautilus_trader.common.c_enums.component_trigger cimport ComponentTriggerParser
 from nautilus_trader.core.fsm cimport FiniteStateMachine
 from nautilus_trader.core.fsm cimport InvalidStateTrigger
+from nautilus_trader.core.fsm cimport StateTransitionTable
 
 
 cdef dict _COMPONENT_STATE_TABLE = {
@@ -45,6 +46,9 @@ cdef dict _COMPONENT_STATE_TABLE = {
     (ComponentState.DISPOSING, ComponentTrigger.DISPOSED): ComponentState.DISPOSED,
 }
 
+# Compiled once and shared by every component FSM
+cdef StateTransitionTable _COMPONENT_STATE_TRANSITIONS = StateTransitionTable(_COMPONENT_STATE_TABLE)
+
 cdef class ComponentFSMFactory:
     """
     Provides generic component Finite-State Machines.
@@ -73,7 +77,7 @@ cdef class ComponentFSMFactory:
 
         """
         return FiniteStateMachine(
-            state_transition_table=ComponentFSMFactory.get_state_transition_table(),
+            state_transition_table=_COMPONENT_STATE_TRANSITIONS,
             initial_state=ComponentState.INITIALIZED,
             trigger_parser=ComponentTriggerParser.to_str,
             state_parser=ComponentStateParser.to_str,
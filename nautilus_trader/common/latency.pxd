@@ -0,0 +1,79 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2021 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from nautilus_trader.model.identifiers cimport StrategyId
+
+
+cpdef enum LatencyStage:
+    ADAPTER_PARSE = 0,
+    QUEUE_WAIT = 1,
+    DATA_DISPATCH = 2,
+    STRATEGY = 3,
+    EXEC_ROUTING = 4,
+    CLIENT_SEND = 5,
+    TICK_TO_TRADE = 6
+
+
+cpdef str latency_stage_to_str(int value)
+cpdef long long monotonic_ns()
+
+
+cdef class LatencyHistogram:
+    cdef int _sub_bucket_bits
+    cdef long long _sub_bucket_count
+    cdef long long _sub_bucket_half_count
+    cdef long long[:] _counts
+
+    cdef readonly int significant_figures
+    """The number of significant figures held for each value.\n\n:returns: `int`"""
+    cdef readonly long long highest_trackable
+    """The highest value tracked at full precision (nanoseconds).\n\n:returns: `int`"""
+    cdef readonly long long count
+    """The count of recorded values.\n\n:returns: `int`"""
+    cdef readonly long long min
+    """The minimum recorded value (nanoseconds).\n\n:returns: `int`"""
+    cdef readonly long long max
+    """The maximum recorded value (nanoseconds).\n\n:returns: `int`"""
+    cdef readonly long long total
+    """The sum of the recorded values (nanoseconds).\n\n:returns: `int`"""
+
+    cpdef void record(self, long long value) except *
+    cpdef double mean(self) except *
+    cpdef long long value_at_percentile(self, double percentile) except *
+    cpdef dict stats(self)
+    cpdef void reset(self) except *
+
+    cdef inline int _index(self, long long value) except *
+    cdef inline long long _highest_equivalent(self, int index) except *
+
+
+cdef class LatencyRecorder:
+    cdef list _histograms
+    cdef dict _strategy_histograms
+    cdef object _origin
+
+    cdef readonly int significant_figures
+    """The number of significant figures held by the histograms.\n\n:returns: `int`"""
+    cdef readonly long long highest_trackable
+    """The highest value tracked by the histograms (nanoseconds).\n\n:returns: `int`"""
+
+    cpdef void record(self, LatencyStage stage, long long duration_ns, StrategyId strategy_id=*) except *
+    cpdef long long origin_ns(self) except *
+    cpdef void set_origin_ns(self, long long origin_ns) except *
+    cpdef LatencyHistogram histogram(self, LatencyStage stage, StrategyId strategy_id=*)
+    cpdef dict report(self)
+    cpdef void reset(self) except *
+
+    cdef inline LatencyHistogram _new_histogram(self)
@@ -0,0 +1,468 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2021 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import threading
+from time import perf_counter_ns
+
+import numpy as np
+
+cimport cython
+from libc.math cimport ceil
+
+from nautilus_trader.core.correctness cimport Condition
+from nautilus_trader.model.identifiers cimport StrategyId
+
+
+cdef tuple _PERCENTILES = (50.0, 90.0, 99.0, 99.9)
+cdef tuple _PERCENTILE_KEYS = ("p50", "p90", "p99", "p99.9")
+
+
+cpdef str latency_stage_to_str(int value):
+    """
+    Covert a C enum int to a latency stage string.
+
+    Parameters
+    ----------
+    value : int
+        The value to convert.
+
+    Returns
+    -------
+    str
+
+    """
+    if value == 0:
+        return "ADAPTER_PARSE"
+    elif value == 1:
+        return "QUEUE_WAIT"
+    elif value == 2:
+        return "DATA_DISPATCH"
+    elif value == 3:
+        return "STRATEGY"
+    elif value == 4:
+        return "EXEC_ROUTING"
+    elif value == 5:
+        return "CLIENT_SEND"
+    elif value == 6:
+        return "TICK_TO_TRADE"
+    else:
+        return "UNDEFINED"
+
+
+cpdef long long monotonic_ns():
+    """
+    Return the current monotonic timestamp used for latency stamps.
+
+    This is the clock of `time.perf_counter_ns`, only the difference between
+    two stamps is meaningful.
+
+    Returns
+    -------
+    int
+        The timestamp in nanoseconds.
+
+    """
+    return perf_counter_ns()
+
+
+cdef class LatencyHistogram:
+    """
+    Provides a histogram of latency values with a fixed relative precision.
+
+    Values are counted in log-linear buckets (in the manner of an HDR
+    histogram), so recording is constant time, memory is fixed up front, and
+    every value up to the highest trackable value is held to the given number
+    of significant figures.
+    """
+
+    def __init__(
+        self,
+        int significant_figures=2,
+        long long highest_trackable=3_600_000_000_000,
+    ):
+        """
+        Initialize a new instance of the `LatencyHistogram` class.
+
+        Parameters
+        ----------
+        significant_figures : int
+            The number of significant figures to hold for each value.
+        highest_trackable : int
+            The highest value to track at full precision (nanoseconds), larger
+            values are counted in the highest bucket.
+
+        Raises
+        ------
+        ValueError
+            If significant_figures is not in range [1, 3].
+        ValueError
+            If highest_trackable is not positive (> 0).
+
+        """
+        Condition.in_range_int(significant_figures, 1, 3, "significant_figures")
+        Condition.positive(highest_trackable, "highest_trackable")
+
+        # Sub-buckets must resolve 2 * 10^significant_figures distinct values
+        cdef long long resolution = 2
+        cdef int i
+        for i in range(significant_figures):
+            resolution *= 10
+        self._sub_bucket_bits = 1
+        while (1 << self._sub_bucket_bits) < resolution:
+            self._sub_bucket_bits += 1
+        self._sub_bucket_count = 1 << self._sub_bucket_bits
+        self._sub_bucket_half_count = self._sub_bucket_count >> 1
+
+        self.significant_figures = significant_figures
+        self.highest_trackable = highest_trackable
+        self._counts = np.zeros(self._index(highest_trackable) + 1, dtype=np.int64)
+
+        self.count = 0
+        self.min = 0
+        self.max = 0
+        self.total = 0
+
+    def __repr__(self) -> str:
+        return (f"{type(self).__name__}("
+                f"count={self.count}, "
+                f"min={self.min}, "
+                f"max={self.max})")
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cpdef void record(self, long long value) except *:
+        """
+        Record the given value.
+
+        Parameters
+        ----------
+        value : int
+            The value to record (nanoseconds), negative values are recorded
+            as zero.
+
+        """
+        if value < 0:
+            value = 0
+
+        cdef long long tracked = value
+        if tracked > self.highest_trackable:
+            tracked = self.highest_trackable
+
+        self._counts[self._index(tracked)] += 1
+
+        if self.count == 0 or value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        self.count += 1
+        self.total += value
+
+    cpdef double mean(self) except *:
+        """
+        Return the mean of the recorded values.
+
+        Returns
+        -------
+        double
+            The mean in nanoseconds (zero if no values recorded).
+
+        """
+        if self.count == 0:
+            return 0.0
+        return <double>self.total / self.count
+
+    cpdef long long value_at_percentile(self, double percentile) except *:
+        """
+        Return the value at the given percentile.
+
+        The value is the highest value equivalent to the bucket the percentile
+        falls in, capped at the maximum recorded value.
+
+        Parameters
+        ----------
+        percentile : double
+            The percentile in range [0, 100].
+
+        Returns
+        -------
+        int
+            The value in nanoseconds (zero if no values recorded).
+
+        Raises
+        ------
+        ValueError
+            If percentile is not in range [0, 100].
+
+        """
+        Condition.in_range(percentile, 0, 100, "percentile")
+
+        if self.count == 0:
+            return 0
+
+        cdef long long target = <long long>ceil(percentile / 100 * self.count)
+        if target < 1:
+            target = 1
+
+        cdef long long cumulative = 0
+        cdef int i
+        for i in range(self._counts.shape[0]):
+            cumulative += self._counts[i]
+            if cumulative >= target:
+                return min(self._highest_equivalent(i), self.max)
+
+        return self.max
+
+    cpdef dict stats(self):
+        """
+        Return the summary statistics of the recorded values.
+
+        Returns
+        -------
+        dict[str, object]
+            The count, min, mean, percentiles and max (nanoseconds).
+
+        """
+        cdef dict stats = {
+            "count": self.count,
+            "min": self.min,
+            "mean": self.mean(),
+        }
+
+        cdef int i
+        for i in range(len(_PERCENTILES)):
+            stats[_PERCENTILE_KEYS[i]] = self.value_at_percentile(_PERCENTILES[i])
+
+        stats["max"] = self.max
+        return stats
+
+    cpdef void reset(self) except *:
+        """
+        Reset the histogram.
+
+        All stateful fields are reset to their initial value.
+        """
+        self._counts[:] = 0
+        self.count = 0
+        self.min = 0
+        self.max = 0
+        self.total = 0
+
+    cdef inline int _index(self, long long value) except *:
+        if value < self._sub_bucket_count:
+            return value
+
+        # Shift the value into the upper half of the sub-bucket range, each
+        # extra bit of magnitude is a further bucket of half count sub-buckets.
+        cdef int shift = 1
+        while (value >> shift) >= self._sub_bucket_count:
+            shift += 1
+
+        return (
+            self._sub_bucket_count
+            + (shift - 1) * self._sub_bucket_half_count
+            + (value >> shift)
+            - self._sub_bucket_half_count
+        )
+
+    cdef inline long long _highest_equivalent(self, int index) except *:
+        if index < self._sub_bucket_count:
+            return index
+
+        cdef long long offset = index - self._sub_bucket_count
+        cdef int shift = <int>(offset // self._sub_bucket_half_count) + 1
+        cdef long long sub_bucket = offset % self._sub_bucket_half_count + self._sub_bucket_half_count
+        return ((sub_bucket + 1) << shift) - 1
+
+
+cdef class LatencyRecorder:
+    """
+    Provides a recorder of the latency of each stage between receiving market
+    data from a venue and sending an order to it.
+
+    Durations are aggregated per stage, and per strategy for the stages run on
+    behalf of a strategy. Components hold no recorder unless latency
+    statistics are enabled, so the cost when disabled is a single check.
+
+    The receive stamp of the tick being dispatched (the origin) is held per
+    thread, so commands sent from another thread during a dispatch are not
+    attributed to the tick.
+    """
+
+    def __init__(
+        self,
+        int significant_figures=2,
+        long long highest_trackable=3_600_000_000_000,
+    ):
+        """
+        Initialize a new instance of the `LatencyRecorder` class.
+
+        Parameters
+        ----------
+        significant_figures : int
+            The number of significant figures for the histograms.
+        highest_trackable : int
+            The highest value tracked by the histograms (nanoseconds).
+
+        Raises
+        ------
+        ValueError
+            If significant_figures is not in range [1, 3].
+        ValueError
+            If highest_trackable is not positive (> 0).
+
+        """
+        Condition.in_range_int(significant_figures, 1, 3, "significant_figures")
+        Condition.positive(highest_trackable, "highest_trackable")
+
+        self.significant_figures = significant_figures
+        self.highest_trackable = highest_trackable
+
+        self._origin = threading.local()
+        self._histograms = [self._new_histogram() for _ in range(LatencyStage.TICK_TO_TRADE + 1)]
+        self._strategy_histograms = {}  # type: dict[str, list[LatencyHistogram]]
+
+    cpdef void record(self, LatencyStage stage, long long duration_ns, StrategyId strategy_id=None) except *:
+        """
+        Record the given stage duration.
+
+        Parameters
+        ----------
+        stage : LatencyStage
+            The stage for the duration.
+        duration_ns : int
+            The duration of the stage (nanoseconds).
+        strategy_id : StrategyId, optional
+            The strategy the stage was run on behalf of.
+
+        """
+        (<LatencyHistogram>self._histograms[stage]).record(duration_ns)
+
+        if strategy_id is None:
+            return
+
+        # Keyed by the identifiers value as the hash of a str is cached
+        cdef list histograms = self._strategy_histograms.get(strategy_id.value)
+        if histograms is None:
+            histograms = [self._new_histogram() for _ in range(LatencyStage.TICK_TO_TRADE + 1)]
+            self._strategy_histograms[strategy_id.value] = histograms
+
+        (<LatencyHistogram>histograms[stage]).record(duration_ns)
+
+    cpdef long long origin_ns(self) except *:
+        """
+        Return the receive stamp of the tick being dispatched on the calling
+        thread.
+
+        Returns
+        -------
+        int
+            The stamp in nanoseconds, zero if no tick is being dispatched.
+
+        """
+        return getattr(self._origin, "ns", 0)
+
+    cpdef void set_origin_ns(self, long long origin_ns) except *:
+        """
+        Set the receive stamp of the tick being dispatched on the calling
+        thread.
+
+        Parameters
+        ----------
+        origin_ns : int
+            The stamp in nanoseconds, zero when the dispatch ends.
+
+        """
+        self._origin.ns = origin_ns
+
+    cpdef LatencyHistogram histogram(self, LatencyStage stage, StrategyId strategy_id=None):
+        """
+        Return the histogram for the given stage.
+
+        Parameters
+        ----------
+        stage : LatencyStage
+            The stage for the histogram.
+        strategy_id : StrategyId, optional
+            The strategy for the histogram, if None then the histogram of all
+            durations for the stage.
+
+        Returns
+        -------
+        LatencyHistogram or None
+            None if no durations were recorded for the strategy.
+
+        """
+        if strategy_id is None:
+            return self._histograms[stage]
+
+        cdef list histograms = self._strategy_histograms.get(strategy_id.value)
+        if histograms is None:
+            return None
+
+        return histograms[stage]
+
+    cpdef dict report(self):
+        """
+        Return a report of the recorded latencies.
+
+        Only stages with recorded durations are included.
+
+        Returns
+        -------
+        dict[str, dict]
+            The summary statistics per stage under "stages", and per strategy
+            then stage under "strategies" (nanoseconds).
+
+        """
+        cdef dict stages = {}
+        cdef LatencyHistogram histogram
+        cdef int i
+        for i in range(len(self._histograms)):
+            histogram = self._histograms[i]
+            if histogram.count > 0:
+                stages[latency_stage_to_str(i)] = histogram.stats()
+
+        cdef dict strategies = {}
+        cdef dict strategy_stages
+        cdef str strategy_id
+        cdef list histograms
+        for strategy_id, histograms in self._strategy_histograms.items():
+            strategy_stages = {}
+            for i in range(len(histograms)):
+                histogram = histograms[i]
+                if histogram.count > 0:
+                    strategy_stages[latency_stage_to_str(i)] = histogram.stats()
+            strategies[strategy_id] = strategy_stages
+
+        return {
+            "stages": stages,
+            "strategies": strategies,
+        }
+
+    cpdef void reset(self) except *:
+        """
+        Reset the recorder.
+
+        All stateful fields are reset to their initial value.
+        """
+        cdef LatencyHistogram histogram
+        for histogram in self._histograms:
+            histogram.reset()
+
+        self._strategy_histograms.clear()
+        self._origin = threading.local()
+
+    cdef inline LatencyHistogram _new_histogram(self):
+        return LatencyHistogram(self.significant_figures, self.highest_trackable)
@@ -41,12 +41,18 @@ cdef class Timer:
     """The timers callback function.\n\n:returns: `object`"""
     cdef readonly timedelta interval
     """The timers set interval.\n\n:returns: `timedelta`"""
+    cdef readonly long long interval_ns
+    """The timers set interval (nanoseconds).\n\n:returns: `int`"""
     cdef readonly datetime start_time
     """The timers set start time.\n\n:returns: `datetime`"""
     cdef readonly datetime next_time
     """The timers next alert timestamp.\n\n:returns: `datetime`"""
+    cdef readonly long long next_time_ns
+    """The timers next alert UNIX timestamp (nanoseconds).\n\n:returns: `int`"""
     cdef readonly datetime stop_time
     """The timers set stop time (if set).\n\n:returns: `datetime`"""
+    cdef readonly long long stop_time_ns
+    """The timers set stop UNIX timestamp (nanoseconds), zero if not set.\n\n:returns: `int`"""
     cdef readonly bint expired
     """If the timer is expired.\n\n:returns: `bool`"""
 
@@ -54,12 +60,15 @@ cdef class Timer:
     cpdef void iterate_next_time(self, datetime now) except *
     cpdef void cancel(self) except *
 
+    cdef inline void _iterate_next_time_ns(self, long long now_ns) except *
+
 
 cdef class TestTimer(Timer):
     cdef UUIDFactory _uuid_factory
 
     cpdef Event pop_next_event(self)
     cpdef list advance(self, datetime to_time)
+    cdef list advance_ns(self, long long to_time_ns)
 
 
 cdef class LiveTimer(Timer):
@@ -67,3 +76,7 @@ cdef class LiveTimer(Timer):
 
     cpdef void repeat(self, datetime now) except *
     cdef object _start_timer(self, datetime now)
+
+
+cdef class LoopTimer(Timer):
+    pass
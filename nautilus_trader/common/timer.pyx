@@ -21,6 +21,7 @@ from cpython.datetime cimport timedelta
 from nautilus_trader.common.timer cimport TimeEvent
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.core.datetime cimport format_iso8601
+from nautilus_trader.core.datetime cimport to_unix_nanos
 from nautilus_trader.core.message cimport Event
 from nautilus_trader.core.uuid cimport UUID
 
@@ -80,22 +81,22 @@ cdef class TimeEventHandler:
         self._handler(self.event)
 
     def __eq__(self, TimeEventHandler other) -> bool:
-        return self.event.timestamp == other.event.timestamp
+        return self.event.timestamp_ns == other.event.timestamp_ns
 
     def __ne__(self, TimeEventHandler other) -> bool:
-        return self.event.timestamp != other.event.timestamp
+        return self.event.timestamp_ns != other.event.timestamp_ns
 
     def __lt__(self, TimeEventHandler other) -> bool:
-        return self.event.timestamp < other.event.timestamp
+        return self.event.timestamp_ns < other.event.timestamp_ns
 
     def __le__(self, TimeEventHandler other) -> bool:
-        return self.event.timestamp <= other.event.timestamp
+        return self.event.timestamp_ns <= other.event.timestamp_ns
 
     def __gt__(self, TimeEventHandler other) -> bool:
-        return self.event.timestamp > other.event.timestamp
+        return self.event.timestamp_ns > other.event.timestamp_ns
 
     def __ge__(self, TimeEventHandler other) -> bool:
-        return self.event.timestamp >= other.event.timestamp
+        return self.event.timestamp_ns >= other.event.timestamp_ns
 
     def __repr__(self) -> str:
         return (f"{type(self).__name__}("
@@ -143,9 +144,15 @@ cdef class Timer:
         self.name = name
         self.callback = callback
         self.interval = interval
+        self.interval_ns = (
+            (<long long>interval.days * 86400 + interval.seconds) * 1_000_000_000
+            + <long long>interval.microseconds * 1000
+        )
         self.start_time = start_time
         self.next_time = start_time + interval
+        self.next_time_ns = to_unix_nanos(self.next_time)
         self.stop_time = stop_time
+        self.stop_time_ns = to_unix_nanos(stop_time) if stop_time is not None else 0
         self.expired = False
 
     def __eq__(self, Timer other) -> bool:
@@ -191,8 +198,12 @@ cdef class Timer:
         """
         Condition.not_none(now, "now")
 
+        self._iterate_next_time_ns(to_unix_nanos(now))
+
+    cdef inline void _iterate_next_time_ns(self, long long now_ns) except *:
         self.next_time += self.interval
-        if self.stop_time and now >= self.stop_time:
+        self.next_time_ns += self.interval_ns
+        if self.stop_time_ns and now_ns >= self.stop_time_ns:
             self.expired = True
 
     cpdef void cancel(self) except *:
@@ -254,10 +265,13 @@ cdef class TestTimer(Timer):
         """
         Condition.not_none(to_time, "to_time")
 
+        return self.advance_ns(to_unix_nanos(to_time))
+
+    cdef list advance_ns(self, long long to_time_ns):
         cdef list events = []  # type: list[TimeEvent]
-        while not self.expired and to_time >= self.next_time:
+        while not self.expired and to_time_ns >= self.next_time_ns:
             events.append(self.pop_event(self._uuid_factory.generate()))
-            self.iterate_next_time(self.next_time)
+            self._iterate_next_time_ns(self.next_time_ns)
 
         return events
 
@@ -276,7 +290,7 @@ cdef class TestTimer(Timer):
 
         """
         cdef TimeEvent event = self.pop_event(self._uuid_factory.generate())
-        self.iterate_next_time(self.next_time)
+        self._iterate_next_time_ns(self.next_time_ns)
 
         return event
 
@@ -360,3 +374,51 @@ cdef class LiveTimer(Timer):
         timer.start()
 
         return timer
+
+
+cdef class LoopTimer(Timer):
+    """
+    Provides a timer for live trading which is driven by an event loop.
+
+    The timer holds no thread or handle of its own, the owning `LiveClock`
+    schedules the timers next time on its event loop.
+    """
+
+    def __init__(
+        self,
+        str name not None,
+        callback not None: callable,
+        timedelta interval not None,
+        datetime start_time not None,
+        datetime stop_time=None,
+    ):
+        """
+        Initialize a new instance of the `LoopTimer` class.
+
+        Parameters
+        ----------
+        name : str
+            The name for the timer.
+        callback : callable
+            The function to call at the next time.
+        interval : timedelta
+            The time interval for the timer.
+        start_time : datetime
+            The start datetime for the timer (UTC).
+        stop_time : datetime, optional
+            The stop datetime for the timer (UTC) (if None then timer repeats).
+
+        Raises
+        ------
+        TypeError
+            If callback is not of type callable.
+
+        """
+        Condition.valid_string(name, "name")
+        super().__init__(name, callback, interval, start_time, stop_time)
+
+    cpdef void cancel(self) except *:
+        """
+        Cancels the timer (the timer will not generate an event).
+        """
+        self.expired = True
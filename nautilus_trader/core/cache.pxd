@@ -15,14 +15,25 @@
 
 
 cdef class ObjectCache:
-    cdef dict _cache
+    cdef object _cache
     cdef object _parser
 
     cdef readonly type type_key
     """The caches key type.\n\n:returns: `type`"""
     cdef readonly type type_value
     """The caches value type.\n\n:returns: `type`"""
+    cdef readonly int capacity
+    """The maximum number of objects held in the cache.\n\n:returns: `int`"""
+    cdef readonly long hits
+    """The count of gets returning a cached object.\n\n:returns: `int`"""
+    cdef readonly long misses
+    """The count of gets which parsed a new object.\n\n:returns: `int`"""
+    cdef readonly long evictions
+    """The count of least recently used objects evicted from the cache.\n\n:returns: `int`"""
 
     cpdef object get(self, str key)
     cpdef list keys(self)
+    cpdef void prewarm(self, list keys) except *
     cpdef void clear(self) except *
+
+    cdef inline void _put(self, str key, object parsed) except *
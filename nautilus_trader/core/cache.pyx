@@ -20,15 +20,24 @@ The intended use is to reduce the creation of duplicate objects such as
 identifiers, which represent the same thing.
 """
 
+from collections import OrderedDict
+
 from nautilus_trader.core.correctness cimport Condition
 
 
 cdef class ObjectCache:
     """
-    Provides an object cache with strings as keys.
+    Provides a size capped object cache with strings as keys.
+
+    When the cache is full the least recently used object is evicted.
     """
 
-    def __init__(self, type type_value not None, parser not None: callable):
+    def __init__(
+        self,
+        type type_value not None,
+        parser not None: callable,
+        int capacity=10000,
+    ):
         """
         Initialize a new instance of the `ObjectCache` class.
 
@@ -38,16 +47,29 @@ cdef class ObjectCache:
             The type of the cached objects.
         parser : callable
             The parser function to created an object for the cache.
+        capacity : int, optional
+            The maximum number of objects to hold in the cache.
+
+        Raises
+        ------
+        ValueError
+            If capacity is not positive (> 0).
 
         """
+        Condition.positive_int(capacity, "capacity")
+
         self.type_key = str
         self.type_value = type_value
-        self._cache = {}
+        self.capacity = capacity
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._cache = OrderedDict()  # type: OrderedDict[str, object]
         self._parser = parser
 
     cpdef list keys(self):
         """
-        The keys held in the cache.
+        The keys held in the cache (least recently used first).
 
         Returns
         -------
@@ -76,13 +98,44 @@ cdef class ObjectCache:
 
         parsed = self._cache.get(key)
         if parsed is None:
+            self.misses += 1
             parsed = self._parser(key)
-            self._cache[key] = parsed
+            self._put(key, parsed)
+        else:
+            self.hits += 1
+            self._cache.move_to_end(key)
 
         return parsed
 
+    cpdef void prewarm(self, list keys) except *:
+        """
+        Parse and cache the objects for the given keys ahead of use.
+
+        Parameters
+        ----------
+        keys : list[str]
+            The keys of the objects to cache.
+
+        """
+        Condition.not_none(keys, "keys")
+
+        cdef str key
+        for key in keys:
+            Condition.valid_string(key, "key")
+            if key not in self._cache:
+                self._put(key, self._parser(key))
+
     cpdef void clear(self) except *:
         """
-        Clear all cached values.
+        Clear all cached values and reset the counters.
         """
         self._cache.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    cdef inline void _put(self, str key, object parsed) except *:
+        self._cache[key] = parsed
+        if len(self._cache) > self.capacity:
+            self._cache.popitem(last=False)
+            self.evictions += 1
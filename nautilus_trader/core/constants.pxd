@@ -74,6 +74,7 @@ cdef str BALANCES_FREE
 cdef str BALANCES_LOCKED
 
 cdef str INSTRUMENT
+cdef str ASSET_CLASS
 cdef str BASE_CURRENCY
 cdef str QUOTE_CURRENCY
 cdef str SETTLEMENT_CURRENCY
@@ -86,10 +87,13 @@ cdef str SIZE_PRECISION
 cdef str TICK_SIZE
 cdef str LOT_SIZE
 cdef str MULTIPLIER
+cdef str LEVERAGE
 cdef str MIN_QUANTITY
 cdef str MAX_QUANTITY
 cdef str MIN_NOTIONAL
 cdef str MAX_NOTIONAL
+cdef str MIN_PRICE
+cdef str MAX_PRICE
 cdef str MARGIN_INIT
 cdef str MARGIN_MAINT
 cdef str MAKER_FEE
@@ -97,6 +101,7 @@ cdef str TAKER_FEE
 cdef str SETTLEMENT_FEE
 cdef str FUNDING_LONG
 cdef str FUNDING_SHORT
+cdef str FINANCING
 
 cdef str FROM_DATETIME
 cdef str TO_DATETIME
@@ -74,6 +74,7 @@ BALANCES_FREE = "BalancesFree"
 BALANCES_LOCKED = "BalancesLocked"
 
 INSTRUMENT = "Instrument"
+ASSET_CLASS = "AssetClass"
 BASE_CURRENCY = "BaseCurrency"
 QUOTE_CURRENCY = "QuoteCurrency"
 SETTLEMENT_CURRENCY = "SettlementCurrency"
@@ -85,10 +86,13 @@ SIZE_PRECISION = "SizePrecision"
 TICK_SIZE = "TickSize"
 LOT_SIZE = "LotSize"
 MULTIPLIER = "Multiplier"
+LEVERAGE = "Leverage"
 MIN_QUANTITY = "MinQuantity"
 MAX_QUANTITY = "MaxQuantity"
 MIN_NOTIONAL = "MinNotional"
 MAX_NOTIONAL = "MaxNotional"
+MIN_PRICE = "MinPrice"
+MAX_PRICE = "MaxPrice"
 MARGIN_INIT = "MarginInit"
 MARGIN_MAINT = "MarginMaint"
 MAKER_FEE = "MakerFee"
@@ -96,6 +100,7 @@ TAKER_FEE = "TakerFee"
 SETTLEMENT_FEE = "SettlementFee"
 FUNDING_LONG = "FundingLong"
 FUNDING_SHORT = "FundingShort"
+FINANCING = "Financing"
 
 FROM_DATETIME = "FromDateTime"
 TO_DATETIME = "ToDateTime"
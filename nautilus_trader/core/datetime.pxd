@@ -19,6 +19,8 @@ cdef datetime UNIX_EPOCH
 
 
 cpdef long to_posix_ms(datetime timestamp) except *
+cpdef long long to_unix_nanos(datetime timestamp) except *
+cpdef datetime from_unix_nanos(long long nanos)
 cpdef datetime from_posix_ms(long posix)
 cpdef bint is_datetime_utc(datetime timestamp) except *
 cpdef bint is_tz_aware(time_object) except *
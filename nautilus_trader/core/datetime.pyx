@@ -19,19 +19,42 @@ related operations. Functions include awareness/tz checks and conversions, as
 well as ISO 8601 conversion.
 """
 
+from datetime import timezone
+
+import cython
 import pandas as pd
 import pytz
 
 from cpython.datetime cimport datetime
+from cpython.datetime cimport datetime_day
+from cpython.datetime cimport datetime_hour
+from cpython.datetime cimport datetime_microsecond
+from cpython.datetime cimport datetime_minute
+from cpython.datetime cimport datetime_month
+from cpython.datetime cimport datetime_new
+from cpython.datetime cimport datetime_second
 from cpython.datetime cimport datetime_tzinfo
+from cpython.datetime cimport datetime_year
+from cpython.datetime cimport import_datetime
 from cpython.datetime cimport timedelta
+from cpython.datetime cimport timedelta_days
+from cpython.datetime cimport timedelta_microseconds
+from cpython.datetime cimport timedelta_seconds
 from cpython.unicode cimport PyUnicode_Contains
 
 from nautilus_trader.core.correctness cimport Condition
 
+# Initialize the datetime C API (required for datetime_new)
+import_datetime()
+
 # Unix epoch is the UTC time at 00:00:00 on 1/1/1970
 UNIX_EPOCH = datetime(1970, 1, 1, 0, 0, 0, 0, tzinfo=pytz.utc)
 
+cdef object _PYTZ_UTC = pytz.utc
+cdef object _TIMEZONE_UTC = timezone.utc
+cdef long long _NANOS_IN_SECOND = 1_000_000_000
+cdef long long _NANOS_IN_DAY = 86400 * _NANOS_IN_SECOND
+
 
 cpdef long to_posix_ms(datetime timestamp) except *:
     """
@@ -50,6 +73,106 @@ cpdef long to_posix_ms(datetime timestamp) except *:
     return <long>((timestamp - UNIX_EPOCH).total_seconds() * 1000)
 
 
+@cython.cdivision(True)
+cdef inline long long _days_from_civil(long long year, long long month, long long day):
+    # Days since the UNIX epoch for the given proleptic Gregorian date
+    # https://howardhinnant.github.io/date_algorithms.html#days_from_civil
+    year -= month <= 2
+    cdef long long era = (year if year >= 0 else year - 399) // 400
+    cdef long long yoe = year - era * 400
+    cdef long long doy = (153 * (month + (-3 if month > 2 else 9)) + 2) // 5 + day - 1
+    cdef long long doe = yoe * 365 + yoe // 4 - yoe // 100 + doy
+    return era * 146097 + doe - 719468
+
+
+cpdef long long to_unix_nanos(datetime timestamp) except *:
+    """
+    Returns the UNIX nanoseconds timestamp for the given object.
+
+    Parameters
+    ----------
+    timestamp : datetime
+        The datetime for the timestamp (if tz-naive then assumed UTC).
+
+    Returns
+    -------
+    int
+
+    Notes
+    -----
+    Unit accuracy is microsecond.
+
+    A tz-naive datetime is read as UTC wall time (never local time), in line
+    with `as_utc_timestamp`.
+
+    """
+    cdef object tz = <object>datetime_tzinfo(timestamp)
+    if tz is None or tz is _PYTZ_UTC or tz is _TIMEZONE_UTC:
+        # Fast path for UTC (and tz-naive) avoids allocating a timedelta
+        return (
+            _days_from_civil(datetime_year(timestamp), datetime_month(timestamp), datetime_day(timestamp))
+            * _NANOS_IN_DAY
+            + (datetime_hour(timestamp) * 3600 + datetime_minute(timestamp) * 60 + datetime_second(timestamp))
+            * _NANOS_IN_SECOND
+            + <long long>datetime_microsecond(timestamp) * 1000
+        )
+
+    cdef timedelta delta = timestamp - UNIX_EPOCH
+    return (
+        (<long long>timedelta_days(delta) * 86400 + timedelta_seconds(delta)) * _NANOS_IN_SECOND
+        + <long long>timedelta_microseconds(delta) * 1000
+    )
+
+
+@cython.cdivision(True)
+cpdef datetime from_unix_nanos(long long nanos):
+    """
+    Returns the datetime in UTC from the given UNIX nanoseconds timestamp.
+
+    Parameters
+    ----------
+    nanos : int
+        The timestamp to convert.
+
+    Returns
+    -------
+    datetime
+
+    Notes
+    -----
+    Unit accuracy is microsecond (nanoseconds are truncated).
+
+    """
+    cdef long long days = nanos // _NANOS_IN_DAY
+    cdef long long nanos_of_day = nanos - days * _NANOS_IN_DAY
+    if nanos_of_day < 0:  # Floor towards the earlier day before the epoch
+        days -= 1
+        nanos_of_day += _NANOS_IN_DAY
+
+    # https://howardhinnant.github.io/date_algorithms.html#civil_from_days
+    days += 719468
+    cdef long long era = (days if days >= 0 else days - 146096) // 146097
+    cdef long long doe = days - era * 146097
+    cdef long long yoe = (doe - doe // 1460 + doe // 36524 - doe // 146096) // 365
+    cdef long long doy = doe - (365 * yoe + yoe // 4 - yoe // 100)
+    cdef long long mp = (5 * doy + 2) // 153
+    cdef long long day = doy - (153 * mp + 2) // 5 + 1
+    cdef long long month = mp + 3 if mp < 10 else mp - 9
+    cdef long long year = yoe + era * 400 + (month <= 2)
+
+    cdef long long seconds = nanos_of_day // _NANOS_IN_SECOND
+    return datetime_new(
+        year,
+        month,
+        day,
+        seconds // 3600,
+        (seconds // 60) % 60,
+        seconds % 60,
+        (nanos_of_day % _NANOS_IN_SECOND) // 1000,
+        _PYTZ_UTC,
+    )
+
+
 cpdef datetime from_posix_ms(long posix):
     """
     Returns the datetime in UTC from the given POSIX milliseconds timestamp.
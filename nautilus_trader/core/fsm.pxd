@@ -18,8 +18,22 @@ cdef class InvalidStateTrigger(Exception):
     pass
 
 
+cdef class StateTransitionTable:
+    cdef int *_next_states
+
+    cdef readonly int state_count
+    """The count of state rows in the table.\n\n:returns: `int`"""
+    cdef readonly int trigger_count
+    """The count of trigger columns in the table.\n\n:returns: `int`"""
+
+    cpdef int next_state(self, int state, int trigger) except *
+
+
 cdef class FiniteStateMachine:
-    cdef dict _state_transition_table
+    cdef StateTransitionTable _table
+    cdef int *_next_states
+    cdef int _state_count
+    cdef int _trigger_count
     cdef object _trigger_parser
     cdef object _state_parser
 
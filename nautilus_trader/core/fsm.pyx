@@ -16,9 +16,10 @@
 """
 Defines a generic `Finite-State Machine` (FSM).
 
-The FSM operates with a state-transition table of tuples and C-level enums. The
-intended use case is to ensure correct state transitions, as well as holding a
-deterministic state value.
+The FSM operates with a state-transition table of tuples and C-level enums,
+compiled into a dense array indexed by state and trigger so that a transition
+is a single lookup with no allocation. The intended use case is to ensure
+correct state transitions, as well as holding a deterministic state value.
 
 References
 ----------
@@ -26,6 +27,9 @@ https://en.wikipedia.org/wiki/Finite-state_machine
 
 """
 
+from cpython.mem cimport PyMem_Free
+from cpython.mem cimport PyMem_Malloc
+
 from nautilus_trader.core.correctness cimport Condition
 
 
@@ -36,6 +40,90 @@ cdef class InvalidStateTrigger(Exception):
     pass
 
 
+cdef class StateTransitionTable:
+    """
+    Provides a compiled state-transition table for finite state machines.
+
+    The table is held as a dense array of next states with a row per state and
+    a column per trigger, where an invalid transition holds -1. A table can be
+    compiled once and then shared by any number of FSMs.
+    """
+
+    def __init__(self, dict state_transition_table not None):
+        """
+        Initialize a new instance of the `StateTransitionTable` class.
+
+        Parameters
+        ----------
+        state_transition_table : dict of tuples and states
+            The state-transition table consisting of a tuple of starting state
+            and trigger as keys, and resulting states as values.
+
+        Raises
+        ------
+        ValueError
+            If state_transition_table is empty.
+        ValueError
+            If state_transition_table key not tuple.
+        ValueError
+            If any state or trigger is negative (< 0).
+
+        """
+        Condition.not_empty(state_transition_table, "state_transition_table")
+        Condition.dict_types(state_transition_table, tuple, object, "state_transition_table")
+
+        cdef int state_count = 0
+        cdef int trigger_count = 0
+        cdef int state
+        cdef int trigger
+        cdef int next_state
+        for (state, trigger), next_state in state_transition_table.items():
+            Condition.not_negative_int(state, "state")
+            Condition.not_negative_int(trigger, "trigger")
+            Condition.not_negative_int(next_state, "next_state")
+            state_count = max(state_count, state + 1, next_state + 1)
+            trigger_count = max(trigger_count, trigger + 1)
+
+        self._next_states = <int *>PyMem_Malloc(state_count * trigger_count * sizeof(int))
+        if self._next_states == NULL:
+            raise MemoryError()
+
+        cdef int i
+        for i in range(state_count * trigger_count):
+            self._next_states[i] = -1
+
+        for (state, trigger), next_state in state_transition_table.items():
+            self._next_states[state * trigger_count + trigger] = next_state
+
+        self.state_count = state_count
+        self.trigger_count = trigger_count
+
+    def __dealloc__(self):
+        PyMem_Free(self._next_states)
+
+    cpdef int next_state(self, int state, int trigger) except *:
+        """
+        Return the state resulting from the given state and trigger.
+
+        Parameters
+        ----------
+        state : int / C enum
+            The starting state.
+        trigger : int / C enum
+            The trigger.
+
+        Returns
+        -------
+        int
+            The next state, or -1 if the transition is invalid.
+
+        """
+        if state < 0 or state >= self.state_count or trigger < 0 or trigger >= self.trigger_count:
+            return -1
+
+        return self._next_states[state * self.trigger_count + trigger]
+
+
 cdef class FiniteStateMachine:
     """
     Provides a generic finite state machine.
@@ -43,7 +131,7 @@ cdef class FiniteStateMachine:
 
     def __init__(
         self,
-        dict state_transition_table not None,
+        state_transition_table not None,
         int initial_state,
         trigger_parser=str,
         state_parser=str,
@@ -53,9 +141,11 @@ cdef class FiniteStateMachine:
 
         Parameters
         ----------
-        state_transition_table : dict of tuples and states
+        state_transition_table : StateTransitionTable or dict of tuples and states
             The state-transition table for the FSM consisting of a tuple of
             starting state and trigger as keys, and resulting states as values.
+            Pass a compiled table to share it between FSMs, a dict will be
+            compiled for this FSM only.
         initial_state : int / C enum
             The initial state for the FSM.
         trigger_parser : callable, optional
@@ -81,12 +171,15 @@ cdef class FiniteStateMachine:
             trigger_parser = str
         if state_parser is None:
             state_parser = str
-        Condition.not_empty(state_transition_table, "state_transition_table")
-        Condition.dict_types(state_transition_table, tuple, object, "state_transition_table")
+        if not isinstance(state_transition_table, StateTransitionTable):
+            state_transition_table = StateTransitionTable(state_transition_table)
         Condition.callable_or_none(trigger_parser, "trigger_parser")
         Condition.callable_or_none(state_parser, "state_parser")
 
-        self._state_transition_table = state_transition_table
+        self._table = state_transition_table
+        self._next_states = self._table._next_states
+        self._state_count = self._table.state_count
+        self._trigger_count = self._table.trigger_count
         self._trigger_parser = trigger_parser
         self._state_parser = state_parser
 
@@ -112,7 +205,10 @@ cdef class FiniteStateMachine:
             If the state and trigger combination is not found in the transition table.
 
         """
-        cdef int next_state = self._state_transition_table.get((self.state, trigger), -1)
+        cdef int next_state = -1
+        if 0 <= self.state < self._state_count and 0 <= trigger < self._trigger_count:
+            next_state = self._next_states[self.state * self._trigger_count + trigger]
+
         if next_state == -1:  # Invalid
             raise InvalidStateTrigger(f"{self.state_string_c()} -> {self._trigger_parser(trigger)}")
 
@@ -16,6 +16,7 @@
 from cpython.datetime cimport datetime
 
 from nautilus_trader.core.correctness cimport Condition
+from nautilus_trader.core.datetime cimport to_unix_nanos
 from nautilus_trader.core.message cimport MessageType
 from nautilus_trader.core.uuid cimport UUID
 
@@ -126,6 +127,18 @@ cdef class Message:
     def __hash__(self) -> int:
         return hash((self.type, self.id))
 
+    @property
+    def timestamp_ns(self):
+        """
+        The message initialization UNIX timestamp (nanoseconds).
+
+        Returns
+        -------
+        int
+
+        """
+        return to_unix_nanos(self.timestamp)
+
     def __repr__(self) -> str:
         return f"{type(self).__name__}(id={self.id}, timestamp={self.timestamp})"
 
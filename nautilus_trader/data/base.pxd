@@ -22,6 +22,7 @@ from nautilus_trader.model.identifiers cimport Symbol
 from nautilus_trader.model.identifiers cimport Venue
 from nautilus_trader.model.instrument cimport Instrument
 from nautilus_trader.model.objects cimport Price
+from nautilus_trader.model.order_book cimport OrderBook
 from nautilus_trader.model.tick cimport QuoteTick
 from nautilus_trader.model.tick cimport TradeTick
 
@@ -40,12 +41,14 @@ cdef class DataCacheFacade:
     cpdef QuoteTick quote_tick(self, Symbol symbol, int index=*)
     cpdef TradeTick trade_tick(self, Symbol symbol, int index=*)
     cpdef Bar bar(self, BarType bar_type, int index=*)
+    cpdef OrderBook order_book(self, Symbol symbol)
     cpdef int quote_tick_count(self, Symbol symbol) except *
     cpdef int trade_tick_count(self, Symbol symbol) except *
     cpdef int bar_count(self, BarType bar_type) except *
     cpdef bint has_quote_ticks(self, Symbol symbol) except *
     cpdef bint has_trade_ticks(self, Symbol symbol) except *
     cpdef bint has_bars(self, BarType bar_type) except *
+    cpdef bint has_order_book(self, Symbol symbol) except *
 
     cpdef object get_xrate(
         self,
@@ -20,6 +20,7 @@ from nautilus_trader.model.bar cimport Bar
 from nautilus_trader.model.bar cimport BarType
 from nautilus_trader.model.identifiers cimport Venue
 from nautilus_trader.model.instrument cimport Instrument
+from nautilus_trader.model.order_book cimport OrderBookDelta
 from nautilus_trader.model.tick cimport QuoteTick
 from nautilus_trader.model.tick cimport TradeTick
 from nautilus_trader.trading.calculators cimport ExchangeRateCalculator
@@ -32,6 +33,7 @@ cdef class DataCache(DataCacheFacade):
     cdef dict _quote_ticks
     cdef dict _trade_ticks
     cdef dict _bars
+    cdef dict _order_books
     cdef ExchangeRateCalculator _xrate_calculator
 
     cdef readonly int tick_capacity
@@ -45,6 +47,7 @@ cdef class DataCache(DataCacheFacade):
     cpdef void add_quote_tick(self, QuoteTick tick) except *
     cpdef void add_trade_tick(self, TradeTick tick) except *
     cpdef void add_bar(self, BarType bar_type, Bar bar) except *
+    cpdef void add_order_book_delta(self, OrderBookDelta delta) except *
     cpdef void add_quote_ticks(self, list ticks) except *
     cpdef void add_trade_ticks(self, list ticks) except *
     cpdef void add_bars(self, BarType bar_type, list bars) except *
@@ -35,6 +35,8 @@ from nautilus_trader.model.identifiers cimport Symbol
 from nautilus_trader.model.identifiers cimport Venue
 from nautilus_trader.model.instrument cimport Instrument
 from nautilus_trader.model.objects cimport Price
+from nautilus_trader.model.order_book cimport OrderBook
+from nautilus_trader.model.order_book cimport OrderBookDelta
 from nautilus_trader.model.tick cimport QuoteTick
 from nautilus_trader.model.tick cimport TradeTick
 from nautilus_trader.trading.calculators cimport ExchangeRateCalculator
@@ -75,6 +77,7 @@ cdef class DataCache(DataCacheFacade):
         self._quote_ticks = {}  # type: dict[Symbol, list[QuoteTick]]
         self._trade_ticks = {}  # type: dict[Symbol, list[TradeTick]]
         self._bars = {}         # type: dict[BarType, list[Bar]]
+        self._order_books = {}  # type: dict[Symbol, OrderBook]
 
         self._log.info("Initialized.")
 
@@ -93,6 +96,7 @@ cdef class DataCache(DataCacheFacade):
         self._quote_ticks.clear()
         self._trade_ticks.clear()
         self._bars.clear()
+        self._order_books.clear()
 
     cpdef void add_instrument(self, Instrument instrument) except *:
         """
@@ -181,6 +185,28 @@ cdef class DataCache(DataCacheFacade):
 
         bars.appendleft(bar)
 
+    cpdef void add_order_book_delta(self, OrderBookDelta delta) except *:
+        """
+        Apply the given order book delta to the cached order book for the
+        deltas symbol, creating the order book if not already cached.
+
+        Parameters
+        ----------
+        delta : OrderBookDelta
+            The received delta to apply.
+
+        """
+        Condition.not_none(delta, "delta")
+
+        cdef OrderBook order_book = self._order_books.get(delta.symbol)
+
+        if order_book is None:
+            # The symbol was not registered
+            order_book = OrderBook(delta.symbol)
+            self._order_books[delta.symbol] = order_book
+
+        order_book.apply(delta)
+
     cpdef void add_quote_ticks(self, list ticks) except *:
         """
         Add the given ticks to the cache, if it is empty.
@@ -524,6 +550,25 @@ cdef class DataCache(DataCacheFacade):
         except IndexError:
             return None
 
+    cpdef OrderBook order_book(self, Symbol symbol):
+        """
+        Return the order book for the given symbol.
+
+        Parameters
+        ----------
+        symbol : Symbol
+            The symbol for the order book to get.
+
+        Returns
+        -------
+        OrderBook or None
+            If no order book is cached for the symbol then returns None.
+
+        """
+        Condition.not_none(symbol, "symbol")
+
+        return self._order_books.get(symbol)
+
     cpdef int quote_tick_count(self, Symbol symbol) except *:
         """
         The count of quote ticks for the given symbol.
@@ -635,6 +680,25 @@ cdef class DataCache(DataCacheFacade):
 
         return self.bar_count(bar_type) > 0
 
+    cpdef bint has_order_book(self, Symbol symbol) except *:
+        """
+        Return a value indicating whether the data engine has an order book for
+        the given symbol.
+
+        Parameters
+        ----------
+        symbol : Symbol
+            The symbol for the order book.
+
+        Returns
+        -------
+        bool
+
+        """
+        Condition.not_none(symbol, "symbol")
+
+        return symbol in self._order_books
+
     cpdef object get_xrate(
         self,
         Venue venue,
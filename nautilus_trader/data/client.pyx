@@ -24,6 +24,7 @@ from cpython.datetime cimport datetime
 
 from nautilus_trader.core.uuid cimport UUID
 from nautilus_trader.common.clock cimport Clock
+from nautilus_trader.common.latency cimport monotonic_ns
 from nautilus_trader.core.constants cimport *  # str constants only
 from nautilus_trader.common.logging cimport Logger
 from nautilus_trader.common.logging cimport LoggerAdapter
@@ -36,6 +37,7 @@ from nautilus_trader.model.bar cimport BarType
 from nautilus_trader.model.identifiers cimport Symbol
 from nautilus_trader.model.identifiers cimport Venue
 from nautilus_trader.model.instrument cimport Instrument
+from nautilus_trader.model.order_book cimport OrderBookDelta
 from nautilus_trader.model.tick cimport QuoteTick
 from nautilus_trader.model.tick cimport TradeTick
 
@@ -137,6 +139,10 @@ cdef class DataClient:
         """Abstract method (implement in subclass)."""
         raise NotImplementedError("method must be implemented in the subclass")
 
+    cpdef void subscribe_order_book(self, Symbol symbol) except *:
+        """Abstract method (implement in subclass)."""
+        raise NotImplementedError("method must be implemented in the subclass")
+
     cpdef void unsubscribe_instrument(self, Symbol symbol) except *:
         """Abstract method (implement in subclass)."""
         raise NotImplementedError("method must be implemented in the subclass")
@@ -153,6 +159,10 @@ cdef class DataClient:
         """Abstract method (implement in subclass)."""
         raise NotImplementedError("method must be implemented in the subclass")
 
+    cpdef void unsubscribe_order_book(self, Symbol symbol) except *:
+        """Abstract method (implement in subclass)."""
+        raise NotImplementedError("method must be implemented in the subclass")
+
 # -- REQUESTS --------------------------------------------------------------------------------------
 
     cpdef void request_instrument(self, Symbol symbol, UUID correlation_id) except *:
@@ -210,6 +220,9 @@ cdef class DataClient:
     def _handle_bar_py(self, BarType bar_type, Bar bar):
         self._engine.process(BarData(bar_type, bar))
 
+    def _handle_order_book_delta_py(self, OrderBookDelta delta):
+        self._engine.process(delta)
+
     def _handle_instruments_py(self, list instruments, UUID correlation_id):
         self._handle_instruments(instruments, correlation_id)
 
@@ -224,6 +237,13 @@ cdef class DataClient:
 
 # -- DATA HANDLERS ---------------------------------------------------------------------------------
 
+    cdef long long _recv_stamp(self) except *:
+        # The receive stamp for ticks parsed from a venue message, taken as the
+        # message arrives (zero when the engine records no latency statistics).
+        if self._engine.latency_recorder is None:
+            return 0
+        return monotonic_ns()
+
     cdef void _handle_instrument(self, Instrument instrument) except *:
         self._engine.process(instrument)
 
@@ -236,6 +256,9 @@ cdef class DataClient:
     cdef void _handle_bar(self, BarType bar_type, Bar bar) except *:
         self._engine.process(BarData(bar_type, bar))
 
+    cdef void _handle_order_book_delta(self, OrderBookDelta delta) except *:
+        self._engine.process(delta)
+
     cdef void _handle_instruments(self, list instruments, UUID correlation_id) except *:
         cdef DataResponse response = DataResponse(
             venue=self.venue,
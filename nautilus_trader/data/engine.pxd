@@ -16,6 +16,7 @@
 from cpython.datetime cimport datetime
 
 from nautilus_trader.common.component cimport Component
+from nautilus_trader.common.latency cimport LatencyRecorder
 from nautilus_trader.common.messages cimport DataRequest
 from nautilus_trader.common.messages cimport DataResponse
 from nautilus_trader.common.messages cimport Subscribe
@@ -31,7 +32,9 @@ from nautilus_trader.model.commands cimport VenueCommand
 from nautilus_trader.model.identifiers cimport Symbol
 from nautilus_trader.model.identifiers cimport Venue
 from nautilus_trader.model.instrument cimport Instrument
+from nautilus_trader.model.order_book cimport OrderBookDelta
 from nautilus_trader.model.tick cimport QuoteTick
+from nautilus_trader.model.tick cimport Tick
 from nautilus_trader.model.tick cimport TradeTick
 from nautilus_trader.trading.portfolio cimport Portfolio
 from nautilus_trader.trading.strategy cimport TradingStrategy
@@ -45,12 +48,15 @@ cdef class DataEngine(Component):
     cdef dict _quote_tick_handlers
     cdef dict _trade_tick_handlers
     cdef dict _bar_handlers
+    cdef dict _order_book_handlers
     cdef dict _bar_aggregators
 
     cdef readonly Portfolio portfolio
     """The portfolio wired to the engine.\n\n:returns: `Portfolio`"""
     cdef readonly DataCache cache
     """The engines data cache.\n\n:returns: `DataCache`"""
+    cdef readonly LatencyRecorder latency_recorder
+    """The latency recorder for the engine (None if not registered).\n\n:returns: `LatencyRecorder` or `None`"""
     cdef readonly int command_count
     """The total count of commands received by the engine.\n\n:returns: `int`"""
     cdef readonly int data_count
@@ -67,6 +73,7 @@ cdef class DataEngine(Component):
 
     cpdef void register_client(self, DataClient client) except *
     cpdef void register_strategy(self, TradingStrategy strategy) except *
+    cpdef void register_latency_recorder(self, LatencyRecorder recorder) except *
     cpdef void deregister_client(self, DataClient client) except *
 
 # -- ABSTRACT METHODS ------------------------------------------------------------------------------
@@ -92,10 +99,12 @@ cdef class DataEngine(Component):
     cdef inline void _handle_subscribe_quote_ticks(self, DataClient client, Symbol symbol, handler: callable) except *
     cdef inline void _handle_subscribe_trade_ticks(self, DataClient client, Symbol symbol, handler: callable) except *
     cdef inline void _handle_subscribe_bars(self, DataClient client, BarType bar_type, handler: callable) except *
+    cdef inline void _handle_subscribe_order_book(self, DataClient client, Symbol symbol, handler: callable) except *
     cdef inline void _handle_unsubscribe_instrument(self, DataClient client, Symbol symbol, handler: callable) except *
     cdef inline void _handle_unsubscribe_quote_ticks(self, DataClient client, Symbol symbol, handler: callable) except *
     cdef inline void _handle_unsubscribe_trade_ticks(self, DataClient client, Symbol symbol, handler: callable) except *
     cdef inline void _handle_unsubscribe_bars(self, DataClient client, BarType bar_type, handler: callable) except *
+    cdef inline void _handle_unsubscribe_order_book(self, DataClient client, Symbol symbol, handler: callable) except *
     cdef inline void _handle_request(self, DataRequest request) except *
 
 # -- DATA HANDLERS ---------------------------------------------------------------------------------
@@ -105,6 +114,7 @@ cdef class DataEngine(Component):
     cdef inline void _handle_quote_tick(self, QuoteTick tick) except *
     cdef inline void _handle_trade_tick(self, TradeTick tick) except *
     cdef inline void _handle_bar(self, BarType bar_type, Bar bar) except *
+    cdef inline void _handle_order_book_delta(self, OrderBookDelta delta) except *
 
 # -- RESPONSE HANDLERS -----------------------------------------------------------------------------
 
@@ -117,6 +127,9 @@ cdef class DataEngine(Component):
 # -- INTERNAL --------------------------------------------------------------------------------------
 
     cpdef void _internal_update_instruments(self, list instruments) except *
+    cdef inline void _stamp_received(self, data) except *
+    cdef inline void _record_queue_wait(self, Tick tick) except *
+    cdef inline void _send_tick_timed(self, Tick tick, list handlers) except *
     cdef inline void _start_bar_aggregator(self, DataClient client, BarType bar_type) except *
     cdef inline void _hydrate_aggregator(self, DataClient client, TimeBarAggregator aggregator, BarType bar_type) except *
     cdef inline void _stop_bar_aggregator(self, DataClient client, BarType bar_type) except *
@@ -135,7 +148,9 @@ cdef class DataEngine(Component):
     cdef inline void _add_quote_tick_handler(self, Symbol symbol, handler: callable) except *
     cdef inline void _add_trade_tick_handler(self, Symbol symbol, handler: callable) except *
     cdef inline void _add_bar_handler(self, BarType bar_type, handler: callable) except *
+    cdef inline void _add_order_book_handler(self, Symbol symbol, handler: callable) except *
     cdef inline void _remove_instrument_handler(self, Symbol symbol, handler: callable) except *
     cdef inline void _remove_quote_tick_handler(self, Symbol symbol, handler: callable) except *
     cdef inline void _remove_trade_tick_handler(self, Symbol symbol, handler: callable) except *
     cdef inline void _remove_bar_handler(self, BarType bar_type, handler: callable) except *
+    cdef inline void _remove_order_book_handler(self, Symbol symbol, handler: callable) except *
@@ -33,6 +33,9 @@ from cpython.datetime cimport datetime
 
 from nautilus_trader.common.clock cimport Clock
 from nautilus_trader.common.component cimport Component
+from nautilus_trader.common.latency cimport LatencyRecorder
+from nautilus_trader.common.latency cimport LatencyStage
+from nautilus_trader.common.latency cimport monotonic_ns
 from nautilus_trader.common.messages cimport Connect
 from nautilus_trader.common.messages cimport Disconnect
 from nautilus_trader.common.messages cimport DataRequest
@@ -61,10 +64,14 @@ from nautilus_trader.model.bar cimport BarType
 from nautilus_trader.model.c_enums.bar_aggregation cimport BarAggregation
 from nautilus_trader.model.c_enums.bar_aggregation cimport BarAggregationParser
 from nautilus_trader.model.c_enums.price_type cimport PriceType
+from nautilus_trader.model.identifiers cimport StrategyId
 from nautilus_trader.model.identifiers cimport Symbol
 from nautilus_trader.model.identifiers cimport Venue
 from nautilus_trader.model.instrument cimport Instrument
+from nautilus_trader.model.order_book cimport OrderBook
+from nautilus_trader.model.order_book cimport OrderBookDelta
 from nautilus_trader.model.tick cimport QuoteTick
+from nautilus_trader.model.tick cimport Tick
 from nautilus_trader.model.tick cimport TradeTick
 from nautilus_trader.trading.strategy cimport TradingStrategy
 from nautilus_trader.trading.portfolio cimport Portfolio
@@ -111,6 +118,7 @@ cdef class DataEngine(Component):
         self._quote_tick_handlers = {}  # type: dict[Symbol, list[callable]]
         self._trade_tick_handlers = {}  # type: dict[Symbol, list[callable]]
         self._bar_handlers = {}         # type: dict[BarType, list[callable]]
+        self._order_book_handlers = {}  # type: dict[Symbol, list[callable]]
 
         # Aggregators
         self._bar_aggregators = {}      # type: dict[BarType, BarAggregator]
@@ -118,6 +126,7 @@ cdef class DataEngine(Component):
         # Public components
         self.portfolio = portfolio
         self.cache = DataCache(logger)
+        self.latency_recorder = None
 
         # Counters
         self.command_count = 0
@@ -187,6 +196,18 @@ cdef class DataEngine(Component):
         """
         return sorted(list(self._bar_handlers.keys()))
 
+    @property
+    def subscribed_order_books(self):
+        """
+        The order book symbols subscribed to.
+
+        Returns
+        -------
+        list[Symbol]
+
+        """
+        return sorted(list(self._order_book_handlers.keys()))
+
     cpdef bint check_initialized(self) except *:
         """
         Check the engine is initialized.
@@ -259,6 +280,25 @@ cdef class DataEngine(Component):
 
         self._log.info(f"Registered {strategy}.")
 
+    cpdef void register_latency_recorder(self, LatencyRecorder recorder) except *:
+        """
+        Register the given latency recorder with the data engine.
+
+        Once registered ticks are stamped on receipt, and the time each spends
+        in the engine and in each strategy handler is recorded.
+
+        Parameters
+        ----------
+        recorder : LatencyRecorder
+            The latency recorder to register.
+
+        """
+        Condition.not_none(recorder, "recorder")
+
+        self.latency_recorder = recorder
+
+        self._log.info(f"Registered {type(recorder).__name__}.")
+
     cpdef void deregister_client(self, DataClient client) except *:
         """
         Deregister the given data client from the data engine.
@@ -315,6 +355,7 @@ cdef class DataEngine(Component):
         self._quote_tick_handlers.clear()
         self._trade_tick_handlers.clear()
         self._bar_handlers.clear()
+        self._order_book_handlers.clear()
         self._bar_aggregators.clear()
         self._clock.cancel_timers()
         self.command_count = 0
@@ -357,6 +398,9 @@ cdef class DataEngine(Component):
         """
         Condition.not_none(data, "data")
 
+        if self.latency_recorder is not None:
+            self._stamp_received(data)
+
         self._handle_data(data)
 
     cpdef void send(self, DataRequest request) except *:
@@ -468,6 +512,12 @@ cdef class DataEngine(Component):
                 command.metadata.get(BAR_TYPE),
                 command.handler,
             )
+        elif command.data_type == OrderBook:
+            self._handle_subscribe_order_book(
+                client,
+                command.metadata.get(SYMBOL),
+                command.handler,
+            )
         else:
             self._log.error(f"Cannot subscribe to unrecognized data type {command.data_type}.")
 
@@ -496,6 +546,12 @@ cdef class DataEngine(Component):
                 command.metadata.get(BAR_TYPE),
                 command.handler,
             )
+        elif command.data_type == OrderBook:
+            self._handle_unsubscribe_order_book(
+                client,
+                command.metadata.get(SYMBOL),
+                command.handler,
+            )
         else:
             self._log.error(f"Cannot unsubscribe from unrecognized data type {command.data_type}.")
 
@@ -562,6 +618,20 @@ cdef class DataEngine(Component):
             # External aggregation
             client.subscribe_bars(bar_type)
 
+    cdef inline void _handle_subscribe_order_book(
+        self,
+        DataClient client,
+        Symbol symbol,
+        handler: callable,
+    ) except *:
+        # client already checked
+        # validate message data
+        Condition.not_none(symbol, "symbol")
+        Condition.callable(handler, "handler")
+
+        self._add_order_book_handler(symbol, handler)
+        client.subscribe_order_book(symbol)
+
     cdef inline void _handle_unsubscribe_instrument(
         self,
         DataClient client,
@@ -627,6 +697,20 @@ cdef class DataEngine(Component):
 
 # -- REQUEST HANDLERS ------------------------------------------------------------------------------
 
+    cdef inline void _handle_unsubscribe_order_book(
+        self,
+        DataClient client,
+        Symbol symbol,
+        handler: callable,
+    ) except *:
+        # client already checked
+        # validate message data
+        Condition.not_none(symbol, "symbol")
+        Condition.callable(handler, "handler")
+
+        client.unsubscribe_order_book(symbol)
+        self._remove_order_book_handler(symbol, handler)
+
     cdef inline void _handle_request(self, DataRequest request) except *:
         self._log.debug(f"{RECV}{REQ} {request}.")
         self.request_count += 1
@@ -690,6 +774,8 @@ cdef class DataEngine(Component):
             self._handle_trade_tick(data)
         elif isinstance(data, BarData):
             self._handle_bar(data.bar_type, data.bar)
+        elif isinstance(data, OrderBookDelta):
+            self._handle_order_book_delta(data)
         elif isinstance(data, Instrument):
             self._handle_instrument(data)
         else:
@@ -712,6 +798,9 @@ cdef class DataEngine(Component):
         # Send to all registered tick handlers for that symbol
         cdef list tick_handlers = self._quote_tick_handlers.get(tick.symbol)
         if tick_handlers is not None:
+            if self.latency_recorder is not None:
+                self._send_tick_timed(tick, tick_handlers)
+                return
             for handler in tick_handlers:
                 handler(tick)
 
@@ -721,6 +810,9 @@ cdef class DataEngine(Component):
         # Send to all registered tick handlers for that symbol
         cdef list tick_handlers = self._trade_tick_handlers.get(tick.symbol)
         if tick_handlers is not None:
+            if self.latency_recorder is not None:
+                self._send_tick_timed(tick, tick_handlers)
+                return
             for handler in tick_handlers:
                 handler(tick)
 
@@ -733,6 +825,16 @@ cdef class DataEngine(Component):
             for handler in bar_handlers:
                 handler(bar_type, bar)
 
+    cdef inline void _handle_order_book_delta(self, OrderBookDelta delta) except *:
+        self.cache.add_order_book_delta(delta)
+
+        # Send the updated order book to all registered handlers for that symbol
+        cdef list order_book_handlers = self._order_book_handlers.get(delta.symbol)
+        if order_book_handlers is not None:
+            order_book = self.cache.order_book(delta.symbol)
+            for handler in order_book_handlers:
+                handler(order_book)
+
 # -- RESPONSE HANDLERS -----------------------------------------------------------------------------
 
     cdef inline void _handle_response(self, DataResponse response) except *:
@@ -819,6 +921,47 @@ cdef class DataEngine(Component):
         for instrument in instruments:
             self._handle_instrument(instrument)
 
+    cdef inline void _stamp_received(self, data) except *:
+        if not isinstance(data, Tick):
+            return  # Only ticks are stamped
+
+        cdef Tick tick = data
+        cdef long long now = monotonic_ns()
+        if tick.recv_ns == 0:
+            # Not stamped by the client, the tick is received now
+            tick.recv_ns = now
+        else:
+            self.latency_recorder.record(LatencyStage.ADAPTER_PARSE, now - tick.recv_ns)
+        tick.stage_ns = now
+
+    cdef inline void _record_queue_wait(self, Tick tick) except *:
+        cdef long long now = monotonic_ns()
+        if tick.stage_ns > 0:
+            self.latency_recorder.record(LatencyStage.QUEUE_WAIT, now - tick.stage_ns)
+        tick.stage_ns = now
+
+    cdef inline void _send_tick_timed(self, Tick tick, list handlers) except *:
+        cdef LatencyRecorder recorder = self.latency_recorder
+        cdef long long start = monotonic_ns()
+        recorder.record(LatencyStage.DATA_DISPATCH, start - tick.stage_ns)
+
+        # Commands sent from within the handlers carry the ticks receive stamp
+        recorder.set_origin_ns(tick.recv_ns)
+
+        cdef long long end
+        cdef StrategyId strategy_id
+        try:
+            for handler in handlers:
+                handler(tick)
+                end = monotonic_ns()
+                owner = getattr(handler, "__self__", None)
+                strategy_id = (<TradingStrategy>owner).id if isinstance(owner, TradingStrategy) else None
+                recorder.record(LatencyStage.STRATEGY, end - start, strategy_id)
+                start = end
+        finally:
+            recorder.set_origin_ns(0)
+        tick.stage_ns = start
+
     cdef inline void _start_bar_aggregator(self, DataClient client, BarType bar_type) except *:
         if bar_type.spec.is_time_aggregated():
             # Create aggregator
@@ -996,6 +1139,19 @@ cdef class DataEngine(Component):
         else:
             self._log.warning(f"Handler {handler} already subscribed to {bar_type} <Bar> data.")
 
+    cdef inline void _add_order_book_handler(self, Symbol symbol, handler: callable) except *:
+        if symbol not in self._order_book_handlers:
+            # Setup handlers
+            self._order_book_handlers[symbol] = []  # type: list[callable]
+            self._log.info(f"Subscribed to {symbol} <OrderBook> data.")
+
+        # Add handler for subscriber
+        if handler not in self._order_book_handlers[symbol]:
+            self._order_book_handlers[symbol].append(handler)
+            self._log.debug(f"Added {handler} for {symbol} <OrderBook> data.")
+        else:
+            self._log.warning(f"Handler {handler} already subscribed to {symbol} <OrderBook> data.")
+
     cdef inline void _remove_instrument_handler(self, Symbol symbol, handler: callable) except *:
         if symbol not in self._instrument_handlers:
             self._log.warning(f"Handler {handler} not subscribed to {symbol} <Instrument> data.")
@@ -1059,3 +1215,19 @@ cdef class DataEngine(Component):
         if not self._bar_handlers[bar_type]:
             del self._bar_handlers[bar_type]
             self._log.info(f"Unsubscribed from {bar_type} <Bar> data.")
+
+    cdef inline void _remove_order_book_handler(self, Symbol symbol, handler: callable) except *:
+        if symbol not in self._order_book_handlers:
+            self._log.warning(f"Handler {handler} not subscribed to {symbol} <OrderBook> data.")
+            return
+
+        # Remove subscribers handler
+        if handler in self._order_book_handlers[symbol]:
+            self._order_book_handlers[symbol].remove(handler)
+            self._log.debug(f"Removed handler {handler} for {symbol} <OrderBook> data.")
+        else:
+            self._log.warning(f"Handler {handler} not subscribed to {symbol} <OrderBook> data.")
+
+        if not self._order_book_handlers[symbol]:  # No more handlers for symbol
+            del self._order_book_handlers[symbol]
+            self._log.info(f"Unsubscribed from {symbol} <OrderBook> data.")
@@ -18,6 +18,7 @@ from cpython.datetime cimport datetime
 from nautilus_trader.model.bar cimport Bar
 from nautilus_trader.model.c_enums.bar_aggregation cimport BarAggregation
 from nautilus_trader.model.instrument cimport Instrument
+from nautilus_trader.model.order_book cimport OrderBookDelta
 from nautilus_trader.model.tick cimport QuoteTick
 from nautilus_trader.model.tick cimport TradeTick
 
@@ -45,6 +46,16 @@ cdef class TradeTickDataWrangler:
     cpdef TradeTick _build_tick_from_values(self, str[:] values, datetime timestamp)
 
 
+cdef class OrderBookDeltaDataWrangler:
+    cdef object _data_deltas
+
+    cdef readonly Instrument instrument
+    cdef readonly processed_data
+
+    cpdef list build_deltas(self)
+    cpdef OrderBookDelta _build_delta_from_values(self, str[:] values, datetime timestamp)
+
+
 cdef class BarDataWrangler:
     cdef int _price_precision
     cdef int _size_precision
@@ -27,6 +27,7 @@ from nautilus_trader.model.c_enums.order_side cimport OrderSideParser
 from nautilus_trader.model.instrument cimport Instrument
 from nautilus_trader.model.objects cimport Price
 from nautilus_trader.model.objects cimport Quantity
+from nautilus_trader.model.order_book cimport OrderBookDelta
 from nautilus_trader.model.identifiers cimport TradeMatchId
 from nautilus_trader.model.tick cimport QuoteTick
 
@@ -126,39 +127,7 @@ cdef class QuoteTickDataWrangler:
             return
 
         # Build ticks from highest resolution bar data
-        if BarAggregation.SECOND in self._data_bars_bid:
-            bars_bid = self._data_bars_bid[BarAggregation.SECOND]
-            bars_ask = self._data_bars_ask[BarAggregation.SECOND]
-            self.resolution = BarAggregation.SECOND
-        elif BarAggregation.MINUTE in self._data_bars_bid:
-            bars_bid = self._data_bars_bid[BarAggregation.MINUTE]
-            bars_ask = self._data_bars_ask[BarAggregation.MINUTE]
-            self.resolution = BarAggregation.MINUTE
-        elif BarAggregation.HOUR in self._data_bars_bid:
-            bars_bid = self._data_bars_bid[BarAggregation.HOUR]
-            bars_ask = self._data_bars_ask[BarAggregation.HOUR]
-            self.resolution = BarAggregation.HOUR
-        elif BarAggregation.DAY in self._data_bars_bid:
-            bars_bid = self._data_bars_bid[BarAggregation.DAY]
-            bars_ask = self._data_bars_ask[BarAggregation.DAY]
-            self.resolution = BarAggregation.DAY
-
-        Condition.not_none(bars_bid, "bars_bid")
-        Condition.not_none(bars_ask, "bars_ask")
-        Condition.false(bars_bid.empty, "bars_bid.empty")
-        Condition.false(bars_ask.empty, "bars_ask.empty")
-        Condition.true(all(bars_bid.index) == all(bars_ask.index), "bars_bid.index == bars_ask.index")
-        Condition.true(bars_bid.shape == bars_ask.shape, "bars_bid.shape == bars_ask.shape")
-
-        # Ensure index is tz-aware UTC
-        bars_bid = as_utc_index(bars_bid)
-        bars_ask = as_utc_index(bars_ask)
-
-        if "volume" not in bars_bid:
-            bars_bid["volume"] = 4
-
-        if "volume" not in bars_ask:
-            bars_ask["volume"] = 4
+        bars_bid, bars_ask = self._highest_resolution_bars()
 
         cdef dict data_open = {
             "bid": bars_bid["open"],
@@ -229,6 +198,91 @@ cdef class QuoteTickDataWrangler:
         self.processed_data = df_ticks_final
         self.processed_data["symbol"] = symbol_indexer
 
+    def pre_process_bars(self, int symbol_indexer):
+        """
+        Pre-process the highest resolution bar data in preparation for bar
+        execution, without expanding the bars into ticks.
+
+        The processed data holds a row per bar with the bid and ask open, high,
+        low and close prices, and the bid and ask volumes.
+
+        Parameters
+        ----------
+        symbol_indexer : int
+            The symbol indexer for the built bars.
+
+        Raises
+        ------
+        ValueError
+            If the wrangler was initialized with quote tick data.
+
+        """
+        Condition.true(self._data_quotes is None, "data_quotes was not None")
+
+        bars_bid, bars_ask = self._highest_resolution_bars()
+
+        processed_data = pd.DataFrame(
+            data={
+                "bid_open": bars_bid["open"],
+                "bid_high": bars_bid["high"],
+                "bid_low": bars_bid["low"],
+                "bid_close": bars_bid["close"],
+                "ask_open": bars_ask["open"],
+                "ask_high": bars_ask["high"],
+                "ask_low": bars_ask["low"],
+                "ask_close": bars_ask["close"],
+                "bid_volume": bars_bid["volume"],
+                "ask_volume": bars_ask["volume"],
+            },
+        )
+
+        # Pre-process prices and volumes into formatted strings
+        price_cols = ["bid_open", "bid_high", "bid_low", "bid_close", "ask_open", "ask_high", "ask_low", "ask_close"]
+        processed_data[price_cols] = processed_data[price_cols].applymap(lambda x: f'{x:.{self.instrument.price_precision}f}')
+        size_cols = ["bid_volume", "ask_volume"]
+        processed_data[size_cols] = processed_data[size_cols].applymap(lambda x: f'{x:.{self.instrument.size_precision}f}')
+
+        self.processed_data = processed_data
+        self.processed_data["symbol"] = symbol_indexer
+
+    def _highest_resolution_bars(self):
+        # Return the bid and ask bars for the highest resolution bar data
+        if BarAggregation.SECOND in self._data_bars_bid:
+            bars_bid = self._data_bars_bid[BarAggregation.SECOND]
+            bars_ask = self._data_bars_ask[BarAggregation.SECOND]
+            self.resolution = BarAggregation.SECOND
+        elif BarAggregation.MINUTE in self._data_bars_bid:
+            bars_bid = self._data_bars_bid[BarAggregation.MINUTE]
+            bars_ask = self._data_bars_ask[BarAggregation.MINUTE]
+            self.resolution = BarAggregation.MINUTE
+        elif BarAggregation.HOUR in self._data_bars_bid:
+            bars_bid = self._data_bars_bid[BarAggregation.HOUR]
+            bars_ask = self._data_bars_ask[BarAggregation.HOUR]
+            self.resolution = BarAggregation.HOUR
+        elif BarAggregation.DAY in self._data_bars_bid:
+            bars_bid = self._data_bars_bid[BarAggregation.DAY]
+            bars_ask = self._data_bars_ask[BarAggregation.DAY]
+            self.resolution = BarAggregation.DAY
+
+        Condition.not_none(bars_bid, "bars_bid")
+        Condition.not_none(bars_ask, "bars_ask")
+        Condition.false(bars_bid.empty, "bars_bid.empty")
+        Condition.false(bars_ask.empty, "bars_ask.empty")
+        Condition.true(all(bars_bid.index) == all(bars_ask.index), "bars_bid.index == bars_ask.index")
+        Condition.true(bars_bid.shape == bars_ask.shape, "bars_bid.shape == bars_ask.shape")
+
+        # Ensure index is tz-aware UTC
+        bars_bid = as_utc_index(bars_bid)
+        bars_ask = as_utc_index(bars_ask)
+
+        if "volume" not in bars_bid:
+            bars_bid["volume"] = 4
+
+        if "volume" not in bars_ask:
+            bars_ask["volume"] = 4
+
+        return bars_bid, bars_ask
+
     cpdef list build_ticks(self):
         """
         Build ticks from all data.
@@ -332,6 +386,85 @@ cdef class TradeTickDataWrangler:
         )
 
 
+cdef class OrderBookDeltaDataWrangler:
+    """
+    Provides a means of building lists of order book deltas from the given
+    DataFrame of L2 level updates.
+    """
+
+    def __init__(self, Instrument instrument not None, data not None: pd.DataFrame):
+        """
+        Initialize a new instance of the `OrderBookDeltaDataWrangler` class.
+
+        The format of the dataframe is expected to be a DateTimeIndex with
+        'side' ('BUY' for bids, 'SELL' for asks), 'price' and 'size' data
+        columns, where size is the new total size at the price level.
+
+        Parameters
+        ----------
+        instrument : Instrument
+            The instrument for the data wrangler.
+        data : pd.DataFrame
+            The pd.DataFrame containing the level updates.
+
+        Raises
+        ------
+        ValueError
+            If data is empty.
+
+        """
+        Condition.not_none(data, "data")
+        Condition.type_or_none(data, pd.DataFrame, "data")
+        Condition.true(not data.empty, "not data.empty")
+
+        self.instrument = instrument
+        self._data_deltas = as_utc_index(data)
+
+        self.processed_data = []
+
+    def pre_process(self, int symbol_indexer):
+        """
+        Pre-process the level updates in preparation for building deltas.
+
+        Parameters
+        ----------
+        symbol_indexer : int
+            The symbol indexer for the built deltas.
+
+        """
+        processed_deltas = pd.DataFrame(index=self._data_deltas.index)
+        processed_deltas["side"] = self._data_deltas["side"].apply(str)
+        processed_deltas["price"] = self._data_deltas["price"].apply(lambda x: f'{x:.{self.instrument.price_precision}f}')
+        processed_deltas["size"] = self._data_deltas["size"].apply(lambda x: f'{x:.{self.instrument.size_precision}f}')
+        processed_deltas["symbol"] = symbol_indexer
+
+        self.processed_data = processed_deltas
+
+    cpdef list build_deltas(self):
+        """
+        Build order book deltas from all data.
+
+        Returns
+        -------
+        list[OrderBookDelta]
+
+        """
+        return list(map(self._build_delta_from_values,
+                        self.processed_data.values,
+                        self.processed_data.index))
+
+    cpdef OrderBookDelta _build_delta_from_values(self, str[:] values, datetime timestamp):
+        # Build a delta from the given values. The function expects the values to
+        # be an ndarray with 3 elements [side, price, size] of type str.
+        return OrderBookDelta(
+            symbol=self.instrument.symbol,
+            side=OrderSideParser.from_str(values[0]),
+            price=Price(values[1]),
+            size=Quantity(values[2]),
+            timestamp=timestamp,
+        )
+
+
 cdef class BarDataWrangler:
     """
     Provides a means of building lists of bars from a given Pandas DataFrame of
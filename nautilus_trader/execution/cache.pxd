@@ -39,10 +39,27 @@ cdef class ExecutionCache(ExecutionCacheFacade):
     cdef dict _index_order_strategy
     cdef dict _index_position_strategy
     cdef dict _index_position_orders
-    cdef dict _index_symbol_orders
-    cdef dict _index_symbol_positions
-    cdef dict _index_strategy_orders
-    cdef dict _index_strategy_positions
+    cdef dict _index_query_orders
+    cdef dict _index_query_orders_working
+    cdef dict _index_query_orders_completed
+    cdef dict _index_query_positions
+    cdef dict _index_query_positions_open
+    cdef dict _index_query_positions_closed
+
+    cdef object _retained_orders_completed
+    cdef object _retained_positions_closed
+    cdef set _archived_orders
+    cdef set _archived_positions
+    cdef bint _discard_archived
+    cdef int _discarded_orders_count
+    cdef int _discarded_positions_count
+
+    cdef readonly int max_completed_orders
+    """The maximum completed orders retained in memory (0 for unlimited).\n\n:returns: `int`"""
+    cdef readonly int max_closed_positions
+    """The maximum closed positions retained in memory (0 for unlimited).\n\n:returns: `int`"""
+    cdef readonly object retention_age
+    """The maximum age of retained completed orders and closed positions.\n\n:returns: `timedelta` or `None`"""
     cdef set _index_orders
     cdef set _index_orders_working
     cdef set _index_orders_completed
@@ -76,6 +93,10 @@ cdef class ExecutionCache(ExecutionCacheFacade):
     cpdef void update_strategy(self, TradingStrategy strategy) except *
 
     cpdef void check_residuals(self) except *
+    cpdef list orders_archived(self)
+    cpdef list positions_archived(self)
+    cpdef int orders_archived_count(self) except *
+    cpdef int positions_archived_count(self) except *
     cpdef void reset(self) except *
     cpdef void flush_db(self) except *
     cdef void _clear_indexes(self) except *
@@ -84,5 +105,17 @@ cdef class ExecutionCache(ExecutionCacheFacade):
     cdef void _cache_venue_account_id(self, AccountId account_id) except *
     cdef void _build_indexes_from_orders(self) except *
     cdef void _build_indexes_from_positions(self) except *
-    cdef inline set _build_ord_query_filter_set(self, Symbol symbol, StrategyId strategy_id)
-    cdef inline set _build_pos_query_filter_set(self, Symbol symbol, StrategyId strategy_id)
+    cdef void _index_query_add(self, dict index, Symbol symbol, StrategyId strategy_id, key, value) except *
+    cdef void _index_query_remove(self, dict index, Symbol symbol, StrategyId strategy_id, key) except *
+    cdef void _index_query_remove_strategy(self, dict index, StrategyId strategy_id) except *
+    cdef void _index_order_state(self, Order order) except *
+    cdef void _index_position_state(self, Position position) except *
+    cdef void _apply_order_retention(self) except *
+    cdef void _apply_position_retention(self) except *
+    cdef void _archive_order(self, ClientOrderId cl_ord_id) except *
+    cdef void _archive_position(self, PositionId position_id) except *
+    cdef Order _reload_order(self, ClientOrderId cl_ord_id)
+    cdef Position _reload_position(self, PositionId position_id)
+    cdef inline tuple _query_key(self, dict index, Symbol symbol, StrategyId strategy_id)
+    cdef inline dict _query_orders(self, dict index, Symbol symbol, StrategyId strategy_id)
+    cdef inline dict _query_positions(self, dict index, Symbol symbol, StrategyId strategy_id)
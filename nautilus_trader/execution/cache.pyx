@@ -17,10 +17,14 @@
 The `ExecutionCache` provides an interface for querying on orders and positions.
 """
 
+from collections import deque
+from datetime import timedelta
+
 from nautilus_trader.common.logging cimport Logger
 from nautilus_trader.common.logging cimport LoggerAdapter
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.execution.base cimport ExecutionCacheFacade
+from nautilus_trader.execution.database cimport BypassExecutionDatabase
 from nautilus_trader.execution.database cimport ExecutionDatabase
 from nautilus_trader.model.identifiers cimport AccountId
 from nautilus_trader.model.identifiers cimport ClientOrderId
@@ -42,6 +46,7 @@ cdef class ExecutionCache(ExecutionCacheFacade):
         self,
         ExecutionDatabase database not None,
         Logger logger not None,
+        dict config=None,
     ):
         """
         Initialize a new instance of the `ExecutionCache` class.
@@ -52,8 +57,42 @@ cdef class ExecutionCache(ExecutionCacheFacade):
             The execution database adapter.
         logger : Logger
             The logger for the cache.
+        config : dict[str, object], optional
+            The configuration options.
+
+        Notes
+        -----
+        The config options `max_completed_orders` and `max_closed_positions`
+        bound the number of completed orders and closed positions retained in
+        memory, and `retention_age` (seconds) bounds their age relative to the
+        most recently completed (or closed) object. Beyond these limits objects
+        are archived: they are released from memory along with their indexes,
+        leaving only their identifiers, and are lazily reloaded from the
+        execution database when looked up by identifier. Archived objects are
+        excluded from queries and counts. All limits default to 0 (unlimited).
+
+        A `BypassExecutionDatabase` persists nothing, so with it archiving is
+        lossy: archived objects are discarded outright (identifiers included)
+        and only their count is kept.
+
+        Raises
+        ------
+        ValueError
+            If max_completed_orders is negative (< 0).
+        ValueError
+            If max_closed_positions is negative (< 0).
+        ValueError
+            If retention_age is negative (< 0).
 
         """
+        if config is None:
+            config = {}
+        max_completed_orders = config.get("max_completed_orders", 0)
+        max_closed_positions = config.get("max_closed_positions", 0)
+        retention_age = config.get("retention_age", 0)
+        Condition.not_negative_int(max_completed_orders, "max_completed_orders")
+        Condition.not_negative_int(max_closed_positions, "max_closed_positions")
+        Condition.not_negative(retention_age, "retention_age")
         super().__init__()
 
         self._log = LoggerAdapter("ExecCache", logger)
@@ -70,10 +109,6 @@ cdef class ExecutionCache(ExecutionCacheFacade):
         self._index_order_strategy = {}       # type: dict[ClientOrderId, StrategyId]
         self._index_position_strategy = {}    # type: dict[PositionId, StrategyId]
         self._index_position_orders = {}      # type: dict[PositionId, set[ClientOrderId]]
-        self._index_symbol_orders = {}        # type: dict[Symbol, set[ClientOrderId]]
-        self._index_symbol_positions = {}     # type: dict[Symbol, set[PositionId]]
-        self._index_strategy_orders = {}      # type: dict[StrategyId, set[ClientOrderId]]
-        self._index_strategy_positions = {}   # type: dict[StrategyId, set[PositionId]]
         self._index_orders = set()            # type: set[ClientOrderId]
         self._index_orders_working = set()    # type: set[ClientOrderId]
         self._index_orders_completed = set()  # type: set[ClientOrderId]
@@ -82,6 +117,30 @@ cdef class ExecutionCache(ExecutionCacheFacade):
         self._index_positions_closed = set()  # type: set[PositionId]
         self._index_strategies = set()        # type: set[StrategyId]
 
+        # Composite query indexes keyed by (Symbol or None, StrategyId or None)
+        self._index_query_orders = {}              # type: dict[tuple, dict[ClientOrderId, Order]]
+        self._index_query_orders_working = {}      # type: dict[tuple, dict[ClientOrderId, Order]]
+        self._index_query_orders_completed = {}    # type: dict[tuple, dict[ClientOrderId, Order]]
+        self._index_query_positions = {}           # type: dict[tuple, dict[PositionId, Position]]
+        self._index_query_positions_open = {}      # type: dict[tuple, dict[PositionId, Position]]
+        self._index_query_positions_closed = {}    # type: dict[tuple, dict[PositionId, Position]]
+
+        # Retention
+        self.max_completed_orders = max_completed_orders
+        self.max_closed_positions = max_closed_positions
+        self.retention_age = timedelta(seconds=retention_age) if retention_age > 0 else None
+        self._retained_orders_completed = deque()  # type: deque[tuple[datetime, ClientOrderId]]
+        self._retained_positions_closed = deque()  # type: deque[tuple[datetime, PositionId]]
+        self._archived_orders = set()              # type: set[ClientOrderId]
+        self._archived_positions = set()           # type: set[PositionId]
+        # The bypass database persists nothing to reload archived objects from
+        self._discard_archived = type(database) is BypassExecutionDatabase
+        self._discarded_orders_count = 0
+        self._discarded_positions_count = 0
+
+        self._log.info(f"max_completed_orders={self.max_completed_orders}, "
+                       f"max_closed_positions={self.max_closed_positions}, "
+                       f"retention_age={self.retention_age}")
         self._log.info("Initialized.")
 
 # -- COMMANDS --------------------------------------------------------------------------------------
@@ -126,6 +185,8 @@ cdef class ExecutionCache(ExecutionCacheFacade):
         self._build_index_venue_account()
         self._build_indexes_from_orders()
         self._build_indexes_from_positions()
+        self._apply_order_retention()
+        self._apply_position_retention()
 
         self._log.debug(f"Indexes built.")
 
@@ -152,27 +213,16 @@ cdef class ExecutionCache(ExecutionCacheFacade):
             if order.strategy_id.not_null():
                 self._index_order_strategy[cl_ord_id] = order.strategy_id
 
-            # 3- Build _index_symbol_orders -> {Symbol, {ClientOrderId}}
-            if order.symbol not in self._index_symbol_orders:
-                self._index_symbol_orders[order.symbol] = set()
-            self._index_symbol_orders[order.symbol].add(cl_ord_id)
+            # 3- Build _index_query_orders -> {(Symbol, StrategyId), {ClientOrderId, Order}}
+            self._index_query_add(self._index_query_orders, order.symbol, order.strategy_id, cl_ord_id, order)
 
-            # 4- Build _index_strategy_orders -> {StrategyId, {ClientOrderId}}
-            if order.strategy_id not in self._index_strategy_orders:
-                self._index_strategy_orders[order.strategy_id] = set()
-            self._index_strategy_orders[order.strategy_id].add(cl_ord_id)
-
-            # 5- Build _index_orders -> {ClientOrderId}
+            # 4- Build _index_orders -> {ClientOrderId}
             self._index_orders.add(cl_ord_id)
 
-            # 6- Build _index_orders_working -> {ClientOrderId}
-            if order.is_working_c():
-                self._index_orders_working.add(cl_ord_id)
-            # 7- Build _index_orders_completed -> {ClientOrderId}
-            elif order.is_completed_c():
-                self._index_orders_completed.add(cl_ord_id)
+            # 5- Build working and completed indexes
+            self._index_order_state(order)
 
-            # 8- Build _index_strategies -> {StrategyId}
+            # 6- Build _index_strategies -> {StrategyId}
             self._index_strategies.add(order.strategy_id)
 
     cdef void _build_indexes_from_positions(self) except *:
@@ -191,27 +241,22 @@ cdef class ExecutionCache(ExecutionCacheFacade):
             for cl_ord_id in position.order_ids:
                 index_position_orders.add(cl_ord_id)
 
-            # 3- Build _index_symbol_positions -> {Symbol, {PositionId}}
-            if position.symbol not in self._index_symbol_positions:
-                self._index_symbol_positions[position_id] = set()
-            self._index_symbol_positions[position.symbol].add(position_id)
-
-            # 4- Build _index_strategy_positions -> {StrategyId, {PositionId}}
-            if position.strategy_id is not None and position.strategy_id not in self._index_strategy_positions:
-                self._index_strategy_positions[position.strategy_id] = set()
-            self._index_strategy_positions[position.strategy_id].add(position.strategy_id)
+            # 3- Build _index_query_positions -> {(Symbol, StrategyId), {PositionId, Position}}
+            self._index_query_add(
+                self._index_query_positions,
+                position.symbol,
+                self._index_position_strategy.get(position_id, position.strategy_id),
+                position_id,
+                position,
+            )
 
-            # 5- Build _index_positions -> {PositionId}
+            # 4- Build _index_positions -> {PositionId}
             self._index_positions.add(position_id)
 
-            # 6- Build _index_positions_open -> {PositionId}
-            if position.is_open_c():
-                self._index_positions_open.add(position_id)
-            # 6- Build _index_positions_closed -> {PositionId}
-            elif position.is_closed_c():
-                self._index_positions_closed.add(position_id)
+            # 5- Build open and closed indexes
+            self._index_position_state(position)
 
-            # 7- Build _index_strategies -> {StrategyId}
+            # 6- Build _index_strategies -> {StrategyId}
             self._index_strategies.add(position.strategy_id)
 
     cpdef void load_strategy(self, TradingStrategy strategy) except *:
@@ -268,7 +313,11 @@ cdef class ExecutionCache(ExecutionCacheFacade):
         """
         Condition.not_none(cl_ord_id, "cl_ord_id")
 
-        return self._cached_orders.get(cl_ord_id)
+        cdef Order order = self._cached_orders.get(cl_ord_id)
+        if order is None and cl_ord_id in self._archived_orders:
+            order = self._reload_order(cl_ord_id)
+
+        return order
 
     cpdef Position load_position(self, PositionId position_id):
         """
@@ -286,7 +335,11 @@ cdef class ExecutionCache(ExecutionCacheFacade):
         """
         Condition.not_none(position_id, "position_id")
 
-        return self._cached_positions.get(position_id)
+        cdef Position position = self._cached_positions.get(position_id)
+        if position is None and position_id in self._archived_positions:
+            position = self._reload_position(position_id)
+
+        return position
 
     cpdef void add_account(self, Account account) except *:
         """
@@ -350,17 +403,8 @@ cdef class ExecutionCache(ExecutionCacheFacade):
         self._index_orders.add(order.cl_ord_id)
         self._index_order_strategy[order.cl_ord_id] = order.strategy_id
 
-        # Index: Symbol -> Set[ClientOrderId]
-        if order.symbol not in self._index_symbol_orders:
-            self._index_symbol_orders[order.symbol] = {order.cl_ord_id}
-        else:
-            self._index_symbol_orders[order.symbol].add(order.cl_ord_id)
-
-        # Index: StrategyId -> Set[ClientOrderId]
-        if order.strategy_id not in self._index_strategy_orders:
-            self._index_strategy_orders[order.strategy_id] = {order.cl_ord_id}
-        else:
-            self._index_strategy_orders[order.strategy_id].add(order.cl_ord_id)
+        # Index: (Symbol, StrategyId) -> Dict[ClientOrderId, Order]
+        self._index_query_add(self._index_query_orders, order.symbol, order.strategy_id, order.cl_ord_id, order)
 
         cdef str position_id_str = f", {position_id.value}" if position_id.not_null() else ""
         self._log.debug(f"Added Order(id={order.cl_ord_id.value}{position_id_str}).")
@@ -410,12 +454,6 @@ cdef class ExecutionCache(ExecutionCacheFacade):
         else:
             self._index_position_orders[position_id].add(cl_ord_id)
 
-        # Index: StrategyId -> Set[PositionId]
-        if strategy_id not in self._index_strategy_positions:
-            self._index_strategy_positions[strategy_id] = {position_id}
-        else:
-            self._index_strategy_positions[strategy_id].add(position_id)
-
         self._log.debug(f"Indexed {repr(position_id)}, "
                         f"cl_ord_id={cl_ord_id}, "
                         f"strategy_id={strategy_id}).")
@@ -450,11 +488,10 @@ cdef class ExecutionCache(ExecutionCacheFacade):
 
         self.add_position_id(position.id, position.from_order, position.strategy_id)
 
-        # Index: Symbol -> Set[PositionId]
-        if position.symbol not in self._index_symbol_positions:
-            self._index_symbol_positions[position.symbol] = {position.id}
-        else:
-            self._index_symbol_positions[position.symbol].add(position.id)
+        # Index: (Symbol, StrategyId) -> Dict[PositionId, Position]
+        cdef StrategyId strategy_id = self._index_position_strategy[position.id]
+        self._index_query_add(self._index_query_positions, position.symbol, strategy_id, position.id, position)
+        self._index_query_add(self._index_query_positions_open, position.symbol, strategy_id, position.id, position)
 
         self._log.debug(f"Added Position(id={position.id.value}, strategy_id={position.strategy_id}).")
 
@@ -487,12 +524,8 @@ cdef class ExecutionCache(ExecutionCacheFacade):
         """
         Condition.not_none(order, "order")
 
-        if order.is_working_c():
-            self._index_orders_working.add(order.cl_ord_id)
-            self._index_orders_completed.discard(order.cl_ord_id)
-        elif order.is_completed_c():
-            self._index_orders_completed.add(order.cl_ord_id)
-            self._index_orders_working.discard(order.cl_ord_id)
+        self._index_order_state(order)
+        self._apply_order_retention()
 
         # Update database
         self._database.update_order(order)
@@ -509,9 +542,8 @@ cdef class ExecutionCache(ExecutionCacheFacade):
         """
         Condition.not_none(position, "position")
 
-        if position.is_closed_c():
-            self._index_positions_closed.add(position.id)
-            self._index_positions_open.discard(position.id)
+        self._index_position_state(position)
+        self._apply_position_retention()
 
         # Update database
         self._database.update_position(position)
@@ -553,11 +585,12 @@ cdef class ExecutionCache(ExecutionCacheFacade):
 
         self._index_strategies.discard(strategy.id)
 
-        if strategy.id in self._index_strategy_orders:
-            del self._index_strategy_orders[strategy.id]
-
-        if strategy.id in self._index_strategy_positions:
-            del self._index_strategy_positions[strategy.id]
+        self._index_query_remove_strategy(self._index_query_orders, strategy.id)
+        self._index_query_remove_strategy(self._index_query_orders_working, strategy.id)
+        self._index_query_remove_strategy(self._index_query_orders_completed, strategy.id)
+        self._index_query_remove_strategy(self._index_query_positions, strategy.id)
+        self._index_query_remove_strategy(self._index_query_positions_open, strategy.id)
+        self._index_query_remove_strategy(self._index_query_positions_closed, strategy.id)
 
         # Update database
         self._database.delete_strategy(strategy.id)
@@ -576,6 +609,74 @@ cdef class ExecutionCache(ExecutionCacheFacade):
         for position in self.positions_open():
             self._log.warning(f"Residual {position}")
 
+    cpdef list orders_archived(self):
+        """
+        Return the completed orders archived out of the cache indexes.
+
+        Archived orders are read from the execution database without being
+        reloaded into the cache (orders discarded with a
+        `BypassExecutionDatabase` are not returned).
+
+        Returns
+        -------
+        list[Order]
+
+        """
+        cdef list orders = []
+        cdef ClientOrderId cl_ord_id
+        cdef Order order
+        for cl_ord_id in self._archived_orders:
+            order = self._database.load_order(cl_ord_id)
+            if order is not None:
+                orders.append(order)
+
+        return orders
+
+    cpdef list positions_archived(self):
+        """
+        Return the closed positions archived out of the cache indexes.
+
+        Archived positions are read from the execution database without being
+        reloaded into the cache (positions discarded with a
+        `BypassExecutionDatabase` are not returned).
+
+        Returns
+        -------
+        list[Position]
+
+        """
+        cdef list positions = []
+        cdef PositionId position_id
+        cdef Position position
+        for position_id in self._archived_positions:
+            position = self._database.load_position(position_id)
+            if position is not None:
+                positions.append(position)
+
+        return positions
+
+    cpdef int orders_archived_count(self) except *:
+        """
+        Return the count of completed orders archived out of memory.
+
+        Returns
+        -------
+        int
+
+        """
+        return len(self._archived_orders) + self._discarded_orders_count
+
+    cpdef int positions_archived_count(self) except *:
+        """
+        Return the count of closed positions archived out of memory.
+
+        Returns
+        -------
+        int
+
+        """
+        return len(self._archived_positions) + self._discarded_positions_count
+
     cpdef void reset(self) except *:
         """
         Reset the cache.
@@ -609,10 +710,6 @@ cdef class ExecutionCache(ExecutionCacheFacade):
         self._index_order_strategy.clear()
         self._index_position_strategy.clear()
         self._index_position_orders.clear()
-        self._index_symbol_orders.clear()
-        self._index_symbol_positions.clear()
-        self._index_strategy_orders.clear()
-        self._index_strategy_positions.clear()
         self._index_orders.clear()
         self._index_orders_working.clear()
         self._index_orders_completed.clear()
@@ -620,8 +717,179 @@ cdef class ExecutionCache(ExecutionCacheFacade):
         self._index_positions_open.clear()
         self._index_positions_closed.clear()
         self._index_strategies.clear()
+        self._index_query_orders.clear()
+        self._index_query_orders_working.clear()
+        self._index_query_orders_completed.clear()
+        self._index_query_positions.clear()
+        self._index_query_positions_open.clear()
+        self._index_query_positions_closed.clear()
+        self._retained_orders_completed.clear()
+        self._retained_positions_closed.clear()
+        self._archived_orders.clear()
+        self._archived_positions.clear()
+        self._discarded_orders_count = 0
+        self._discarded_positions_count = 0
         self._log.debug(f"Indexes cleared.")
 
+    cdef void _index_query_add(
+        self,
+        dict index,
+        Symbol symbol,
+        StrategyId strategy_id,
+        key,
+        value,
+    ) except *:
+        # Index the object under every query it can match, so that any
+        # combination of filters resolves with a single lookup.
+        cdef tuple query
+        cdef dict objects
+        for query in ((None, None), (symbol, None), (None, strategy_id), (symbol, strategy_id)):
+            objects = index.get(query)
+            if objects is None:
+                index[query] = {key: value}
+            else:
+                objects[key] = value
+
+    cdef void _index_query_remove(
+        self,
+        dict index,
+        Symbol symbol,
+        StrategyId strategy_id,
+        key,
+    ) except *:
+        cdef tuple query
+        cdef dict objects
+        for query in ((None, None), (symbol, None), (None, strategy_id), (symbol, strategy_id)):
+            objects = index.get(query)
+            if objects is not None:
+                objects.pop(key, None)
+
+    cdef void _index_query_remove_strategy(self, dict index, StrategyId strategy_id) except *:
+        cdef tuple query
+        for query in [query for query in index if query[1] is not None and query[1] == strategy_id]:
+            del index[query]
+
+    cdef void _index_order_state(self, Order order) except *:
+        # Use the strategy indexed when the order was added, as fill events
+        # can carry a different strategy identifier.
+        cdef StrategyId strategy_id = self._index_order_strategy.get(order.cl_ord_id, order.strategy_id)
+        if order.is_working_c():
+            self._index_orders_working.add(order.cl_ord_id)
+            self._index_orders_completed.discard(order.cl_ord_id)
+            self._index_query_add(self._index_query_orders_working, order.symbol, strategy_id, order.cl_ord_id, order)
+            self._index_query_remove(self._index_query_orders_completed, order.symbol, strategy_id, order.cl_ord_id)
+        elif order.is_completed_c():
+            if order.cl_ord_id not in self._index_orders_completed:
+                self._retained_orders_completed.append((order.last_event_c().timestamp, order.cl_ord_id))
+            self._index_orders_completed.add(order.cl_ord_id)
+            self._index_orders_working.discard(order.cl_ord_id)
+            self._index_query_add(self._index_query_orders_completed, order.symbol, strategy_id, order.cl_ord_id, order)
+            self._index_query_remove(self._index_query_orders_working, order.symbol, strategy_id, order.cl_ord_id)
+
+    cdef void _index_position_state(self, Position position) except *:
+        cdef StrategyId strategy_id = self._index_position_strategy.get(position.id, position.strategy_id)
+        if position.is_open_c():
+            self._index_positions_open.add(position.id)
+            self._index_positions_closed.discard(position.id)
+            self._index_query_add(self._index_query_positions_open, position.symbol, strategy_id, position.id, position)
+            self._index_query_remove(self._index_query_positions_closed, position.symbol, strategy_id, position.id)
+        elif position.is_closed_c():
+            if position.id not in self._index_positions_closed:
+                self._retained_positions_closed.append((position.closed_time, position.id))
+            self._index_positions_closed.add(position.id)
+            self._index_positions_open.discard(position.id)
+            self._index_query_add(self._index_query_positions_closed, position.symbol, strategy_id, position.id, position)
+            self._index_query_remove(self._index_query_positions_open, position.symbol, strategy_id, position.id)
+
+    cdef void _apply_order_retention(self) except *:
+        cdef object retained = self._retained_orders_completed
+        if self.max_completed_orders > 0:
+            while len(retained) > self.max_completed_orders:
+                self._archive_order(retained.popleft()[1])
+        if self.retention_age is not None and retained:
+            cutoff = retained[-1][0] - self.retention_age
+            while retained and retained[0][0] < cutoff:
+                self._archive_order(retained.popleft()[1])
+
+    cdef void _apply_position_retention(self) except *:
+        cdef object retained = self._retained_positions_closed
+        if self.max_closed_positions > 0:
+            while len(retained) > self.max_closed_positions:
+                self._archive_position(retained.popleft()[1])
+        if self.retention_age is not None and retained:
+            cutoff = retained[-1][0] - self.retention_age
+            while retained and retained[0][0] < cutoff:
+                self._archive_position(retained.popleft()[1])
+
+    cdef void _archive_order(self, ClientOrderId cl_ord_id) except *:
+        if cl_ord_id not in self._index_orders_completed:
+            return  # Already archived or removed
+
+        # Late events for archived orders are routed by the strategy index,
+        # which is restored by reloading the order from the database.
+        cdef Order order = self._cached_orders.pop(cl_ord_id)
+        cdef StrategyId strategy_id = self._index_order_strategy.pop(cl_ord_id, order.strategy_id)
+        self._index_order_position.pop(cl_ord_id, None)
+        self._index_orders.discard(cl_ord_id)
+        self._index_orders_completed.discard(cl_ord_id)
+        self._index_query_remove(self._index_query_orders, order.symbol, strategy_id, cl_ord_id)
+        self._index_query_remove(self._index_query_orders_completed, order.symbol, strategy_id, cl_ord_id)
+        if self._discard_archived:
+            self._discarded_orders_count += 1
+        else:
+            self._archived_orders.add(cl_ord_id)
+
+    cdef void _archive_position(self, PositionId position_id) except *:
+        if position_id not in self._index_positions_closed:
+            return  # Already archived, removed or re-opened
+
+        cdef Position position = self._cached_positions.pop(position_id)
+        cdef StrategyId strategy_id = self._index_position_strategy.pop(position_id, position.strategy_id)
+        self._index_position_orders.pop(position_id, None)
+        self._index_positions.discard(position_id)
+        self._index_positions_closed.discard(position_id)
+        self._index_query_remove(self._index_query_positions, position.symbol, strategy_id, position_id)
+        self._index_query_remove(self._index_query_positions_closed, position.symbol, strategy_id, position_id)
+        if self._discard_archived:
+            self._discarded_positions_count += 1
+        else:
+            self._archived_positions.add(position_id)
+
+    cdef Order _reload_order(self, ClientOrderId cl_ord_id):
+        cdef Order order = self._database.load_order(cl_ord_id)
+        if order is None:
+            self._log.warning(f"Cannot reload archived {repr(cl_ord_id)} from the database.")
+            return None
+
+        self._archived_orders.discard(cl_ord_id)
+        self._cached_orders[cl_ord_id] = order
+        self._index_orders.add(cl_ord_id)
+        cdef StrategyId strategy_id = self._index_order_strategy.setdefault(cl_ord_id, order.strategy_id)
+        if order.position_id is not None:
+            self._index_order_position.setdefault(cl_ord_id, order.position_id)
+        self._index_query_add(self._index_query_orders, order.symbol, strategy_id, cl_ord_id, order)
+        self._index_order_state(order)
+
+        self._log.debug(f"Reloaded archived Order(id={cl_ord_id.value}).")
+        return order
+
+    cdef Position _reload_position(self, PositionId position_id):
+        cdef Position position = self._database.load_position(position_id)
+        if position is None:
+            self._log.warning(f"Cannot reload archived {repr(position_id)} from the database.")
+            return None
+
+        self._archived_positions.discard(position_id)
+        self._cached_positions[position_id] = position
+        self._index_positions.add(position_id)
+        cdef StrategyId strategy_id = self._index_position_strategy.setdefault(position_id, position.strategy_id)
+        self._index_position_orders[position_id] = set(position.cl_ord_ids_c())
+        self._index_query_add(self._index_query_positions, position.symbol, strategy_id, position_id, position)
+        self._index_position_state(position)
+
+        self._log.debug(f"Reloaded archived Position(id={position_id.value}).")
+        return position
+
 # -- ACCOUNT QUERIES -------------------------------------------------------------------------------
 
     cpdef Account account(self, AccountId account_id):
@@ -684,33 +952,25 @@ cdef class ExecutionCache(ExecutionCacheFacade):
 
 # -- IDENTIFIER QUERIES ----------------------------------------------------------------------------
 
-    cdef inline set _build_ord_query_filter_set(self, Symbol symbol, StrategyId strategy_id):
-        cdef set query = None
-
-        # Build potential query set
-        if symbol is not None:
-            query = self._index_symbol_orders.get(symbol, set())
+    cdef inline tuple _query_key(self, dict index, Symbol symbol, StrategyId strategy_id):
+        # Resolve the query with the semantics of intersecting the symbol and
+        # strategy filters, where an empty filter result matches everything.
+        cdef tuple query = None
+        if symbol is not None and index.get((symbol, None)):
+            query = (symbol, None)
         if strategy_id is not None:
-            if not query:
-                query = self._index_strategy_orders.get(strategy_id, set())
-            else:
-                query = query.intersection(self._index_strategy_orders.get(strategy_id, set()))
-
+            query = (None, strategy_id) if query is None else (symbol, strategy_id)
+        if query is None or not index.get(query):
+            return (None, None)
         return query
 
-    cdef inline set _build_pos_query_filter_set(self, Symbol symbol, StrategyId strategy_id):
-        cdef set query = None
+    cdef inline dict _query_orders(self, dict index, Symbol symbol, StrategyId strategy_id):
+        # Return the indexed orders matching the query (or None if no match)
+        return index.get(self._query_key(self._index_query_orders, symbol, strategy_id))
 
-        # Build potential query set
-        if symbol is not None:
-            query = self._index_symbol_positions.get(symbol, set())
-        if strategy_id is not None:
-            if not query:
-                query = self._index_strategy_positions.get(strategy_id, set())
-            else:
-                query = query.intersection(self._index_strategy_positions.get(strategy_id, set()))
-
-        return query
+    cdef inline dict _query_positions(self, dict index, Symbol symbol, StrategyId strategy_id):
+        # Return the indexed positions matching the query (or None if no match)
+        return index.get(self._query_key(self._index_query_positions, symbol, strategy_id))
 
     cpdef set order_ids(self, Symbol symbol=None, StrategyId strategy_id=None):
         """
@@ -728,12 +988,11 @@ cdef class ExecutionCache(ExecutionCacheFacade):
         set[ClientOrderId]
 
         """
-        cdef set query = self._build_ord_query_filter_set(symbol, strategy_id)
-
-        if not query:
+        if symbol is None and strategy_id is None:
             return self._index_orders
-        else:
-            return self._index_orders.intersection(query)
+
+        cdef dict query = self._query_orders(self._index_query_orders, symbol, strategy_id)
+        return set(query) if query is not None else set()
 
     cpdef set order_working_ids(self, Symbol symbol=None, StrategyId strategy_id=None):
         """
@@ -752,12 +1011,11 @@ cdef class ExecutionCache(ExecutionCacheFacade):
         set[ClientOrderId]
 
         """
-        cdef set query = self._build_ord_query_filter_set(symbol, strategy_id)
-
-        if not query:
+        if symbol is None and strategy_id is None:
             return self._index_orders_working
-        else:
-            return self._index_orders_working.intersection(query)
+
+        cdef dict query = self._query_orders(self._index_query_orders_working, symbol, strategy_id)
+        return set(query) if query is not None else set()
 
     cpdef set order_completed_ids(self, Symbol symbol=None, StrategyId strategy_id=None):
         """
@@ -776,12 +1034,11 @@ cdef class ExecutionCache(ExecutionCacheFacade):
         set[ClientOrderId]
 
         """
-        cdef set query = self._build_ord_query_filter_set(symbol, strategy_id)
-
-        if not query:
+        if symbol is None and strategy_id is None:
             return self._index_orders_completed
-        else:
-            return self._index_orders_completed.intersection(query)
+
+        cdef dict query = self._query_orders(self._index_query_orders_completed, symbol, strategy_id)
+        return set(query) if query is not None else set()
 
     cpdef set position_ids(self, Symbol symbol=None, StrategyId strategy_id=None):
         """
@@ -799,12 +1056,11 @@ cdef class ExecutionCache(ExecutionCacheFacade):
         Set[PositionId]
 
         """
-        cdef set query = self._build_pos_query_filter_set(symbol, strategy_id)
-
-        if not query:
+        if symbol is None and strategy_id is None:
             return self._index_positions
-        else:
-            return self._index_positions.intersection(query)
+
+        cdef dict query = self._query_positions(self._index_query_positions, symbol, strategy_id)
+        return set(query) if query is not None else set()
 
     cpdef set position_open_ids(self, Symbol symbol=None, StrategyId strategy_id=None):
         """
@@ -822,12 +1078,11 @@ cdef class ExecutionCache(ExecutionCacheFacade):
         Set[PositionId]
 
         """
-        cdef set query = self._build_pos_query_filter_set(symbol, strategy_id)
-
-        if not query:
+        if symbol is None and strategy_id is None:
             return self._index_positions_open
-        else:
-            return self._index_positions_open.intersection(query)
+
+        cdef dict query = self._query_positions(self._index_query_positions_open, symbol, strategy_id)
+        return set(query) if query is not None else set()
 
     cpdef set position_closed_ids(self, Symbol symbol=None, StrategyId strategy_id=None):
         """
@@ -845,12 +1100,11 @@ cdef class ExecutionCache(ExecutionCacheFacade):
         Set[PositionId]
 
         """
-        cdef set query = self._build_pos_query_filter_set(symbol, strategy_id)
-
-        if not query:
+        if symbol is None and strategy_id is None:
             return self._index_positions_closed
-        else:
-            return self._index_positions_closed.intersection(query)
+
+        cdef dict query = self._query_positions(self._index_query_positions_closed, symbol, strategy_id)
+        return set(query) if query is not None else set()
 
     cpdef set strategy_ids(self):
         """
@@ -874,9 +1128,7 @@ cdef class ExecutionCache(ExecutionCacheFacade):
         Order or None
 
         """
-        Condition.not_none(cl_ord_id, "cl_ord_id")
-
-        return self._cached_orders.get(cl_ord_id)
+        return self.load_order(cl_ord_id)
 
     cpdef list orders(self, Symbol symbol=None, StrategyId strategy_id=None):
         """
@@ -894,16 +1146,8 @@ cdef class ExecutionCache(ExecutionCacheFacade):
         list[Order]
 
         """
-        cdef set cl_ord_ids = self.order_ids(symbol, strategy_id)
-
-        cdef ClientOrderId cl_ord_id
-        cdef list orders
-        try:
-            orders = [self._cached_orders[cl_ord_id] for cl_ord_id in cl_ord_ids]
-        except KeyError as ex:
-            self._log.error("Cannot find order object in cached orders " + str(ex))
-
-        return orders
+        cdef dict query = self._query_orders(self._index_query_orders, symbol, strategy_id)
+        return list(query.values()) if query is not None else []
 
     cpdef list orders_working(self, Symbol symbol=None, StrategyId strategy_id=None):
         """
@@ -921,16 +1165,8 @@ cdef class ExecutionCache(ExecutionCacheFacade):
         list[Order]
 
         """
-        cdef set cl_ord_ids = self.order_working_ids(symbol, strategy_id)
-
-        cdef ClientOrderId cl_ord_id
-        cdef list orders_working
-        try:
-            orders_working = [self._cached_orders[cl_ord_id] for cl_ord_id in cl_ord_ids]
-        except KeyError as ex:
-            self._log.error("Cannot find Order object in cache " + str(ex))
-
-        return orders_working
+        cdef dict query = self._query_orders(self._index_query_orders_working, symbol, strategy_id)
+        return list(query.values()) if query is not None else []
 
     cpdef list orders_completed(self, Symbol symbol=None, StrategyId strategy_id=None):
         """
@@ -948,16 +1184,8 @@ cdef class ExecutionCache(ExecutionCacheFacade):
         list[Order]
 
         """
-        cdef set cl_ord_ids = self.order_completed_ids(symbol, strategy_id)
-
-        cdef ClientOrderId cl_ord_id
-        cdef list orders_completed
-        try:
-            orders_completed = [self._cached_orders[cl_ord_id] for cl_ord_id in cl_ord_ids]
-        except KeyError as ex:
-            self._log.error("Cannot find Order object in cache " + str(ex))
-
-        return orders_completed
+        cdef dict query = self._query_orders(self._index_query_orders_completed, symbol, strategy_id)
+        return list(query.values()) if query is not None else []
 
 # -- POSITION QUERIES ------------------------------------------------------------------------------
 
@@ -975,9 +1203,7 @@ cdef class ExecutionCache(ExecutionCacheFacade):
         Position or None
 
         """
-        Condition.not_none(position_id, "position_id")
-
-        return self._cached_positions.get(position_id)
+        return self.load_position(position_id)
 
     cpdef PositionId position_id(self, ClientOrderId cl_ord_id):
         """
@@ -996,6 +1222,9 @@ cdef class ExecutionCache(ExecutionCacheFacade):
         """
         Condition.not_none(cl_ord_id, "cl_ord_id")
 
+        if cl_ord_id in self._archived_orders:
+            self._reload_order(cl_ord_id)
+
         return self._index_order_position.get(cl_ord_id)
 
     cpdef list positions(self, Symbol symbol=None, StrategyId strategy_id=None):
@@ -1014,16 +1243,8 @@ cdef class ExecutionCache(ExecutionCacheFacade):
         list[Position]
 
         """
-        cdef set position_ids = self.position_ids(symbol, strategy_id)
-
-        cdef PositionId position_id
-        cdef list positions
-        try:
-            positions = [self._cached_positions[position_id] for position_id in position_ids]
-        except KeyError as ex:
-            self._log.error("Cannot find Position object in cache " + str(ex))
-
-        return positions
+        cdef dict query = self._query_positions(self._index_query_positions, symbol, strategy_id)
+        return list(query.values()) if query is not None else []
 
     cpdef list positions_open(self, Symbol symbol=None, StrategyId strategy_id=None):
         """
@@ -1041,16 +1262,8 @@ cdef class ExecutionCache(ExecutionCacheFacade):
         list[Position]
 
         """
-        cdef set position_ids = self.position_open_ids(symbol, strategy_id)
-
-        cdef PositionId position_id
-        cdef list positions
-        try:
-            positions = [self._cached_positions[position_id] for position_id in position_ids]
-        except KeyError as ex:
-            self._log.error("Cannot find Position object in cache " + str(ex))
-
-        return positions
+        cdef dict query = self._query_positions(self._index_query_positions_open, symbol, strategy_id)
+        return list(query.values()) if query is not None else []
 
     cpdef list positions_closed(self, Symbol symbol=None, StrategyId strategy_id=None):
         """
@@ -1068,16 +1281,8 @@ cdef class ExecutionCache(ExecutionCacheFacade):
         list[Position]
 
         """
-        cdef set position_ids = self.position_closed_ids(symbol, strategy_id)
-
-        cdef PositionId position_id
-        cdef list positions
-        try:
-            positions = [self._cached_positions[position_id] for position_id in position_ids]
-        except KeyError as ex:
-            self._log.error("Cannot find Position object in cache " + str(ex))
-
-        return positions
+        cdef dict query = self._query_positions(self._index_query_positions_closed, symbol, strategy_id)
+        return list(query.values()) if query is not None else []
 
     cpdef bint order_exists(self, ClientOrderId cl_ord_id) except *:
         """
@@ -1096,7 +1301,7 @@ cdef class ExecutionCache(ExecutionCacheFacade):
         """
         Condition.not_none(cl_ord_id, "cl_ord_id")
 
-        return cl_ord_id in self._index_orders
+        return cl_ord_id in self._index_orders or cl_ord_id in self._archived_orders
 
     cpdef bint is_order_working(self, ClientOrderId cl_ord_id) except *:
         """
@@ -1134,7 +1339,7 @@ cdef class ExecutionCache(ExecutionCacheFacade):
         """
         Condition.not_none(cl_ord_id, "cl_ord_id")
 
-        return cl_ord_id in self._index_orders_completed
+        return cl_ord_id in self._index_orders_completed or cl_ord_id in self._archived_orders
 
     cpdef int orders_total_count(self, Symbol symbol=None, StrategyId strategy_id=None) except *:
         """
@@ -1152,7 +1357,8 @@ cdef class ExecutionCache(ExecutionCacheFacade):
         int
 
         """
-        return len(self.order_ids(symbol, strategy_id))
+        cdef dict query = self._query_orders(self._index_query_orders, symbol, strategy_id)
+        return len(query) if query is not None else 0
 
     cpdef int orders_working_count(self, Symbol symbol=None, StrategyId strategy_id=None) except *:
         """
@@ -1170,7 +1376,8 @@ cdef class ExecutionCache(ExecutionCacheFacade):
         int
 
         """
-        return len(self.order_working_ids(symbol, strategy_id))
+        cdef dict query = self._query_orders(self._index_query_orders_working, symbol, strategy_id)
+        return len(query) if query is not None else 0
 
     cpdef int orders_completed_count(self, Symbol symbol=None, StrategyId strategy_id=None) except *:
         """
@@ -1188,7 +1395,8 @@ cdef class ExecutionCache(ExecutionCacheFacade):
         int
 
         """
-        return len(self.order_completed_ids(symbol, strategy_id))
+        cdef dict query = self._query_orders(self._index_query_orders_completed, symbol, strategy_id)
+        return len(query) if query is not None else 0
 
     cpdef bint position_exists(self, PositionId position_id) except *:
         """
@@ -1207,7 +1415,7 @@ cdef class ExecutionCache(ExecutionCacheFacade):
         """
         Condition.not_none(position_id, "position_id")
 
-        return position_id in self._index_positions
+        return position_id in self._index_positions or position_id in self._archived_positions
 
     cpdef bint is_position_open(self, PositionId position_id) except *:
         """
@@ -1245,7 +1453,7 @@ cdef class ExecutionCache(ExecutionCacheFacade):
         """
         Condition.not_none(position_id, "position_id")
 
-        return position_id in self._index_positions_closed
+        return position_id in self._index_positions_closed or position_id in self._archived_positions
 
     cpdef int positions_total_count(self, Symbol symbol=None, StrategyId strategy_id=None) except *:
         """
@@ -1263,7 +1471,8 @@ cdef class ExecutionCache(ExecutionCacheFacade):
         int
 
         """
-        return len(self.position_ids(symbol, strategy_id))
+        cdef dict query = self._query_positions(self._index_query_positions, symbol, strategy_id)
+        return len(query) if query is not None else 0
 
     cpdef int positions_open_count(self, Symbol symbol=None, StrategyId strategy_id=None) except *:
         """
@@ -1281,7 +1490,8 @@ cdef class ExecutionCache(ExecutionCacheFacade):
         int
 
         """
-        return len(self.position_open_ids(symbol, strategy_id))
+        cdef dict query = self._query_positions(self._index_query_positions_open, symbol, strategy_id)
+        return len(query) if query is not None else 0
 
     cpdef int positions_closed_count(self, Symbol symbol=None, StrategyId strategy_id=None) except *:
         """
@@ -1299,7 +1509,8 @@ cdef class ExecutionCache(ExecutionCacheFacade):
         int
 
         """
-        return len(self.position_closed_ids(symbol, strategy_id))
+        cdef dict query = self._query_positions(self._index_query_positions_closed, symbol, strategy_id)
+        return len(query) if query is not None else 0
 
 # -- STRATEGY QUERIES ------------------------------------------------------------------------------
 
@@ -1319,6 +1530,9 @@ cdef class ExecutionCache(ExecutionCacheFacade):
         """
         Condition.not_none(cl_ord_id, "cl_ord_id")
 
+        if cl_ord_id in self._archived_orders:
+            self._reload_order(cl_ord_id)
+
         return self._index_order_strategy.get(cl_ord_id)
 
     cpdef StrategyId strategy_id_for_position(self, PositionId position_id):
@@ -1337,4 +1551,7 @@ cdef class ExecutionCache(ExecutionCacheFacade):
         """
         Condition.not_none(position_id, "position_id")
 
+        if position_id in self._archived_positions:
+            self._reload_position(position_id)
+
         return self._index_position_strategy.get(position_id)
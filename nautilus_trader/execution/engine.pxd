@@ -15,6 +15,7 @@
 
 from nautilus_trader.common.component cimport Component
 from nautilus_trader.common.generators cimport PositionIdGenerator
+from nautilus_trader.common.latency cimport LatencyRecorder
 from nautilus_trader.execution.cache cimport ExecutionCache
 from nautilus_trader.execution.client cimport ExecutionClient
 from nautilus_trader.model.commands cimport CancelOrder
@@ -36,6 +37,7 @@ from nautilus_trader.model.identifiers cimport StrategyId
 from nautilus_trader.model.identifiers cimport TraderId
 from nautilus_trader.model.order cimport Order
 from nautilus_trader.model.position cimport Position
+from nautilus_trader.risk.engine cimport RiskEngine
 from nautilus_trader.trading.portfolio cimport Portfolio
 from nautilus_trader.trading.strategy cimport TradingStrategy
 
@@ -44,6 +46,7 @@ cdef class ExecutionEngine(Component):
     cdef PositionIdGenerator _pos_id_generator
     cdef dict _clients
     cdef dict _strategies
+    cdef RiskEngine _risk_engine
 
     cdef readonly TraderId trader_id
     """The trader identifier associated with the engine.\n\n:returns: `TraderId`"""
@@ -51,6 +54,8 @@ cdef class ExecutionEngine(Component):
     """The engines execution cache.\n\n:returns: `ExecutionCache`"""
     cdef readonly Portfolio portfolio
     """The portfolio wired to the engine.\n\n:returns: `Portfolio`"""
+    cdef readonly LatencyRecorder latency_recorder
+    """The latency recorder for the engine (None if not registered).\n\n:returns: `LatencyRecorder` or `None`"""
     cdef readonly int command_count
     """The total count of commands received by the engine.\n\n:returns: `int`"""
     cdef readonly int event_count
@@ -62,6 +67,8 @@ cdef class ExecutionEngine(Component):
 
     cpdef void register_client(self, ExecutionClient client) except *
     cpdef void register_strategy(self, TradingStrategy strategy) except *
+    cpdef void register_risk_engine(self, RiskEngine engine) except *
+    cpdef void register_latency_recorder(self, LatencyRecorder recorder) except *
     cpdef void deregister_client(self, ExecutionClient client) except *
     cpdef void deregister_strategy(self, TradingStrategy strategy) except *
 
@@ -110,3 +117,6 @@ cdef class ExecutionEngine(Component):
 # -- INTERNAL --------------------------------------------------------------------------------------
 
     cdef inline void _set_position_symbol_counts(self) except *
+    cdef inline void _stamp_command(self, VenueCommand command) except *
+    cdef inline void _record_routed(self, VenueCommand command, StrategyId strategy_id) except *
+    cdef inline void _record_sent(self, VenueCommand command, StrategyId strategy_id) except *
@@ -33,6 +33,9 @@ the engines `execute` and `process` methods.
 from nautilus_trader.common.clock cimport Clock
 from nautilus_trader.common.component cimport Component
 from nautilus_trader.common.generators cimport PositionIdGenerator
+from nautilus_trader.common.latency cimport LatencyRecorder
+from nautilus_trader.common.latency cimport LatencyStage
+from nautilus_trader.common.latency cimport monotonic_ns
 from nautilus_trader.common.logging cimport CMD
 from nautilus_trader.common.logging cimport EVT
 from nautilus_trader.common.logging cimport Logger
@@ -68,6 +71,7 @@ from nautilus_trader.model.identifiers cimport Venue
 from nautilus_trader.model.objects cimport Money
 from nautilus_trader.model.objects cimport Quantity
 from nautilus_trader.model.order cimport Order
+from nautilus_trader.risk.engine cimport RiskEngine
 from nautilus_trader.trading.account cimport Account
 from nautilus_trader.trading.portfolio cimport Portfolio
 from nautilus_trader.trading.strategy cimport TradingStrategy
@@ -114,11 +118,13 @@ cdef class ExecutionEngine(Component):
 
         # Handlers
         self._strategies = {}  # type: dict[StrategyId, TradingStrategy]
+        self._risk_engine = None  # Initialized when risk engine registered
 
         # Public components
         self.trader_id = database.trader_id
-        self.cache = ExecutionCache(database, logger)
+        self.cache = ExecutionCache(database, logger, config)
         self.portfolio = portfolio
+        self.latency_recorder = None
 
         # Counters
         self.command_count = 0
@@ -204,6 +210,42 @@ cdef class ExecutionEngine(Component):
         self._strategies[strategy.id] = strategy
         self._log.info(f"Registered {strategy}.")
 
+    cpdef void register_risk_engine(self, RiskEngine engine) except *:
+        """
+        Register the given risk engine with the execution engine.
+
+        All submit order commands will be checked by the risk engine prior to
+        routing to an execution client, orders failing a check are denied.
+
+        Parameters
+        ----------
+        engine : RiskEngine
+            The risk engine to register.
+
+        """
+        Condition.not_none(engine, "engine")
+
+        self._risk_engine = engine
+        self._log.info(f"Registered {type(engine).__name__}.")
+
+    cpdef void register_latency_recorder(self, LatencyRecorder recorder) except *:
+        """
+        Register the given latency recorder with the execution engine.
+
+        Once registered commands are stamped on receipt, and the time each
+        takes to be routed to and sent by an execution client is recorded.
+
+        Parameters
+        ----------
+        recorder : LatencyRecorder
+            The latency recorder to register.
+
+        """
+        Condition.not_none(recorder, "recorder")
+
+        self.latency_recorder = recorder
+        self._log.info(f"Registered {type(recorder).__name__}.")
+
     cpdef void deregister_client(self, ExecutionClient client) except *:
         """
         Deregister the given execution client from the execution engine.
@@ -271,6 +313,8 @@ cdef class ExecutionEngine(Component):
 
         self.cache.reset()
         self._pos_id_generator.reset()
+        if self._risk_engine is not None:
+            self._risk_engine.reset()
 
         self.command_count = 0
         self.event_count = 0
@@ -314,6 +358,9 @@ cdef class ExecutionEngine(Component):
         """
         Condition.not_none(command, "command")
 
+        if self.latency_recorder is not None:
+            self._stamp_command(command)
+
         self._execute_command(command)
 
     cpdef void process(self, Event event) except *:
@@ -387,8 +434,20 @@ cdef class ExecutionEngine(Component):
         # Cache order
         self.cache.add_order(command.order, command.position_id)
 
+        # Check pre-trade risk
+        cdef str denied_reason = None
+        if self._risk_engine is not None:
+            denied_reason = self._risk_engine.check_submit_order(command)
+        if denied_reason is not None:
+            self._deny_order(command.order, denied_reason)
+            return  # Denied command
+
         # Submit order
+        if self.latency_recorder is not None:
+            self._record_routed(command, command.strategy_id)
         client.submit_order(command)
+        if self.latency_recorder is not None:
+            self._record_sent(command, command.strategy_id)
 
     cdef inline void _handle_submit_bracket_order(self, ExecutionClient client, SubmitBracketOrder command) except *:
         # Validate command
@@ -416,8 +475,23 @@ cdef class ExecutionEngine(Component):
         if command.bracket_order.take_profit is not None:
             self.cache.add_order(command.bracket_order.take_profit, PositionId.null_c())
 
+        # Check pre-trade risk
+        cdef str denied_reason = None
+        if self._risk_engine is not None:
+            denied_reason = self._risk_engine.check_submit_bracket_order(command)
+        if denied_reason is not None:
+            self._deny_order(command.bracket_order.entry, denied_reason)
+            self._deny_order(command.bracket_order.stop_loss, denied_reason)
+            if command.bracket_order.take_profit is not None:
+                self._deny_order(command.bracket_order.take_profit, denied_reason)
+            return  # Denied command
+
         # Submit bracket order
+        if self.latency_recorder is not None:
+            self._record_routed(command, command.strategy_id)
         client.submit_bracket_order(command)
+        if self.latency_recorder is not None:
+            self._record_sent(command, command.strategy_id)
 
     cdef inline void _handle_modify_order(self, ExecutionClient client, ModifyOrder command) except *:
         # Validate command
@@ -426,7 +500,14 @@ cdef class ExecutionEngine(Component):
                               f"({repr(command.cl_ord_id)} already completed).")
             return  # Invalid command
 
+        if self.latency_recorder is None:
+            client.modify_order(command)
+            return
+
+        cdef StrategyId strategy_id = self.cache.strategy_id_for_order(command.cl_ord_id)
+        self._record_routed(command, strategy_id)
         client.modify_order(command)
+        self._record_sent(command, strategy_id)
 
     cdef inline void _handle_cancel_order(self, ExecutionClient client, CancelOrder command) except *:
         # Validate command
@@ -435,7 +516,14 @@ cdef class ExecutionEngine(Component):
                               f"({repr(command.cl_ord_id)} already completed).")
             return  # Invalid command
 
+        if self.latency_recorder is None:
+            client.cancel_order(command)
+            return
+
+        cdef StrategyId strategy_id = self.cache.strategy_id_for_order(command.cl_ord_id)
+        self._record_routed(command, strategy_id)
         client.cancel_order(command)
+        self._record_sent(command, strategy_id)
 
     cdef inline void _invalidate_order(self, Order order, str reason) except *:
         # Generate event
@@ -744,3 +832,21 @@ cdef class ExecutionEngine(Component):
         for symbol, count in counts.items():
             self._pos_id_generator.set_count(symbol, count)
             self._log.info(f"Set position count {symbol} to {count}")
+
+    cdef inline void _stamp_command(self, VenueCommand command) except *:
+        # Commands sent while a tick is being dispatched carry its receive stamp
+        command.origin_ns = self.latency_recorder.origin_ns()
+        command.stage_ns = monotonic_ns()
+
+    cdef inline void _record_routed(self, VenueCommand command, StrategyId strategy_id) except *:
+        cdef long long now = monotonic_ns()
+        if command.stage_ns > 0:
+            self.latency_recorder.record(LatencyStage.EXEC_ROUTING, now - command.stage_ns, strategy_id)
+        command.stage_ns = now
+
+    cdef inline void _record_sent(self, VenueCommand command, StrategyId strategy_id) except *:
+        cdef long long now = monotonic_ns()
+        self.latency_recorder.record(LatencyStage.CLIENT_SEND, now - command.stage_ns, strategy_id)
+        if command.origin_ns > 0:
+            self.latency_recorder.record(LatencyStage.TICK_TO_TRADE, now - command.origin_ns, strategy_id)
+        command.stage_ns = now
@@ -13,11 +13,9 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
-from collections import deque
-
 from nautilus_trader.core.correctness cimport Condition
-from nautilus_trader.core.functions cimport fast_mean
 from nautilus_trader.indicators.average.moving_average cimport MovingAverage
+from nautilus_trader.indicators.base.window cimport RollingWindow
 from nautilus_trader.model.bar cimport Bar
 from nautilus_trader.model.c_enums.price_type cimport PriceType
 from nautilus_trader.model.tick cimport QuoteTick
@@ -49,7 +47,7 @@ cdef class SimpleMovingAverage(MovingAverage):
         Condition.positive_int(period, "period")
         super().__init__(period, params=[period], price_type=price_type)
 
-        self._inputs = deque(maxlen=period)
+        self._inputs = RollingWindow(period)
         self.value = 0
 
     cpdef void handle_quote_tick(self, QuoteTick tick) except *:
@@ -105,9 +103,9 @@ cdef class SimpleMovingAverage(MovingAverage):
 
         """
         self._increment_count()
-        self._inputs.append(value)
+        self._inputs.update(value)
 
-        self.value = fast_mean(list(self._inputs))
+        self.value = self._inputs.mean()
 
     cdef void _reset_ma(self) except *:
-        self._inputs.clear()
+        self._inputs.reset()
@@ -0,0 +1,37 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2021 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+
+cdef class RollingWindow:
+    cdef object _values
+    cdef double _shift
+    cdef double _sum
+    cdef double _sum_squares
+    cdef int _updates
+
+    cdef readonly int period
+    """The rolling window period.\n\n:returns: `int`"""
+
+    cpdef void update(self, double value) except *
+    cpdef int count(self) except *
+    cpdef double first(self) except *
+    cpdef double last(self) except *
+    cpdef double sum(self) except *
+    cpdef double mean(self) except *
+    cpdef double std(self) except *
+    cpdef double std_with_mean(self, double mean) except *
+    cpdef void reset(self) except *
+
+    cdef void _resync(self) except *
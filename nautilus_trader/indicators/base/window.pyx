@@ -0,0 +1,218 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2021 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from collections import deque
+
+from libc.math cimport sqrt
+
+from nautilus_trader.core.correctness cimport Condition
+
+
+cdef class RollingWindow:
+    """
+    Provides a fixed length window of values with O(1) running statistics.
+
+    The running sums are kept relative to a shift value (close to the window
+    mean) to avoid catastrophic cancellation, and are re-summed from the window
+    once every period updates to stop floating point drift accumulating.
+    """
+
+    def __init__(self, int period):
+        """
+        Initialize a new instance of the `RollingWindow` class.
+
+        Parameters
+        ----------
+        period : int
+            The rolling window period (> 0).
+
+        Raises
+        ------
+        ValueError
+            If period is not positive (> 0).
+
+        """
+        Condition.positive_int(period, "period")
+
+        self.period = period
+        self._values = deque(maxlen=period)
+        self._shift = 0
+        self._sum = 0
+        self._sum_squares = 0
+        self._updates = 0
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    cpdef void update(self, double value) except *:
+        """
+        Append the given value to the window, dropping the oldest value if the
+        window is full.
+
+        Parameters
+        ----------
+        value : double
+            The value to append.
+
+        """
+        if not self._values:
+            self._shift = value
+
+        cdef double dropped
+        if len(self._values) == self.period:
+            dropped = self._values[0] - self._shift
+            self._sum -= dropped
+            self._sum_squares -= dropped * dropped
+
+        self._values.append(value)
+        cdef double shifted = value - self._shift
+        self._sum += shifted
+        self._sum_squares += shifted * shifted
+
+        self._updates += 1
+        if self._updates >= self.period:
+            self._resync()
+
+    cpdef int count(self) except *:
+        """
+        Return the count of values in the window.
+
+        Returns
+        -------
+        int
+
+        """
+        return len(self._values)
+
+    cpdef double first(self) except *:
+        """
+        Return the oldest value in the window.
+
+        Returns
+        -------
+        double
+
+        Raises
+        ------
+        IndexError
+            If the window is empty.
+
+        """
+        return self._values[0]
+
+    cpdef double last(self) except *:
+        """
+        Return the newest value in the window.
+
+        Returns
+        -------
+        double
+
+        Raises
+        ------
+        IndexError
+            If the window is empty.
+
+        """
+        return self._values[len(self._values) - 1]
+
+    cpdef double sum(self) except *:
+        """
+        Return the sum of the values in the window.
+
+        Returns
+        -------
+        double
+
+        """
+        return self._sum + self._shift * len(self._values)
+
+    cpdef double mean(self) except *:
+        """
+        Return the mean of the values in the window (0 if empty).
+
+        Returns
+        -------
+        double
+
+        """
+        cdef int length = len(self._values)
+        if length == 0:
+            return 0
+
+        return self._shift + self._sum / length
+
+    cpdef double std(self) except *:
+        """
+        Return the population standard deviation of the values in the window.
+
+        Returns
+        -------
+        double
+
+        """
+        return self.std_with_mean(self.mean())
+
+    cpdef double std_with_mean(self, double mean) except *:
+        """
+        Return the standard deviation of the values in the window around the
+        given mean (which may come from another average).
+
+        Parameters
+        ----------
+        mean : double
+            The mean to measure the deviations from.
+
+        Returns
+        -------
+        double
+
+        """
+        cdef int length = len(self._values)
+        if length == 0:
+            return 0
+
+        cdef double offset = mean - self._shift
+        cdef double squares = self._sum_squares - 2 * offset * self._sum + length * offset * offset
+        if squares <= 0:
+            return 0
+
+        return sqrt(squares / length)
+
+    cpdef void reset(self) except *:
+        """
+        Reset the window.
+
+        All stateful fields are reset to their initial value.
+        """
+        self._values.clear()
+        self._shift = 0
+        self._sum = 0
+        self._sum_squares = 0
+        self._updates = 0
+
+    cdef void _resync(self) except *:
+        cdef int length = len(self._values)
+        self._shift = self._shift + self._sum / length
+        self._sum = 0
+        self._sum_squares = 0
+        self._updates = 0
+
+        cdef double value
+        cdef double shifted
+        for value in self._values:
+            shifted = value - self._shift
+            self._sum += shifted
+            self._sum_squares += shifted * shifted
@@ -123,9 +123,9 @@ cdef class WindowedMinMaxPrices:
         self._add_min_price(ts, price)
         self._add_max_price(ts, price)
 
-        # Pull out the min/max
-        self.min_price = min([p[1] for p in self._min_prices])
-        self.max_price = max([p[1] for p in self._max_prices])
+        # Pull out the min/max (the deques are monotonic so the extremes are at the front)
+        self.min_price = self._min_prices[0][1]
+        self.max_price = self._max_prices[0][1]
 
     cpdef void reset(self) except *:
         """
@@ -152,24 +152,18 @@ cdef class WindowedMinMaxPrices:
 
     cdef inline void _add_min_price(self, datetime ts, Price price) except *:
         """Handle appending to the min deque"""
-        # Pop front elements that are less than or equal (since we want the max ask)
-        while self._min_prices and self._min_prices[-1][1] <= price:
+        # Pop back elements that are greater than or equal to the new price,
+        # keeping the deque increasing so the min is at the front.
+        while self._min_prices and self._min_prices[-1][1] >= price:
             self._min_prices.pop()
 
-        # Pop back elements that are less than or equal to the new ask
-        while self._min_prices and self._min_prices[0][1] <= price:
-            self._min_prices.popleft()
-
         self._min_prices.append((ts, price))
 
     cdef inline void _add_max_price(self, datetime ts, Price price) except *:
         """Handle appending to the max deque"""
-        # Pop front elements that are less than or equal (since we want the max bid)
+        # Pop back elements that are less than or equal to the new price,
+        # keeping the deque decreasing so the max is at the front.
         while self._max_prices and self._max_prices[-1][1] <= price:
             self._max_prices.pop()
 
-        # Pop back elements that are less than or equal to the new bid
-        while self._max_prices and self._max_prices[0][1] <= price:
-            self._max_prices.popleft()
-
         self._max_prices.append((ts, price))
@@ -13,10 +13,9 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
-from collections import deque
-
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.indicators.base.indicator cimport Indicator
+from nautilus_trader.indicators.base.window cimport RollingWindow
 from nautilus_trader.model.bar cimport Bar
 from nautilus_trader.model.tick cimport QuoteTick
 from nautilus_trader.model.tick cimport TradeTick
@@ -24,8 +23,6 @@ from nautilus_trader.model.tick cimport TradeTick
 from nautilus_trader.indicators.average.ma_factory import MovingAverageFactory
 from nautilus_trader.indicators.average.ma_factory import MovingAverageType
 
-from nautilus_trader.core.functions cimport fast_std_with_mean
-
 
 cdef class BollingerBands(Indicator):
     """
@@ -68,7 +65,7 @@ cdef class BollingerBands(Indicator):
         self.period = period
         self.k = k
         self._ma = MovingAverageFactory.create(period, ma_type)
-        self._prices = deque(maxlen=period)
+        self._prices = RollingWindow(period)
 
         self.upper = 0
         self.middle = 0
@@ -141,17 +138,17 @@ cdef class BollingerBands(Indicator):
         # Add data to queues
         cdef double typical = (high + low + close) / 3
 
-        self._prices.append(typical)
+        self._prices.update(typical)
         self._ma.update_raw(typical)
 
         # Initialization logic
         if not self.initialized:
             self._set_has_inputs(True)
-            if len(self._prices) >= self.period:
+            if self._prices.count() >= self.period:
                 self._set_initialized(True)
 
         # Calculate values
-        cdef double std = fast_std_with_mean(values=list(self._prices), mean=self._ma.value)
+        cdef double std = self._prices.std_with_mean(self._ma.value)
 
         # Set values
         self.upper = self._ma.value + (self.k * std)
@@ -160,7 +157,7 @@ cdef class BollingerBands(Indicator):
 
     cdef void _reset(self) except *:
         self._ma.reset()
-        self._prices.clear()
+        self._prices.reset()
 
         self.upper = 0
         self.middle = 0
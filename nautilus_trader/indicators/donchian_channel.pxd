@@ -19,6 +19,7 @@ from nautilus_trader.indicators.base.indicator cimport Indicator
 cdef class DonchianChannel(Indicator):
     cdef object _upper_prices
     cdef object _lower_prices
+    cdef long _update_count
 
     cdef readonly int period
     """The period for the moving average.\n\n:returns: `int`"""
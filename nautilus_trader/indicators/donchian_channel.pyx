@@ -51,8 +51,9 @@ cdef class DonchianChannel(Indicator):
         super().__init__(params=[period])
 
         self.period = period
-        self._upper_prices = deque(maxlen=period)
-        self._lower_prices = deque(maxlen=period)
+        self._upper_prices = deque()  # type: deque[tuple[int, float]] (monotonically decreasing)
+        self._lower_prices = deque()  # type: deque[tuple[int, float]] (monotonically increasing)
+        self._update_count = 0
 
         self.upper = 0
         self.middle = 0
@@ -113,24 +114,39 @@ cdef class DonchianChannel(Indicator):
             The price for the lower channel.
 
         """
-        # Add data to queues
-        self._upper_prices.append(high)
-        self._lower_prices.append(low)
+        self._update_count += 1
+
+        # Add data to queues, dropping prices which can no longer be the extreme
+        while self._upper_prices and self._upper_prices[-1][1] <= high:
+            self._upper_prices.pop()
+        self._upper_prices.append((self._update_count, high))
+
+        while self._lower_prices and self._lower_prices[-1][1] >= low:
+            self._lower_prices.pop()
+        self._lower_prices.append((self._update_count, low))
+
+        # Expire prices which have left the window
+        cdef long cutoff = self._update_count - self.period
+        if self._upper_prices[0][0] <= cutoff:
+            self._upper_prices.popleft()
+        if self._lower_prices[0][0] <= cutoff:
+            self._lower_prices.popleft()
 
         # Initialization logic
         if not self.initialized:
             self._set_has_inputs(True)
-            if len(self._upper_prices) >= self.period and len(self._lower_prices) >= self.period:
+            if self._update_count >= self.period:
                 self._set_initialized(True)
 
         # Set values
-        self.upper = max(self._upper_prices)
-        self.lower = min(self._lower_prices)
+        self.upper = self._upper_prices[0][1]
+        self.lower = self._lower_prices[0][1]
         self.middle = (self.upper + self.lower) / 2
 
     cdef void _reset(self) except *:
         self._upper_prices.clear()
         self._lower_prices.clear()
+        self._update_count = 0
 
         self.upper = 0
         self.middle = 0
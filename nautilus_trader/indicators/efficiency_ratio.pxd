@@ -14,11 +14,12 @@
 # -------------------------------------------------------------------------------------------------
 
 from nautilus_trader.indicators.base.indicator cimport Indicator
+from nautilus_trader.indicators.base.window cimport RollingWindow
 
 
 cdef class EfficiencyRatio(Indicator):
     cdef object _inputs
-    cdef object _deltas
+    cdef RollingWindow _deltas
 
     cdef readonly int period
     """The window period.\n\n:returns: `int`"""
@@ -17,6 +17,7 @@ from collections import deque
 
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.indicators.base.indicator cimport Indicator
+from nautilus_trader.indicators.base.window cimport RollingWindow
 from nautilus_trader.model.bar cimport Bar
 
 
@@ -47,7 +48,7 @@ cdef class EfficiencyRatio(Indicator):
 
         self.period = period
         self._inputs = deque(maxlen=period)
-        self._deltas = deque(maxlen=period)
+        self._deltas = RollingWindow(period)
         self.value = 0
 
     cpdef void handle_bar(self, Bar bar) except *:
@@ -85,11 +86,11 @@ cdef class EfficiencyRatio(Indicator):
                 self._set_initialized(True)
 
         # Add data to queues
-        self._deltas.append(abs(self._inputs[-1] - self._inputs[-2]))
+        self._deltas.update(abs(self._inputs[-1] - self._inputs[-2]))
 
         # Calculate efficiency ratio
         cdef double net_diff = abs(self._inputs[0] - self._inputs[-1])
-        cdef double sum_deltas = sum(self._deltas)
+        cdef double sum_deltas = self._deltas.sum()
 
         if sum_deltas > 0:
             self.value = net_diff / sum_deltas
@@ -98,5 +99,5 @@ cdef class EfficiencyRatio(Indicator):
 
     cdef void _reset(self) except *:
         self._inputs.clear()
-        self._deltas.clear()
+        self._deltas.reset()
         self.value = 0
@@ -14,6 +14,7 @@
 # -------------------------------------------------------------------------------------------------
 
 from nautilus_trader.indicators.base.indicator cimport Indicator
+from nautilus_trader.indicators.base.window cimport RollingWindow
 from nautilus_trader.indicators.fuzzy_enums.candle_body cimport CandleBodySize
 from nautilus_trader.indicators.fuzzy_enums.candle_direction cimport CandleDirection
 from nautilus_trader.indicators.fuzzy_enums.candle_size cimport CandleSize
@@ -39,10 +40,10 @@ cdef class FuzzyCandlesticks(Indicator):
     cdef double _threshold2
     cdef double _threshold3
     cdef double _threshold4
-    cdef object _lengths
-    cdef object _body_percents
-    cdef object _upper_wick_percents
-    cdef object _lower_wick_percents
+    cdef RollingWindow _lengths
+    cdef RollingWindow _body_percents
+    cdef RollingWindow _upper_wick_percents
+    cdef RollingWindow _lower_wick_percents
     cdef double _last_open
     cdef double _last_high
     cdef double _last_low
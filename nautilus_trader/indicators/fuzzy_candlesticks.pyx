@@ -15,12 +15,9 @@
 
 from libc.math cimport fabs
 
-from collections import deque
-
 from nautilus_trader.core.correctness cimport Condition
-from nautilus_trader.core.functions cimport fast_mean
-from nautilus_trader.core.functions cimport fast_std_with_mean
 from nautilus_trader.indicators.base.indicator cimport Indicator
+from nautilus_trader.indicators.base.window cimport RollingWindow
 from nautilus_trader.indicators.fuzzy_enums.candle_body cimport CandleBodySize
 from nautilus_trader.indicators.fuzzy_enums.candle_direction cimport CandleDirection
 from nautilus_trader.indicators.fuzzy_enums.candle_size cimport CandleSize
@@ -130,10 +127,10 @@ cdef class FuzzyCandlesticks(Indicator):
         self._threshold2 = threshold2
         self._threshold3 = threshold3
         self._threshold4 = threshold4
-        self._lengths = deque(maxlen=self.period)
-        self._body_percents = deque(maxlen=self.period)
-        self._upper_wick_percents = deque(maxlen=self.period)
-        self._lower_wick_percents = deque(maxlen=self.period)
+        self._lengths = RollingWindow(self.period)
+        self._body_percents = RollingWindow(self.period)
+        self._upper_wick_percents = RollingWindow(self.period)
+        self._lower_wick_percents = RollingWindow(self.period)
         self._last_open = 0.0
         self._last_high = 0.0
         self._last_low = 0.0
@@ -196,45 +193,46 @@ cdef class FuzzyCandlesticks(Indicator):
         self._last_close = close_price
 
         # Update measurements
-        self._lengths.append(fabs(high_price - low_price))
+        self._lengths.update(fabs(high_price - low_price))
+        cdef double first_length = self._lengths.first()
 
-        if self._lengths[0] == 0.0:
-            self._body_percents.append(0.0)
-            self._upper_wick_percents.append(0.0)
-            self._lower_wick_percents.append(0.0)
+        if first_length == 0.0:
+            self._body_percents.update(0.0)
+            self._upper_wick_percents.update(0.0)
+            self._lower_wick_percents.update(0.0)
         else:
-            self._body_percents.append(fabs(open_price - low_price / self._lengths[0]))
-            self._upper_wick_percents.append((high_price - max(open_price, close_price)) / self._lengths[0])
-            self._lower_wick_percents.append((min(open_price, close_price) - low_price) / self._lengths[0])
+            self._body_percents.update(fabs(open_price - low_price / first_length))
+            self._upper_wick_percents.update((high_price - max(open_price, close_price)) / first_length)
+            self._lower_wick_percents.update((min(open_price, close_price) - low_price) / first_length)
 
         # Calculate statistics for bars
-        cdef double mean_length = fast_mean(list(self._lengths))
-        cdef double mean_body_percent = fast_mean(list(self._body_percents))
-        cdef double mean_upper_wick = fast_mean(list(self._upper_wick_percents))
-        cdef double mean_lower_wick = fast_mean(list(self._lower_wick_percents))
+        cdef double mean_length = self._lengths.mean()
+        cdef double mean_body_percent = self._body_percents.mean()
+        cdef double mean_upper_wick = self._upper_wick_percents.mean()
+        cdef double mean_lower_wick = self._lower_wick_percents.mean()
 
-        cdef double sd_lengths = fast_std_with_mean(list(self._lengths), mean_length)
-        cdef double sd_body_percents = fast_std_with_mean(list(self._body_percents), mean_body_percent)
-        cdef double sd_upper_wick_percents = fast_std_with_mean(list(self._upper_wick_percents), mean_upper_wick)
-        cdef double sd_lower_wick_percents = fast_std_with_mean(list(self._lower_wick_percents), mean_lower_wick)
+        cdef double sd_lengths = self._lengths.std_with_mean(mean_length)
+        cdef double sd_body_percents = self._body_percents.std_with_mean(mean_body_percent)
+        cdef double sd_upper_wick_percents = self._upper_wick_percents.std_with_mean(mean_upper_wick)
+        cdef double sd_lower_wick_percents = self._lower_wick_percents.std_with_mean(mean_lower_wick)
 
         # Create fuzzy candle
         self.value = FuzzyCandle(
             direction=self._fuzzify_direction(open_price, close_price),
             size=self._fuzzify_size(
-                self._lengths[0],
+                first_length,
                 mean_length,
                 sd_lengths),
             body_size=self._fuzzify_body_size(
-                self._body_percents[0],
+                self._body_percents.first(),
                 mean_body_percent,
                 sd_body_percents),
             upper_wick_size=self._fuzzify_wick_size(
-                self._upper_wick_percents[0],
+                self._upper_wick_percents.first(),
                 mean_upper_wick,
                 sd_upper_wick_percents),
             lower_wick_size=self._fuzzify_wick_size(
-                self._lower_wick_percents[0],
+                self._lower_wick_percents.first(),
                 mean_lower_wick,
                 sd_lower_wick_percents),
         )
@@ -251,7 +249,7 @@ cdef class FuzzyCandlesticks(Indicator):
         # Initialization logic
         if self.initialized is False:
             self._set_has_inputs(True)
-            if len(self._lengths) >= self.period:
+            if self._lengths.count() >= self.period:
                 self._set_initialized(True)
 
     cdef CandleDirection _fuzzify_direction(self, double open_price, double close_price):
@@ -359,10 +357,10 @@ cdef class FuzzyCandlesticks(Indicator):
         return CandleWickSize.LARGE
 
     cdef void _reset(self) except *:
-        self._lengths.clear()
-        self._body_percents.clear()
-        self._upper_wick_percents.clear()
-        self._lower_wick_percents.clear()
+        self._lengths.reset()
+        self._body_percents.reset()
+        self._upper_wick_percents.reset()
+        self._lower_wick_percents.reset()
         self._last_open = 0
         self._last_high = 0
         self._last_low = 0
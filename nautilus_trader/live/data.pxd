@@ -13,8 +13,13 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+from nautilus_trader.core.message cimport Message
 from nautilus_trader.data.client cimport DataClient
 from nautilus_trader.data.engine cimport DataEngine
+from nautilus_trader.live.recorder cimport DataRecorder
+from nautilus_trader.live.scheduler cimport LiveScheduler
+from nautilus_trader.model.identifiers cimport Symbol
+from nautilus_trader.model.tick cimport QuoteTick
 
 
 cdef class LiveDataEngine(DataEngine):
@@ -22,15 +27,54 @@ cdef class LiveDataEngine(DataEngine):
     cdef object _loop
     cdef object _data_queue
     cdef object _message_queue
+    cdef object _response_queue
+    cdef int _queue_batch_size
     cdef object _run_queues_task
+    cdef bint _conflate_quote_ticks
+    cdef dict _quote_tick_conflation
+    cdef dict _pending_quote_ticks
+    cdef dict _coalesced_counts
+    cdef DataRecorder _recorder
+    cdef LiveScheduler _scheduler
 
     cdef readonly bint is_running
 
     cpdef object get_event_loop(self)
     cpdef object get_run_queue_task(self)
+    cpdef object get_initialized_future(self)
+    cpdef object get_disconnected_future(self)
     cpdef int data_qsize(self) except *
     cpdef int message_qsize(self) except *
+    cpdef int data_qsize_hwm(self) except *
+    cpdef int message_qsize_hwm(self) except *
+    cpdef int dropped_data_count(self) except *
+    cpdef void set_quote_tick_conflation(self, Symbol symbol, bint conflate) except *
+    cpdef bint is_quote_tick_conflated(self, Symbol symbol) except *
+    cpdef int coalesced_count(self, Symbol symbol) except *
+    cpdef dict coalesced_counts(self)
+    cpdef void register_recorder(self, DataRecorder recorder) except *
+    cpdef void deregister_recorder(self) except *
+    cpdef void register_scheduler(self, LiveScheduler scheduler) except *
+
+    cpdef void process_batch(self, list data) except *
+    cdef inline bint _receive_data(self, data) except *
+    cpdef void _enqueue_conflated_quote_tick(self, QuoteTick tick) except *
+    cdef inline bint _is_loop_thread(self) except *
+    cdef inline void _enqueue(self, queue, item) except *
+    cpdef void _on_data_dropped(self, data) except *
+    cpdef void _handle_queued_data(self, data) except *
+    cpdef void _handle_queued_message(self, Message message) except *
 
 
 cdef class LiveDataClient(DataClient):
     cdef object _loop
+    cdef bint _is_connected
+    cdef object _initialized_future
+    cdef object _disconnected_future
+
+    cpdef object get_initialized_future(self)
+    cpdef object get_disconnected_future(self)
+
+    cdef void _set_initialized(self) except *
+    cdef void _set_connected(self, bint connected) except *
+    cdef void _reconcile_instruments(self, dict previous, dict current) except *
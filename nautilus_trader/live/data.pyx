@@ -15,8 +15,14 @@
 
 from asyncio import AbstractEventLoop
 from asyncio import CancelledError
+from asyncio import _get_running_loop
 import asyncio
 
+from nautilus_trader.live.futures import complete_future
+from nautilus_trader.live.futures import gather_futures
+from nautilus_trader.live.queue import LiveQueue
+
+from nautilus_trader.common.c_enums.component_state cimport ComponentState
 from nautilus_trader.common.clock cimport LiveClock
 from nautilus_trader.common.messages cimport DataRequest
 from nautilus_trader.common.messages cimport DataResponse
@@ -27,14 +33,47 @@ from nautilus_trader.core.message cimport Message
 from nautilus_trader.core.message cimport MessageType
 from nautilus_trader.data.client cimport DataClient
 from nautilus_trader.data.engine cimport DataEngine
+from nautilus_trader.live.recorder cimport DataRecorder
+from nautilus_trader.live.scheduler cimport LiveScheduler
+from nautilus_trader.live.scheduler cimport QueuePriority
+from nautilus_trader.live.snapshot cimport changed_instruments
+from nautilus_trader.live.snapshot cimport removed_instruments
 from nautilus_trader.model.commands cimport VenueCommand
+from nautilus_trader.model.identifiers cimport Symbol
 from nautilus_trader.model.identifiers cimport Venue
+from nautilus_trader.model.instrument cimport Instrument
+from nautilus_trader.model.tick cimport QuoteTick
+from nautilus_trader.model.tick cimport Tick
 from nautilus_trader.trading.portfolio cimport Portfolio
 
 
 cdef class LiveDataEngine(DataEngine):
     """
     Provides a high-performance asynchronous live data engine.
+
+    Quote ticks may optionally be conflated per symbol. When conflation is
+    enabled for a symbol only the latest quote tick which has not yet been
+    dispatched is held, any superseded ticks are dropped (coalesced) before
+    reaching the handlers. This bounds the data queue for conflated symbols
+    and prevents strategies acting on stale quotes if the engine falls behind.
+
+    A `DataRecorder` may be registered to record all data passed to the engine
+    for processing (before any conflation), for later replay.
+
+    Objects passed from the event loop thread are put directly on the internal
+    queues, objects passed from any other thread are scheduled onto the loop
+    thread with `call_soon_threadsafe`. The queues are drained in batches of up
+    to `queue_batch_size` items per wake-up.
+
+    The queues may be bounded. When the data queue is full either the oldest
+    data is dropped, or producers are blocked (producers on the event loop
+    thread cannot block, so their data is held in order until there is space).
+    Commands, requests and responses are never dropped.
+
+    If a `LiveScheduler` is registered then responses are put on a separate
+    queue, and the queues are run by the scheduler instead of by the engines
+    own tasks (commands and requests above responses, and responses above
+    market data).
     """
 
     def __init__(
@@ -61,7 +100,30 @@ cdef class LiveDataEngine(DataEngine):
         config : dict[str, object], optional
             The configuration options.
 
+        Notes
+        -----
+        If the config option `conflate_quote_ticks` is True then quote ticks
+        for every symbol are conflated by default (per symbol settings made
+        with `set_quote_tick_conflation` take precedence).
+
+        The config option `queue_batch_size` sets the maximum number of items
+        handled from a queue before yielding to the event loop (default 1000).
+
+        The config options `data_queue_maxsize` and `message_queue_maxsize` set
+        the bounds of the queues (default 0, unbounded). If the config option
+        `data_queue_drop_oldest` is True then the oldest data is dropped when
+        the data queue is full, else producers are blocked (default False).
+
+        Raises
+        ------
+        ValueError
+            If queue_batch_size is not positive (> 0).
+        ValueError
+            If data_queue_maxsize or message_queue_maxsize is negative (< 0).
+
         """
+        if config is None:
+            config = {}
         super().__init__(
             portfolio,
             clock,
@@ -70,10 +132,34 @@ cdef class LiveDataEngine(DataEngine):
         )
 
         self._loop = loop
-        self._data_queue = asyncio.Queue()
-        self._message_queue = asyncio.Queue()
+        self._data_queue = LiveQueue(
+            maxsize=config.get("data_queue_maxsize", 0),
+            drop_oldest=config.get("data_queue_drop_oldest", False),
+            on_drop=self._on_data_dropped,
+        )
+        self._message_queue = LiveQueue(maxsize=config.get("message_queue_maxsize", 0))
+        self._response_queue = self._message_queue  # Separate queue when scheduled
+        self._queue_batch_size = config.get("queue_batch_size", 1000)
+        Condition.positive_int(self._queue_batch_size, "queue_batch_size")
+
+        # Conflation
+        self._conflate_quote_ticks = config.get("conflate_quote_ticks", False)
+        self._quote_tick_conflation = {}  # type: dict[Symbol, bool]
+        self._pending_quote_ticks = {}    # type: dict[Symbol, QuoteTick]
+        self._coalesced_counts = {}       # type: dict[Symbol, int]
+
+        self._recorder = None
+        self._scheduler = None
+        self._run_queues_task = None
+
         self.is_running = False
 
+        self._log.info(f"conflate_quote_ticks={self._conflate_quote_ticks}")
+        self._log.info(f"queue_batch_size={self._queue_batch_size}")
+        self._log.info(f"data_queue_maxsize={self._data_queue.maxsize}")
+        self._log.info(f"data_queue_drop_oldest={self._data_queue.drop_oldest}")
+        self._log.info(f"message_queue_maxsize={self._message_queue.maxsize}")
+
     cpdef object get_event_loop(self):
         """
         Return the internal event loop for the engine.
@@ -91,32 +177,215 @@ cdef class LiveDataEngine(DataEngine):
 
         Returns
         -------
-        asyncio.Task
+        asyncio.Task or None
+            None if not started, or if the queues are run by a scheduler.
 
         """
         return self._run_queues_task
 
+    cpdef object get_initialized_future(self):
+        """
+        Return a future which completes when all live data clients are
+        initialized.
+
+        Returns
+        -------
+        asyncio.Future
+
+        """
+        cdef list futures = [
+            (<LiveDataClient>client).get_initialized_future()
+            for client in self._clients.values() if isinstance(client, LiveDataClient)
+        ]
+        return gather_futures(self._loop, futures)
+
+    cpdef object get_disconnected_future(self):
+        """
+        Return a future which completes when all live data clients are
+        disconnected.
+
+        Returns
+        -------
+        asyncio.Future
+
+        """
+        cdef list futures = [
+            (<LiveDataClient>client).get_disconnected_future()
+            for client in self._clients.values() if isinstance(client, LiveDataClient)
+        ]
+        return gather_futures(self._loop, futures)
+
     cpdef int data_qsize(self) except *:
         """
-        Return the number of objects buffered on the internal data queue.
+        Return the number of objects buffered on the internal data queue
+        (including any data held waiting for space on a full queue).
 
         Returns
         -------
         int
 
         """
-        return self._data_queue.qsize()
+        return self._data_queue.depth()
 
     cpdef int message_qsize(self) except *:
         """
-        Return the number of objects buffered on the internal message queue.
+        Return the number of objects buffered on the internal message queues
+        (including any messages held waiting for space on a full queue).
+
+        Returns
+        -------
+        int
+
+        """
+        if self._response_queue is self._message_queue:
+            return self._message_queue.depth()
+        return self._message_queue.depth() + self._response_queue.depth()
+
+    cpdef int data_qsize_hwm(self) except *:
+        """
+        Return the high-water mark of the internal data queue size.
 
         Returns
         -------
         int
 
         """
-        return self._message_queue.qsize()
+        return self._data_queue.high_water_mark
+
+    cpdef int message_qsize_hwm(self) except *:
+        """
+        Return the high-water mark of the internal message queue size (the
+        largest of the internal message queues when scheduled).
+
+        Returns
+        -------
+        int
+
+        """
+        return max(self._message_queue.high_water_mark, self._response_queue.high_water_mark)
+
+    cpdef int dropped_data_count(self) except *:
+        """
+        Return the count of data dropped from the full internal data queue.
+
+        Returns
+        -------
+        int
+
+        """
+        return self._data_queue.dropped_count
+
+    cpdef void set_quote_tick_conflation(self, Symbol symbol, bint conflate) except *:
+        """
+        Set the quote tick conflation policy for the given symbol.
+
+        Parameters
+        ----------
+        symbol : Symbol
+            The symbol for the policy.
+        conflate : bool
+            If quote ticks for the symbol should be conflated (latest only).
+
+        """
+        Condition.not_none(symbol, "symbol")
+
+        self._quote_tick_conflation[symbol] = conflate
+
+        self._log.info(f"Set {symbol} <QuoteTick> conflation={conflate}.")
+
+    cpdef bint is_quote_tick_conflated(self, Symbol symbol) except *:
+        """
+        Return a value indicating whether quote ticks for the given symbol are
+        conflated.
+
+        Parameters
+        ----------
+        symbol : Symbol
+            The symbol to check.
+
+        Returns
+        -------
+        bool
+
+        """
+        Condition.not_none(symbol, "symbol")
+
+        return self._quote_tick_conflation.get(symbol, self._conflate_quote_ticks)
+
+    cpdef int coalesced_count(self, Symbol symbol) except *:
+        """
+        Return the count of superseded quote ticks dropped for the given symbol.
+
+        Parameters
+        ----------
+        symbol : Symbol
+            The symbol for the count.
+
+        Returns
+        -------
+        int
+
+        """
+        Condition.not_none(symbol, "symbol")
+
+        return self._coalesced_counts.get(symbol, 0)
+
+    cpdef dict coalesced_counts(self):
+        """
+        Return the counts of superseded quote ticks dropped per symbol.
+
+        Returns
+        -------
+        dict[Symbol, int]
+
+        """
+        return self._coalesced_counts.copy()
+
+    cpdef void register_recorder(self, DataRecorder recorder) except *:
+        """
+        Register the given data recorder with the engine.
+
+        Parameters
+        ----------
+        recorder : DataRecorder
+            The recorder for all data passed to the engine.
+
+        """
+        Condition.not_none(recorder, "recorder")
+
+        self._recorder = recorder
+
+        self._log.info(f"Registered recorder writing to {recorder.path}.")
+
+    cpdef void register_scheduler(self, LiveScheduler scheduler) except *:
+        """
+        Register the given scheduler to run the engines queues.
+
+        Parameters
+        ----------
+        scheduler : LiveScheduler
+            The scheduler for the engines queues.
+
+        Raises
+        ------
+        ValueError
+            If the engine is running.
+
+        """
+        Condition.not_none(scheduler, "scheduler")
+        Condition.true(self.state_c() != ComponentState.RUNNING, "state_c() != RUNNING")
+
+        self._scheduler = scheduler
+        if self._response_queue is self._message_queue:
+            self._response_queue = LiveQueue(maxsize=self._message_queue.maxsize)
+
+        self._log.info(f"Registered {type(scheduler).__name__}.")
+
+    cpdef void deregister_recorder(self) except *:
+        """
+        Deregister the data recorder from the engine (if registered).
+        """
+        self._recorder = None
 
     cpdef void execute(self, VenueCommand command) except *:
         """
@@ -131,7 +400,7 @@ cdef class LiveDataEngine(DataEngine):
         Condition.not_none(command, "command")
         # Do not allow None through (None is a sentinel value which stops the queue)
 
-        self._loop.call_soon_threadsafe(self._message_queue.put_nowait, command)
+        self._enqueue(self._message_queue, command)
 
     cpdef void process(self, data) except *:
         """
@@ -146,7 +415,117 @@ cdef class LiveDataEngine(DataEngine):
         Condition.not_none(data, "data")
         # Do not allow None through (None is a sentinel value which stops the queue)
 
-        self._loop.call_soon_threadsafe(self._data_queue.put_nowait, data)
+        if self._receive_data(data):
+            self._enqueue(self._data_queue, data)
+
+    async def process_wait(self, data):
+        """
+        Process the given data, waiting while the internal data queue is full.
+
+        Coroutine producers on the event loop thread await this method so that
+        a bounded data queue holds them back, rather than holding their data.
+
+        Parameters
+        ----------
+        data : object
+            The data to process.
+
+        """
+        Condition.not_none(data, "data")
+        # Do not allow None through (None is a sentinel value which stops the queue)
+
+        if self._receive_data(data):
+            await self._data_queue.enqueue_wait(data)
+
+    cpdef void process_batch(self, list data) except *:
+        """
+        Process the given batch of data in order.
+
+        When called from a thread other than the event loop thread the whole
+        batch is handed to the loop in a single call.
+
+        Parameters
+        ----------
+        data : list[object]
+            The data to process.
+
+        """
+        Condition.not_none(data, "data")
+
+        if not self._is_loop_thread() and self._loop.is_running():
+            self._loop.call_soon_threadsafe(self.process_batch, data)
+            return
+
+        for item in data:
+            self.process(item)
+
+    async def process_batch_wait(self, list data):
+        """
+        Process the given batch of data in order, waiting while the internal
+        data queue is full.
+
+        Parameters
+        ----------
+        data : list[object]
+            The data to process.
+
+        """
+        Condition.not_none(data, "data")
+
+        for item in data:
+            await self.process_wait(item)
+
+    cdef inline bint _receive_data(self, data) except *:
+        # Returns False if the data was conflated rather than to be enqueued
+        if self._recorder is not None:
+            self._recorder.record(data)
+
+        if self.latency_recorder is not None:
+            self._stamp_received(data)
+
+        if isinstance(data, QuoteTick) and self.is_quote_tick_conflated(data.symbol):
+            if self._is_loop_thread():
+                self._enqueue_conflated_quote_tick(data)
+            else:
+                self._loop.call_soon_threadsafe(self._enqueue_conflated_quote_tick, data)
+            return False
+
+        return True
+
+    cdef inline bint _is_loop_thread(self) except *:
+        # The running loop is thread local, so this is only True when called
+        # from the event loop thread while the engines loop is running.
+        return _get_running_loop() is self._loop
+
+    cdef inline void _enqueue(self, queue, item) except *:
+        if self._is_loop_thread():
+            queue.enqueue(item)
+        elif (
+            queue.maxsize > 0
+            and not queue.drop_oldest
+            and queue.depth() >= queue.maxsize
+            and self._loop.is_running()
+        ):
+            # Block the producer thread until the item is on the queue
+            asyncio.run_coroutine_threadsafe(queue.enqueue_wait(item), self._loop).result()
+        else:
+            self._loop.call_soon_threadsafe(queue.enqueue, item)
+
+    cpdef void _on_data_dropped(self, data) except *:
+        # Called on the event loop thread only
+        if isinstance(data, Symbol):  # Conflated quote tick marker
+            self._pending_quote_ticks.pop(data, None)
+
+    cpdef void _enqueue_conflated_quote_tick(self, QuoteTick tick) except *:
+        # Called on the event loop thread only
+        if tick.symbol in self._pending_quote_ticks:
+            # Supersede the pending tick which is already marked on the queue
+            self._pending_quote_ticks[tick.symbol] = tick
+            self._coalesced_counts[tick.symbol] = self._coalesced_counts.get(tick.symbol, 0) + 1
+            return
+
+        self._pending_quote_ticks[tick.symbol] = tick
+        self._data_queue.enqueue(tick.symbol)  # Marker for the pending tick
 
     cpdef void send(self, DataRequest request) except *:
         """
@@ -161,7 +540,7 @@ cdef class LiveDataEngine(DataEngine):
         Condition.not_none(request, "request")
         # Do not allow None through (None is a sentinel value which stops the queue)
 
-        self._loop.call_soon_threadsafe(self._message_queue.put_nowait, request)
+        self._enqueue(self._message_queue, request)
 
     cpdef void receive(self, DataResponse response) except *:
         """
@@ -176,7 +555,7 @@ cdef class LiveDataEngine(DataEngine):
         Condition.not_none(response, "response")
         # Do not allow None through (None is a sentinel value which stops the queue)
 
-        self._loop.call_soon_threadsafe(self._message_queue.put_nowait, response)
+        self._enqueue(self._response_queue, response)
 
     cpdef void _on_start(self) except *:
         if not self._loop.is_running():
@@ -185,6 +564,25 @@ cdef class LiveDataEngine(DataEngine):
         # Ensure this is set True so that below queues continue to process
         self.is_running = True
 
+        if self._scheduler is not None:
+            self._scheduler.register_queue(
+                self._message_queue,
+                self._handle_queued_message,
+                QueuePriority.COMMAND,
+            )
+            self._scheduler.register_queue(
+                self._response_queue,
+                self._handle_queued_message,
+                QueuePriority.DATA_RESPONSE,
+            )
+            self._scheduler.register_queue(
+                self._data_queue,
+                self._handle_queued_data,
+                QueuePriority.MARKET_DATA,
+            )
+            self._log.debug(f"Queues registered with {type(self._scheduler).__name__}.")
+            return
+
         # Run queues
         self._run_queues_task = asyncio.gather(
             self._loop.create_task(self._run_data_queue()),
@@ -195,19 +593,42 @@ cdef class LiveDataEngine(DataEngine):
 
     cpdef void _on_stop(self) except *:
         self.is_running = False
-        self._data_queue.put_nowait(None)     # Sentinel message pattern
-        self._message_queue.put_nowait(None)  # Sentinel message pattern
+        if self._scheduler is not None:
+            self._scheduler.deregister_queue(self._data_queue)
+            self._scheduler.deregister_queue(self._message_queue)
+            self._scheduler.deregister_queue(self._response_queue)
+            return
+
+        # Sentinel message pattern (a full queue already wakes its run loop)
+        if not self._data_queue.full():
+            self._data_queue.put_nowait(None)
+        if not self._message_queue.full():
+            self._message_queue.put_nowait(None)
         self._log.debug(f"Sentinel message placed on data queue.")
         self._log.debug(f"Sentinel message placed on message queue.")
 
+    cpdef void _reset(self) except *:
+        DataEngine._reset(self)
+
+        self._pending_quote_ticks.clear()
+        self._coalesced_counts.clear()
+        self._data_queue.reset_gauges()
+        self._message_queue.reset_gauges()
+        self._response_queue.reset_gauges()
+
     async def _run_data_queue(self):
         self._log.debug(f"Data queue processing starting (qsize={self.data_qsize()})...")
+        cdef int count
         try:
             while self.is_running:
-                data = await self._data_queue.get()
-                if data is None:  # Sentinel message
-                    continue      # Returns to the top to check `self.is_running`
-                self._handle_data(data)
+                self._handle_queued_data(await self._data_queue.get())
+                # Drain the data already queued without awaiting each item
+                count = 1
+                while self.is_running and count < self._queue_batch_size and self._data_queue.qsize() > 0:
+                    self._handle_queued_data(self._data_queue.get_nowait())
+                    count += 1
+                if count == self._queue_batch_size:
+                    await asyncio.sleep(0)  # Yield to other tasks between batches
         except CancelledError:
             if self.data_qsize() > 0:
                 self._log.warning(f"Running cancelled "
@@ -217,20 +638,17 @@ cdef class LiveDataEngine(DataEngine):
 
     async def _run_message_queue(self):
         self._log.debug(f"Message queue processing starting (qsize={self.message_qsize()})...")
-        cdef Message message
+        cdef int count
         try:
             while self.is_running:
-                message = await self._message_queue.get()
-                if message is None:  # Sentinel message
-                    continue         # Returns to the top to check `self.is_running`
-                if message.type == MessageType.COMMAND:
-                    self._execute_command(message)
-                elif message.type == MessageType.REQUEST:
-                    self._handle_request(message)
-                elif message.type == MessageType.RESPONSE:
-                    self._handle_response(message)
-                else:
-                    self._log.error(f"Cannot handle unrecognized message {message}.")
+                self._handle_queued_message(await self._message_queue.get())
+                # Drain the messages already queued without awaiting each one
+                count = 1
+                while self.is_running and count < self._queue_batch_size and self._message_queue.qsize() > 0:
+                    self._handle_queued_message(self._message_queue.get_nowait())
+                    count += 1
+                if count == self._queue_batch_size:
+                    await asyncio.sleep(0)  # Yield to other tasks between batches
         except CancelledError:
             if self.message_qsize() > 0:
                 self._log.warning(f"Running cancelled "
@@ -238,6 +656,29 @@ cdef class LiveDataEngine(DataEngine):
             else:
                 self._log.debug(f"Message queue processing stopped (qsize={self.message_qsize()}).")
 
+    cpdef void _handle_queued_data(self, data) except *:
+        if data is None:  # Sentinel message
+            return        # Returns to the run loop to check `self.is_running`
+        if isinstance(data, Symbol):  # Conflated quote tick marker
+            data = self._pending_quote_ticks.pop(data, None)
+            if data is None:
+                return  # Pending tick cleared on reset
+        if self.latency_recorder is not None and isinstance(data, Tick):
+            self._record_queue_wait(data)
+        self._handle_data(data)
+
+    cpdef void _handle_queued_message(self, Message message) except *:
+        if message is None:  # Sentinel message
+            return           # Returns to the run loop to check `self.is_running`
+        if message.type == MessageType.COMMAND:
+            self._execute_command(message)
+        elif message.type == MessageType.REQUEST:
+            self._handle_request(message)
+        elif message.type == MessageType.RESPONSE:
+            self._handle_response(message)
+        else:
+            self._log.error(f"Cannot handle unrecognized message {message}.")
+
 
 cdef class LiveDataClient(DataClient):
     """
@@ -280,3 +721,83 @@ cdef class LiveDataClient(DataClient):
         )
 
         self._loop: asyncio.AbstractEventLoop = engine.get_event_loop()
+        self._is_connected = False
+        self._initialized_future = self._loop.create_future()
+        self._disconnected_future = self._loop.create_future()
+        self._disconnected_future.set_result(True)  # Not yet connected
+
+    cpdef bint is_connected(self) except *:
+        """
+        Return a value indicating whether the client is connected.
+
+        Returns
+        -------
+        bool
+            True if connected, else False.
+
+        """
+        return self._is_connected
+
+    cpdef object get_initialized_future(self):
+        """
+        Return the future which completes when the client is initialized.
+
+        Returns
+        -------
+        asyncio.Future
+
+        """
+        return self._initialized_future
+
+    cpdef object get_disconnected_future(self):
+        """
+        Return the future which completes when the client is disconnected.
+
+        The future is complete while the client is not connected, and is
+        replaced with a pending future each time the client connects.
+
+        Returns
+        -------
+        asyncio.Future
+
+        """
+        return self._disconnected_future
+
+    cdef void _set_initialized(self) except *:
+        # May be called from any thread
+        self.initialized = True
+        complete_future(self._loop, self._initialized_future)
+
+    cdef void _set_connected(self, bint connected) except *:
+        # May be called from any thread
+        self._is_connected = connected
+        if not connected:
+            complete_future(self._loop, self._disconnected_future)
+        elif self._disconnected_future.done():
+            self._disconnected_future = self._loop.create_future()
+
+    cdef void _reconcile_instruments(self, dict previous, dict current) except *:
+        # May be called from any thread
+        cdef list changed = changed_instruments(previous, current)
+        cdef list removed = removed_instruments(previous, current)
+        cdef bint is_loop_thread = _get_running_loop() is self._loop
+
+        cdef Instrument instrument
+        for instrument in changed:
+            if is_loop_thread:
+                self._handle_instrument(instrument)
+            else:
+                self._loop.call_soon_threadsafe(self._handle_instrument_py, instrument)
+
+        cdef Symbol symbol
+        for symbol in removed:
+            self._log.warning(f"Removed instrument {symbol.value}, no longer listed by the venue.")
+
+        self._log.info(
+            f"Reconciled {len(changed)} changed and {len(removed)} removed instruments with the venue.",
+        )
+
+    async def _handle_data_batch(self, list data):
+        # Called on the event loop thread only
+        await (<LiveDataEngine>self._engine).process_batch_wait(data)
+
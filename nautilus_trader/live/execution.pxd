@@ -13,21 +13,45 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+from nautilus_trader.core.message cimport Message
 from nautilus_trader.execution.client cimport ExecutionClient
 from nautilus_trader.execution.engine cimport ExecutionEngine
+from nautilus_trader.live.scheduler cimport LiveScheduler
 
 
 cdef class LiveExecutionEngine(ExecutionEngine):
     cdef object _loop
     cdef object _queue
+    cdef object _command_queue
+    cdef int _queue_batch_size
     cdef object _run_queue_task
+    cdef object _settled_future
+    cdef LiveScheduler _scheduler
 
     cdef readonly bint is_running
 
     cpdef object get_event_loop(self)
     cpdef object get_run_queue_task(self)
+    cpdef object get_initialized_future(self)
+    cpdef object get_disconnected_future(self)
+    cpdef object get_settled_future(self)
     cpdef int qsize(self) except *
+    cpdef int qsize_hwm(self) except *
+    cpdef void register_scheduler(self, LiveScheduler scheduler) except *
+
+    cdef inline void _enqueue(self, queue, Message message) except *
+    cpdef void _handle_queued_message(self, Message message) except *
+    cdef void _check_settled(self) except *
 
 
 cdef class LiveExecutionClient(ExecutionClient):
     cdef object _loop
+    cdef bint _is_connected
+    cdef object _initialized_future
+    cdef object _disconnected_future
+
+    cpdef object get_initialized_future(self)
+    cpdef object get_disconnected_future(self)
+
+    cdef void _set_initialized(self) except *
+    cdef void _set_connected(self, bint connected) except *
@@ -15,8 +15,14 @@
 
 from asyncio import AbstractEventLoop
 from asyncio import CancelledError
+from asyncio import _get_running_loop
 import asyncio
 
+from nautilus_trader.live.futures import complete_future
+from nautilus_trader.live.futures import gather_futures
+from nautilus_trader.live.queue import LiveQueue
+
+from nautilus_trader.common.c_enums.component_state cimport ComponentState
 from nautilus_trader.common.clock cimport LiveClock
 from nautilus_trader.common.logging cimport Logger
 from nautilus_trader.core.correctness cimport Condition
@@ -25,6 +31,8 @@ from nautilus_trader.core.message cimport MessageType
 from nautilus_trader.execution.client cimport ExecutionClient
 from nautilus_trader.execution.database cimport ExecutionDatabase
 from nautilus_trader.execution.engine cimport ExecutionEngine
+from nautilus_trader.live.scheduler cimport LiveScheduler
+from nautilus_trader.live.scheduler cimport QueuePriority
 from nautilus_trader.model.commands cimport VenueCommand
 from nautilus_trader.model.events cimport Event
 from nautilus_trader.model.identifiers cimport AccountId
@@ -35,6 +43,19 @@ from nautilus_trader.trading.portfolio cimport Portfolio
 cdef class LiveExecutionEngine(ExecutionEngine):
     """
     Provides a high-performance asynchronous live execution engine.
+
+    Messages passed from the event loop thread are put directly on the internal
+    queue, messages passed from any other thread are scheduled onto the loop
+    thread with `call_soon_threadsafe`. The queue is drained in batches of up
+    to `queue_batch_size` messages per wake-up.
+
+    The queue may be bounded, commands and events are never dropped. When the
+    queue is full producers are blocked (producers on the event loop thread
+    cannot block, so their messages are held in order until there is space).
+
+    If a `LiveScheduler` is registered then commands are put on a separate
+    queue, and both queues are run by the scheduler instead of by the engines
+    own task (events above commands, and both above all data engine queues).
     """
 
     def __init__(
@@ -64,6 +85,21 @@ cdef class LiveExecutionEngine(ExecutionEngine):
         config : dict[str, object], optional
             The configuration options.
 
+        Notes
+        -----
+        The config option `queue_batch_size` sets the maximum number of messages
+        handled from the queue before yielding to the event loop (default 1000).
+
+        The config option `queue_maxsize` sets the bound of the queue (default 0,
+        unbounded).
+
+        Raises
+        ------
+        ValueError
+            If queue_batch_size is not positive (> 0).
+        ValueError
+            If queue_maxsize is negative (< 0).
+
         """
         if config is None:
             config = {}
@@ -76,7 +112,13 @@ cdef class LiveExecutionEngine(ExecutionEngine):
         )
 
         self._loop = loop
-        self._queue = asyncio.Queue()
+        self._queue = LiveQueue(maxsize=config.get("queue_maxsize", 0))
+        self._command_queue = self._queue  # Separate queue when scheduled
+        self._queue_batch_size = config.get("queue_batch_size", 1000)
+        Condition.positive_int(self._queue_batch_size, "queue_batch_size")
+        self._scheduler = None
+        self._run_queue_task = None
+        self._settled_future = None
         self.is_running = True
 
     cpdef object get_event_loop(self):
@@ -96,21 +138,110 @@ cdef class LiveExecutionEngine(ExecutionEngine):
 
         Returns
         -------
-        asyncio.Task
+        asyncio.Task or None
+            None if not started, or if the queue is run by a scheduler.
 
         """
         return self._run_queue_task
 
+    cpdef object get_initialized_future(self):
+        """
+        Return a future which completes when all live execution clients are
+        initialized.
+
+        Returns
+        -------
+        asyncio.Future
+
+        """
+        cdef list futures = [
+            (<LiveExecutionClient>client).get_initialized_future()
+            for client in self._clients.values() if isinstance(client, LiveExecutionClient)
+        ]
+        return gather_futures(self._loop, futures)
+
+    cpdef object get_disconnected_future(self):
+        """
+        Return a future which completes when all live execution clients are
+        disconnected.
+
+        Returns
+        -------
+        asyncio.Future
+
+        """
+        cdef list futures = [
+            (<LiveExecutionClient>client).get_disconnected_future()
+            for client in self._clients.values() if isinstance(client, LiveExecutionClient)
+        ]
+        return gather_futures(self._loop, futures)
+
+    cpdef object get_settled_future(self):
+        """
+        Return a future which completes when the engine is settled.
+
+        The engine is settled when its queue is empty and every cached order is
+        completed, so there are no commands or orders in flight.
+
+        Returns
+        -------
+        asyncio.Future
+
+        """
+        if self._settled_future is None or self._settled_future.done():
+            self._settled_future = self._loop.create_future()
+        self._check_settled()
+        return self._settled_future
+
     cpdef int qsize(self) except *:
         """
-        Return the number of messages buffered on the internal queue.
+        Return the number of messages buffered on the internal queues
+        (including any messages held waiting for space on a full queue).
 
         Returns
         -------
         int
 
         """
-        return self._queue.qsize()
+        if self._command_queue is self._queue:
+            return self._queue.depth()
+        return self._queue.depth() + self._command_queue.depth()
+
+    cpdef int qsize_hwm(self) except *:
+        """
+        Return the high-water mark of the internal queue size (the largest
+        of the internal queues when scheduled).
+
+        Returns
+        -------
+        int
+
+        """
+        return max(self._queue.high_water_mark, self._command_queue.high_water_mark)
+
+    cpdef void register_scheduler(self, LiveScheduler scheduler) except *:
+        """
+        Register the given scheduler to run the engines queues.
+
+        Parameters
+        ----------
+        scheduler : LiveScheduler
+            The scheduler for the engines queues.
+
+        Raises
+        ------
+        ValueError
+            If the engine is running.
+
+        """
+        Condition.not_none(scheduler, "scheduler")
+        Condition.true(self.state_c() != ComponentState.RUNNING, "state_c() != RUNNING")
+
+        self._scheduler = scheduler
+        if self._command_queue is self._queue:
+            self._command_queue = LiveQueue(maxsize=self._queue.maxsize)
+
+        self._log.info(f"Registered {type(scheduler).__name__}.")
 
     cpdef void execute(self, VenueCommand command) except *:
         """
@@ -125,7 +256,10 @@ cdef class LiveExecutionEngine(ExecutionEngine):
         Condition.not_none(command, "command")
         # Do not allow None through (None is a sentinel value which stops the queue)
 
-        self._loop.call_soon_threadsafe(self._queue.put_nowait, command)
+        if self.latency_recorder is not None:
+            self._stamp_command(command)
+
+        self._enqueue(self._command_queue, command)
 
     cpdef void process(self, Event event) except *:
         """
@@ -140,7 +274,22 @@ cdef class LiveExecutionEngine(ExecutionEngine):
         Condition.not_none(event, "event")
         # Do not allow None through (None is a sentinel value which stops the queue)
 
-        self._loop.call_soon_threadsafe(self._queue.put_nowait, event)
+        self._enqueue(self._queue, event)
+
+    cdef inline void _enqueue(self, queue, Message message) except *:
+        # The running loop is thread local, so this is only the event loop
+        # thread while the engines loop is running.
+        if _get_running_loop() is self._loop:
+            queue.enqueue(message)
+        elif (
+            queue.maxsize > 0
+            and queue.depth() >= queue.maxsize
+            and self._loop.is_running()
+        ):
+            # Block the producer thread until the message is on the queue
+            asyncio.run_coroutine_threadsafe(queue.enqueue_wait(message), self._loop).result()
+        else:
+            self._loop.call_soon_threadsafe(queue.enqueue, message)
 
     cpdef void _on_start(self) except *:
         if not self._loop.is_running():
@@ -149,29 +298,55 @@ cdef class LiveExecutionEngine(ExecutionEngine):
         # Ensure this is set True so that below queues continue to process
         self.is_running = True
 
+        if self._scheduler is not None:
+            self._scheduler.register_queue(
+                self._queue,
+                self._handle_queued_message,
+                QueuePriority.EXECUTION,
+            )
+            self._scheduler.register_queue(
+                self._command_queue,
+                self._handle_queued_message,
+                QueuePriority.COMMAND,
+            )
+            self._log.debug(f"Queues registered with {type(self._scheduler).__name__}.")
+            return
+
         self._run_queue_task = self._loop.create_task(self._run())
 
         self._log.debug(f"Scheduled {self._run_queue_task}")
 
     cpdef void _on_stop(self) except *:
         self.is_running = False
-        self._queue.put_nowait(None)  # Sentinel message pattern
+        if self._scheduler is not None:
+            self._scheduler.deregister_queue(self._queue)
+            self._scheduler.deregister_queue(self._command_queue)
+            return
+
+        # Sentinel message pattern (a full queue already wakes its run loop)
+        if not self._queue.full():
+            self._queue.put_nowait(None)
         self._log.debug(f"Sentinel message placed on message queue.")
 
+    cpdef void _reset(self) except *:
+        ExecutionEngine._reset(self)
+
+        self._queue.reset_gauges()
+        self._command_queue.reset_gauges()
+
     async def _run(self):
         self._log.debug(f"Message queue processing starting (qsize={self.qsize()})...")
-        cdef Message message
+        cdef int count
         try:
             while self.is_running:
-                message = await self._queue.get()
-                if message is None:  # Sentinel message
-                    continue         # Returns to the top to check `self.is_running`
-                if message.type == MessageType.EVENT:
-                    self._handle_event(message)
-                elif message.type == MessageType.COMMAND:
-                    self._execute_command(message)
-                else:
-                    self._log.error(f"Cannot handle unrecognized message {message}.")
+                self._handle_queued_message(await self._queue.get())
+                # Drain the messages already queued without awaiting each one
+                count = 1
+                while self.is_running and count < self._queue_batch_size and self._queue.qsize() > 0:
+                    self._handle_queued_message(self._queue.get_nowait())
+                    count += 1
+                if count == self._queue_batch_size:
+                    await asyncio.sleep(0)  # Yield to other tasks between batches
         except CancelledError:
             if self.qsize() > 0:
                 self._log.warning(f"Running cancelled "
@@ -179,6 +354,25 @@ cdef class LiveExecutionEngine(ExecutionEngine):
             else:
                 self._log.debug(f"Message queue processing stopped (qsize={self.qsize()}).")
 
+    cpdef void _handle_queued_message(self, Message message) except *:
+        if message is None:  # Sentinel message
+            return           # Returns to the run loop to check `self.is_running`
+        if message.type == MessageType.EVENT:
+            self._handle_event(message)
+        elif message.type == MessageType.COMMAND:
+            self._execute_command(message)
+        else:
+            self._log.error(f"Cannot handle unrecognized message {message}.")
+
+        if self._settled_future is not None:
+            self._check_settled()
+
+    cdef void _check_settled(self) except *:
+        if self._settled_future.done():
+            return
+        if self.qsize() == 0 and self.cache.orders_total_count() == self.cache.orders_completed_count():
+            self._settled_future.set_result(True)
+
 
 cdef class LiveExecutionClient(ExecutionClient):
     """
@@ -221,3 +415,59 @@ cdef class LiveExecutionClient(ExecutionClient):
         )
 
         self._loop: asyncio.AbstractEventLoop = engine.get_event_loop()
+        self._is_connected = False
+        self._initialized_future = self._loop.create_future()
+        if self.initialized:
+            self._initialized_future.set_result(True)
+        self._disconnected_future = self._loop.create_future()
+        self._disconnected_future.set_result(True)  # Not yet connected
+
+    cpdef bint is_connected(self) except *:
+        """
+        Return a value indicating whether the client is connected.
+
+        Returns
+        -------
+        bool
+            True if connected, else False.
+
+        """
+        return self._is_connected
+
+    cpdef object get_initialized_future(self):
+        """
+        Return the future which completes when the client is initialized.
+
+        Returns
+        -------
+        asyncio.Future
+
+        """
+        return self._initialized_future
+
+    cpdef object get_disconnected_future(self):
+        """
+        Return the future which completes when the client is disconnected.
+
+        The future is complete while the client is not connected, and is
+        replaced with a pending future each time the client connects.
+
+        Returns
+        -------
+        asyncio.Future
+
+        """
+        return self._disconnected_future
+
+    cdef void _set_initialized(self) except *:
+        # May be called from any thread
+        self.initialized = True
+        complete_future(self._loop, self._initialized_future)
+
+    cdef void _set_connected(self, bint connected) except *:
+        # May be called from any thread
+        self._is_connected = connected
+        if not connected:
+            complete_future(self._loop, self._disconnected_future)
+        elif self._disconnected_future.done():
+            self._disconnected_future = self._loop.create_future()
@@ -0,0 +1,80 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2021 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import asyncio
+from asyncio import _get_running_loop
+
+
+def set_future_done(future):
+    """
+    Set the result of the given future to True (if not already done).
+
+    Must be called from the event loop thread of the future.
+
+    Parameters
+    ----------
+    future : asyncio.Future
+        The future to complete.
+
+    """
+    if not future.done():
+        future.set_result(True)
+
+
+def complete_future(loop, future):
+    """
+    Complete the given future from any thread.
+
+    Futures are not thread safe, so when called off the loop thread (and the
+    loop is running) the future is completed on the loop thread.
+
+    Parameters
+    ----------
+    loop : asyncio.AbstractEventLoop
+        The event loop of the future.
+    future : asyncio.Future
+        The future to complete.
+
+    """
+    if _get_running_loop() is loop or not loop.is_running():
+        set_future_done(future)
+    else:
+        loop.call_soon_threadsafe(set_future_done, future)
+
+
+def gather_futures(loop, list futures):
+    """
+    Return a future aggregating the results of the given futures.
+
+    Unlike `asyncio.gather`, if all the futures are already done then the
+    returned future is also done (rather than on the next loop iteration).
+
+    Parameters
+    ----------
+    loop : asyncio.AbstractEventLoop
+        The event loop for the returned future.
+    futures : list[asyncio.Future]
+        The futures to gather.
+
+    Returns
+    -------
+    asyncio.Future
+
+    """
+    if all([future.done() for future in futures]):
+        gathered = loop.create_future()
+        gathered.set_result([future.result() for future in futures])
+        return gathered
+    return asyncio.gather(*futures)
@@ -28,6 +28,7 @@ from nautilus_trader.adapters.ccxt.client import CCXTDataClientFactory
 from nautilus_trader.adapters.oanda.client import OandaDataClientFactory
 from nautilus_trader.analysis.performance import PerformanceAnalyzer
 from nautilus_trader.common.clock import LiveClock
+from nautilus_trader.common.latency import LatencyRecorder
 from nautilus_trader.common.logging import LiveLogger
 from nautilus_trader.common.logging import LogLevelParser
 from nautilus_trader.common.logging import LoggerAdapter
@@ -37,8 +38,14 @@ from nautilus_trader.core.functions import is_ge_python_version
 from nautilus_trader.execution.database import BypassExecutionDatabase
 from nautilus_trader.live.data import LiveDataEngine
 from nautilus_trader.live.execution import LiveExecutionEngine
+from nautilus_trader.live.recorder import DataRecorder
+from nautilus_trader.live.replay import ReplayDataClient
+from nautilus_trader.live.replay import record_files
+from nautilus_trader.live.scheduler import LiveScheduler
 from nautilus_trader.model.identifiers import TraderId
+from nautilus_trader.model.identifiers import Venue
 from nautilus_trader.redis.execution import RedisExecutionDatabase
+from nautilus_trader.risk.engine import RiskEngine
 from nautilus_trader.serialization.serializers import MsgPackCommandSerializer
 from nautilus_trader.serialization.serializers import MsgPackEventSerializer
 from nautilus_trader.trading.portfolio import Portfolio
@@ -80,14 +87,20 @@ class TradingNode:
 
         config_trader = config.get("trader", {})
         config_log = config.get("logging", {})
+        config_scheduler = config.get("scheduler", {})
+        config_data_engine = config.get("data_engine", {})
         config_exec_db = config.get("exec_database", {})
+        config_exec_engine = config.get("exec_engine", {})
+        config_risk = config.get("risk", {})
         config_strategy = config.get("strategy", {})
         config_data_clients = config.get("data_clients", {})
+        config_recorder = config.get("data_recorder")
+        config_latency = config.get("latency_stats")
         config_exec_clients = config.get("exec_clients", {})
 
-        self._clock = LiveClock()
-        self._uuid_factory = UUIDFactory()
         self._loop = asyncio.get_event_loop()
+        self._clock = LiveClock(loop=self._loop)
+        self._uuid_factory = UUIDFactory()
         self._executor = concurrent.futures.ThreadPoolExecutor()
         self._loop.set_default_executor(self._executor)
         self._is_running = False
@@ -122,16 +135,35 @@ class TradingNode:
             logger=logger,
         )
 
+        # Runs the engine queues with execution ahead of market data
+        self._scheduler = LiveScheduler(
+            loop=self._loop,
+            logger=logger,
+            config=config_scheduler,
+        )
+
         self._data_engine = LiveDataEngine(
             loop=self._loop,
             portfolio=self.portfolio,
             clock=self._clock,
             logger=logger,
+            config=config_data_engine,
         )
+        self._data_engine.register_scheduler(self._scheduler)
 
         self.portfolio.register_cache(self._data_engine.cache)
         self.analyzer = PerformanceAnalyzer()
 
+        self._recorder = None
+        if config_recorder is not None:
+            self._recorder = DataRecorder(
+                path=config_recorder["path"],
+                clock=self._clock,
+                logger=logger,
+                name=config_recorder.get("name", "data"),
+            )
+            self._data_engine.register_recorder(self._recorder)
+
         if config_exec_db["type"] == "redis":
             exec_db = RedisExecutionDatabase(
                 trader_id=self.trader_id,
@@ -155,9 +187,30 @@ class TradingNode:
             portfolio=self.portfolio,
             clock=self._clock,
             logger=logger,
+            config=config_exec_engine,
         )
+        self._exec_engine.register_scheduler(self._scheduler)
 
         self._exec_engine.load_cache()
+
+        self.risk_engine = RiskEngine(
+            cache=self._data_engine.cache,
+            portfolio=self.portfolio,
+            clock=self._clock,
+            logger=logger,
+            config=config_risk,
+        )
+
+        self._exec_engine.register_risk_engine(self.risk_engine)
+
+        self._latency_recorder = None
+        if config_latency is not None:
+            self._latency_recorder = LatencyRecorder(
+                significant_figures=config_latency.get("significant_figures", 2),
+            )
+            self._data_engine.register_latency_recorder(self._latency_recorder)
+            self._exec_engine.register_latency_recorder(self._latency_recorder)
+
         self._setup_data_clients(config_data_clients, logger)
         self._setup_exec_clients(config_exec_clients, logger)
 
@@ -170,7 +223,7 @@ class TradingNode:
             logger=logger,
         )
 
-        self._check_residuals_delay = 2.0  # Hard coded delay (refactor)
+        self._check_residuals_delay = 2.0  # Maximum delay awaiting residual state
         self._load_strategy_state = config_strategy.get("load_state", True)
         self._save_strategy_state = config_strategy.get("save_state", True)
 
@@ -191,6 +244,21 @@ class TradingNode:
         """
         return self._loop
 
+    def get_latency_report(self):
+        """
+        Return the report of the latency statistics recorded by the node.
+
+        Returns
+        -------
+        dict[str, dict] or None
+            None if latency statistics are not configured.
+
+        """
+        if self._latency_recorder is None:
+            return None
+
+        return self._latency_recorder.report()
+
     def start(self):
         """
         Start the trading node.
@@ -321,6 +389,15 @@ class TradingNode:
                     clock=self._clock,
                     logger=logger,
                 )
+            elif name.startswith("replay-"):
+                data_client = ReplayDataClient(
+                    files=record_files(config["path"], config.get("name", "data")),
+                    venue=Venue(config["venue"]),
+                    engine=self._data_engine,
+                    clock=self._clock,
+                    logger=logger,
+                    speed=config.get("speed", 0),
+                )
             else:
                 self._log.error(f"No DataClient available for `{name}`.")
                 continue
@@ -365,11 +442,24 @@ class TradingNode:
         try:
             self._log.info("state=STARTING...")
 
+            self._scheduler.start()
             self._data_engine.start()
             self._exec_engine.start()
 
             # Wait for engines to initialize (will hang if never initialized)
-            await self._loop.run_in_executor(None, self._wait_for_engines)
+            self._log.info("Waiting for engines to initialize...")
+
+            # The engines require that all of their clients are initialized.
+            # The data engine clients will be set as initialized when all
+            # instruments are received and updated with the data engine.
+            # The execution engine clients will be set as initialized when all
+            # accounts are updated and the current order and position status is
+            # confirmed. Thus any delay here will be due to network IO, the
+            # clients of both engines connect and initialize concurrently.
+            await asyncio.gather(
+                self._data_engine.get_initialized_future(),
+                self._exec_engine.get_initialized_future(),
+            )
 
             self.trader.start()
 
@@ -381,38 +471,22 @@ class TradingNode:
             self._is_running = True
 
             # Continue to run while engines are running...
-            await self._data_engine.get_run_queue_task()
-            await self._exec_engine.get_run_queue_task()
+            await self._scheduler.get_run_task()
         except asyncio.CancelledError as ex:
             self._log.error(str(ex))
 
-    def _wait_for_engines(self):
-        self._log.info("Waiting for engines to initialize...")
-
-        # The engines require that all of their clients are initialized.
-        # The data engine clients will be set as initialized when all
-        # instruments are received and updated with the data engine.
-        # The execution engine clients will be set as initialized when all
-        # accounts are updated and the current order and position status is
-        # confirmed. Thus any delay here will be due to blocking network IO.
-        while True:
-            time.sleep(0.1)
-            if not self._data_engine.check_initialized():
-                continue
-            if not self._exec_engine.check_initialized():
-                continue
-            break
-
-        return True  # Engines initialized
-
     async def _stop(self):
         self._is_stopping = True
         self._log.info("state=STOPPING...")
 
         self.trader.stop()
 
+        # Wait for in-flight commands and orders to complete (up to the delay)
         self._log.info("Awaiting residual state...")
-        await asyncio.sleep(self._check_residuals_delay)
+        await asyncio.wait(
+            [self._exec_engine.get_settled_future()],
+            timeout=self._check_residuals_delay,
+        )
         self.trader.check_residuals()
 
         if self._save_strategy_state:
@@ -420,9 +494,12 @@ class TradingNode:
 
         self._data_engine.stop()
         self._exec_engine.stop()
+        self._scheduler.stop()
+
+        await self._scheduler.get_run_task()
 
-        await self._data_engine.get_run_queue_task()
-        await self._exec_engine.get_run_queue_task()
+        if self._recorder is not None:
+            self._recorder.close()
 
         # Clean up remaining timers
         timer_names = self._clock.timer_names()
@@ -431,19 +508,15 @@ class TradingNode:
         for name in timer_names:
             self._log.info(f"Cancelled Timer(name={name}).")
 
-        # Wait for engines to disconnect (will hang if never disconnected)
+        # Wait for engines to disconnect (up to 5s)
         self._log.info("Waiting for engines to disconnect...")
-        timeout = self._clock.utc_now() + timedelta(seconds=5)
-        while True:
-            time.sleep(0.1)
-            if self._clock.utc_now() >= timeout:
-                self._log.warning("Timed out (5s) waiting for engines to disconnect.")
-                break
-            if not self._data_engine.check_disconnected():
-                continue
-            # if not self._exec_engine.check_disconnected():  # TODO: Implement
-            #     continue
-            break
+        disconnected = asyncio.gather(
+            self._data_engine.get_disconnected_future(),
+            self._exec_engine.get_disconnected_future(),
+        )
+        await asyncio.wait([disconnected], timeout=5)
+        if not disconnected.done():
+            self._log.warning("Timed out (5s) waiting for engines to disconnect.")
 
         self._log.info("state=STOPPED.")
         self._is_running = False
@@ -0,0 +1,103 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2021 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from nautilus_trader.live.snapshot cimport InstrumentSnapshotCache
+from nautilus_trader.model.identifiers cimport Symbol
+from nautilus_trader.model.identifiers cimport Venue
+from nautilus_trader.model.instrument cimport Instrument
+
+
+cdef class LiveInstrumentProvider:
+    """
+    The abstract base class for all live instrument providers.
+
+    This class should not be used directly, but through its concrete subclasses.
+    """
+
+    def __init__(self, Venue venue not None, InstrumentSnapshotCache snapshot_cache=None):
+        """
+        Initialize a new instance of the `LiveInstrumentProvider` class.
+
+        Parameters
+        ----------
+        venue : Venue
+            The venue for the provider.
+        snapshot_cache : InstrumentSnapshotCache, optional
+            The cache to load instrument snapshots from, and to save a
+            snapshot to whenever all instruments are loaded.
+
+        """
+        self.venue = venue
+        self.count = 0
+        self._instruments = {}  # type: dict[Symbol: Instrument]
+        self._snapshot_cache = snapshot_cache
+
+    cpdef void load_all(self) except *:
+        """Abstract method (implement in subclass)."""
+        raise NotImplementedError("method must be implemented in the subclass")
+
+    cpdef bint load_snapshot(self) except *:
+        """
+        Load all instruments for the venue from the snapshot cache.
+
+        Returns
+        -------
+        bool
+            True if any instruments were loaded, else False.
+
+        """
+        if self._snapshot_cache is None:
+            return False
+
+        cdef dict instruments = self._snapshot_cache.load()
+        if not instruments:
+            return False
+
+        self._instruments = instruments
+        self.count = len(self._instruments)
+        return True
+
+    cpdef dict get_all(self):
+        """
+        Return all loaded instruments.
+
+        If no instruments loaded, will return an empty dict.
+
+        Returns
+        -------
+        dict[Symbol, Instrument]
+
+        """
+        return self._instruments.copy()
+
+    cpdef Instrument get(self, Symbol symbol):
+        """
+        Return the instrument for the given symbol (if found).
+
+        Returns
+        -------
+        Instrument or None
+
+        """
+        return self._instruments.get(symbol)
+
+    cdef void _set_instruments(self, dict instruments) except *:
+        # Replace all instruments with those loaded from the venue, so any
+        # instruments no longer listed (including from a snapshot) are removed.
+        self._instruments = instruments
+        self.count = len(self._instruments)
+
+        if self._snapshot_cache is not None:
+            self._snapshot_cache.save(self._instruments)
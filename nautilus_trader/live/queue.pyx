@@ -0,0 +1,214 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2021 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import asyncio
+from collections import deque
+
+from nautilus_trader.core.correctness cimport Condition
+
+
+class LiveQueue(asyncio.Queue):
+    """
+    Provides an asyncio queue for the live engines with an optional bound, an
+    overflow policy and queue depth gauges.
+
+    When the queue is full either the oldest item is dropped to make space for
+    the new item, or the new item is held in order until space is available
+    (no item is ever dropped). Held items count towards the queue depth.
+
+    Only producers which wait keep the depth within the bound, coroutines
+    should therefore await `enqueue_wait` rather than call `enqueue`, which
+    holds items without limit while the queue is full.
+
+    All methods must be called from the event loop thread.
+    """
+
+    def __init__(self, int maxsize=0, bint drop_oldest=False, on_drop=None):
+        """
+        Initialize a new instance of the `LiveQueue` class.
+
+        Parameters
+        ----------
+        maxsize : int, optional
+            The maximum number of items on the queue (if zero then unbounded).
+        drop_oldest : bool, optional
+            If the oldest item is dropped when the queue is full, else new items
+            are held until space is available.
+        on_drop : callable, optional
+            The callback for each dropped item.
+
+        Raises
+        ------
+        ValueError
+            If maxsize is negative (< 0).
+        TypeError
+            If on_drop is not of type callable or None.
+
+        """
+        Condition.not_negative_int(maxsize, "maxsize")
+        Condition.callable_or_none(on_drop, "on_drop")
+        super().__init__(maxsize)
+
+        self._drop_oldest = drop_oldest
+        self._on_drop = on_drop
+        self._held = deque()  # type: deque[(object, asyncio.Future)]
+        self._hold_task = None
+        self._ready = None
+
+        self.high_water_mark = 0
+        self.dropped_count = 0
+
+    @property
+    def drop_oldest(self):
+        """
+        If the oldest item is dropped when the queue is full.
+
+        Returns
+        -------
+        bool
+
+        """
+        return self._drop_oldest
+
+    def set_ready_event(self, ready):
+        """
+        Set the event to set whenever an item is put on the queue.
+
+        Parameters
+        ----------
+        ready : asyncio.Event or None
+            The event for a consumer waiting on several queues.
+
+        """
+        self._ready = ready
+
+    def depth(self):
+        """
+        Return the number of items on the queue, including any held items.
+
+        Returns
+        -------
+        int
+
+        """
+        return self.qsize() + len(self._held)
+
+    def held_count(self):
+        """
+        Return the number of items held waiting for space on the queue.
+
+        Returns
+        -------
+        int
+
+        """
+        return len(self._held)
+
+    def enqueue(self, item, bint wait=False):
+        """
+        Put the given item on the queue without blocking.
+
+        If the queue is full then the overflow policy applies.
+
+        Parameters
+        ----------
+        item : object
+            The item to put.
+        wait : bool, optional
+            If a future should be returned when the item is held.
+
+        Returns
+        -------
+        asyncio.Future or None
+            The future completed when a held item is put on the queue (if wait).
+
+        """
+        if not self._held and not self.full():
+            self.put_nowait(item)
+            self._on_put()
+            return None
+
+        if self._drop_oldest:
+            dropped = self.get_nowait()
+            self.dropped_count += 1
+            self.put_nowait(item)
+            if self._ready is not None:
+                self._ready.set()
+            if self._on_drop is not None:
+                self._on_drop(dropped)
+            return None
+
+        # Hold the item in order until space is available
+        loop = asyncio.get_event_loop()
+        future = loop.create_future() if wait else None
+        self._held.append((item, future))
+        if self.depth() > self.high_water_mark:
+            self.high_water_mark = self.depth()
+        if self._hold_task is None:
+            self._hold_task = loop.create_task(self._put_held())
+
+        return future
+
+    async def enqueue_wait(self, item):
+        """
+        Put the given item on the queue, waiting while the queue is full.
+
+        Unless the oldest item is dropped, the item is not held while waiting,
+        so the queue depth stays within the bound.
+
+        Parameters
+        ----------
+        item : object
+            The item to put.
+
+        """
+        if self._held:
+            # Wait behind the held items so the new item cannot overtake them
+            future = self.enqueue(item, wait=True)
+            if future is not None:
+                await future
+        elif self._drop_oldest or not self.full():
+            self.enqueue(item)
+        else:
+            await self.put(item)
+            self._on_put()
+
+    def reset_gauges(self):
+        """
+        Reset the high-water mark to the current depth and the dropped count to zero.
+        """
+        self.high_water_mark = self.depth()
+        self.dropped_count = 0
+
+    def _on_put(self):
+        if self.qsize() > self.high_water_mark:
+            self.high_water_mark = self.qsize()
+        if self._ready is not None:
+            self._ready.set()
+
+    async def _put_held(self):
+        # The next held item stays at the front of the held items until it is
+        # on the queue, so new items cannot overtake it.
+        try:
+            while self._held:
+                item, future = self._held[0]
+                await self.put(item)
+                self._held.popleft()
+                if self._ready is not None:
+                    self._ready.set()
+                if future is not None and not future.done():
+                    future.set_result(None)
+        finally:
+            self._hold_task = None
@@ -0,0 +1,59 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2021 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from nautilus_trader.common.clock cimport LiveClock
+from nautilus_trader.common.logging cimport LoggerAdapter
+from nautilus_trader.serialization.serializers cimport MsgPackInstrumentSerializer
+
+
+cpdef enum RecordType:
+    INSTRUMENT = 0,
+    QUOTE_TICK = 1,
+    TRADE_TICK = 2,
+    BAR_EXTERNAL = 3,
+    BAR_INTERNAL = 4,
+    ORDER_BOOK_DELTA = 5
+
+
+cdef class DataRecorder:
+    cdef LiveClock _clock
+    cdef LoggerAdapter _log
+    cdef object _lock
+    cdef object _packer
+    cdef MsgPackInstrumentSerializer _serializer
+    cdef object _queue
+    cdef object _thread
+    cdef object _file
+    cdef list _buffer
+    cdef int _buffer_size
+    cdef long _max_file_size
+    cdef int _compress_level
+    cdef long _file_size
+    cdef str _session
+
+    cdef readonly str path
+    cdef readonly str name
+    cdef readonly list files
+    cdef readonly long record_count
+
+    cpdef void record(self, data) except *
+    cpdef void flush(self) except *
+    cpdef void close(self) except *
+
+    cdef inline void _enqueue_buffer(self) except *
+    cpdef void _consume_chunks(self) except *
+    cdef inline void _write_chunk(self, list chunk) except *
+    cdef inline void _close_file(self) except *
+    cdef inline void _roll_file(self) except *
@@ -0,0 +1,241 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2021 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import gzip
+import os
+import queue
+import threading
+import time
+
+import msgpack
+
+from nautilus_trader.common.clock cimport LiveClock
+from nautilus_trader.common.logging cimport Logger
+from nautilus_trader.common.logging cimport LoggerAdapter
+from nautilus_trader.core.correctness cimport Condition
+from nautilus_trader.model.bar cimport BarData
+from nautilus_trader.model.instrument cimport Instrument
+from nautilus_trader.model.order_book cimport OrderBookDelta
+from nautilus_trader.model.tick cimport QuoteTick
+from nautilus_trader.model.tick cimport TradeTick
+from nautilus_trader.serialization.serializers cimport MsgPackInstrumentSerializer
+
+
+RECORD_FILE_SUFFIX = ".rec.gz"
+
+cdef object _FLUSH = object()  # Writer marker to flush the current file
+cdef object _CLOSE = object()  # Writer marker to close the current file
+
+
+cdef class DataRecorder:
+    """
+    Provides a recorder for live market data.
+
+    Every data object passed to `record` is written, with the local time it was
+    received, to rolling gzip compressed files of msgpack records. Records are
+    buffered in memory and handed off in batches to a writer thread, so the
+    compression and file writes are kept off the data path. The recorded files
+    can be played back with a `ReplayDataClient`.
+    """
+
+    def __init__(
+        self,
+        str path not None,
+        LiveClock clock not None,
+        Logger logger not None,
+        str name not None="data",
+        int buffer_size=1000,
+        long max_file_size=64_000_000,
+        int compress_level=1,
+    ):
+        """
+        Initialize a new instance of the `DataRecorder` class.
+
+        Parameters
+        ----------
+        path : str
+            The directory path for the record files.
+        clock : LiveClock
+            The clock for the recorder.
+        logger : Logger
+            The logger for the recorder.
+        name : str, optional
+            The name prefix for the record files.
+        buffer_size : int, optional
+            The number of records to buffer before writing to file (> 0).
+        max_file_size : int, optional
+            The uncompressed size in bytes at which to roll to a new file (> 0).
+        compress_level : int, optional
+            The gzip compression level (0 to 9, lower is faster).
+
+        Raises
+        ------
+        ValueError
+            If name is not a valid string.
+        ValueError
+            If buffer_size is not positive (> 0).
+        ValueError
+            If max_file_size is not positive (> 0).
+        ValueError
+            If compress_level is not in range [0, 9].
+
+        """
+        Condition.valid_string(name, "name")
+        Condition.positive_int(buffer_size, "buffer_size")
+        Condition.positive_int(max_file_size, "max_file_size")
+        Condition.in_range_int(compress_level, 0, 9, "compress_level")
+
+        os.makedirs(path, exist_ok=True)
+
+        self._clock = clock
+        self._log = LoggerAdapter(component_name=type(self).__name__, logger=logger)
+        self._lock = threading.Lock()
+        self._packer = msgpack.Packer()
+        self._serializer = MsgPackInstrumentSerializer()
+        self._file = None
+        self._buffer = []
+        self._buffer_size = buffer_size
+        self._max_file_size = max_file_size
+        self._compress_level = compress_level
+        self._file_size = 0
+        self._session = clock.utc_now().strftime("%Y%m%d-%H%M%S")
+
+        self.path = path
+        self.name = name
+        self.files = []
+        self.record_count = 0
+
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._consume_chunks, daemon=True)
+        self._thread.start()
+
+    cpdef void record(self, data) except *:
+        """
+        Record the given data.
+
+        Data types which cannot be replayed are not recorded.
+
+        Parameters
+        ----------
+        data : object
+            The data to record.
+
+        """
+        timestamp_ns = time.time_ns()  # Local receipt time
+        cdef list record
+        if isinstance(data, QuoteTick):
+            record = [timestamp_ns, RecordType.QUOTE_TICK, data.symbol.value, data.to_serializable_string()]
+        elif isinstance(data, TradeTick):
+            record = [timestamp_ns, RecordType.TRADE_TICK, data.symbol.value, data.to_serializable_string()]
+        elif isinstance(data, BarData):
+            record = [
+                timestamp_ns,
+                RecordType.BAR_INTERNAL if data.bar_type.is_internal_aggregation else RecordType.BAR_EXTERNAL,
+                str(data.bar_type),
+                data.bar.to_serializable_string(),
+            ]
+        elif isinstance(data, OrderBookDelta):
+            record = [timestamp_ns, RecordType.ORDER_BOOK_DELTA, data.symbol.value, data.to_serializable_string()]
+        elif isinstance(data, Instrument):
+            record = [timestamp_ns, RecordType.INSTRUMENT, data.symbol.value, self._serializer.serialize(data)]
+        else:
+            self._log.warning(f"Cannot record {type(data).__name__} data.")
+            return
+
+        with self._lock:
+            self._buffer.append(self._packer.pack(record))
+            self.record_count += 1
+            if len(self._buffer) >= self._buffer_size:
+                self._enqueue_buffer()
+
+    cpdef void flush(self) except *:
+        """
+        Write all buffered records to file.
+
+        Blocks until the writer thread has flushed the current file.
+        """
+        with self._lock:
+            self._enqueue_buffer()
+            self._queue.put(_FLUSH)
+
+        self._queue.join()
+
+    cpdef void close(self) except *:
+        """
+        Write all buffered records and close the current file.
+
+        Blocks until the writer thread has closed the current file.
+        """
+        with self._lock:
+            self._enqueue_buffer()
+            self._queue.put(_CLOSE)
+
+        self._queue.join()
+
+        self._log.info(f"Closed with {self.record_count:,} record(s) in {len(self.files)} file(s).")
+
+    cdef inline void _enqueue_buffer(self) except *:
+        # Must be called while holding the lock
+        if not self._buffer:
+            return
+
+        self._queue.put(self._buffer)
+        self._buffer = []
+
+    cpdef void _consume_chunks(self) except *:
+        while True:
+            chunk = self._queue.get()
+            try:
+                if chunk is _FLUSH:
+                    if self._file is not None:
+                        self._file.flush()
+                elif chunk is _CLOSE:
+                    self._close_file()
+                else:
+                    self._write_chunk(chunk)
+            except Exception as ex:
+                self._log.exception(ex)
+            finally:
+                self._queue.task_done()
+
+    cdef inline void _write_chunk(self, list chunk) except *:
+        if self._file is None:
+            self._roll_file()
+
+        cdef bytes data = b"".join(chunk)
+        self._file.write(data)
+        self._file_size += len(data)
+
+        if self._file_size >= self._max_file_size:
+            self._close_file()
+
+    cdef inline void _close_file(self) except *:
+        if self._file is None:
+            return
+
+        self._file.close()
+        self._file = None
+        self._file_size = 0
+
+    cdef inline void _roll_file(self) except *:
+        cdef str file_path = os.path.join(
+            self.path,
+            f"{self.name}-{self._session}-{len(self.files):04d}{RECORD_FILE_SUFFIX}",
+        )
+
+        self._file = gzip.open(file_path, "wb", compresslevel=self._compress_level)
+        self.files.append(file_path)
+
+        self._log.info(f"Recording to {file_path}...")
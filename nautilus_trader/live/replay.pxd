@@ -0,0 +1,36 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2021 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from nautilus_trader.live.data cimport LiveDataClient
+from nautilus_trader.serialization.serializers cimport MsgPackInstrumentSerializer
+
+
+cdef class ReplayDataClient(LiveDataClient):
+    cdef list _files
+    cdef double _speed
+    cdef MsgPackInstrumentSerializer _serializer
+    cdef dict _instruments
+    cdef dict _symbols
+    cdef dict _bar_types
+    cdef object _replay_task
+
+    cdef readonly bint is_replaying
+    cdef readonly long replay_count
+
+    cpdef void start_replay(self) except *
+
+    cdef object _parse_record(self, list record)
+    cdef inline void _load_instruments(self) except *
+    cdef inline void _schedule_replay(self) except *
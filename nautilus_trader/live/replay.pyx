@@ -0,0 +1,587 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2021 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import asyncio
+from cpython.datetime cimport datetime
+import glob
+import gzip
+import os
+import time
+
+import msgpack
+
+from nautilus_trader.common.clock cimport LiveClock
+from nautilus_trader.common.logging cimport Logger
+from nautilus_trader.core.correctness cimport Condition
+from nautilus_trader.core.uuid cimport UUID
+from nautilus_trader.live.data cimport LiveDataClient
+from nautilus_trader.live.data cimport LiveDataEngine
+from nautilus_trader.live.recorder cimport RecordType
+from nautilus_trader.live.recorder import RECORD_FILE_SUFFIX
+from nautilus_trader.model.bar cimport Bar
+from nautilus_trader.model.bar cimport BarData
+from nautilus_trader.model.bar cimport BarType
+from nautilus_trader.model.identifiers cimport Symbol
+from nautilus_trader.model.identifiers cimport Venue
+from nautilus_trader.model.instrument cimport Instrument
+from nautilus_trader.model.order_book cimport OrderBookDelta
+from nautilus_trader.model.tick cimport QuoteTick
+from nautilus_trader.model.tick cimport TradeTick
+from nautilus_trader.serialization.serializers cimport MsgPackInstrumentSerializer
+
+
+def record_files(str path not None, str name not None="data"):
+    """
+    Return the record files written by a `DataRecorder` in recording order.
+
+    Parameters
+    ----------
+    path : str
+        The directory path of the record files.
+    name : str, optional
+        The name prefix of the record files.
+
+    Returns
+    -------
+    list[str]
+
+    """
+    return sorted(glob.glob(os.path.join(path, f"{name}-*{RECORD_FILE_SUFFIX}")))
+
+
+def read_records(list files not None):
+    """
+    Iterate the raw records in the given record files.
+
+    Each record is a list of the local receipt time (UNIX nanoseconds), the
+    `RecordType`, the symbol or bar type string (can be None) and the payload.
+
+    Parameters
+    ----------
+    files : list[str]
+        The record files to read.
+
+    Returns
+    -------
+    Generator[list]
+
+    """
+    for file_path in files:
+        with gzip.open(file_path, "rb") as f:
+            yield from msgpack.Unpacker(f, raw=False)
+
+
+cdef class ReplayDataClient(LiveDataClient):
+    """
+    Provides a data client which replays market data recorded by a
+    `DataRecorder` back through the live data engine.
+
+    Only data for the clients venue is replayed. The instruments recorded at
+    the head of the recording are sent on connect, then the replay starts when
+    the first subscription is made (or `start_replay` is called). Data is
+    replayed either as fast as possible, or paced by the recorded receipt times.
+    """
+
+    def __init__(
+        self,
+        list files not None,
+        Venue venue not None,
+        LiveDataEngine engine not None,
+        LiveClock clock not None,
+        Logger logger not None,
+        double speed=0,
+    ):
+        """
+        Initialize a new instance of the `ReplayDataClient` class.
+
+        Parameters
+        ----------
+        files : list[str]
+            The record files to replay (in recording order).
+        venue : Venue
+            The venue for the client (data for other venues is skipped).
+        engine : LiveDataEngine
+            The live data engine for the client.
+        clock : LiveClock
+            The clock for the client.
+        logger : Logger
+            The logger for the client.
+        speed : double, optional
+            The replay speed relative to the recorded receipt times. If 0 then
+            the data is replayed as fast as possible, 1 replays at wall-clock
+            pace (>= 0).
+
+        Raises
+        ------
+        ValueError
+            If files is empty.
+        ValueError
+            If speed is negative (< 0).
+
+        """
+        Condition.not_empty(files, "files")
+        Condition.not_negative(speed, "speed")
+        super().__init__(
+            venue,
+            engine,
+            clock,
+            logger,
+            config={
+                "unavailable_methods": [
+                    self.request_quote_ticks.__name__,
+                    self.request_trade_ticks.__name__,
+                    self.request_bars.__name__,
+                ],
+            }
+        )
+
+        self._files = files
+        self._speed = speed
+        self._serializer = MsgPackInstrumentSerializer()
+        self._instruments = {}  # type: dict[Symbol, Instrument]
+        self._symbols = {}      # type: dict[str, Symbol]
+        self._bar_types = {}    # type: dict[str, BarType]
+        self._replay_task = None
+
+        self.is_replaying = False
+        self.replay_count = 0
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}-{self.venue.value}"
+
+    cpdef void connect(self) except *:
+        """
+        Connect the client.
+        """
+        self._log.info("Connecting...")
+
+        self._load_instruments()
+        self._set_initialized()
+
+        self._set_connected(True)
+        self._log.info("Connected.")
+
+    cpdef void disconnect(self) except *:
+        """
+        Disconnect the client.
+        """
+        self._log.info("Disconnecting...")
+
+        if self._replay_task is not None:
+            self._replay_task.cancel()
+            self._replay_task = None
+
+        self._set_connected(False)
+        self._log.info("Disconnected.")
+
+    cpdef void reset(self) except *:
+        """
+        Reset the client.
+        """
+        if self._is_connected:
+            self._log.error("Cannot reset a connected data client.")
+            return
+
+        self._instruments.clear()
+        self.is_replaying = False
+        self.replay_count = 0
+
+    cpdef void dispose(self) except *:
+        """
+        Dispose the client.
+        """
+        if self._is_connected:
+            self.disconnect()
+
+        self._log.info("Disposed.")
+
+    cpdef void start_replay(self) except *:
+        """
+        Start replaying the recorded data.
+
+        If the replay has already started then does nothing.
+        """
+        if self._replay_task is not None:
+            return  # Already started
+
+        self.is_replaying = True
+        self._replay_task = self._loop.create_task(self._run_replay())
+
+# -- SUBSCRIPTIONS ---------------------------------------------------------------------------------
+
+    cpdef void subscribe_instrument(self, Symbol symbol) except *:
+        """
+        Subscribe to `Instrument` data for the given symbol.
+
+        Parameters
+        ----------
+        symbol : Instrument
+            The instrument symbol to subscribe to.
+
+        """
+        Condition.not_none(symbol, "symbol")
+
+        self._schedule_replay()
+
+    cpdef void subscribe_quote_ticks(self, Symbol symbol) except *:
+        """
+        Subscribe to `QuoteTick` data for the given symbol.
+
+        Parameters
+        ----------
+        symbol : Symbol
+            The tick symbol to subscribe to.
+
+        """
+        Condition.not_none(symbol, "symbol")
+
+        self._schedule_replay()
+
+    cpdef void subscribe_trade_ticks(self, Symbol symbol) except *:
+        """
+        Subscribe to `TradeTick` data for the given symbol.
+
+        Parameters
+        ----------
+        symbol : Symbol
+            The tick symbol to subscribe to.
+
+        """
+        Condition.not_none(symbol, "symbol")
+
+        self._schedule_replay()
+
+    cpdef void subscribe_bars(self, BarType bar_type) except *:
+        """
+        Subscribe to `Bar` data for the given bar type.
+
+        Parameters
+        ----------
+        bar_type : BarType
+            The bar type to subscribe to.
+
+        """
+        Condition.not_none(bar_type, "bar_type")
+
+        self._schedule_replay()
+
+    cpdef void subscribe_order_book(self, Symbol symbol) except *:
+        """
+        Subscribe to `OrderBookDelta` data for the given symbol.
+
+        Parameters
+        ----------
+        symbol : Symbol
+            The order book symbol to subscribe to.
+
+        """
+        Condition.not_none(symbol, "symbol")
+
+        self._schedule_replay()
+
+    cpdef void unsubscribe_instrument(self, Symbol symbol) except *:
+        """
+        Unsubscribe from `Instrument` data for the given symbol.
+
+        Parameters
+        ----------
+        symbol : Symbol
+            The instrument symbol to unsubscribe from.
+
+        """
+        Condition.not_none(symbol, "symbol")
+        # Do nothing else for replay (the data engine filters unsubscribed data)
+
+    cpdef void unsubscribe_quote_ticks(self, Symbol symbol) except *:
+        """
+        Unsubscribe from `QuoteTick` data for the given symbol.
+
+        Parameters
+        ----------
+        symbol : Symbol
+            The tick symbol to unsubscribe from.
+
+        """
+        Condition.not_none(symbol, "symbol")
+        # Do nothing else for replay (the data engine filters unsubscribed data)
+
+    cpdef void unsubscribe_trade_ticks(self, Symbol symbol) except *:
+        """
+        Unsubscribe from `TradeTick` data for the given symbol.
+
+        Parameters
+        ----------
+        symbol : Symbol
+            The tick symbol to unsubscribe from.
+
+        """
+        Condition.not_none(symbol, "symbol")
+        # Do nothing else for replay (the data engine filters unsubscribed data)
+
+    cpdef void unsubscribe_bars(self, BarType bar_type) except *:
+        """
+        Unsubscribe from `Bar` data for the given bar type.
+
+        Parameters
+        ----------
+        bar_type : BarType
+            The bar type to unsubscribe from.
+
+        """
+        Condition.not_none(bar_type, "bar_type")
+        # Do nothing else for replay (the data engine filters unsubscribed data)
+
+    cpdef void unsubscribe_order_book(self, Symbol symbol) except *:
+        """
+        Unsubscribe from `OrderBookDelta` data for the given symbol.
+
+        Parameters
+        ----------
+        symbol : Symbol
+            The order book symbol to unsubscribe from.
+
+        """
+        Condition.not_none(symbol, "symbol")
+        # Do nothing else for replay (the data engine filters unsubscribed data)
+
+# -- REQUESTS --------------------------------------------------------------------------------------
+
+    cpdef void request_instrument(self, Symbol symbol, UUID correlation_id) except *:
+        """
+        Request the instrument for the given symbol.
+
+        Parameters
+        ----------
+        symbol : Symbol
+            The symbol for the request.
+        correlation_id : UUID
+            The correlation identifier for the request.
+
+        """
+        Condition.not_none(symbol, "symbol")
+        Condition.not_none(correlation_id, "correlation_id")
+
+        cdef Instrument instrument = self._instruments.get(symbol)
+
+        if instrument is None:
+            self._log.warning(f"No instrument recorded for {symbol}.")
+            return
+
+        self._handle_instruments([instrument], correlation_id)
+
+    cpdef void request_instruments(self, UUID correlation_id) except *:
+        """
+        Request all instruments.
+
+        Parameters
+        ----------
+        correlation_id : UUID
+            The correlation identifier for the request.
+
+        """
+        Condition.not_none(correlation_id, "correlation_id")
+
+        self._handle_instruments(list(self._instruments.values()), correlation_id)
+
+    cpdef void request_quote_ticks(
+        self,
+        Symbol symbol,
+        datetime from_datetime,  # Can be None
+        datetime to_datetime,    # Can be None
+        int limit,
+        UUID correlation_id,
+    ) except *:
+        """
+        Request historical quote ticks for the given parameters.
+
+        Parameters
+        ----------
+        symbol : Symbol
+            The tick symbol for the request.
+        from_datetime : datetime, optional
+            The specified from datetime for the data.
+        to_datetime : datetime, optional
+            The specified to datetime for the data. If None then will default
+            to the current datetime.
+        limit : int
+            The limit for the number of returned ticks.
+        correlation_id : UUID
+            The correlation identifier for the request.
+
+        """
+        Condition.not_none(symbol, "symbol")
+        Condition.not_none(correlation_id, "correlation_id")
+
+        self._log.error(f"`request_quote_ticks` was called when not supported for replay.")
+
+    cpdef void request_trade_ticks(
+        self,
+        Symbol symbol,
+        datetime from_datetime,  # Can be None
+        datetime to_datetime,    # Can be None
+        int limit,
+        UUID correlation_id,
+    ) except *:
+        """
+        Request historical trade ticks for the given parameters.
+
+        Parameters
+        ----------
+        symbol : Symbol
+            The tick symbol for the request.
+        from_datetime : datetime, optional
+            The specified from datetime for the data.
+        to_datetime : datetime, optional
+            The specified to datetime for the data. If None then will default
+            to the current datetime.
+        limit : int
+            The limit for the number of returned ticks.
+        correlation_id : UUID
+            The correlation identifier for the request.
+
+        """
+        Condition.not_none(symbol, "symbol")
+        Condition.not_none(correlation_id, "correlation_id")
+
+        self._log.error(f"`request_trade_ticks` was called when not supported for replay.")
+
+    cpdef void request_bars(
+        self,
+        BarType bar_type,
+        datetime from_datetime,  # Can be None
+        datetime to_datetime,    # Can be None
+        int limit,
+        UUID correlation_id,
+    ) except *:
+        """
+        Request historical bars for the given parameters.
+
+        Parameters
+        ----------
+        bar_type : BarType
+            The bar type for the request.
+        from_datetime : datetime, optional
+            The specified from datetime for the data.
+        to_datetime : datetime, optional
+            The specified to datetime for the data. If None then will default
+            to the current datetime.
+        limit : int
+            The limit for the number of returned bars.
+        correlation_id : UUID
+            The correlation identifier for the request.
+
+        """
+        Condition.not_none(bar_type, "bar_type")
+        Condition.not_none(correlation_id, "correlation_id")
+
+        self._log.error(f"`request_bars` was called when not supported for replay.")
+
+# --------------------------------------------------------------------------------------------------
+
+    async def _run_replay(self):
+        self._log.info(f"Replaying {len(self._files)} file(s) "
+                       f"at {'max' if self._speed == 0 else f'{self._speed}x'} speed...")
+
+        cdef double speed = self._speed
+        cdef long count = 0
+        cdef list record
+        start_ns = time.time_ns()
+        first_ns = None
+        try:
+            for record in read_records(self._files):
+                data = self._parse_record(record)
+                if data is None:
+                    continue  # Not for this venue
+
+                if speed > 0:
+                    if first_ns is None:
+                        first_ns = record[0]
+                    # Wait until the paced receipt time
+                    delay_ns = (record[0] - first_ns) / speed - (time.time_ns() - start_ns)
+                    if delay_ns > 0:
+                        await asyncio.sleep(delay_ns / 1e9)
+                elif count % 1000 == 0:
+                    await asyncio.sleep(0)  # Yield to let the engine drain its queue
+
+                await (<LiveDataEngine>self._engine).process_wait(data)
+                count += 1
+                self.replay_count = count
+        except asyncio.CancelledError:
+            self._log.warning(f"Replay cancelled after {count:,} record(s).")
+            self.is_replaying = False
+            return
+
+        self.is_replaying = False
+        self._log.info(f"Replay completed with {count:,} record(s).")
+
+    cdef object _parse_record(self, list record):
+        cdef int record_type = record[1]
+        cdef str key = record[2]
+        cdef Symbol symbol
+        cdef BarType bar_type
+        cdef Instrument instrument
+
+        if record_type == RecordType.BAR_EXTERNAL or record_type == RecordType.BAR_INTERNAL:
+            bar_type = self._bar_types.get(key)
+            if bar_type is None:
+                bar_type = BarType.from_str_c(key, record_type == RecordType.BAR_INTERNAL)
+                self._bar_types[key] = bar_type
+            if bar_type.symbol.venue != self.venue:
+                return None
+            return BarData(bar_type, Bar.from_serializable_string_c(record[3]))
+
+        symbol = self._symbols.get(key)
+        if symbol is None:
+            symbol = Symbol.from_str_c(key)
+            self._symbols[key] = symbol
+        if symbol.venue != self.venue:
+            return None
+
+        if record_type == RecordType.QUOTE_TICK:
+            return QuoteTick.from_serializable_string_c(symbol, record[3])
+        elif record_type == RecordType.TRADE_TICK:
+            return TradeTick.from_serializable_string_c(symbol, record[3])
+        elif record_type == RecordType.ORDER_BOOK_DELTA:
+            return OrderBookDelta.from_serializable_string_c(symbol, record[3])
+        elif record_type == RecordType.INSTRUMENT:
+            instrument = self._serializer.deserialize(record[3])
+            self._instruments[instrument.symbol] = instrument
+            return instrument
+        else:
+            self._log.error(f"Cannot replay unrecognized record type {record_type}.")
+            return None
+
+    cdef inline void _load_instruments(self) except *:
+        # Send the instruments recorded at the head of the recording, as
+        # adapters load instruments on connect
+        records = read_records(self._files)
+        cdef list record
+        for record in records:
+            if record[1] != RecordType.INSTRUMENT:
+                break
+            data = self._parse_record(record)
+            if isinstance(data, Instrument):
+                self._handle_instrument(data)
+        records.close()
+
+        self._log.info(f"Loaded {len(self._instruments)} instrument(s).")
+
+    cdef inline void _schedule_replay(self) except *:
+        if self._replay_task is not None:
+            return  # Already started
+
+        # Start on the next loop iteration so the other subscriptions made by
+        # a starting strategy are registered before any data is replayed
+        self._loop.call_soon(self.start_replay)
@@ -0,0 +1,47 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2021 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from nautilus_trader.common.logging cimport LoggerAdapter
+
+
+cpdef enum QueuePriority:
+    EXECUTION = 0,      # Order events
+    COMMAND = 1,        # Trading commands, data commands and requests
+    DATA_RESPONSE = 2,  # Data responses
+    MARKET_DATA = 3
+
+
+cdef class LiveScheduler:
+    cdef object _loop
+    cdef LoggerAdapter _log
+    cdef list _entries
+    cdef dict _time_slices
+    cdef object _ready
+    cdef object _run_task
+
+    cdef readonly bint is_running
+    """If the scheduler is running.\n\n:returns: `bool`"""
+    cdef readonly long handled_count
+    """The count of items handled by the scheduler.\n\n:returns: `int`"""
+
+    cpdef object get_run_task(self)
+    cpdef double time_slice(self, QueuePriority priority) except *
+    cpdef void register_queue(self, queue, handler, QueuePriority priority) except *
+    cpdef void deregister_queue(self, queue) except *
+    cpdef void start(self) except *
+    cpdef void stop(self) except *
+
+    cdef inline bint _run_pass(self) except *
+    cdef inline bint _higher_pending(self, list entries, list budgets, int index) except *
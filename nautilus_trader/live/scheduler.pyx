@@ -0,0 +1,243 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2021 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import asyncio
+from asyncio import AbstractEventLoop
+from asyncio import CancelledError
+from operator import itemgetter
+import time
+
+from nautilus_trader.common.logging cimport Logger
+from nautilus_trader.common.logging cimport LoggerAdapter
+from nautilus_trader.core.correctness cimport Condition
+
+
+cdef class LiveScheduler:
+    """
+    Provides a scheduler which runs the queues of the live engines from a single
+    task on the event loop, in priority order.
+
+    Queues are registered with one of four priority classes, from highest to
+    lowest: execution events, commands (and data requests), data responses and
+    market data. On each pass the scheduler handles the queues from the highest
+    priority class down, each for at most the time slice of its class. Whenever
+    a higher priority queue has items waiting the current slice is preempted
+    and the scheduler returns to the top. Between passes the scheduler yields to the event loop, so the latency
+    of order events is bounded by one pass no matter the market data rate.
+    """
+
+    def __init__(
+        self,
+        loop not None: AbstractEventLoop,
+        Logger logger not None,
+        dict config=None,
+    ):
+        """
+        Initialize a new instance of the `LiveScheduler` class.
+
+        Parameters
+        ----------
+        loop : AbstractEventLoop
+            The event loop for the scheduler.
+        logger : Logger
+            The logger for the scheduler.
+        config : dict[str, object], optional
+            The configuration options.
+
+        Notes
+        -----
+        The config options `execution_time_slice_ms`, `command_time_slice_ms`,
+        `data_response_time_slice_ms` and `market_data_time_slice_ms` set the
+        time slice for each priority class (defaults 10, 5, 2 and 1
+        milliseconds).
+
+        Raises
+        ------
+        ValueError
+            If any time slice is not positive (> 0).
+
+        """
+        if config is None:
+            config = {}
+
+        self._loop = loop
+        self._log = LoggerAdapter(component_name=type(self).__name__, logger=logger)
+        self._entries = []  # type: list[(QueuePriority, LiveQueue, callable)]
+        self._time_slices = {
+            QueuePriority.EXECUTION: config.get("execution_time_slice_ms", 10) / 1000,
+            QueuePriority.COMMAND: config.get("command_time_slice_ms", 5) / 1000,
+            QueuePriority.DATA_RESPONSE: config.get("data_response_time_slice_ms", 2) / 1000,
+            QueuePriority.MARKET_DATA: config.get("market_data_time_slice_ms", 1) / 1000,
+        }  # type: dict[QueuePriority, float]
+        for time_slice in self._time_slices.values():
+            Condition.positive(time_slice, "time_slice")
+
+        self._ready = asyncio.Event()
+        self._run_task = None
+
+        self.is_running = False
+        self.handled_count = 0
+
+    cpdef object get_run_task(self):
+        """
+        Return the internal run task for the scheduler.
+
+        Returns
+        -------
+        asyncio.Task or None
+
+        """
+        return self._run_task
+
+    cpdef double time_slice(self, QueuePriority priority) except *:
+        """
+        Return the time slice for the given priority class.
+
+        Parameters
+        ----------
+        priority : QueuePriority
+            The priority class.
+
+        Returns
+        -------
+        double
+            The time slice in seconds.
+
+        """
+        return self._time_slices[priority]
+
+    cpdef void register_queue(self, queue, handler, QueuePriority priority) except *:
+        """
+        Register the given queue to be run by the scheduler.
+
+        Queues with the same priority class are run in registration order.
+
+        Parameters
+        ----------
+        queue : LiveQueue
+            The queue to run.
+        handler : callable
+            The handler for each item taken from the queue.
+        priority : QueuePriority
+            The priority class for the queue.
+
+        Raises
+        ------
+        ValueError
+            If queue is already registered.
+
+        """
+        Condition.not_none(queue, "queue")
+        Condition.callable(handler, "handler")
+        cdef tuple entry
+        for entry in self._entries:
+            Condition.true(entry[1] is not queue, "queue was already registered")
+
+        # Replace rather than mutate the list, a pass may be iterating it
+        self._entries = sorted(self._entries + [(priority, queue, handler)], key=itemgetter(0))
+        queue.set_ready_event(self._ready)
+        self._ready.set()  # The queue may already have items
+
+    cpdef void deregister_queue(self, queue) except *:
+        """
+        Deregister the given queue from the scheduler (if registered).
+
+        Parameters
+        ----------
+        queue : LiveQueue
+            The queue to deregister.
+
+        """
+        Condition.not_none(queue, "queue")
+
+        cdef tuple entry
+        self._entries = [entry for entry in self._entries if entry[1] is not queue]
+        queue.set_ready_event(None)
+
+    cpdef void start(self) except *:
+        """
+        Start running the registered queues.
+        """
+        if self.is_running:
+            return
+
+        self.is_running = True
+        self._run_task = self._loop.create_task(self._run())
+
+        self._log.debug(f"Scheduled {self._run_task}")
+
+    cpdef void stop(self) except *:
+        """
+        Stop running the registered queues.
+        """
+        self.is_running = False
+        self._ready.set()  # Wake the run task to check `self.is_running`
+
+    async def _run(self):
+        self._log.debug("Scheduler starting...")
+        try:
+            while self.is_running:
+                if self._run_pass():
+                    await asyncio.sleep(0)  # Yield to the event loop between passes
+                else:
+                    # Nothing was handled so all queues are empty
+                    self._ready.clear()
+                    await self._ready.wait()
+        except CancelledError:
+            self._log.debug("Scheduler cancelled.")
+        else:
+            self._log.debug("Scheduler stopped.")
+
+    cdef inline bint _run_pass(self) except *:
+        # Each queue has the time slice of its class as a budget for the pass,
+        # time spent before a preemption is deducted from the budget.
+        cdef list entries = self._entries  # Deregistering replaces the list
+        cdef list budgets = [self._time_slices[entry[0]] for entry in entries]
+        cdef bint handled = False
+        cdef bint preempted
+        cdef int i = 0
+        cdef double deadline
+        while i < len(entries) and self.is_running:
+            priority, queue, handler = entries[i]
+            if queue.qsize() == 0 or budgets[i] <= 0:
+                i += 1
+                continue
+
+            preempted = False
+            deadline = time.perf_counter() + budgets[i]
+            while queue.qsize() > 0:
+                handler(queue.get_nowait())
+                handled = True
+                self.handled_count += 1
+                if time.perf_counter() >= deadline:
+                    break
+                if self._higher_pending(entries, budgets, i):
+                    preempted = True
+                    break
+
+            budgets[i] = deadline - time.perf_counter()
+            if preempted:
+                i = 0  # Return to the highest priority class
+            else:
+                i += 1
+
+        return handled
+
+    cdef inline bint _higher_pending(self, list entries, list budgets, int index) except *:
+        cdef int i
+        for i in range(index):
+            if budgets[i] > 0 and entries[i][1].qsize() > 0:
+                return True
+        return False
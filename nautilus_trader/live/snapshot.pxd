@@ -0,0 +1,36 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2021 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from nautilus_trader.common.logging cimport LoggerAdapter
+from nautilus_trader.model.identifiers cimport Venue
+from nautilus_trader.serialization.serializers cimport MsgPackInstrumentSerializer
+
+
+cpdef list changed_instruments(dict previous, dict current)
+cpdef list removed_instruments(dict previous, dict current)
+
+
+cdef class InstrumentSnapshotCache:
+    cdef LoggerAdapter _log
+    cdef MsgPackInstrumentSerializer _serializer
+
+    cdef readonly Venue venue
+    """The venue of the cached instruments.\n\n:returns: `Venue`"""
+    cdef readonly str file_path
+    """The file path of the snapshot.\n\n:returns: `str`"""
+
+    cpdef dict load(self)
+    cpdef void save(self, dict instruments) except *
+    cpdef void clear(self) except *
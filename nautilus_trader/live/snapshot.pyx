@@ -0,0 +1,214 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2021 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import os
+
+import msgpack
+
+from nautilus_trader import __version__
+
+from nautilus_trader.common.logging cimport Logger
+from nautilus_trader.common.logging cimport LoggerAdapter
+from nautilus_trader.core.correctness cimport Condition
+from nautilus_trader.model.identifiers cimport Symbol
+from nautilus_trader.model.identifiers cimport Venue
+from nautilus_trader.model.instrument cimport Instrument
+from nautilus_trader.serialization.serializers cimport MsgPackInstrumentSerializer
+
+
+SNAPSHOT_FILE_SUFFIX = ".instruments.msgpack"
+SNAPSHOT_VERSION = 2  # Increment when the snapshot layout changes
+
+
+cpdef list changed_instruments(dict previous, dict current):
+    """
+    Return the instruments which are new or changed between the given loads.
+
+    An instrument is changed if the venue definition it was parsed from
+    (`Instrument.info`) differs.
+
+    Parameters
+    ----------
+    previous : dict[Symbol, Instrument]
+        The previously loaded instruments.
+    current : dict[Symbol, Instrument]
+        The currently loaded instruments.
+
+    Returns
+    -------
+    list[Instrument]
+
+    """
+    Condition.not_none(previous, "previous")
+    Condition.not_none(current, "current")
+
+    cdef list changed = []
+    cdef Symbol symbol
+    cdef Instrument instrument
+    cdef Instrument previous_instrument
+    for symbol, instrument in current.items():
+        previous_instrument = previous.get(symbol)
+        if previous_instrument is None or previous_instrument.info != instrument.info:
+            changed.append(instrument)
+
+    return changed
+
+
+cpdef list removed_instruments(dict previous, dict current):
+    """
+    Return the symbols of the instruments which were removed between the given
+    loads (such as instruments delisted by the venue).
+
+    Parameters
+    ----------
+    previous : dict[Symbol, Instrument]
+        The previously loaded instruments.
+    current : dict[Symbol, Instrument]
+        The currently loaded instruments.
+
+    Returns
+    -------
+    list[Symbol]
+
+    """
+    Condition.not_none(previous, "previous")
+    Condition.not_none(current, "current")
+
+    return [symbol for symbol in previous if symbol not in current]
+
+
+cdef class InstrumentSnapshotCache:
+    """
+    Provides a local file cache of the parsed instruments for a venue.
+
+    Instrument providers save a snapshot after loading all instruments from
+    the venue, so on the next start the instruments can be loaded from the
+    snapshot while the venue is queried in the background. Snapshots written
+    by a different version are ignored.
+
+    Snapshots are written with the `MessagePack` instrument serializer, so
+    loading a snapshot never executes code from the file.
+    """
+
+    def __init__(
+        self,
+        str path not None,
+        Venue venue not None,
+        Logger logger not None,
+    ):
+        """
+        Initialize a new instance of the `InstrumentSnapshotCache` class.
+
+        Parameters
+        ----------
+        path : str
+            The directory path for the snapshot file.
+        venue : Venue
+            The venue of the cached instruments.
+        logger : Logger
+            The logger for the cache.
+
+        Raises
+        ------
+        ValueError
+            If path is not a valid string.
+
+        """
+        Condition.valid_string(path, "path")
+
+        self._log = LoggerAdapter(component_name=type(self).__name__, logger=logger)
+        self._serializer = MsgPackInstrumentSerializer()
+
+        self.venue = venue
+        self.file_path = os.path.join(path, f"{venue.value.lower()}{SNAPSHOT_FILE_SUFFIX}")
+
+    cpdef dict load(self):
+        """
+        Load the instruments from the snapshot.
+
+        If the snapshot does not exist, cannot be read or was written by a
+        different version then will return an empty dict.
+
+        Returns
+        -------
+        dict[Symbol, Instrument]
+
+        """
+        if not os.path.exists(self.file_path):
+            return {}
+
+        try:
+            with open(self.file_path, "rb") as snapshot_file:
+                snapshot = msgpack.unpackb(snapshot_file.read())
+        except Exception as ex:
+            self._log.warning(f"Cannot read instrument snapshot {self.file_path}, {ex}.")
+            return {}
+
+        if not isinstance(snapshot, dict) \
+                or snapshot.get("version") != SNAPSHOT_VERSION \
+                or snapshot.get("nautilus_trader") != __version__ \
+                or snapshot.get("venue") != self.venue.value:
+            self._log.info(f"Ignoring stale instrument snapshot {self.file_path}.")
+            return {}
+
+        cdef dict instruments = {}
+        cdef Instrument instrument
+        try:
+            for instrument_bytes in snapshot["instruments"]:
+                instrument = self._serializer.deserialize(instrument_bytes)
+                instruments[instrument.symbol] = instrument
+        except Exception as ex:
+            self._log.warning(f"Cannot read instrument snapshot {self.file_path}, {ex}.")
+            return {}
+
+        return instruments
+
+    cpdef void save(self, dict instruments) except *:
+        """
+        Save the given instruments as the snapshot.
+
+        The snapshot is replaced atomically, so a concurrent or interrupted
+        save never leaves a partial snapshot.
+
+        Parameters
+        ----------
+        instruments : dict[Symbol, Instrument]
+            The instruments to save.
+
+        """
+        Condition.not_none(instruments, "instruments")
+
+        cdef dict snapshot = {
+            "version": SNAPSHOT_VERSION,
+            "nautilus_trader": __version__,
+            "venue": self.venue.value,
+            "instruments": [self._serializer.serialize(i) for i in instruments.values()],
+        }
+
+        cdef str temp_path = f"{self.file_path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.file_path), exist_ok=True)
+            with open(temp_path, "wb") as snapshot_file:
+                snapshot_file.write(msgpack.packb(snapshot))
+            os.replace(temp_path, self.file_path)
+        except OSError as ex:
+            self._log.warning(f"Cannot write instrument snapshot {self.file_path}, {ex}.")
+
+    cpdef void clear(self) except *:
+        """
+        Remove the snapshot.
+        """
+        if os.path.exists(self.file_path):
+            os.remove(self.file_path)
@@ -60,11 +60,14 @@ cdef class Bar:
     """The close price of the bar.\n\n:returns: `Price`"""
     cdef readonly Quantity volume
     """The volume of the bar.\n\n:returns: `Quantity`"""
-    cdef readonly datetime timestamp
-    """The timestamp the bar closed at.\n\n:returns: `datetime`"""
+    cdef datetime _timestamp
+    cdef readonly long long timestamp_ns
+    """The UNIX timestamp (nanoseconds) the bar closed at.\n\n:returns: `int`"""
     cdef readonly bint checked
     """If the input values were integrity checked.\n\n:returns: `bool`"""
 
+    cdef datetime timestamp_c(self)
+
     @staticmethod
     cdef Bar from_serializable_string_c(str value)
     cpdef str to_serializable_string(self)
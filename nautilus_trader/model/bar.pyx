@@ -19,6 +19,8 @@ from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.core.datetime cimport format_iso8601
 from nautilus_trader.core.datetime cimport to_posix_ms
 from nautilus_trader.core.datetime cimport from_posix_ms
+from nautilus_trader.core.datetime cimport from_unix_nanos
+from nautilus_trader.core.datetime cimport to_unix_nanos
 from nautilus_trader.model.c_enums.bar_aggregation cimport BarAggregation
 from nautilus_trader.model.c_enums.bar_aggregation cimport BarAggregationParser
 from nautilus_trader.model.c_enums.price_type cimport PriceType
@@ -296,8 +298,9 @@ cdef class Bar:
         Price low_price not None,
         Price close_price not None,
         Quantity volume not None,
-        datetime timestamp not None,
+        datetime timestamp=None,
         bint check=False,
+        long long timestamp_ns=0,
     ):
         """
         Initialize a new instance of the `Bar` class.
@@ -314,10 +317,13 @@ cdef class Bar:
             The bars close price.
         volume : Quantity
             The bars volume.
-        timestamp : datetime
-            The bars timestamp (UTC).
+        timestamp : datetime, optional
+            The bars timestamp (UTC), if None then created from timestamp_ns
+            when first accessed.
         check : bool
             If bar parameters should be checked valid.
+        timestamp_ns : int, optional
+            The bars UNIX timestamp (nanoseconds), used if timestamp is None.
 
         Raises
         ------
@@ -339,7 +345,8 @@ cdef class Bar:
         self.low = low_price
         self.close = close_price
         self.volume = volume
-        self.timestamp = timestamp
+        self._timestamp = timestamp
+        self.timestamp_ns = to_unix_nanos(timestamp) if timestamp is not None else timestamp_ns
         self.checked = check
 
     def __eq__(self, Bar other) -> bool:
@@ -348,11 +355,28 @@ cdef class Bar:
             and self.low == other.low \
             and self.close == other.close \
             and self.volume == other.volume \
-            and self.timestamp == other.timestamp
+            and self.timestamp_ns == other.timestamp_ns
 
     def __ne__(self, Bar other) -> bool:
         return not self == other
 
+    @property
+    def timestamp(self):
+        """
+        The timestamp the bar closed at.
+
+        Returns
+        -------
+        datetime
+
+        """
+        return self.timestamp_c()
+
+    cdef datetime timestamp_c(self):
+        if self._timestamp is None:
+            self._timestamp = from_unix_nanos(self.timestamp_ns)
+        return self._timestamp
+
     def __str__(self) -> str:
         return f"{self.open},{self.high},{self.low},{self.close},{self.volume},{format_iso8601(self.timestamp)}"
 
@@ -29,6 +29,10 @@ from nautilus_trader.model.order cimport Order
 cdef class VenueCommand(Command):
     cdef readonly Venue venue
     """The venue the command relates to.\n\n:returns: `Venue`"""
+    cdef public long long origin_ns
+    """The receive stamp of the tick which led to the command, zero if none (nanoseconds).\n\n:returns: `int`"""
+    cdef public long long stage_ns
+    """The monotonic stamp when the commands last latency stage ended (nanoseconds).\n\n:returns: `int`"""
 
 
 cdef class SubmitOrder(VenueCommand):
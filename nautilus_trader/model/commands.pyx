@@ -55,6 +55,8 @@ cdef class VenueCommand(Command):
         super().__init__(command_id, command_timestamp)
 
         self.venue = venue
+        self.origin_ns = 0  # Stamped when latency statistics are enabled
+        self.stage_ns = 0   # Stamped when latency statistics are enabled
 
 
 cdef class SubmitOrder(VenueCommand):
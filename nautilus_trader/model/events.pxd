@@ -47,9 +47,26 @@ cdef class AccountState(Event):
     """The additional implementation specific account information.\n\n:returns: `dict[str, object]`"""
 
 
+cdef enum OrderEventType:
+    UNDEFINED_ORDER_EVENT = 0,
+    ORDER_INITIALIZED = 1,
+    ORDER_INVALID = 2,
+    ORDER_DENIED = 3,
+    ORDER_SUBMITTED = 4,
+    ORDER_REJECTED = 5,
+    ORDER_ACCEPTED = 6,
+    ORDER_WORKING = 7,
+    ORDER_CANCEL_REJECT = 8,
+    ORDER_CANCELLED = 9,
+    ORDER_MODIFIED = 10,
+    ORDER_EXPIRED = 11,
+    ORDER_FILLED = 12
+
+
 cdef class OrderEvent(Event):
     cdef readonly ClientOrderId cl_ord_id
     """The client order identifier associated with the event.\n\n:returns: `ClientOrderId`"""
+    cdef OrderEventType type_code
 
 
 cdef class OrderInitialized(OrderEvent):
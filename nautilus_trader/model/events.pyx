@@ -119,6 +119,7 @@ cdef class OrderEvent(Event):
         super().__init__(event_id, event_timestamp)
 
         self.cl_ord_id = cl_ord_id
+        self.type_code = OrderEventType.UNDEFINED_ORDER_EVENT
 
 
 cdef class OrderInitialized(OrderEvent):
@@ -184,6 +185,7 @@ cdef class OrderInitialized(OrderEvent):
             event_timestamp,
         )
 
+        self.type_code = OrderEventType.ORDER_INITIALIZED
         self.cl_ord_id = cl_ord_id
         self.strategy_id = strategy_id
         self.symbol = symbol
@@ -237,6 +239,7 @@ cdef class OrderInvalid(OrderEvent):
             event_timestamp,
         )
 
+        self.type_code = OrderEventType.ORDER_INVALID
         self.reason = reason
 
     def __repr__(self) -> str:
@@ -285,6 +288,7 @@ cdef class OrderDenied(OrderEvent):
             event_timestamp,
         )
 
+        self.type_code = OrderEventType.ORDER_DENIED
         self.reason = reason
 
     def __repr__(self) -> str:
@@ -331,6 +335,7 @@ cdef class OrderSubmitted(OrderEvent):
             event_timestamp,
         )
 
+        self.type_code = OrderEventType.ORDER_SUBMITTED
         self.account_id = account_id
         self.submitted_time = submitted_time
 
@@ -386,6 +391,7 @@ cdef class OrderRejected(OrderEvent):
             event_timestamp,
         )
 
+        self.type_code = OrderEventType.ORDER_REJECTED
         self.account_id = account_id
         self.rejected_time = rejected_time
         self.reason = reason
@@ -437,6 +443,7 @@ cdef class OrderAccepted(OrderEvent):
             event_timestamp,
         )
 
+        self.type_code = OrderEventType.ORDER_ACCEPTED
         self.account_id = account_id
         self.order_id = order_id
         self.accepted_time = accepted_time
@@ -523,6 +530,7 @@ cdef class OrderWorking(OrderEvent):
             event_timestamp,
         )
 
+        self.type_code = OrderEventType.ORDER_WORKING
         self.account_id = account_id
         self.order_id = order_id
         self.symbol = symbol
@@ -598,6 +606,7 @@ cdef class OrderCancelReject(OrderEvent):
             event_timestamp,
         )
 
+        self.type_code = OrderEventType.ORDER_CANCEL_REJECT
         self.account_id = account_id
         self.rejected_time = rejected_time
         self.response_to = response_to
@@ -652,6 +661,7 @@ cdef class OrderCancelled(OrderEvent):
             event_timestamp,
         )
 
+        self.type_code = OrderEventType.ORDER_CANCELLED
         self.account_id = account_id
         self.order_id = order_id
         self.cancelled_time = cancelled_time
@@ -710,6 +720,7 @@ cdef class OrderModified(OrderEvent):
             event_timestamp,
         )
 
+        self.type_code = OrderEventType.ORDER_MODIFIED
         self.account_id = account_id
         self.order_id = order_id
         self.quantity = quantity
@@ -765,6 +776,7 @@ cdef class OrderExpired(OrderEvent):
             event_timestamp,
         )
 
+        self.type_code = OrderEventType.ORDER_EXPIRED
         self.account_id = account_id
         self.order_id = order_id
         self.expired_time = expired_time
@@ -862,6 +874,7 @@ cdef class OrderFilled(OrderEvent):
             event_timestamp,
         )
 
+        self.type_code = OrderEventType.ORDER_FILLED
         self.account_id = account_id
         self.order_id = order_id
         self.execution_id = execution_id
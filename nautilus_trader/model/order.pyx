@@ -23,6 +23,7 @@ from cpython.datetime cimport datetime
 from nautilus_trader.core.constants cimport *  # str constants only
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.core.datetime cimport format_iso8601
+from nautilus_trader.core.fsm cimport StateTransitionTable
 from nautilus_trader.core.uuid cimport UUID
 from nautilus_trader.model.c_enums.liquidity_side cimport LiquiditySide
 from nautilus_trader.model.c_enums.order_side cimport OrderSide
@@ -37,6 +38,7 @@ from nautilus_trader.model.events cimport OrderAccepted
 from nautilus_trader.model.events cimport OrderCancelled
 from nautilus_trader.model.events cimport OrderDenied
 from nautilus_trader.model.events cimport OrderEvent
+from nautilus_trader.model.events cimport OrderEventType
 from nautilus_trader.model.events cimport OrderExpired
 from nautilus_trader.model.events cimport OrderFilled
 from nautilus_trader.model.events cimport OrderInitialized
@@ -89,6 +91,9 @@ cdef dict _ORDER_STATE_TABLE = {
     (OrderState.PARTIALLY_FILLED, OrderState.FILLED): OrderState.FILLED,
 }
 
+# Compiled once and shared by every order FSM
+cdef StateTransitionTable _ORDER_STATE_TRANSITIONS = StateTransitionTable(_ORDER_STATE_TABLE)
+
 
 cdef class Order:
     """
@@ -110,7 +115,7 @@ cdef class Order:
         self._events = [event]    # type: list[OrderEvent]
         self._execution_ids = []  # type: list[ExecutionId]
         self._fsm = FiniteStateMachine(
-            state_transition_table=_ORDER_STATE_TABLE,
+            state_transition_table=_ORDER_STATE_TRANSITIONS,
             initial_state=OrderState.INITIALIZED,
             trigger_parser=OrderStateParser.to_str,  # order_state_to_str correct here
             state_parser=OrderStateParser.to_str,
@@ -377,35 +382,37 @@ cdef class Order:
         # Update events
         self._events.append(event)
 
-        # Handle event (FSM can raise InvalidStateTrigger)
-        if isinstance(event, OrderInvalid):
+        # Handle event (FSM can raise InvalidStateTrigger), dispatched on the
+        # events type code which compiles to a switch.
+        cdef OrderEventType type_code = event.type_code
+        if type_code == OrderEventType.ORDER_INVALID:
             self._fsm.trigger(OrderState.INVALID)
             self._invalid(event)
-        elif isinstance(event, OrderDenied):
+        elif type_code == OrderEventType.ORDER_DENIED:
             self._fsm.trigger(OrderState.DENIED)
             self._denied(event)
-        elif isinstance(event, OrderSubmitted):
+        elif type_code == OrderEventType.ORDER_SUBMITTED:
             self._fsm.trigger(OrderState.SUBMITTED)
             self._submitted(event)
-        elif isinstance(event, OrderRejected):
+        elif type_code == OrderEventType.ORDER_REJECTED:
             self._fsm.trigger(OrderState.REJECTED)
             self._rejected(event)
-        elif isinstance(event, OrderAccepted):
+        elif type_code == OrderEventType.ORDER_ACCEPTED:
             self._fsm.trigger(OrderState.ACCEPTED)
             self._accepted(event)
-        elif isinstance(event, OrderWorking):
+        elif type_code == OrderEventType.ORDER_WORKING:
             self._fsm.trigger(OrderState.WORKING)
             self._working(event)
-        elif isinstance(event, OrderCancelled):
+        elif type_code == OrderEventType.ORDER_CANCELLED:
             self._fsm.trigger(OrderState.CANCELLED)
             self._cancelled(event)
-        elif isinstance(event, OrderExpired):
+        elif type_code == OrderEventType.ORDER_EXPIRED:
             self._fsm.trigger(OrderState.EXPIRED)
             self._expired(event)
-        elif isinstance(event, OrderModified):
+        elif type_code == OrderEventType.ORDER_MODIFIED:
             self._fsm.trigger(OrderState.WORKING)
             self._modified(event)
-        elif isinstance(event, OrderFilled):
+        elif type_code == OrderEventType.ORDER_FILLED:
             leaves_qty: Decimal = self.quantity - self.filled_qty - event.fill_qty
             if leaves_qty > 0:
                 self._fsm.trigger(OrderState.PARTIALLY_FILLED)
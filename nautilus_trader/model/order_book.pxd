@@ -0,0 +1,65 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2021 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from cpython.datetime cimport datetime
+
+from nautilus_trader.model.c_enums.order_side cimport OrderSide
+from nautilus_trader.model.identifiers cimport Symbol
+from nautilus_trader.model.objects cimport Price
+from nautilus_trader.model.objects cimport Quantity
+from nautilus_trader.model.tick cimport Tick
+
+
+cdef class OrderBookDelta(Tick):
+    cdef readonly OrderSide side
+    """The side of the book for the delta (BUY for bids, SELL for asks).\n\n:returns: `OrderSide`"""
+    cdef readonly Price price
+    """The price level for the delta.\n\n:returns: `Price`"""
+    cdef readonly Quantity size
+    """The new total size at the price level (zero removes the level).\n\n:returns: `Quantity`"""
+
+    @staticmethod
+    cdef OrderBookDelta from_serializable_string_c(Symbol symbol, str values)
+    cpdef str to_serializable_string(self)
+
+
+cdef class OrderBook:
+    cdef dict _bid_levels
+    cdef dict _ask_levels
+    cdef list _bid_heap
+    cdef list _ask_heap
+
+    cdef readonly Symbol symbol
+    """The order books symbol.\n\n:returns: `Symbol`"""
+    cdef readonly datetime timestamp
+    """The order books last update timestamp.\n\n:returns: `datetime` or None"""
+    cdef readonly int update_count
+    """The count of level updates applied to the order book.\n\n:returns: `int`"""
+
+    cpdef void apply(self, OrderBookDelta delta) except *
+    cpdef void update(self, OrderSide side, Price price, Quantity size) except *
+    cpdef void clear(self) except *
+    cpdef int bid_depth(self) except *
+    cpdef int ask_depth(self) except *
+    cpdef Price best_bid_price(self)
+    cpdef Price best_ask_price(self)
+    cpdef Quantity best_bid_qty(self)
+    cpdef Quantity best_ask_qty(self)
+    cpdef Quantity level_qty(self, OrderSide side, Price price)
+    cpdef list bids(self)
+    cpdef list asks(self)
+
+    cdef inline tuple _best_bid_level(self)
+    cdef inline tuple _best_ask_level(self)
@@ -0,0 +1,401 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2021 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from heapq import heapify
+from heapq import heappop
+from heapq import heappush
+
+from cpython.datetime cimport datetime
+
+from nautilus_trader.core.correctness cimport Condition
+from nautilus_trader.core.datetime cimport format_iso8601
+from nautilus_trader.core.datetime cimport from_posix_ms
+from nautilus_trader.core.datetime cimport to_posix_ms
+from nautilus_trader.model.c_enums.order_side cimport OrderSide
+from nautilus_trader.model.c_enums.order_side cimport OrderSideParser
+from nautilus_trader.model.identifiers cimport Symbol
+from nautilus_trader.model.objects cimport Price
+from nautilus_trader.model.objects cimport Quantity
+from nautilus_trader.model.tick cimport Tick
+
+
+cdef int _HEAP_SLACK = 16  # Stale heap keys tolerated before a rebuild
+
+
+cdef class OrderBookDelta(Tick):
+    """
+    Represents an update to a single price level of an L2 order book.
+
+    The size is the new total size resting at the price level, a zero size
+    removes the level from the book.
+    """
+
+    def __init__(
+        self,
+        Symbol symbol not None,
+        OrderSide side,
+        Price price not None,
+        Quantity size not None,
+        datetime timestamp=None,
+        long long timestamp_ns=0,
+    ):
+        """
+        Initialize a new instance of the `OrderBookDelta` class.
+
+        Parameters
+        ----------
+        symbol : Symbol
+            The ticker symbol.
+        side : OrderSide
+            The side of the book (BUY for bids, SELL for asks).
+        price : Price
+            The price level.
+        size : Quantity
+            The new total size at the price level.
+        timestamp : datetime, optional
+            The delta timestamp (UTC), if None then created from timestamp_ns
+            when first accessed.
+        timestamp_ns : int, optional
+            The delta UNIX timestamp (nanoseconds), used if timestamp is None.
+
+        Raises
+        ------
+        ValueError
+            If side is UNDEFINED.
+
+        """
+        Condition.not_equal(side, OrderSide.UNDEFINED, "side", "UNDEFINED")
+        super().__init__(symbol, timestamp, timestamp_ns)
+
+        self.side = side
+        self.price = price
+        self.size = size
+
+    def __str__(self) -> str:
+        return (f"{self.symbol},"
+                f"{OrderSideParser.to_str(self.side)},"
+                f"{self.price},"
+                f"{self.size},"
+                f"{format_iso8601(self.timestamp)}")
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self})"
+
+    @staticmethod
+    cdef OrderBookDelta from_serializable_string_c(Symbol symbol, str values):
+        Condition.not_none(symbol, 'symbol')
+        Condition.valid_string(values, 'values')
+
+        cdef list pieces = values.split(',', maxsplit=3)
+
+        if len(pieces) != 4:
+            raise ValueError(f"The OrderBookDelta string value was malformed, was {values}")
+
+        return OrderBookDelta(
+            symbol,
+            OrderSideParser.from_str(pieces[0]),
+            Price(pieces[1]),
+            Quantity(pieces[2]),
+            from_posix_ms(long(pieces[3])),
+        )
+
+    @staticmethod
+    def from_serializable_string(Symbol symbol, str values):
+        """
+        Parse a delta from the given symbol and values string.
+
+        Parameters
+        ----------
+        symbol : Symbol
+            The delta symbol.
+        values : str
+            The delta values string.
+
+        Returns
+        -------
+        OrderBookDelta
+
+        Raises
+        ------
+        ValueError
+            If values is not a valid string.
+
+        """
+        return OrderBookDelta.from_serializable_string_c(symbol, values)
+
+    cpdef str to_serializable_string(self):
+        """
+        The serializable string representation of this object.
+
+        Returns
+        -------
+        str
+
+        """
+        return (f"{OrderSideParser.to_str(self.side)},"
+                f"{self.price},"
+                f"{self.size},"
+                f"{to_posix_ms(self.timestamp)}")
+
+
+cdef class OrderBook:
+    """
+    Represents an L2 (aggregated by price level) order book for a symbol.
+
+    Each side holds a dictionary of levels keyed by price along with a heap of
+    level keys (bid keys are stored negated so both heaps are best-first).
+    Adding a level is O(log n), changing or removing a level is O(1) and level
+    lookups are O(1). Keys of removed levels are discarded lazily when they
+    reach the top of the heap, so best prices are amortized O(log n). Ordered
+    levels are sorted on demand in O(n log n).
+    """
+
+    def __init__(self, Symbol symbol not None):
+        """
+        Initialize a new instance of the `OrderBook` class.
+
+        Parameters
+        ----------
+        symbol : Symbol
+            The symbol for the order book.
+
+        """
+        self.symbol = symbol
+        self.timestamp = None
+        self.update_count = 0
+
+        self._bid_levels = {}  # type: {float, (Price, Quantity)}
+        self._ask_levels = {}  # type: {float, (Price, Quantity)}
+        self._bid_heap = []    # type: [float] (negated prices heap)
+        self._ask_heap = []    # type: [float] (prices heap)
+
+    def __str__(self) -> str:
+        return (f"{type(self).__name__}("
+                f"{self.symbol}, "
+                f"bid={self.best_bid_price()}x{self.best_bid_qty()}, "
+                f"ask={self.best_ask_price()}x{self.best_ask_qty()}, "
+                f"depth={len(self._bid_levels)}/{len(self._ask_levels)})")
+
+    def __repr__(self) -> str:
+        return f"<{str(self)} object at {id(self)}>"
+
+    cpdef void apply(self, OrderBookDelta delta) except *:
+        """
+        Apply the given order book delta to the order book.
+
+        Parameters
+        ----------
+        delta : OrderBookDelta
+            The delta to apply.
+
+        Raises
+        ------
+        ValueError
+            If delta.symbol is not equal to the order books symbol.
+
+        """
+        Condition.not_none(delta, "delta")
+        Condition.equal(delta.symbol, self.symbol, "delta.symbol", "self.symbol")
+
+        self.update(delta.side, delta.price, delta.size)
+        self.timestamp = delta.timestamp
+
+    cpdef void update(self, OrderSide side, Price price, Quantity size) except *:
+        """
+        Set the total size at the given price level, a zero size removes the level.
+
+        Parameters
+        ----------
+        side : OrderSide
+            The side of the book (BUY for bids, SELL for asks).
+        price : Price
+            The price level.
+        size : Quantity
+            The new total size at the price level.
+
+        """
+        Condition.not_none(price, "price")
+        Condition.not_none(size, "size")
+
+        cdef double key = price.as_double()
+        cdef double heap_key
+        cdef dict levels
+        cdef list heap
+        if side == OrderSide.BUY:
+            levels = self._bid_levels
+            heap = self._bid_heap
+            heap_key = -key
+        elif side == OrderSide.SELL:
+            levels = self._ask_levels
+            heap = self._ask_heap
+            heap_key = key
+        else:
+            raise ValueError(f"Invalid side, was {OrderSideParser.to_str(side)}")
+
+        if size.as_double() == 0:
+            if key in levels:
+                del levels[key]  # Heap key is discarded lazily
+                if len(heap) > 2 * len(levels) + _HEAP_SLACK:
+                    # Rebuild from the live levels to bound stale keys
+                    heap[:] = [-k for k in levels] if side == OrderSide.BUY else list(levels)
+                    heapify(heap)
+        else:
+            if key not in levels:
+                heappush(heap, heap_key)
+            levels[key] = (price, size)
+
+        self.update_count += 1
+
+    cpdef void clear(self) except *:
+        """
+        Clear all levels from the order book.
+        """
+        self._bid_levels.clear()
+        self._ask_levels.clear()
+        self._bid_heap.clear()
+        self._ask_heap.clear()
+
+    cpdef int bid_depth(self) except *:
+        """
+        Return the count of bid price levels.
+
+        Returns
+        -------
+        int
+
+        """
+        return len(self._bid_levels)
+
+    cpdef int ask_depth(self) except *:
+        """
+        Return the count of ask price levels.
+
+        Returns
+        -------
+        int
+
+        """
+        return len(self._ask_levels)
+
+    cpdef Price best_bid_price(self):
+        """
+        Return the best bid price in the order book (if any).
+
+        Returns
+        -------
+        Price or None
+
+        """
+        cdef tuple level = self._best_bid_level()
+        return None if level is None else level[0]
+
+    cpdef Price best_ask_price(self):
+        """
+        Return the best ask price in the order book (if any).
+
+        Returns
+        -------
+        Price or None
+
+        """
+        cdef tuple level = self._best_ask_level()
+        return None if level is None else level[0]
+
+    cpdef Quantity best_bid_qty(self):
+        """
+        Return the size at the best bid price in the order book (if any).
+
+        Returns
+        -------
+        Quantity or None
+
+        """
+        cdef tuple level = self._best_bid_level()
+        return None if level is None else level[1]
+
+    cpdef Quantity best_ask_qty(self):
+        """
+        Return the size at the best ask price in the order book (if any).
+
+        Returns
+        -------
+        Quantity or None
+
+        """
+        cdef tuple level = self._best_ask_level()
+        return None if level is None else level[1]
+
+    cpdef Quantity level_qty(self, OrderSide side, Price price):
+        """
+        Return the size resting at the given price level.
+
+        Parameters
+        ----------
+        side : OrderSide
+            The side of the book (BUY for bids, SELL for asks).
+        price : Price
+            The price level.
+
+        Returns
+        -------
+        Quantity
+            Zero if no level exists at the price.
+
+        """
+        Condition.not_none(price, "price")
+
+        cdef dict levels = self._bid_levels if side == OrderSide.BUY else self._ask_levels
+        cdef tuple level = levels.get(price.as_double())
+        if level is None:
+            return Quantity()
+        return level[1]
+
+    cpdef list bids(self):
+        """
+        Return the bid levels ordered best (highest) price first.
+
+        Returns
+        -------
+        list[(Price, Quantity)]
+
+        """
+        cdef dict levels = self._bid_levels
+        return [levels[key] for key in sorted(levels, reverse=True)]
+
+    cpdef list asks(self):
+        """
+        Return the ask levels ordered best (lowest) price first.
+
+        Returns
+        -------
+        list[(Price, Quantity)]
+
+        """
+        cdef dict levels = self._ask_levels
+        return [levels[key] for key in sorted(levels)]
+
+    cdef inline tuple _best_bid_level(self):
+        cdef list heap = self._bid_heap
+        cdef dict levels = self._bid_levels
+        while heap and -heap[0] not in levels:
+            heappop(heap)  # Discard the key of a removed level
+        return levels[-heap[0]] if heap else None
+
+    cdef inline tuple _best_ask_level(self):
+        cdef list heap = self._ask_heap
+        cdef dict levels = self._ask_levels
+        while heap and heap[0] not in levels:
+            heappop(heap)  # Discard the key of a removed level
+        return levels[heap[0]] if heap else None
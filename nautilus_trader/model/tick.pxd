@@ -26,8 +26,15 @@ from nautilus_trader.model.objects cimport Quantity
 cdef class Tick:
     cdef readonly Symbol symbol
     """The ticks symbol.\n\n:returns: `Symbol`"""
-    cdef readonly datetime timestamp
-    """The ticks timestamp.\n\n:returns: `datetime`"""
+    cdef datetime _timestamp
+    cdef readonly long long timestamp_ns
+    """The ticks UNIX timestamp (nanoseconds).\n\n:returns: `int`"""
+    cdef public long long recv_ns
+    """The monotonic stamp when the tick was received, zero if not stamped (nanoseconds).\n\n:returns: `int`"""
+    cdef public long long stage_ns
+    """The monotonic stamp when the ticks last latency stage ended (nanoseconds).\n\n:returns: `int`"""
+
+    cdef datetime timestamp_c(self)
 
 
 cdef class QuoteTick(Tick):
@@ -18,7 +18,9 @@ from cpython.datetime cimport datetime
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.core.datetime cimport format_iso8601
 from nautilus_trader.core.datetime cimport from_posix_ms
+from nautilus_trader.core.datetime cimport from_unix_nanos
 from nautilus_trader.core.datetime cimport to_posix_ms
+from nautilus_trader.core.datetime cimport to_unix_nanos
 from nautilus_trader.model.c_enums.order_side cimport OrderSide
 from nautilus_trader.model.c_enums.order_side cimport OrderSideParser
 from nautilus_trader.model.c_enums.price_type cimport PriceType
@@ -39,7 +41,8 @@ cdef class Tick:
     def __init__(
         self,
         Symbol symbol not None,
-        datetime timestamp not None,
+        datetime timestamp=None,
+        long long timestamp_ns=0,
     ):
         """
         Initialize a new instance of the `QuoteTick` class.
@@ -48,30 +51,53 @@ cdef class Tick:
         ----------
         symbol : Symbol
             The ticker symbol.
-        timestamp : datetime
-            The tick timestamp (UTC).
+        timestamp : datetime, optional
+            The tick timestamp (UTC), if None then created from timestamp_ns
+            when first accessed.
+        timestamp_ns : int, optional
+            The tick UNIX timestamp (nanoseconds), used if timestamp is None.
 
         """
         self.symbol = symbol
-        self.timestamp = timestamp
+        self._timestamp = timestamp
+        self.timestamp_ns = to_unix_nanos(timestamp) if timestamp is not None else timestamp_ns
+        self.recv_ns = 0   # Stamped when latency statistics are enabled
+        self.stage_ns = 0  # Stamped when latency statistics are enabled
 
     def __eq__(self, Tick other) -> bool:
-        return self.timestamp == other.timestamp
+        return self.timestamp_ns == other.timestamp_ns
 
     def __ne__(self, Tick other) -> bool:
-        return self.timestamp != other.timestamp
+        return self.timestamp_ns != other.timestamp_ns
 
     def __lt__(self, Tick other) -> bool:
-        return self.timestamp < other.timestamp
+        return self.timestamp_ns < other.timestamp_ns
 
     def __le__(self, Tick other) -> bool:
-        return self.timestamp <= other.timestamp
+        return self.timestamp_ns <= other.timestamp_ns
 
     def __gt__(self, Tick other) -> bool:
-        return self.timestamp > other.timestamp
+        return self.timestamp_ns > other.timestamp_ns
 
     def __ge__(self, Tick other) -> bool:
-        return self.timestamp >= other.timestamp
+        return self.timestamp_ns >= other.timestamp_ns
+
+    @property
+    def timestamp(self):
+        """
+        The ticks timestamp.
+
+        Returns
+        -------
+        datetime
+
+        """
+        return self.timestamp_c()
+
+    cdef datetime timestamp_c(self):
+        if self._timestamp is None:
+            self._timestamp = from_unix_nanos(self.timestamp_ns)
+        return self._timestamp
 
 
 cdef class QuoteTick(Tick):
@@ -86,7 +112,8 @@ cdef class QuoteTick(Tick):
         Price ask not None,
         Quantity bid_size not None,
         Quantity ask_size not None,
-        datetime timestamp not None,
+        datetime timestamp=None,
+        long long timestamp_ns=0,
     ):
         """
         Initialize a new instance of the `QuoteTick` class.
@@ -103,11 +130,14 @@ cdef class QuoteTick(Tick):
             The size at the best bid.
         ask_size : Quantity
             The size at the best ask.
-        timestamp : datetime
-            The tick timestamp (UTC).
+        timestamp : datetime, optional
+            The tick timestamp (UTC), if None then created from timestamp_ns
+            when first accessed.
+        timestamp_ns : int, optional
+            The tick UNIX timestamp (nanoseconds), used if timestamp is None.
 
         """
-        super().__init__(symbol, timestamp)
+        super().__init__(symbol, timestamp, timestamp_ns)
 
         self.bid = bid
         self.ask = ask
@@ -238,7 +268,8 @@ cdef class TradeTick(Tick):
         Quantity size not None,
         OrderSide side,
         TradeMatchId match_id not None,
-        datetime timestamp not None,
+        datetime timestamp=None,
+        long long timestamp_ns=0,
     ):
         """
         Initialize a new instance of the `TradeTick` class.
@@ -255,8 +286,11 @@ cdef class TradeTick(Tick):
             The side of the trade.
         match_id : TradeMatchId
             The trade match identifier.
-        timestamp : datetime
-            The tick timestamp (UTC).
+        timestamp : datetime, optional
+            The tick timestamp (UTC), if None then created from timestamp_ns
+            when first accessed.
+        timestamp_ns : int, optional
+            The tick UNIX timestamp (nanoseconds), used if timestamp is None.
 
         Raises
         ------
@@ -265,7 +299,7 @@ cdef class TradeTick(Tick):
 
         """
         Condition.not_equal(side, OrderSide.UNDEFINED, "side", "UNDEFINED")
-        super().__init__(symbol, timestamp)
+        super().__init__(symbol, timestamp, timestamp_ns)
 
         self.price = price
         self.size = size
@@ -0,0 +1,57 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2021 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from cpython.datetime cimport datetime
+
+from nautilus_trader.common.clock cimport Clock
+from nautilus_trader.common.logging cimport LoggerAdapter
+from nautilus_trader.data.base cimport DataCacheFacade
+from nautilus_trader.model.commands cimport SubmitBracketOrder
+from nautilus_trader.model.commands cimport SubmitOrder
+from nautilus_trader.model.identifiers cimport Symbol
+from nautilus_trader.model.order cimport Order
+from nautilus_trader.trading.portfolio cimport PortfolioFacade
+
+
+cdef class RiskEngine:
+    cdef Clock _clock
+    cdef LoggerAdapter _log
+    cdef DataCacheFacade _data
+    cdef PortfolioFacade _portfolio
+    cdef dict _max_notionals
+    cdef dict _max_positions
+    cdef dict _price_bands
+    cdef object _order_rate_interval
+    cdef object _order_timestamps
+
+    cdef readonly int max_order_rate
+    """The maximum number of orders per order rate interval (0 for no limit).\n\n:returns: `int`"""
+    cdef readonly int check_count
+    """The total count of orders checked by the engine.\n\n:returns: `int`"""
+    cdef readonly int denied_count
+    """The total count of orders denied by the engine.\n\n:returns: `int`"""
+
+    cpdef void set_max_notional_per_order(self, Symbol symbol, new_value) except *
+    cpdef void set_max_position(self, Symbol symbol, new_value) except *
+    cpdef void set_price_band(self, Symbol symbol, new_value) except *
+    cpdef object max_notional_per_order(self, Symbol symbol)
+    cpdef object max_position(self, Symbol symbol)
+    cpdef object price_band(self, Symbol symbol)
+    cpdef str check_submit_order(self, SubmitOrder command)
+    cpdef str check_submit_bracket_order(self, SubmitBracketOrder command)
+    cpdef void reset(self) except *
+
+    cdef inline str _check_order(self, Order order)
+    cdef inline str _check_order_rate(self, datetime now)
@@ -0,0 +1,391 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2021 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+"""
+The `RiskEngine` is the pre-trade risk stage of the execution stack.
+
+Orders submitted by trading strategies are checked by the engine before being
+routed to an execution client. Orders failing a check are denied by the
+`ExecutionEngine` with an `OrderDenied` event.
+
+Each check runs in constant time against incrementally maintained state (the
+last quote held in the `DataCache`, the portfolios net positions and a fixed
+length window of order submission timestamps), so the cost of a check does not
+grow with the number of orders or positions held in the `ExecutionCache`.
+"""
+
+from collections import deque
+from datetime import timedelta
+from decimal import Decimal
+
+from cpython.datetime cimport datetime
+
+from nautilus_trader.common.clock cimport Clock
+from nautilus_trader.common.logging cimport Logger
+from nautilus_trader.common.logging cimport LoggerAdapter
+from nautilus_trader.core.correctness cimport Condition
+from nautilus_trader.data.base cimport DataCacheFacade
+from nautilus_trader.model.c_enums.order_side cimport OrderSide
+from nautilus_trader.model.commands cimport SubmitBracketOrder
+from nautilus_trader.model.commands cimport SubmitOrder
+from nautilus_trader.model.identifiers cimport Symbol
+from nautilus_trader.model.instrument cimport Instrument
+from nautilus_trader.model.objects cimport Money
+from nautilus_trader.model.objects cimport Price
+from nautilus_trader.model.order cimport Order
+from nautilus_trader.model.order cimport PassiveOrder
+from nautilus_trader.model.tick cimport QuoteTick
+from nautilus_trader.trading.portfolio cimport PortfolioFacade
+
+
+cdef class RiskEngine:
+    """
+    Provides a low-latency pre-trade risk engine.
+
+    The following checks are available, each is disabled until a limit is set:
+
+    - Maximum notional value per order (per symbol).
+    - Maximum absolute net position after the order (per symbol).
+    - Price band around the mid of the last quote for priced orders (per symbol).
+    - Maximum order submission rate (across all orders).
+    """
+
+    def __init__(
+        self,
+        DataCacheFacade cache not None,
+        PortfolioFacade portfolio not None,
+        Clock clock not None,
+        Logger logger not None,
+        dict config=None,
+    ):
+        """
+        Initialize a new instance of the `RiskEngine` class.
+
+        Parameters
+        ----------
+        cache : DataCacheFacade
+            The data cache for market prices and instruments.
+        portfolio : PortfolioFacade
+            The portfolio for net positions.
+        clock : Clock
+            The clock for the engine.
+        logger : Logger
+            The logger for the engine.
+        config : dict[str, object], optional
+            The configuration options.
+
+        Notes
+        -----
+        The config option `max_order_rate` limits the number of orders which
+        can be submitted within any `max_order_rate_interval` (seconds, default 1).
+
+        Raises
+        ------
+        ValueError
+            If max_order_rate is negative (< 0).
+        ValueError
+            If max_order_rate_interval is not positive (> 0).
+
+        """
+        if config is None:
+            config = {}
+        max_order_rate = config.get("max_order_rate", 0)
+        max_order_rate_interval = config.get("max_order_rate_interval", 1.0)
+        Condition.not_negative_int(max_order_rate, "max_order_rate")
+        Condition.positive(max_order_rate_interval, "max_order_rate_interval")
+
+        self._clock = clock
+        self._log = LoggerAdapter(type(self).__name__, logger)
+        self._data = cache
+        self._portfolio = portfolio
+
+        # Limits
+        self._max_notionals = {}  # type: dict[Symbol, Decimal]
+        self._max_positions = {}  # type: dict[Symbol, Decimal]
+        self._price_bands = {}    # type: dict[Symbol, Decimal]
+
+        # Throttle
+        self.max_order_rate = max_order_rate
+        self._order_rate_interval = timedelta(seconds=max_order_rate_interval)
+        self._order_timestamps = deque(maxlen=max_order_rate)  # type: deque[datetime]
+
+        # Counters
+        self.check_count = 0
+        self.denied_count = 0
+
+        self._log.info(f"max_order_rate={self.max_order_rate}/{self._order_rate_interval}")
+
+    cpdef void set_max_notional_per_order(self, Symbol symbol, new_value) except *:
+        """
+        Set the maximum notional value per order for the given symbol.
+
+        Parameters
+        ----------
+        symbol : Symbol
+            The symbol for the limit.
+        new_value : Decimal or int or str
+            The maximum notional value in the instruments settlement currency
+            (None to remove the limit).
+
+        Raises
+        ------
+        ValueError
+            If new_value is not None and not positive (> 0).
+
+        """
+        Condition.not_none(symbol, "symbol")
+
+        if new_value is None:
+            self._max_notionals.pop(symbol, None)
+        else:
+            new_value = Decimal(new_value)
+            Condition.positive(new_value, "new_value")
+            self._max_notionals[symbol] = new_value
+
+        self._log.info(f"Set {symbol} max_notional_per_order={new_value}.")
+
+    cpdef void set_max_position(self, Symbol symbol, new_value) except *:
+        """
+        Set the maximum absolute net position for the given symbol.
+
+        Parameters
+        ----------
+        symbol : Symbol
+            The symbol for the limit.
+        new_value : Decimal or int or str
+            The maximum absolute net position quantity (None to remove the limit).
+
+        Raises
+        ------
+        ValueError
+            If new_value is not None and negative (< 0).
+
+        """
+        Condition.not_none(symbol, "symbol")
+
+        if new_value is None:
+            self._max_positions.pop(symbol, None)
+        else:
+            new_value = Decimal(new_value)
+            Condition.not_negative(new_value, "new_value")
+            self._max_positions[symbol] = new_value
+
+        self._log.info(f"Set {symbol} max_position={new_value}.")
+
+    cpdef void set_price_band(self, Symbol symbol, new_value) except *:
+        """
+        Set the price band for the given symbol.
+
+        Orders with a price deviating from the mid of the last quote by more
+        than the band (as a fraction of the mid) will be denied.
+
+        Parameters
+        ----------
+        symbol : Symbol
+            The symbol for the limit.
+        new_value : Decimal or str
+            The price band as a fraction of the mid, e.g. '0.05' for 5%
+            (None to remove the limit).
+
+        Raises
+        ------
+        ValueError
+            If new_value is not None and not positive (> 0).
+
+        """
+        Condition.not_none(symbol, "symbol")
+
+        if new_value is None:
+            self._price_bands.pop(symbol, None)
+        else:
+            new_value = Decimal(new_value)
+            Condition.positive(new_value, "new_value")
+            self._price_bands[symbol] = new_value
+
+        self._log.info(f"Set {symbol} price_band={new_value}.")
+
+    cpdef object max_notional_per_order(self, Symbol symbol):
+        """
+        Return the maximum notional value per order for the given symbol.
+
+        Parameters
+        ----------
+        symbol : Symbol
+            The symbol for the query.
+
+        Returns
+        -------
+        Decimal or None
+
+        """
+        return self._max_notionals.get(symbol)
+
+    cpdef object max_position(self, Symbol symbol):
+        """
+        Return the maximum absolute net position for the given symbol.
+
+        Parameters
+        ----------
+        symbol : Symbol
+            The symbol for the query.
+
+        Returns
+        -------
+        Decimal or None
+
+        """
+        return self._max_positions.get(symbol)
+
+    cpdef object price_band(self, Symbol symbol):
+        """
+        Return the price band for the given symbol.
+
+        Parameters
+        ----------
+        symbol : Symbol
+            The symbol for the query.
+
+        Returns
+        -------
+        Decimal or None
+
+        """
+        return self._price_bands.get(symbol)
+
+    cpdef str check_submit_order(self, SubmitOrder command):
+        """
+        Check the given submit order command against the risk limits.
+
+        Parameters
+        ----------
+        command : SubmitOrder
+            The command to check.
+
+        Returns
+        -------
+        str or None
+            The reason the order should be denied, else None if passed.
+
+        """
+        Condition.not_none(command, "command")
+
+        cdef str reason = self._check_order(command.order)
+        if reason is None:
+            reason = self._check_order_rate(self._clock.utc_now())
+
+        self.check_count += 1
+        if reason is not None:
+            self.denied_count += 1
+            self._log.warning(f"Denied {command.order.cl_ord_id.value}: {reason}.")
+
+        return reason
+
+    cpdef str check_submit_bracket_order(self, SubmitBracketOrder command):
+        """
+        Check the given submit bracket order command against the risk limits.
+
+        Only the entry order is checked for notional and position limits as
+        the stop-loss and take-profit orders can only reduce the position.
+
+        Parameters
+        ----------
+        command : SubmitBracketOrder
+            The command to check.
+
+        Returns
+        -------
+        str or None
+            The reason the bracket order should be denied, else None if passed.
+
+        """
+        Condition.not_none(command, "command")
+
+        cdef str reason = self._check_order(command.bracket_order.entry)
+        if reason is None:
+            reason = self._check_order_rate(self._clock.utc_now())
+
+        self.check_count += 1
+        if reason is not None:
+            self.denied_count += 1
+            self._log.warning(f"Denied {command.bracket_order.id.value}: {reason}.")
+
+        return reason
+
+    cpdef void reset(self) except *:
+        """
+        Reset the risk engine by clearing all stateful values.
+
+        The configured limits are retained.
+        """
+        self._order_timestamps.clear()
+        self.check_count = 0
+        self.denied_count = 0
+
+    cdef inline str _check_order(self, Order order):
+        cdef Symbol symbol = order.symbol
+        max_notional = self._max_notionals.get(symbol)
+        max_position = self._max_positions.get(symbol)
+        price_band = self._price_bands.get(symbol)
+
+        if max_notional is None and max_position is None and price_band is None:
+            return None  # No limits for symbol
+
+        if max_position is not None:
+            net_position = self._portfolio.net_position(symbol)
+            if order.side == OrderSide.BUY:
+                projected = net_position + order.quantity
+            else:
+                projected = net_position - order.quantity
+            if abs(projected) > max_position and abs(projected) > abs(net_position):
+                return f"projected position {projected} exceeds max_position {max_position}"
+
+        if max_notional is None and price_band is None:
+            return None  # No price dependent limits for symbol
+
+        cdef QuoteTick last = self._data.quote_tick(symbol)
+        cdef Price price = order.price if isinstance(order, PassiveOrder) else None
+
+        if price_band is not None and price is not None:
+            if last is None:
+                return f"no quote for {symbol} to check price_band"
+            mid = (last.bid + last.ask) / 2
+            deviation = abs(price - mid) / mid
+            if deviation > price_band:
+                return f"price {price} outside price_band {price_band} of mid {mid}"
+
+        if max_notional is not None:
+            if price is None:
+                if last is None:
+                    return f"no quote for {symbol} to check max_notional"
+                price = last.ask if order.side == OrderSide.BUY else last.bid
+            instrument = self._data.instrument(symbol)
+            if instrument is None:
+                return f"no instrument for {symbol} to check max_notional"
+            notional = instrument.notional_value(order.quantity, price).as_decimal()
+            if notional > max_notional:
+                return f"notional {notional} exceeds max_notional_per_order {max_notional}"
+
+        return None
+
+    cdef inline str _check_order_rate(self, datetime now):
+        if self.max_order_rate == 0:
+            return None  # No throttle
+
+        if len(self._order_timestamps) == self.max_order_rate:
+            if now - self._order_timestamps[0] < self._order_rate_interval:
+                return f"order rate exceeds {self.max_order_rate} per {self._order_rate_interval}"
+
+        self._order_timestamps.append(now)
+        return None
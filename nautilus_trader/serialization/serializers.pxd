@@ -15,11 +15,25 @@
 
 from nautilus_trader.common.cache cimport IdentifierCache
 from nautilus_trader.core.cache cimport ObjectCache
+from nautilus_trader.model.currency cimport Currency
+from nautilus_trader.model.objects cimport Money
 from nautilus_trader.serialization.base cimport CommandSerializer
 from nautilus_trader.serialization.base cimport EventSerializer
+from nautilus_trader.serialization.base cimport InstrumentSerializer
 from nautilus_trader.serialization.base cimport OrderSerializer
 
 
+cdef class MsgPackInstrumentSerializer(InstrumentSerializer):
+    cdef ObjectCache symbol_cache
+
+    cdef inline list _pack_currency(self, Currency currency)
+    cdef inline Currency _unpack_currency(self, list values)
+    cdef inline str _pack_object(self, value)
+    cdef inline object _unpack_object(self, cls, str value)
+    cdef inline list _pack_money(self, Money money)
+    cdef inline Money _unpack_money(self, list values)
+
+
 cdef class MsgPackOrderSerializer(OrderSerializer):
     cdef ObjectCache symbol_cache
 
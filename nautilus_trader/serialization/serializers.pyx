@@ -15,6 +15,8 @@
 
 from cpython.datetime cimport datetime
 
+from decimal import Decimal
+
 import msgpack
 
 from nautilus_trader.common.cache cimport IdentifierCache
@@ -24,6 +26,9 @@ from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.core.message cimport Command
 from nautilus_trader.core.message cimport Event
 from nautilus_trader.core.uuid cimport UUID
+from nautilus_trader.model.c_enums.asset_class cimport AssetClassParser
+from nautilus_trader.model.c_enums.asset_type cimport AssetTypeParser
+from nautilus_trader.model.c_enums.currency_type cimport CurrencyTypeParser
 from nautilus_trader.model.c_enums.liquidity_side cimport LiquiditySideParser
 from nautilus_trader.model.c_enums.order_side cimport OrderSide
 from nautilus_trader.model.c_enums.order_side cimport OrderSideParser
@@ -56,6 +61,7 @@ from nautilus_trader.model.identifiers cimport PositionId
 from nautilus_trader.model.identifiers cimport StrategyId
 from nautilus_trader.model.identifiers cimport Symbol
 from nautilus_trader.model.identifiers cimport Venue
+from nautilus_trader.model.instrument cimport Instrument
 from nautilus_trader.model.objects cimport Money
 from nautilus_trader.model.objects cimport Quantity
 from nautilus_trader.model.objects cimport Price
@@ -68,6 +74,7 @@ from nautilus_trader.model.order cimport StopMarketOrder
 from nautilus_trader.serialization.parsing cimport ObjectParser
 from nautilus_trader.serialization.base cimport CommandSerializer
 from nautilus_trader.serialization.base cimport EventSerializer
+from nautilus_trader.serialization.base cimport InstrumentSerializer
 from nautilus_trader.serialization.base cimport OrderSerializer
 
 
@@ -115,6 +122,150 @@ cdef class MsgPackSerializer:
         return msgpack.unpackb(message_bytes)
 
 
+cdef class MsgPackInstrumentSerializer(InstrumentSerializer):
+    """
+    Provides an `Instrument` serializer for the MessagePack specification.
+
+    """
+
+    def __init__(self):
+        """
+        Initialize a new instance of the `MsgPackInstrumentSerializer` class.
+
+        """
+        super().__init__()
+
+        self.symbol_cache = ObjectCache(Symbol, Symbol.from_str_c)
+
+    cpdef bytes serialize(self, Instrument instrument):
+        """
+        Return the serialized MessagePack specification bytes from the given instrument.
+
+        Parameters
+        ----------
+        instrument : Instrument
+            The instrument to serialize.
+
+        Returns
+        -------
+        bytes
+
+        """
+        Condition.not_none(instrument, "instrument")
+
+        cdef dict package = {
+            SYMBOL: instrument.symbol.value,
+            ASSET_CLASS: AssetClassParser.to_str(instrument.asset_class),
+            ASSET_TYPE: AssetTypeParser.to_str(instrument.asset_type),
+            BASE_CURRENCY: self._pack_currency(instrument.base_currency),
+            QUOTE_CURRENCY: self._pack_currency(instrument.quote_currency),
+            SETTLEMENT_CURRENCY: self._pack_currency(instrument.settlement_currency),
+            IS_INVERSE: instrument.is_inverse,
+            PRICE_PRECISION: instrument.price_precision,
+            SIZE_PRECISION: instrument.size_precision,
+            TICK_SIZE: str(instrument.tick_size),
+            MULTIPLIER: str(instrument.multiplier),
+            LEVERAGE: str(instrument.leverage),
+            LOT_SIZE: str(instrument.lot_size),
+            MAX_QUANTITY: self._pack_object(instrument.max_quantity),
+            MIN_QUANTITY: self._pack_object(instrument.min_quantity),
+            MAX_NOTIONAL: self._pack_money(instrument.max_notional),
+            MIN_NOTIONAL: self._pack_money(instrument.min_notional),
+            MAX_PRICE: self._pack_object(instrument.max_price),
+            MIN_PRICE: self._pack_object(instrument.min_price),
+            MARGIN_INIT: str(instrument.margin_init),
+            MARGIN_MAINT: str(instrument.margin_maint),
+            MAKER_FEE: str(instrument.maker_fee),
+            TAKER_FEE: str(instrument.taker_fee),
+            FINANCING: instrument.financing,
+            TIMESTAMP: ObjectParser.datetime_to_str(instrument.timestamp),
+            INFO: instrument.info,
+        }
+
+        return MsgPackSerializer.serialize(package)
+
+    cpdef Instrument deserialize(self, bytes instrument_bytes):
+        """
+        Return the `Instrument` deserialized from the given MessagePack specification bytes.
+
+        Parameters
+        ----------
+        instrument_bytes : bytes
+            The bytes to deserialize.
+
+        Returns
+        -------
+        Instrument
+
+        Raises
+        ------
+        ValueError
+            If instrument_bytes is empty.
+
+        """
+        Condition.not_empty(instrument_bytes, "instrument_bytes")
+
+        cdef dict unpacked = MsgPackSerializer.deserialize(instrument_bytes)
+
+        return Instrument(
+            symbol=self.symbol_cache.get(unpacked[SYMBOL]),
+            asset_class=AssetClassParser.from_str(unpacked[ASSET_CLASS]),
+            asset_type=AssetTypeParser.from_str(unpacked[ASSET_TYPE]),
+            base_currency=self._unpack_currency(unpacked[BASE_CURRENCY]),
+            quote_currency=self._unpack_currency(unpacked[QUOTE_CURRENCY]),
+            settlement_currency=self._unpack_currency(unpacked[SETTLEMENT_CURRENCY]),
+            is_inverse=unpacked[IS_INVERSE],
+            price_precision=unpacked[PRICE_PRECISION],
+            size_precision=unpacked[SIZE_PRECISION],
+            tick_size=Decimal(unpacked[TICK_SIZE]),
+            multiplier=Decimal(unpacked[MULTIPLIER]),
+            leverage=Decimal(unpacked[LEVERAGE]),
+            lot_size=Quantity(unpacked[LOT_SIZE]),
+            max_quantity=self._unpack_object(Quantity, unpacked[MAX_QUANTITY]),
+            min_quantity=self._unpack_object(Quantity, unpacked[MIN_QUANTITY]),
+            max_notional=self._unpack_money(unpacked[MAX_NOTIONAL]),
+            min_notional=self._unpack_money(unpacked[MIN_NOTIONAL]),
+            max_price=self._unpack_object(Price, unpacked[MAX_PRICE]),
+            min_price=self._unpack_object(Price, unpacked[MIN_PRICE]),
+            margin_init=Decimal(unpacked[MARGIN_INIT]),
+            margin_maint=Decimal(unpacked[MARGIN_MAINT]),
+            maker_fee=Decimal(unpacked[MAKER_FEE]),
+            taker_fee=Decimal(unpacked[TAKER_FEE]),
+            financing=unpacked[FINANCING],
+            timestamp=ObjectParser.string_to_datetime(unpacked[TIMESTAMP]),
+            info=unpacked[INFO],
+        )
+
+    cdef inline list _pack_currency(self, Currency currency):
+        if currency is None:
+            return None
+        return [currency.code, currency.precision, CurrencyTypeParser.to_str(currency.currency_type)]
+
+    cdef inline Currency _unpack_currency(self, list values):
+        if values is None:
+            return None
+        cdef Currency currency = Currency.from_str_c(values[0])
+        if currency is not None and currency.precision == values[1]:
+            return currency
+        return Currency(values[0], values[1], CurrencyTypeParser.from_str(values[2]))
+
+    cdef inline str _pack_object(self, value):
+        return None if value is None else str(value)
+
+    cdef inline object _unpack_object(self, cls, str value):
+        return None if value is None else cls(value)
+
+    cdef inline list _pack_money(self, Money money):
+        if money is None:
+            return None
+        return [str(money), self._pack_currency(money.currency)]
+
+    cdef inline Money _unpack_money(self, list values):
+        if values is None:
+            return None
+        return Money(values[0], self._unpack_currency(values[1]))
+
+
 cdef class MsgPackOrderSerializer(OrderSerializer):
     """
     Provides a `Command` serializer for the `MessagePack` specification.
@@ -365,7 +516,7 @@ cdef class MsgPackCommandSerializer(CommandSerializer):
                 self.identifier_cache.get_trader_id(unpacked[TRADER_ID]),
                 self.identifier_cache.get_account_id(unpacked[ACCOUNT_ID]),
                 self.identifier_cache.get_strategy_id(unpacked[STRATEGY_ID]),
-                PositionId(unpacked[POSITION_ID]),
+                self.identifier_cache.get_position_id(unpacked[POSITION_ID]),
                 self.order_serializer.deserialize(unpacked[ORDER]),
                 command_id,
                 command_timestamp,
@@ -387,7 +538,7 @@ cdef class MsgPackCommandSerializer(CommandSerializer):
                 Venue(unpacked[VENUE]),
                 self.identifier_cache.get_trader_id(unpacked[TRADER_ID]),
                 self.identifier_cache.get_account_id(unpacked[ACCOUNT_ID]),
-                ClientOrderId(unpacked[CLIENT_ORDER_ID]),
+                self.identifier_cache.get_cl_ord_id(unpacked[CLIENT_ORDER_ID]),
                 Quantity(unpacked[QUANTITY]),
                 Price(unpacked[PRICE]),
                 command_id,
@@ -398,7 +549,7 @@ cdef class MsgPackCommandSerializer(CommandSerializer):
                 Venue(unpacked[VENUE]),
                 self.identifier_cache.get_trader_id(unpacked[TRADER_ID]),
                 self.identifier_cache.get_account_id(unpacked[ACCOUNT_ID]),
-                ClientOrderId(unpacked[CLIENT_ORDER_ID]),
+                self.identifier_cache.get_cl_ord_id(unpacked[CLIENT_ORDER_ID]),
                 command_id,
                 command_timestamp,
             )
@@ -585,7 +736,7 @@ cdef class MsgPackEventSerializer(EventSerializer):
         elif event_type == OrderInitialized.__name__:
             options = unpacked.get(OPTIONS)
             return OrderInitialized(
-                ClientOrderId(unpacked[CLIENT_ORDER_ID]),
+                self.identifier_cache.get_cl_ord_id(unpacked[CLIENT_ORDER_ID]),
                 self.identifier_cache.get_strategy_id(unpacked[STRATEGY_ID]),
                 self.identifier_cache.get_symbol(unpacked[SYMBOL]),
                 OrderSideParser.from_str(self.convert_camel_to_snake(unpacked[ORDER_SIDE])),
@@ -599,21 +750,21 @@ cdef class MsgPackEventSerializer(EventSerializer):
         elif event_type == OrderSubmitted.__name__:
             return OrderSubmitted(
                 self.identifier_cache.get_account_id(unpacked[ACCOUNT_ID]),
-                ClientOrderId(unpacked[CLIENT_ORDER_ID]),
+                self.identifier_cache.get_cl_ord_id(unpacked[CLIENT_ORDER_ID]),
                 ObjectParser.string_to_datetime(unpacked[SUBMITTED_TIME]),
                 event_id,
                 event_timestamp,
             )
         elif event_type == OrderInvalid.__name__:
             return OrderInvalid(
-                ClientOrderId(unpacked[CLIENT_ORDER_ID]),
+                self.identifier_cache.get_cl_ord_id(unpacked[CLIENT_ORDER_ID]),
                 unpacked[REASON],
                 event_id,
                 event_timestamp,
             )
         elif event_type == OrderDenied.__name__:
             return OrderDenied(
-                ClientOrderId(unpacked[CLIENT_ORDER_ID]),
+                self.identifier_cache.get_cl_ord_id(unpacked[CLIENT_ORDER_ID]),
                 unpacked[REASON],
                 event_id,
                 event_timestamp,
@@ -621,7 +772,7 @@ cdef class MsgPackEventSerializer(EventSerializer):
         elif event_type == OrderAccepted.__name__:
             return OrderAccepted(
                 self.identifier_cache.get_account_id(unpacked[ACCOUNT_ID]),
-                ClientOrderId(unpacked[CLIENT_ORDER_ID]),
+                self.identifier_cache.get_cl_ord_id(unpacked[CLIENT_ORDER_ID]),
                 OrderId(unpacked[ORDER_ID]),
                 ObjectParser.string_to_datetime(unpacked[ACCEPTED_TIME]),
                 event_id,
@@ -630,7 +781,7 @@ cdef class MsgPackEventSerializer(EventSerializer):
         elif event_type == OrderRejected.__name__:
             return OrderRejected(
                 self.identifier_cache.get_account_id(unpacked[ACCOUNT_ID]),
-                ClientOrderId(unpacked[CLIENT_ORDER_ID]),
+                self.identifier_cache.get_cl_ord_id(unpacked[CLIENT_ORDER_ID]),
                 ObjectParser.string_to_datetime(unpacked[REJECTED_TIME]),
                 unpacked[REASON],
                 event_id,
@@ -639,9 +790,9 @@ cdef class MsgPackEventSerializer(EventSerializer):
         elif event_type == OrderWorking.__name__:
             return OrderWorking(
                 self.identifier_cache.get_account_id(unpacked[ACCOUNT_ID]),
-                ClientOrderId(unpacked[CLIENT_ORDER_ID]),
+                self.identifier_cache.get_cl_ord_id(unpacked[CLIENT_ORDER_ID]),
                 OrderId(unpacked[ORDER_ID]),
-                Symbol.from_str_c(unpacked[SYMBOL]),
+                self.identifier_cache.get_symbol(unpacked[SYMBOL]),
                 OrderSideParser.from_str(self.convert_camel_to_snake(unpacked[ORDER_SIDE])),
                 OrderTypeParser.from_str(self.convert_camel_to_snake(unpacked[ORDER_TYPE])),
                 Quantity(unpacked[QUANTITY]),
@@ -655,7 +806,7 @@ cdef class MsgPackEventSerializer(EventSerializer):
         elif event_type == OrderCancelled.__name__:
             return OrderCancelled(
                 self.identifier_cache.get_account_id(unpacked[ACCOUNT_ID]),
-                ClientOrderId(unpacked[CLIENT_ORDER_ID]),
+                self.identifier_cache.get_cl_ord_id(unpacked[CLIENT_ORDER_ID]),
                 OrderId(unpacked[ORDER_ID]),
                 ObjectParser.string_to_datetime(unpacked[CANCELLED_TIME]),
                 event_id,
@@ -664,7 +815,7 @@ cdef class MsgPackEventSerializer(EventSerializer):
         elif event_type == OrderCancelReject.__name__:
             return OrderCancelReject(
                 self.identifier_cache.get_account_id(unpacked[ACCOUNT_ID]),
-                ClientOrderId(unpacked[CLIENT_ORDER_ID]),
+                self.identifier_cache.get_cl_ord_id(unpacked[CLIENT_ORDER_ID]),
                 ObjectParser.string_to_datetime(unpacked[REJECTED_TIME]),
                 unpacked[RESPONSE_TO],
                 unpacked[REASON],
@@ -674,7 +825,7 @@ cdef class MsgPackEventSerializer(EventSerializer):
         elif event_type == OrderModified.__name__:
             return OrderModified(
                 self.identifier_cache.get_account_id(unpacked[ACCOUNT_ID]),
-                ClientOrderId(unpacked[CLIENT_ORDER_ID]),
+                self.identifier_cache.get_cl_ord_id(unpacked[CLIENT_ORDER_ID]),
                 OrderId(unpacked[ORDER_ID]),
                 Quantity(unpacked[QUANTITY]),
                 Price(unpacked[PRICE]),
@@ -685,7 +836,7 @@ cdef class MsgPackEventSerializer(EventSerializer):
         elif event_type == OrderExpired.__name__:
             return OrderExpired(
                 self.identifier_cache.get_account_id(unpacked[ACCOUNT_ID]),
-                ClientOrderId(unpacked[CLIENT_ORDER_ID]),
+                self.identifier_cache.get_cl_ord_id(unpacked[CLIENT_ORDER_ID]),
                 OrderId(unpacked[ORDER_ID]),
                 ObjectParser.string_to_datetime(unpacked[EXPIRED_TIME]),
                 event_id,
@@ -695,10 +846,10 @@ cdef class MsgPackEventSerializer(EventSerializer):
             commission_currency = Currency.from_str_c(unpacked[COMMISSION_CURRENCY])
             return OrderFilled(
                 self.identifier_cache.get_account_id(unpacked[ACCOUNT_ID]),
-                ClientOrderId(unpacked[CLIENT_ORDER_ID]),
+                self.identifier_cache.get_cl_ord_id(unpacked[CLIENT_ORDER_ID]),
                 OrderId(unpacked[ORDER_ID]),
-                ExecutionId(unpacked[EXECUTION_ID]),
-                PositionId(unpacked[POSITION_ID]),
+                self.identifier_cache.get_execution_id(unpacked[EXECUTION_ID]),
+                self.identifier_cache.get_position_id(unpacked[POSITION_ID]),
                 self.identifier_cache.get_strategy_id(unpacked[STRATEGY_ID]),
                 self.identifier_cache.get_symbol(unpacked[SYMBOL]),
                 OrderSideParser.from_str(self.convert_camel_to_snake(unpacked[ORDER_SIDE])),
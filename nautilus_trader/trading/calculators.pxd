@@ -21,6 +21,10 @@ from nautilus_trader.model.identifiers cimport Symbol
 
 
 cdef class ExchangeRateCalculator:
+    cdef object _symbols
+    cdef dict _graph
+    cdef dict _paths
+
     cpdef object get_rate(
         self,
         Currency from_currency,
@@ -29,10 +33,16 @@ cdef class ExchangeRateCalculator:
         dict bid_quotes,
         dict ask_quotes
     )
+    cdef void _build_graph(self, dict quotes) except *
+    cdef dict _search_paths(self, str source)
 
 
 cdef class RolloverInterestCalculator:
     cdef dict _rate_data
+    cdef dict _currency_index
+    cdef int _month_origin
+    cdef int _month_count
+    cdef double[:, :] _rates
 
     cpdef object get_rate_data(self)
     cpdef object calc_overnight_rate(self, Symbol symbol, date timestamp)
@@ -14,8 +14,10 @@
 # -------------------------------------------------------------------------------------------------
 
 from decimal import Decimal
-from itertools import permutations
 
+from libc.math cimport isnan
+
+import numpy as np
 import pandas as pd
 
 from nautilus_trader.core.correctness cimport Condition
@@ -30,8 +32,22 @@ cdef class ExchangeRateCalculator:
     Provides exchange rate calculations between currencies.
 
     An exchange rate is the value of one asset versus that of another.
+
+    A directly quoted pair (or its inverse) is converted straight from its
+    quote. Otherwise the shortest conversion paths from a currency are searched
+    in the currency graph of the quoted symbols the first time that currency is
+    converted from, and only searched again when the set of quoted symbols
+    changes. Each rate is then evaluated from the current quotes along its path.
     """
 
+    def __init__(self):
+        """
+        Initialize a new instance of the `ExchangeRateCalculator` class.
+        """
+        self._symbols = None  # type: frozenset[str]
+        self._graph = {}      # type: dict[str, dict[str, tuple[str, bool]]]
+        self._paths = {}      # type: dict[str, dict[str, tuple[tuple[str, bool], ...]]]
+
     cpdef object get_rate(
         self,
         Currency from_currency,
@@ -82,114 +98,133 @@ cdef class ExchangeRateCalculator:
         if from_currency == to_currency:
             return Decimal(1)  # No conversion necessary
 
-        if price_type == PriceType.BID:
-            calculation_quotes = bid_quotes
-        elif price_type == PriceType.ASK:
-            calculation_quotes = ask_quotes
-        elif price_type == PriceType.MID:
-            calculation_quotes = {
-                s: (bid_quotes[s] + ask_quotes[s]) / Decimal(2) for s in bid_quotes
-            }  # type: dict[str, Decimal]
-        else:
+        if price_type != PriceType.BID and price_type != PriceType.ASK and price_type != PriceType.MID:
             raise ValueError(f"Cannot calculate exchange rate for price type "
                              f"{PriceTypeParser.to_str(price_type)}")
 
+        cdef dict quotes = ask_quotes if price_type == PriceType.ASK else bid_quotes
+
+        # A directly quoted pair (or its inverse) needs no conversion paths
+        cdef str symbol = f"{from_currency.code}/{to_currency.code}"
+        cdef bint inverse = False
+        if symbol not in quotes:
+            symbol = f"{to_currency.code}/{from_currency.code}"
+            inverse = True
+
+        cdef tuple path
+        cdef dict paths
+        if symbol in quotes:
+            path = ((symbol, inverse),)
+        else:
+            if self._symbols is None or quotes.keys() != self._symbols:
+                self._build_graph(quotes)
+
+            paths = self._paths.get(from_currency.code)
+            if paths is None:
+                paths = self._search_paths(from_currency.code)
+                self._paths[from_currency.code] = paths
+
+            path = paths.get(to_currency.code)
+            if path is None:
+                # Not enough data
+                return Decimal()
+
+        xrate = Decimal(1)
+
+        for symbol, inverse in path:
+            if price_type == PriceType.MID:
+                quote = (bid_quotes[symbol] + ask_quotes[symbol]) / Decimal(2)
+            else:
+                quote = quotes[symbol]
+            assert isinstance(quote, Decimal), f"quote must be type Decimal, was {type(quote)}"
+
+            if inverse:
+                xrate = xrate / quote
+            else:
+                xrate = xrate * quote
+
+        return xrate
+
+    cdef void _build_graph(self, dict quotes) except *:
+        # Build the currency graph from the quoted symbols, the paths searched
+        # in the previous graph are discarded.
+        cdef dict graph = {}  # type: dict[str, dict[str, tuple[str, bool]]]
+
         cdef str symbol
         cdef tuple pieces
         cdef str code_lhs
         cdef str code_rhs
-        cdef set codes = set()
-        cdef dict exchange_rates = {}
-
-        # Build quote table
-        for symbol, quote in calculation_quotes.items():
-            assert isinstance(quote, Decimal), f"quote must be type Decimal, was {type(quote)}"
-
-            # Get symbol codes
+        for symbol in quotes:
             pieces = symbol.partition('/')
             code_lhs = pieces[0]
             code_rhs = pieces[2]
-            codes.add(code_lhs)
-            codes.add(code_rhs)
-
-            # Add currency dictionaries if they do not already exist
-            if code_lhs not in exchange_rates:
-                exchange_rates[code_lhs] = {}
-            if code_rhs not in exchange_rates:
-                exchange_rates[code_rhs] = {}
-            # Add currency rates
-            exchange_rates[code_lhs][code_lhs] = Decimal(1)
-            exchange_rates[code_rhs][code_rhs] = Decimal(1)
-            exchange_rates[code_lhs][code_rhs] = quote
-
-        # Generate possible currency pairs from all symbols
-        cdef set code_perms = set(permutations(codes, 2))
-
-        # Calculate currency inverses
-        cdef dict exchange_rates_perm0
-        cdef dict exchange_rates_perm1
-        for perm in code_perms:
-            exchange_rates_perm0 = exchange_rates.get(perm[0])
-            exchange_rates_perm1 = exchange_rates.get(perm[1])
-            if exchange_rates_perm0 is None or exchange_rates_perm1 is None:
-                continue
-            if perm[0] not in exchange_rates_perm1:
-                # Search for inverse
-                if perm[1] in exchange_rates_perm0:
-                    exchange_rates_perm1[perm[0]] = Decimal(1) / exchange_rates_perm0[perm[1]]
-            if perm[1] not in exchange_rates_perm0:
-                # Search for inverse
-                if perm[0] in exchange_rates_perm1:
-                    exchange_rates_perm0[perm[1]] = Decimal(1) / exchange_rates_perm1[perm[0]]
-
-        cdef dict quotes = exchange_rates.get(from_currency.code)
-        if quotes is not None:
-            xrate = quotes.get(to_currency.code)
-            if xrate is not None:
-                return xrate
-
-        # Exchange rate not yet calculated
-        # Continue to calculate remaining exchange rates
-        cdef dict exchange_rates_code
-        for perm in code_perms:
-            if perm[0] in exchange_rates[perm[1]]:
-                continue
-            # Search for common currency
-            for code in codes:
-                exchange_rates_perm0 = exchange_rates.get(perm[0])
-                exchange_rates_perm1 = exchange_rates.get(perm[1])
-                exchange_rates_code = exchange_rates.get(code)
-                if exchange_rates_perm0 is None or exchange_rates_perm1 is None or exchange_rates_code is None:
-                    continue
-                if code in exchange_rates_perm0 and code in exchange_rates_perm1:
-                    common_rate1 = exchange_rates_perm0[code]
-                    common_rate2 = exchange_rates_perm1[code]
-                    exchange_rates_perm1[perm[0]] = common_rate2 / common_rate1
-                    # Check inverse and calculate if not found
-                    if perm[1] not in exchange_rates_perm0:
-                        exchange_rates_perm0[perm[1]] = common_rate1 / common_rate2
-                elif perm[0] in exchange_rates_code and perm[1] in exchange_rates_code:
-                    common_rate1 = exchange_rates_code[perm[0]]
-                    common_rate2 = exchange_rates_code[perm[1]]
-                    exchange_rates_perm1[perm[0]] = common_rate2 / common_rate1
-                    # Check inverse and calculate if not found
-                    if perm[1] not in exchange_rates[perm[0]]:
-                        exchange_rates_perm0[perm[1]] = common_rate1 / common_rate2
-
-        quotes = exchange_rates.get(from_currency.code)
-        if quotes is None:
-            # Not enough data
-            return Decimal()
-
-        return quotes.get(to_currency.code, Decimal())
+            if code_lhs not in graph:
+                graph[code_lhs] = {}
+            if code_rhs not in graph:
+                graph[code_rhs] = {}
+            # A directly quoted rate takes precedence over an inverse
+            graph[code_lhs][code_rhs] = (symbol, False)
+            if code_lhs not in graph[code_rhs] or graph[code_rhs][code_lhs][1]:
+                graph[code_rhs][code_lhs] = (symbol, True)
+
+        self._symbols = frozenset(quotes)
+        self._graph = graph
+        self._paths = {}
+
+    cdef dict _search_paths(self, str source):
+        # Search the shortest conversion path from the source code to every
+        # connected code with a breadth first search.
+        cdef dict steps = {}  # type: dict[str, tuple[tuple[str, bool], ...]]
+        if source not in self._graph:
+            return steps
+
+        steps[source] = ()
+
+        cdef str code
+        cdef str neighbour
+        cdef tuple step
+        cdef list next_frontier
+        cdef list frontier = [source]
+        while frontier:
+            next_frontier = []
+            for code in frontier:
+                for neighbour, step in self._graph[code].items():
+                    if neighbour in steps:
+                        continue
+                    steps[neighbour] = steps[code] + (step,)
+                    next_frontier.append(neighbour)
+            frontier = next_frontier
+
+        del steps[source]
+        return steps
+
+
+# The short-term interest rate data location for each currency
+_RATE_LOCATIONS = {
+    "AUD": "AUS",
+    "CAD": "CAN",
+    "CHF": "CHE",
+    "EUR": "EA19",
+    "USD": "USA",
+    "JPY": "JPN",
+    "NZD": "NZL",
+    "GBP": "GBR",
+    "RUB": "RUS",
+    "NOK": "NOR",
+    "CNY": "CHN",
+    "CNH": "CHN",
+    "MXN": "MEX",
+    "ZAR": "ZAF",
+}
 
 
 cdef class RolloverInterestCalculator:
     """
     Provides rollover interest rate calculations.
 
-    If rate_data_csv_path is empty then will default to the included short-term
-    interest rate data csv (data since 1956).
+    The short-term interest rates are pre-indexed into a dense (currency, month)
+    array on initialization, so each overnight rate lookup is an array index.
+    Monthly rates take precedence over quarterly rates for the same month.
     """
 
     def __init__(self, data not None: pd.DataFrame):
@@ -198,27 +233,46 @@ cdef class RolloverInterestCalculator:
 
         Parameters
         ----------
-        data : str
+        data : pd.DataFrame
             The short term interest rate data.
 
         """
         self._rate_data = {
-            "AUD": data.loc[data["LOCATION"] == "AUS"],
-            "CAD": data.loc[data["LOCATION"] == "CAN"],
-            "CHF": data.loc[data["LOCATION"] == "CHE"],
-            "EUR": data.loc[data["LOCATION"] == "EA19"],
-            "USD": data.loc[data["LOCATION"] == "USA"],
-            "JPY": data.loc[data["LOCATION"] == "JPN"],
-            "NZD": data.loc[data["LOCATION"] == "NZL"],
-            "GBP": data.loc[data["LOCATION"] == "GBR"],
-            "RUB": data.loc[data["LOCATION"] == "RUS"],
-            "NOK": data.loc[data["LOCATION"] == "NOR"],
-            "CNY": data.loc[data["LOCATION"] == "CHN"],
-            "CNH": data.loc[data["LOCATION"] == "CHN"],
-            "MXN": data.loc[data["LOCATION"] == "MEX"],
-            "ZAR": data.loc[data["LOCATION"] == "ZAF"],
+            currency: data.loc[data["LOCATION"] == location]
+            for currency, location in _RATE_LOCATIONS.items()
         }
 
+        # Parse the TIME column into absolute month numbers (year * 12 + month - 1)
+        time = data["TIME"].astype(str)
+        year = pd.to_numeric(time.str[:4], errors="coerce")
+        is_monthly = time.str.match(r"^\d{4}-\d{2}$")
+        is_quarterly = time.str.match(r"^\d{4}-Q[1-4]$")
+        month = pd.to_numeric(time.str[5:7].where(is_monthly), errors="coerce")
+        quarter = pd.to_numeric(time.str[6:7].where(is_quarterly), errors="coerce")
+
+        periodic = is_monthly | is_quarterly
+        self._month_origin = int(year[periodic].min() * 12) if periodic.any() else 0
+        self._month_count = int(year[periodic].max() * 12 + 12) - self._month_origin if periodic.any() else 0
+        self._currency_index = {}  # type: dict[str, int]
+
+        rates = np.full((len(self._rate_data), self._month_count), np.nan)
+        cdef int row
+        cdef str currency
+        for row, currency in enumerate(self._rate_data):
+            self._currency_index[currency] = row
+            location = data["LOCATION"] == _RATE_LOCATIONS[currency]
+            # Quarterly rates apply to each month of the quarter
+            selected = location & is_quarterly
+            for offset in range(3):
+                columns = (year[selected] * 12 + (quarter[selected] - 1) * 3 + offset - self._month_origin).astype(int)
+                rates[row, columns.values] = data["Value"][selected].values
+            # Then monthly rates overwrite any quarterly rate
+            selected = location & is_monthly
+            columns = (year[selected] * 12 + month[selected] - 1 - self._month_origin).astype(int)
+            rates[row, columns.values] = data["Value"][selected].values
+
+        self._rates = rates
+
     cpdef object get_rate_data(self):
         """
         Return the short-term interest rate dataframe.
@@ -249,6 +303,8 @@ cdef class RolloverInterestCalculator:
         ------
         ValueError
             If symbol.code length is not in range [6, 7].
+        RuntimeError
+            If the rate for either currency is not available for the date.
 
         Notes
         -----
@@ -259,20 +315,17 @@ cdef class RolloverInterestCalculator:
         Condition.not_none(date, "timestamp")
         Condition.in_range_int(len(symbol.code), 6, 7, "len(symbol)")
 
-        cdef str base_currency = symbol.code[:3]
-        cdef str quote_currency = symbol.code[-3:]
-        cdef str time_monthly = f"{date.year}-{str(date.month).zfill(2)}"
-        cdef str time_quarter = f"{date.year}-Q{str(int(((date.month - 1) // 3) + 1)).zfill(2)}"
+        cdef int base_row = self._currency_index[symbol.code[:3]]
+        cdef int quote_row = self._currency_index[symbol.code[-3:]]
+        cdef int column = date.year * 12 + date.month - 1 - self._month_origin
 
-        base_data = self._rate_data[base_currency].loc[self._rate_data[base_currency]['TIME'] == time_monthly]
-        if base_data.empty:
-            base_data = self._rate_data[base_currency].loc[self._rate_data[base_currency]['TIME'] == time_quarter]
+        if column < 0 or column >= self._month_count:
+            raise RuntimeError(f"Cannot find rollover interest rate for {symbol} on {date}")
 
-        quote_data = self._rate_data[quote_currency].loc[self._rate_data[quote_currency]['TIME'] == time_monthly]
-        if quote_data.empty:
-            quote_data = self._rate_data[quote_currency].loc[self._rate_data[quote_currency]['TIME'] == time_quarter]
+        cdef double base_rate = self._rates[base_row, column]
+        cdef double quote_rate = self._rates[quote_row, column]
 
-        if base_data.empty and quote_data.empty:
+        if isnan(base_rate) or isnan(quote_rate):
             raise RuntimeError(f"Cannot find rollover interest rate for {symbol} on {date}")
 
-        return Decimal(((<double>base_data['Value'] - <double>quote_data['Value']) / 365) / 100)
+        return Decimal(((base_rate - quote_rate) / 365) / 100)
@@ -39,6 +39,7 @@ from nautilus_trader.model.objects cimport Quantity
 from nautilus_trader.model.order cimport BracketOrder
 from nautilus_trader.model.order cimport Order
 from nautilus_trader.model.order cimport PassiveOrder
+from nautilus_trader.model.order_book cimport OrderBook
 from nautilus_trader.model.position cimport Position
 from nautilus_trader.model.tick cimport QuoteTick
 from nautilus_trader.model.tick cimport TradeTick
@@ -89,6 +90,7 @@ cdef class TradingStrategy(Component):
     cpdef void on_quote_tick(self, QuoteTick tick) except *
     cpdef void on_trade_tick(self, TradeTick tick) except *
     cpdef void on_bar(self, BarType bar_type, Bar bar) except *
+    cpdef void on_order_book(self, OrderBook order_book) except *
     cpdef void on_data(self, data) except *
     cpdef void on_event(self, Event event) except *
 
@@ -117,10 +119,12 @@ cdef class TradingStrategy(Component):
     cpdef void subscribe_quote_ticks(self, Symbol symbol) except *
     cpdef void subscribe_trade_ticks(self, Symbol symbol) except *
     cpdef void subscribe_bars(self, BarType bar_type) except *
+    cpdef void subscribe_order_book(self, Symbol symbol) except *
     cpdef void unsubscribe_instrument(self, Symbol symbol) except *
     cpdef void unsubscribe_quote_ticks(self, Symbol symbol) except *
     cpdef void unsubscribe_trade_ticks(self, Symbol symbol) except *
     cpdef void unsubscribe_bars(self, BarType bar_type) except *
+    cpdef void unsubscribe_order_book(self, Symbol symbol) except *
 
 # -- REQUESTS --------------------------------------------------------------------------------------
 
@@ -162,6 +166,7 @@ cdef class TradingStrategy(Component):
     cpdef void handle_trade_ticks(self, list ticks) except *
     cpdef void handle_bar(self, BarType bar_type, Bar bar, bint is_historical=*) except *
     cpdef void handle_bars(self, BarType bar_type, list bars) except *
+    cpdef void handle_order_book(self, OrderBook order_book) except *
     cpdef void handle_data(self, data) except *
     cpdef void handle_event(self, Event event) except *
 
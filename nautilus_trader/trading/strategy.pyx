@@ -70,6 +70,7 @@ from nautilus_trader.model.order cimport BracketOrder
 from nautilus_trader.model.order cimport MarketOrder
 from nautilus_trader.model.order cimport Order
 from nautilus_trader.model.order cimport PassiveOrder
+from nautilus_trader.model.order_book cimport OrderBook
 from nautilus_trader.model.position cimport Position
 from nautilus_trader.model.tick cimport QuoteTick
 from nautilus_trader.model.tick cimport TradeTick
@@ -355,6 +356,22 @@ cdef class TradingStrategy(Component):
         """
         pass  # Optionally override in subclass
 
+    cpdef void on_order_book(self, OrderBook order_book) except *:
+        """
+        Actions to be performed when the strategy is running and receives an order book.
+
+        Parameters
+        ----------
+        order_book : OrderBook
+            The order book received.
+
+        Warnings
+        --------
+        System method (not intended to be called by user code).
+
+        """
+        pass  # Optionally override in subclass
+
     cpdef void on_data(self, data) except *:
         """
         Actions to be performed when the strategy is running and receives a data object.
@@ -773,6 +790,35 @@ cdef class TradingStrategy(Component):
 
         self.log.info(f"Subscribed to {bar_type} <Bar> data.")
 
+    cpdef void subscribe_order_book(self, Symbol symbol) except *:
+        """
+        Subscribe to `OrderBook` data for the given symbol.
+
+        The order book is maintained by the data engine from the `OrderBookDelta`
+        stream, and passed to `on_order_book` on each update.
+
+        Parameters
+        ----------
+        symbol : Symbol
+            The order book symbol to subscribe to.
+
+        """
+        Condition.not_none(symbol, "symbol")
+        Condition.not_none(self._data_engine, "data_engine")
+
+        cdef Subscribe subscribe = Subscribe(
+            venue=symbol.venue,
+            data_type=OrderBook,
+            metadata={SYMBOL: symbol},
+            handler=self.handle_order_book,
+            command_id=self.uuid_factory.generate(),
+            command_timestamp=self.clock.utc_now(),
+        )
+
+        self._data_engine.execute(subscribe)
+
+        self.log.info(f"Subscribed to {symbol} <OrderBook> data.")
+
     cpdef void unsubscribe_instrument(self, Symbol symbol) except *:
         """
         Unsubscribe from `Instrument` data for the given symbol.
@@ -877,6 +923,35 @@ cdef class TradingStrategy(Component):
 
         self.log.info(f"Unsubscribed from {bar_type} <Bar> data.")
 
+    cpdef void unsubscribe_order_book(self, Symbol symbol) except *:
+        """
+        Unsubscribe from `OrderBook` data for the given symbol.
+
+        The order book is maintained by the data engine from the `OrderBookDelta`
+        stream, and passed to `on_order_book` on each update.
+
+        Parameters
+        ----------
+        symbol : Symbol
+            The order book symbol to unsubscribe from.
+
+        """
+        Condition.not_none(symbol, "symbol")
+        Condition.not_none(self._data_engine, "data_engine")
+
+        cdef Unsubscribe unsubscribe = Unsubscribe(
+            venue=symbol.venue,
+            data_type=OrderBook,
+            metadata={SYMBOL: symbol},
+            handler=self.handle_order_book,
+            command_id=self.uuid_factory.generate(),
+            command_timestamp=self.clock.utc_now(),
+        )
+
+        self._data_engine.execute(unsubscribe)
+
+        self.log.info(f"Unsubscribed from {symbol} <OrderBook> data.")
+
 # -- REQUESTS --------------------------------------------------------------------------------------
 
     cpdef void request_quote_ticks(
@@ -1531,12 +1606,37 @@ cdef class TradingStrategy(Component):
 
         self.log.info(f"Received <Bar[{length}]> data for {bar_type}.")
 
-        if length > 0 and first.timestamp > last.timestamp:
+        if length > 0 and first.timestamp_ns > last.timestamp_ns:
             raise RuntimeError(f"Cannot handle <Bar[{length}]> data, incorrectly sorted")
 
         for i in range(length):
             self.handle_bar(bar_type, bars[i], is_historical=True)
 
+    cpdef void handle_order_book(self, OrderBook order_book) except *:
+        """
+        Handle the given order book.
+
+        Calls `on_order_book` if `strategy.state` is `RUNNING`.
+
+        Parameters
+        ----------
+        order_book : OrderBook
+            The received order book.
+
+        Warnings
+        --------
+        System method (not intended to be called by user code).
+
+        """
+        Condition.not_none(order_book, "order_book")
+
+        if self._fsm.state == ComponentState.RUNNING:
+            try:
+                self.on_order_book(order_book)
+            except Exception as ex:
+                self.log.exception(ex)
+                raise ex
+
     cpdef void handle_data(self, data) except *:
         """
         Handle the given data object.
@@ -25,6 +25,7 @@ from nautilus_trader.analysis.performance cimport PerformanceAnalyzer
 from nautilus_trader.analysis.reports cimport ReportProvider
 from nautilus_trader.common.c_enums.component_state cimport ComponentState
 from nautilus_trader.common.clock cimport Clock
+from nautilus_trader.common.clock cimport LiveClock
 from nautilus_trader.common.component cimport Component
 from nautilus_trader.common.logging cimport Logger
 from nautilus_trader.core.correctness cimport Condition
@@ -187,6 +188,7 @@ cdef class Trader(Component):
         self._log.info(f"Initializing strategies...")
 
         cdef TradingStrategy strategy
+        cdef Clock clock
         for strategy in self._strategies:
             Condition.true(strategy.state_c() != ComponentState.RUNNING, "strategy.state_c() != RUNNING")
 
@@ -208,9 +210,15 @@ cdef class Trader(Component):
                                  f"duplicate strategy identifiers")
 
             # Wire trader into strategy
+            if isinstance(self._clock, LiveClock):
+                # Clock per strategy, driven by the same event loop (if any)
+                clock = LiveClock(loop=self._clock.loop)
+            else:
+                clock = self._clock.__class__()  # Clock per strategy
+
             strategy.register_trader(
                 self.id,
-                self._clock.__class__(),  # Clock per strategy
+                clock,
                 self._log.get_logger(),
             )
 
@@ -254,7 +262,8 @@ cdef class Trader(Component):
         pd.DataFrame
 
         """
-        return self._report_provider.generate_orders_report(self._exec_engine.cache.orders())
+        cdef list orders = self._exec_engine.cache.orders_archived() + self._exec_engine.cache.orders()
+        return self._report_provider.generate_orders_report(orders)
 
     cpdef object generate_order_fills_report(self):
         """
@@ -265,7 +274,8 @@ cdef class Trader(Component):
         pd.DataFrame
 
         """
-        return self._report_provider.generate_order_fills_report(self._exec_engine.cache.orders())
+        cdef list orders = self._exec_engine.cache.orders_archived() + self._exec_engine.cache.orders()
+        return self._report_provider.generate_order_fills_report(orders)
 
     cpdef object generate_positions_report(self):
         """
@@ -276,7 +286,8 @@ cdef class Trader(Component):
         pd.DataFrame
 
         """
-        return self._report_provider.generate_positions_report(self._exec_engine.cache.positions())
+        cdef list positions = self._exec_engine.cache.positions_archived() + self._exec_engine.cache.positions()
+        return self._report_provider.generate_positions_report(positions)
 
     cpdef object generate_account_report(self, Venue venue):
         """
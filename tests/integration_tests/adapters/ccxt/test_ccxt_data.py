@@ -15,10 +15,12 @@
 
 import asyncio
 import json
+import tempfile
 import unittest
 from unittest.mock import MagicMock
 
 from nautilus_trader.adapters.ccxt.data import CCXTDataClient
+from nautilus_trader.adapters.ccxt.providers import CCXTInstrumentProvider
 from nautilus_trader.common.clock import LiveClock
 from nautilus_trader.common.logging import LiveLogger
 from nautilus_trader.common.logging import LogLevel
@@ -26,6 +28,7 @@ from nautilus_trader.common.messages import DataRequest
 from nautilus_trader.common.uuid import UUIDFactory
 from nautilus_trader.core.uuid import uuid4
 from nautilus_trader.live.data import LiveDataEngine
+from nautilus_trader.live.snapshot import InstrumentSnapshotCache
 from nautilus_trader.model.bar import Bar
 from nautilus_trader.model.bar import BarSpecification
 from nautilus_trader.model.bar import BarType
@@ -58,6 +61,90 @@ async def async_magic():
     return
 
 
+class FakeCCXTProExchange:
+    """
+    Provides a fake ccxt-pro exchange where the watch methods return the
+    updates pushed to it, in the order they were pushed.
+    """
+
+    def __init__(self, markets, combined_streams=False):
+        self.name = "Binance"
+        self.markets = markets
+        self.has = {
+            "watchOrderBook": True,
+            "watchTrades": True,
+            "watchOHLCV": True,
+            "watchOrderBookForSymbols": combined_streams,
+            "watchTradesForSymbols": combined_streams,
+        }
+        self.combined_streams = combined_streams
+        self.watch_calls = []  # The method name and symbols of each watch call
+        self.load_markets_delay = 0.0
+        self._order_books = {}
+        self._trades = {}
+
+    async def load_markets(self, reload=False):
+        await asyncio.sleep(self.load_markets_delay)
+        return self.markets
+
+    def milliseconds(self):
+        return 1610062924204
+
+    async def close(self):
+        pass
+
+    def push_order_book(self, order_book):
+        self._queue(self._order_books, order_book["symbol"]).put_nowait(order_book)
+
+    def push_trades(self, symbol, trades):
+        self._queue(self._trades, symbol).put_nowait(trades)
+
+    def push_order_book_error(self, symbol, error):
+        # The next watch of the symbols order book raises the error
+        self._queue(self._order_books, symbol).put_nowait(error)
+
+    async def watch_order_book(self, symbol, limit=None):
+        self.watch_calls.append(("watch_order_book", symbol))
+        return self._result(await self._queue(self._order_books, symbol).get())
+
+    async def watch_order_book_for_symbols(self, symbols, limit=None):
+        self.watch_calls.append(("watch_order_book_for_symbols", tuple(symbols)))
+        return self._result(await self._queue(self._order_books, None).get())
+
+    async def watch_trades(self, symbol):
+        self.watch_calls.append(("watch_trades", symbol))
+        return self._result(await self._queue(self._trades, symbol).get())
+
+    async def watch_trades_for_symbols(self, symbols):
+        self.watch_calls.append(("watch_trades_for_symbols", tuple(symbols)))
+        return self._result(await self._queue(self._trades, None).get())
+
+    def _result(self, update):
+        if isinstance(update, Exception):
+            raise update
+        return update
+
+    def _queue(self, queues, symbol):
+        # Combined streams deliver the updates for all symbols on one queue
+        key = None if self.combined_streams else symbol
+        queue = queues.get(key)
+        if queue is None:
+            queue = asyncio.Queue()
+            queues[key] = queue
+        return queue
+
+
+class BatchRecordingDataEngine(LiveDataEngine):
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.batches = []
+
+    async def process_batch_wait(self, data):
+        self.batches.append(data)
+        await super().process_batch_wait(data)
+
+
 class CCXTDataClientTests(unittest.TestCase):
 
     def setUp(self):
@@ -247,64 +334,6 @@ class CCXTDataClientTests(unittest.TestCase):
 
         self.loop.run_until_complete(run_test())
 
-    def test_subscribe_quote_ticks(self):
-        async def run_test():
-            # Arrange
-            with open(TEST_PATH + "res_instruments.json") as response:
-                instruments = json.load(response)
-
-            with open(TEST_PATH + "res_order_book.json") as response:
-                order_book = json.load(response)
-
-            self.mock_ccxt.markets = instruments
-            self.mock_ccxt.watch_order_book = order_book
-
-            self.data_engine.start()
-            await asyncio.sleep(0.1)  # Allow engine message queue to start
-
-            # Act
-            self.client.subscribe_quote_ticks(ETHUSDT)
-            await asyncio.sleep(0.3)
-
-            # Assert
-            self.assertIn(ETHUSDT, self.client.subscribed_quote_ticks)
-            self.assertTrue(self.data_engine.cache.has_quote_ticks(ETHUSDT))
-
-            # Tear Down
-            self.data_engine.stop()
-            await self.data_engine.get_run_queue_task()
-
-        self.loop.run_until_complete(run_test())
-
-    def test_subscribe_trade_ticks(self):
-        async def run_test():
-            # Arrange
-            with open(TEST_PATH + "res_instruments.json") as response:
-                instruments = json.load(response)
-
-            with open(TEST_PATH + "res_trades.json") as response:
-                trades = json.load(response)
-
-            self.mock_ccxt.markets = instruments
-            self.mock_ccxt.watch_trades = trades
-
-            self.data_engine.start()
-            await asyncio.sleep(0.1)  # Allow engine message queue to start
-
-            # Act
-            self.client.subscribe_trade_ticks(ETHUSDT)
-            await asyncio.sleep(0.3)
-
-            # Assert
-            self.assertIn(ETHUSDT, self.client.subscribed_trade_ticks)
-            self.assertTrue(self.data_engine.cache.has_trade_ticks(ETHUSDT))
-
-            # Tear Down
-            self.data_engine.stop()
-            await self.data_engine.get_run_queue_task()
-
-        self.loop.run_until_complete(run_test())
-
     def test_subscribe_bars(self):
         async def run_test():
             # Arrange
@@ -355,65 +384,6 @@ class CCXTDataClientTests(unittest.TestCase):
 
         self.loop.run_until_complete(run_test())
 
-    def test_unsubscribe_quote_ticks(self):
-        async def run_test():
-            # Arrange
-            with open(TEST_PATH + "res_instruments.json") as response:
-                instruments = json.load(response)
-
-            with open(TEST_PATH + "res_order_book.json") as response:
-                order_book = json.load(response)
-
-            self.mock_ccxt.markets = instruments
-            self.mock_ccxt.watch_order_book = order_book
-
-            self.data_engine.start()
-            await asyncio.sleep(0.1)  # Allow engine message queue to start
-
-            self.client.subscribe_quote_ticks(ETHUSDT)
-            await asyncio.sleep(0.3)
-
-            # Act
-            self.client.unsubscribe_quote_ticks(ETHUSDT)
-
-            # Assert
-            self.assertNotIn(ETHUSDT, self.client.subscribed_quote_ticks)
-
-            # Tear Down
-            self.data_engine.stop()
-            await self.data_engine.get_run_queue_task()
-
-        self.loop.run_until_complete(run_test())
-
-    def test_unsubscribe_trade_ticks(self):
-        async def run_test():
-            # Arrange
-            with open(TEST_PATH + "res_instruments.json") as response:
-                instruments = json.load(response)
-
-            with open(TEST_PATH + "res_trades.json") as response:
-                trades = json.load(response)
-
-            self.mock_ccxt.markets = instruments
-            self.mock_ccxt.watch_trades = trades
-
-            self.data_engine.start()
-            await asyncio.sleep(0.1)  # Allow engine message queue to start
-
-            self.client.subscribe_trade_ticks(ETHUSDT)
-
-            # Act
-            self.client.unsubscribe_trade_ticks(ETHUSDT)
-
-            # Assert
-            self.assertNotIn(ETHUSDT, self.client.subscribed_trade_ticks)
-
-            # Tear Down
-            self.data_engine.stop()
-            await self.data_engine.get_run_queue_task()
-
-        self.loop.run_until_complete(run_test())
-
     def test_unsubscribe_bars(self):
         async def run_test():
             # Arrange
@@ -609,3 +579,429 @@ class CCXTDataClientTests(unittest.TestCase):
             await self.data_engine.get_run_queue_task()
 
         self.loop.run_until_complete(run_test())
+
+
+class CCXTDataClientWatchTests(unittest.TestCase):
+
+    def setUp(self):
+        # Fixture Setup
+        self.clock = LiveClock()
+        self.logger = LiveLogger(self.clock)
+
+        # Fresh isolated loop testing pattern
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+
+        self.portfolio = Portfolio(
+            clock=self.clock,
+            logger=self.logger,
+        )
+
+        self.data_engine = BatchRecordingDataEngine(
+            loop=self.loop,
+            portfolio=self.portfolio,
+            clock=self.clock,
+            logger=self.logger,
+        )
+
+        with open(TEST_PATH + "res_instruments.json") as response:
+            self.instruments = json.load(response)
+
+        with open(TEST_PATH + "res_order_book.json") as response:
+            self.order_book = json.load(response)
+
+        with open(TEST_PATH + "res_trades.json") as response:
+            self.trades = json.load(response)
+
+    def tearDown(self):
+        self.loop.stop()
+        self.loop.close()
+
+    def create_client(self, combined_streams=False, snapshot_cache=None):
+        self.exchange = FakeCCXTProExchange(self.instruments, combined_streams)
+        self.client = CCXTDataClient(
+            client=self.exchange,
+            engine=self.data_engine,
+            clock=self.clock,
+            logger=self.logger,
+            snapshot_cache=snapshot_cache,
+        )
+
+        self.data_engine.register_client(self.client)
+
+    def order_book_for(self, symbol, best_bid=None):
+        order_book = dict(self.order_book, symbol=symbol.code)
+        if best_bid is not None:
+            order_book["bids"] = [[best_bid, 1.0]] + order_book["bids"][1:]
+        return order_book
+
+    def test_subscribe_quote_ticks(self):
+        async def run_test():
+            # Arrange
+            self.create_client()
+            self.data_engine.start()
+            await asyncio.sleep(0.1)  # Allow engine message queue to start
+
+            # Act
+            self.client.subscribe_quote_ticks(ETHUSDT)
+            self.exchange.push_order_book(self.order_book_for(ETHUSDT))
+            await asyncio.sleep(0.3)
+
+            # Assert
+            self.assertIn(ETHUSDT, self.client.subscribed_quote_ticks)
+            self.assertTrue(self.data_engine.cache.has_quote_ticks(ETHUSDT))
+
+            # Tear Down
+            self.data_engine.stop()
+            await self.data_engine.get_run_queue_task()
+
+        self.loop.run_until_complete(run_test())
+
+    def test_subscribe_trade_ticks(self):
+        async def run_test():
+            # Arrange
+            self.create_client()
+            self.data_engine.start()
+            await asyncio.sleep(0.1)  # Allow engine message queue to start
+
+            # Act
+            self.client.subscribe_trade_ticks(ETHUSDT)
+            self.exchange.push_trades(ETHUSDT.code, self.trades)
+            await asyncio.sleep(0.3)
+
+            # Assert
+            self.assertIn(ETHUSDT, self.client.subscribed_trade_ticks)
+            self.assertTrue(self.data_engine.cache.has_trade_ticks(ETHUSDT))
+
+            # Tear Down
+            self.data_engine.stop()
+            await self.data_engine.get_run_queue_task()
+
+        self.loop.run_until_complete(run_test())
+
+    def test_unsubscribe_quote_ticks(self):
+        async def run_test():
+            # Arrange
+            self.create_client()
+            self.data_engine.start()
+            await asyncio.sleep(0.1)  # Allow engine message queue to start
+
+            self.client.subscribe_quote_ticks(ETHUSDT)
+            self.exchange.push_order_book(self.order_book_for(ETHUSDT))
+            await asyncio.sleep(0.3)
+
+            # Act
+            self.client.unsubscribe_quote_ticks(ETHUSDT)
+
+            # Assert
+            self.assertNotIn(ETHUSDT, self.client.subscribed_quote_ticks)
+
+            # Tear Down
+            self.data_engine.stop()
+            await self.data_engine.get_run_queue_task()
+
+        self.loop.run_until_complete(run_test())
+
+    def test_unsubscribe_trade_ticks(self):
+        async def run_test():
+            # Arrange
+            self.create_client()
+            self.data_engine.start()
+            await asyncio.sleep(0.1)  # Allow engine message queue to start
+
+            self.client.subscribe_trade_ticks(ETHUSDT)
+
+            # Act
+            self.client.unsubscribe_trade_ticks(ETHUSDT)
+
+            # Assert
+            self.assertNotIn(ETHUSDT, self.client.subscribed_trade_ticks)
+
+            # Tear Down
+            self.data_engine.stop()
+            await self.data_engine.get_run_queue_task()
+
+        self.loop.run_until_complete(run_test())
+
+    def test_subscribe_quote_ticks_for_many_symbols_uses_one_combined_stream(self):
+        async def run_test():
+            # Arrange
+            self.create_client(combined_streams=True)
+            self.data_engine.start()
+            await asyncio.sleep(0.1)  # Allow engine message queue to start
+
+            # Act
+            self.client.subscribe_quote_ticks(BTCUSDT)
+            self.client.subscribe_quote_ticks(ETHUSDT)
+            self.exchange.push_order_book(self.order_book_for(BTCUSDT))
+            self.exchange.push_order_book(self.order_book_for(ETHUSDT))
+            await asyncio.sleep(0.3)
+
+            # Assert
+            self.assertEqual(
+                ("watch_order_book_for_symbols", ("BTC/USDT", "ETH/USDT")),
+                self.exchange.watch_calls[0],
+            )
+            self.assertEqual(1, len({symbols for _, symbols in self.exchange.watch_calls}))
+            self.assertEqual(1, self.data_engine.cache.quote_tick_count(BTCUSDT))
+            self.assertEqual(1, self.data_engine.cache.quote_tick_count(ETHUSDT))
+
+            # Tear Down
+            self.data_engine.stop()
+            await self.data_engine.get_run_queue_task()
+
+        self.loop.run_until_complete(run_test())
+
+    def test_subscribe_quote_ticks_when_watching_resubscribes_combined_stream(self):
+        async def run_test():
+            # Arrange
+            self.create_client(combined_streams=True)
+            self.data_engine.start()
+            await asyncio.sleep(0.1)  # Allow engine message queue to start
+
+            self.client.subscribe_quote_ticks(BTCUSDT)
+            await asyncio.sleep(0.1)
+
+            # Act
+            self.client.subscribe_quote_ticks(ETHUSDT)
+            await asyncio.sleep(0.1)
+
+            # Assert
+            self.assertEqual(
+                [
+                    ("watch_order_book_for_symbols", ("BTC/USDT",)),
+                    ("watch_order_book_for_symbols", ("BTC/USDT", "ETH/USDT")),
+                ],
+                self.exchange.watch_calls,
+            )
+
+            # Tear Down
+            self.data_engine.stop()
+            await self.data_engine.get_run_queue_task()
+
+        self.loop.run_until_complete(run_test())
+
+    def test_order_book_updates_received_together_handed_to_engine_as_one_batch(self):
+        async def run_test():
+            # Arrange
+            self.create_client()
+            self.data_engine.start()
+            await asyncio.sleep(0.1)  # Allow engine message queue to start
+
+            # Act
+            self.client.subscribe_quote_ticks(BTCUSDT)
+            self.client.subscribe_quote_ticks(ETHUSDT)
+            self.exchange.push_order_book(self.order_book_for(BTCUSDT))
+            self.exchange.push_order_book(self.order_book_for(ETHUSDT))
+            await asyncio.sleep(0.3)
+
+            # Assert
+            self.assertEqual(1, len(self.data_engine.batches))
+            self.assertEqual([BTCUSDT, ETHUSDT], sorted(tick.symbol for tick in self.data_engine.batches[0]))
+
+            # Tear Down
+            self.data_engine.stop()
+            await self.data_engine.get_run_queue_task()
+
+        self.loop.run_until_complete(run_test())
+
+    def test_watch_error_for_one_symbol_rearms_only_that_symbol(self):
+        async def run_test():
+            # Arrange
+            self.create_client()
+            self.data_engine.start()
+            await asyncio.sleep(0.1)  # Allow engine message queue to start
+
+            self.client.subscribe_quote_ticks(BTCUSDT)
+            self.client.subscribe_quote_ticks(ETHUSDT)
+            await asyncio.sleep(0.1)
+
+            # Act
+            self.exchange.push_order_book_error(BTCUSDT.code, ConnectionError("stream closed"))
+            self.exchange.push_order_book(self.order_book_for(ETHUSDT))
+            await asyncio.sleep(0.1)
+            eth_ticks_after_error = self.data_engine.cache.quote_tick_count(ETHUSDT)
+
+            self.exchange.push_order_book(self.order_book_for(BTCUSDT))
+            await asyncio.sleep(1.2)  # Allow the failed watch to be re-armed
+
+            # Assert
+            self.assertEqual(1, eth_ticks_after_error)
+            self.assertEqual(1, self.data_engine.cache.quote_tick_count(BTCUSDT))
+            self.assertEqual([BTCUSDT, ETHUSDT], self.client.subscribed_quote_ticks)
+
+            # Tear Down
+            self.data_engine.stop()
+            await self.data_engine.get_run_queue_task()
+
+        self.loop.run_until_complete(run_test())
+
+    def test_order_book_update_with_unchanged_top_of_book_skips_quote_tick(self):
+        async def run_test():
+            # Arrange
+            self.create_client()
+            self.data_engine.start()
+            await asyncio.sleep(0.1)  # Allow engine message queue to start
+
+            self.client.subscribe_quote_ticks(ETHUSDT)
+
+            # Act
+            self.exchange.push_order_book(self.order_book_for(ETHUSDT))
+            self.exchange.push_order_book(self.order_book_for(ETHUSDT))
+            self.exchange.push_order_book(self.order_book_for(ETHUSDT, best_bid=1219.12))
+            await asyncio.sleep(0.3)
+
+            # Assert
+            self.assertEqual(2, self.data_engine.cache.quote_tick_count(ETHUSDT))
+
+            # Tear Down
+            self.data_engine.stop()
+            await self.data_engine.get_run_queue_task()
+
+        self.loop.run_until_complete(run_test())
+
+    def test_unsubscribe_quote_ticks_for_last_symbol_stops_watcher(self):
+        async def run_test():
+            # Arrange
+            self.create_client()
+            self.data_engine.start()
+            await asyncio.sleep(0.1)  # Allow engine message queue to start
+
+            self.client.subscribe_quote_ticks(ETHUSDT)
+            await asyncio.sleep(0.1)
+
+            # Act
+            self.client.unsubscribe_quote_ticks(ETHUSDT)
+            self.exchange.push_order_book(self.order_book_for(ETHUSDT))
+            await asyncio.sleep(0.1)
+
+            # Assert
+            self.assertEqual([("watch_order_book", "ETH/USDT")], self.exchange.watch_calls)
+            self.assertFalse(self.data_engine.cache.has_quote_ticks(ETHUSDT))
+
+            # Tear Down
+            self.data_engine.stop()
+            await self.data_engine.get_run_queue_task()
+
+        self.loop.run_until_complete(run_test())
+
+    def test_subscribe_trade_ticks_for_many_symbols_uses_one_combined_stream(self):
+        async def run_test():
+            # Arrange
+            self.create_client(combined_streams=True)
+            self.data_engine.start()
+            await asyncio.sleep(0.1)  # Allow engine message queue to start
+
+            # Act
+            self.client.subscribe_trade_ticks(BTCUSDT)
+            self.client.subscribe_trade_ticks(ETHUSDT)
+            self.exchange.push_trades(ETHUSDT.code, self.trades)
+            await asyncio.sleep(0.3)
+
+            # Assert
+            self.assertEqual(
+                [("watch_trades_for_symbols", ("BTC/USDT", "ETH/USDT"))],
+                self.exchange.watch_calls[:1],
+            )
+            self.assertEqual(1, len(self.data_engine.batches))
+            self.assertEqual(len(self.trades), len(self.data_engine.batches[0]))
+            self.assertTrue(self.data_engine.cache.has_trade_ticks(ETHUSDT))
+
+            # Tear Down
+            self.data_engine.stop()
+            await self.data_engine.get_run_queue_task()
+
+        self.loop.run_until_complete(run_test())
+
+    def test_request_instruments_without_snapshot_responds_once(self):
+        async def run_test():
+            # Arrange
+            self.create_client()
+
+            # Act
+            self.data_engine.start()  # Requests instruments on start
+            await asyncio.sleep(0.3)
+
+            # Assert
+            self.assertTrue(self.client.initialized)
+            self.assertIsNotNone(self.data_engine.cache.instrument(ETHUSDT))
+            self.assertEqual(1, self.data_engine.response_count)
+            self.assertEqual(0, self.data_engine.data_count)  # Not sent again as data
+
+            # Tear Down
+            self.data_engine.stop()
+            await self.data_engine.get_run_queue_task()
+
+        self.loop.run_until_complete(run_test())
+
+    def test_request_instruments_with_snapshot_responds_from_snapshot_then_reconciles(self):
+        async def run_test():
+            with tempfile.TemporaryDirectory() as tempdir:
+                # Arrange
+                snapshot_cache = InstrumentSnapshotCache(tempdir, BINANCE, self.logger)
+
+                # Snapshot saved by a previous run, ETH/USDT has since been activated
+                previous_markets = dict(self.instruments)
+                previous_markets["ETH/USDT"] = dict(self.instruments["ETH/USDT"], active=False)
+                provider = CCXTInstrumentProvider(
+                    client=FakeCCXTProExchange(previous_markets),
+                    snapshot_cache=snapshot_cache,
+                )
+                await provider.load_all_async()
+
+                self.create_client(snapshot_cache=snapshot_cache)
+                self.exchange.load_markets_delay = 0.3
+
+                # Act
+                self.data_engine.start()  # Requests instruments on start
+                await asyncio.sleep(0.1)
+
+                # Assert
+                self.assertTrue(self.client.initialized)
+                self.assertFalse(self.data_engine.cache.instrument(ETHUSDT).info["active"])
+
+                await asyncio.sleep(0.5)
+                self.assertTrue(self.data_engine.cache.instrument(ETHUSDT).info["active"])
+                self.assertEqual(1, self.data_engine.data_count)  # Only the changed instrument
+
+                # Tear Down
+                self.data_engine.stop()
+                await self.data_engine.get_run_queue_task()
+
+        self.loop.run_until_complete(run_test())
+
+    def test_request_instruments_with_snapshot_removes_delisted_instruments(self):
+        async def run_test():
+            with tempfile.TemporaryDirectory() as tempdir:
+                # Arrange
+                snapshot_cache = InstrumentSnapshotCache(tempdir, BINANCE, self.logger)
+
+                # Snapshot saved by a previous run, ETH/USDT has since been delisted
+                provider = CCXTInstrumentProvider(
+                    client=FakeCCXTProExchange(self.instruments),
+                    snapshot_cache=snapshot_cache,
+                )
+                await provider.load_all_async()
+
+                del self.instruments["ETH/USDT"]
+                self.create_client(snapshot_cache=snapshot_cache)
+                self.exchange.load_markets_delay = 0.3
+
+                # Act
+                self.data_engine.start()  # Requests instruments on start
+                await asyncio.sleep(0.1)
+
+                # Assert
+                self.assertIn(ETHUSDT, snapshot_cache.load())
+
+                await asyncio.sleep(0.5)
+                snapshot = snapshot_cache.load()
+                self.assertNotIn(ETHUSDT, snapshot)
+                self.assertIn(BTCUSDT, snapshot)
+                self.assertEqual(0, self.data_engine.data_count)  # Nothing changed
+
+                # Tear Down
+                self.data_engine.stop()
+                await self.data_engine.get_run_queue_task()
+
+        self.loop.run_until_complete(run_test())
@@ -15,10 +15,14 @@
 
 import asyncio
 import json
+import tempfile
 import unittest
 from unittest.mock import MagicMock
 
 from nautilus_trader.adapters.ccxt.providers import CCXTInstrumentProvider
+from nautilus_trader.common.clock import LiveClock
+from nautilus_trader.common.logging import TestLogger
+from nautilus_trader.live.snapshot import InstrumentSnapshotCache
 from nautilus_trader.model.currencies import BTC
 from nautilus_trader.model.currencies import USDT
 from nautilus_trader.model.enums import AssetClass
@@ -177,3 +181,49 @@ class CCXTInstrumentProviderTests(unittest.TestCase):
         self.assertEqual(BTC, instrument.base_currency)
         self.assertEqual(USDT, instrument.quote_currency)
         self.assertEqual(USDT, instrument.settlement_currency)
+
+    def test_load_snapshot_when_no_snapshot_cache_returns_false(self):
+        # Arrange
+        mock_client = MagicMock()
+        mock_client.name = "Binance"
+
+        provider = CCXTInstrumentProvider(client=mock_client)
+
+        # Act
+        result = provider.load_snapshot()
+
+        # Assert
+        self.assertFalse(result)
+        self.assertEqual(0, provider.count)
+
+    def test_load_snapshot_after_load_all_loads_saved_instruments(self):
+        # Arrange
+        mock_client = MagicMock()
+        mock_client.name = "Binance"
+
+        with open(TEST_PATH + "res_instruments.json") as response:
+            instruments = json.load(response)
+
+        mock_client.markets = instruments
+
+        with tempfile.TemporaryDirectory() as tempdir:
+            snapshot_cache = InstrumentSnapshotCache(
+                path=tempdir,
+                venue=Venue("BINANCE"),
+                logger=TestLogger(LiveClock()),
+            )
+
+            provider = CCXTInstrumentProvider(client=mock_client, snapshot_cache=snapshot_cache)
+            provider.load_all()
+
+            new_client = MagicMock()
+            new_client.name = "Binance"
+            new_provider = CCXTInstrumentProvider(client=new_client, snapshot_cache=snapshot_cache)
+
+            # Act
+            result = new_provider.load_snapshot()
+
+            # Assert
+            self.assertTrue(result)
+            self.assertEqual(provider.count, new_provider.count)
+            self.assertEqual(provider.get_all(), new_provider.get_all())
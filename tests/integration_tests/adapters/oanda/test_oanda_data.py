@@ -15,9 +15,21 @@
 
 import asyncio
 import concurrent.futures
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+import importlib
 import json
+import threading
+import time
 import unittest
 from unittest.mock import MagicMock
+from unittest.mock import patch
+from urllib.parse import parse_qs
+from urllib.parse import urlparse
+
+import oandapyV20
+import pytz
 
 from nautilus_trader.adapters.oanda.data import OandaDataClient
 from nautilus_trader.common.clock import LiveClock
@@ -35,6 +47,7 @@ from nautilus_trader.model.enums import PriceType
 from nautilus_trader.model.identifiers import Symbol
 from nautilus_trader.model.identifiers import TraderId
 from nautilus_trader.model.identifiers import Venue
+from nautilus_trader.model.objects import Price
 from nautilus_trader.trading.portfolio import Portfolio
 from tests import PACKAGE_ROOT
 from tests.test_kit.mocks import ObjectStorer
@@ -44,6 +57,62 @@ TEST_PATH = PACKAGE_ROOT + "/integration_tests/adapters/oanda/"
 
 OANDA = Venue("OANDA")
 AUDUSD = Symbol("AUD/USD", OANDA)
+EURUSD = Symbol("EUR/USD", OANDA)
+
+
+class PricingStreamHandler(BaseHTTPRequestHandler):
+
+    def do_GET(self):
+        instruments = parse_qs(urlparse(self.path).query)["instruments"][0].split(",")
+        self.server.requested.append(instruments)
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/octet-stream")
+        self.end_headers()
+
+        try:
+            # Stream the recorded lines for the requested instruments, then
+            # heartbeats until stopped as Oanda does.
+            for line in self.server.lines:
+                if line["type"] == "PRICE" and line["instrument"] not in instruments:
+                    continue
+                self.wfile.write(json.dumps(line).encode() + b"\n")
+                self.wfile.flush()
+            while not self.server.stopped.is_set():
+                self.wfile.write(b'{"type": "HEARTBEAT", "time": "2021-01-18T06:11:43.000000000Z"}\n')
+                self.wfile.flush()
+                time.sleep(0.05)
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # Client reconnected
+
+    def log_message(self, format, *args):
+        pass  # Do not log requests
+
+
+class PricingStreamStub(ThreadingHTTPServer):
+    """
+    A local HTTP server streaming recorded Oanda price lines.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, lines):
+        super().__init__(("127.0.0.1", 0), PricingStreamHandler)
+        self.lines = lines
+        self.requested = []  # The instruments of each stream request
+        self.stopped = threading.Event()
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def start(self):
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+
+    def stop(self):
+        self.stopped.set()
+        self.shutdown()
+        self.server_close()
 
 
 class OandaDataClientTests(unittest.TestCase):
@@ -315,3 +384,144 @@ class OandaDataClientTests(unittest.TestCase):
             self.data_engine.dispose()
 
         self.loop.run_until_complete(run_test())
+
+
+class OandaDataClientPriceStreamTests(unittest.TestCase):
+
+    def setUp(self):
+        # Fixture Setup
+        self.clock = LiveClock()
+        self.logger = LiveLogger(self.clock)
+
+        # Fresh isolated loop testing pattern
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.executor = concurrent.futures.ThreadPoolExecutor()
+        self.loop.set_default_executor(self.executor)
+
+        with open(TEST_PATH + "res_pricing_stream.json") as response:
+            self.stub = PricingStreamStub(json.load(response))
+        self.stub.start()
+
+        # Point a real Oanda client at the local stub
+        environments = importlib.import_module("oandapyV20.oandapyV20").TRADING_ENVIRONMENTS
+        self.environments_patch = patch.dict(
+            environments,
+            {"stub": {"stream": self.stub.url, "api": self.stub.url}},
+        )
+        self.environments_patch.start()
+
+        self.portfolio = Portfolio(
+            clock=self.clock,
+            logger=self.logger,
+        )
+
+        self.data_engine = LiveDataEngine(
+            loop=self.loop,
+            portfolio=self.portfolio,
+            clock=self.clock,
+            logger=self.logger,
+        )
+
+        self.client = OandaDataClient(
+            client=oandapyV20.API(access_token="TOKEN", environment="stub"),
+            account_id="001",
+            engine=self.data_engine,
+            clock=self.clock,
+            logger=self.logger,
+        )
+
+        self.data_engine.register_client(self.client)
+
+    def tearDown(self):
+        self.stub.stop()
+        self.executor.shutdown(wait=True)
+        self.environments_patch.stop()
+        self.loop.stop()
+        self.loop.close()
+
+    def test_subscribe_quote_ticks_for_many_symbols_streams_over_one_connection(self):
+        async def run_test():
+            # Arrange
+            self.data_engine.start()
+
+            # Act
+            self.client.subscribe_quote_ticks(AUDUSD)
+            self.client.subscribe_quote_ticks(EURUSD)
+            await asyncio.sleep(0.5)
+
+            # Assert
+            self.assertEqual(["AUD_USD", "EUR_USD"], self.stub.requested[-1])
+            self.assertEqual(3, self.data_engine.cache.quote_tick_count(AUDUSD))
+            self.assertEqual(2, self.data_engine.cache.quote_tick_count(EURUSD))
+
+            # Tear Down
+            self.client.disconnect()
+            self.data_engine.stop()
+            await asyncio.sleep(0.2)
+
+        self.loop.run_until_complete(run_test())
+
+    def test_subscribe_quote_ticks_when_streaming_resubscribes_with_all_symbols(self):
+        async def run_test():
+            # Arrange
+            self.data_engine.start()
+            self.client.subscribe_quote_ticks(AUDUSD)
+            await asyncio.sleep(0.3)
+
+            # Act
+            self.client.subscribe_quote_ticks(EURUSD)
+            await asyncio.sleep(0.3)
+
+            # Assert
+            self.assertEqual([["AUD_USD"], ["AUD_USD", "EUR_USD"]], self.stub.requested)
+            self.assertEqual(2, self.data_engine.cache.quote_tick_count(EURUSD))
+
+            # Tear Down
+            self.client.disconnect()
+            self.data_engine.stop()
+            await asyncio.sleep(0.2)
+
+        self.loop.run_until_complete(run_test())
+
+    def test_unsubscribe_quote_ticks_for_last_symbol_stops_stream(self):
+        async def run_test():
+            # Arrange
+            self.data_engine.start()
+            self.client.subscribe_quote_ticks(AUDUSD)
+            await asyncio.sleep(0.3)
+
+            # Act
+            self.client.unsubscribe_quote_ticks(AUDUSD)
+            await asyncio.sleep(0.3)
+
+            # Assert
+            self.assertEqual([], self.client.subscribed_quote_ticks)
+            self.assertEqual([["AUD_USD"]], self.stub.requested)
+
+            # Tear Down
+            self.data_engine.stop()
+
+        self.loop.run_until_complete(run_test())
+
+    def test_streamed_prices_parsed_to_quote_ticks(self):
+        async def run_test():
+            # Arrange
+            self.data_engine.start()
+
+            # Act
+            self.client.subscribe_quote_ticks(AUDUSD)
+            await asyncio.sleep(0.3)
+
+            # Assert
+            tick = self.data_engine.cache.quote_tick(AUDUSD, index=-1)  # First tick
+            self.assertEqual(Price("0.77165"), tick.bid)
+            self.assertEqual(Price("0.77181"), tick.ask)
+            self.assertEqual(datetime(2021, 1, 18, 6, 11, 40, 912749, tzinfo=pytz.utc), tick.timestamp)
+
+            # Tear Down
+            self.client.disconnect()
+            self.data_engine.stop()
+            await asyncio.sleep(0.2)
+
+        self.loop.run_until_complete(run_test())
@@ -128,6 +128,43 @@ class BacktestEnginePerformanceTests(unittest.TestCase):
         s = pstats.Stats(stats_file)
         s.strip_dirs().sort_stats("time").print_stats()
 
+    @staticmethod
+    def test_run_for_bar_execution():
+        # Arrange
+        data = BacktestDataContainer()
+        data.add_instrument(USDJPY_SIM)
+        data.add_bars(USDJPY_SIM.symbol, BarAggregation.MINUTE, PriceType.BID, TestDataProvider.usdjpy_1min_bid())
+        data.add_bars(USDJPY_SIM.symbol, BarAggregation.MINUTE, PriceType.ASK, TestDataProvider.usdjpy_1min_ask())
+
+        strategy = EMACross(
+            symbol=USDJPY_SIM.symbol,
+            bar_spec=TestStubs.bar_spec_1min_bid(),
+            trade_size=Decimal(1_000_000),
+            fast_ema=10,
+            slow_ema=20,
+        )
+
+        engine = BacktestEngine(
+            data=data,
+            strategies=[strategy],
+            bypass_logging=True,
+            bar_execution=True,
+        )
+
+        engine.add_exchange(
+            venue=Venue("SIM"),
+            oms_type=OMSType.HEDGING,
+            starting_balances=[Money(1_000_000, USD)],
+        )
+
+        start = datetime(2013, 2, 1, 0, 0, 0, 0, tzinfo=pytz.utc)
+        stop = datetime(2013, 2, 10, 0, 0, 0, 0, tzinfo=pytz.utc)
+
+        stats_file = "perf_stats_bar_execution.prof"
+        cProfile.runctx("engine.run(start, stop)", globals(), locals(), stats_file)
+        s = pstats.Stats(stats_file)
+        s.strip_dirs().sort_stats("time").print_stats()
+
     @staticmethod
     def test_run_with_ema_cross_strategy():
         # Arrange
@@ -0,0 +1,99 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2021 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import unittest
+
+from nautilus_trader.common.clock import LiveClock
+from nautilus_trader.common.logging import TestLogger
+from nautilus_trader.execution.cache import ExecutionCache
+from nautilus_trader.execution.database import BypassExecutionDatabase
+from nautilus_trader.model.enums import OrderSide
+from nautilus_trader.model.identifiers import PositionId
+from nautilus_trader.model.identifiers import TraderId
+from nautilus_trader.model.objects import Price
+from nautilus_trader.model.objects import Quantity
+from nautilus_trader.trading.strategy import TradingStrategy
+from tests.test_kit.performance import PerformanceHarness
+from tests.test_kit.stubs import TestStubs
+
+
+AUDUSD_SIM = TestStubs.symbol_audusd_fxcm()
+GBPUSD_SIM = TestStubs.symbol_gbpusd_fxcm()
+
+
+class ExecutionCachePerformanceTests(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        # Fixture Setup
+        clock = LiveClock()
+        logger = TestLogger(clock, bypass_logging=True)
+
+        trader_id = TraderId("TESTER", "000")
+        cls.strategy = TradingStrategy(order_id_tag="001")
+        cls.strategy.register_trader(trader_id, clock, logger)
+
+        cls.cache = ExecutionCache(
+            database=BypassExecutionDatabase(trader_id=trader_id, logger=logger),
+            logger=logger,
+        )
+
+        # 100,000 historical (completed) orders split across two symbols
+        for i in range(100000):
+            order = cls.strategy.order_factory.limit(
+                AUDUSD_SIM if i % 2 == 0 else GBPUSD_SIM,
+                OrderSide.BUY,
+                Quantity(100000),
+                Price("1.00000"),
+            )
+            cls.cache.add_order(order, PositionId.null())
+            order.apply(TestStubs.event_order_submitted(order))
+            order.apply(TestStubs.event_order_rejected(order))
+            cls.cache.update_order(order)
+
+        # A handful of working orders
+        for _i in range(10):
+            order = cls.strategy.order_factory.limit(
+                AUDUSD_SIM,
+                OrderSide.BUY,
+                Quantity(100000),
+                Price("1.00000"),
+            )
+            cls.cache.add_order(order, PositionId.null())
+            order.apply(TestStubs.event_order_submitted(order))
+            order.apply(TestStubs.event_order_accepted(order))
+            order.apply(TestStubs.event_order_working(order))
+            cls.cache.update_order(order)
+
+    def orders_working_for_symbol(self):
+        self.cache.orders_working(AUDUSD_SIM)
+
+    def orders_working_for_symbol_and_strategy(self):
+        self.cache.orders_working(AUDUSD_SIM, self.strategy.id)
+
+    def orders_working_count_for_symbol(self):
+        self.cache.orders_working_count(AUDUSD_SIM)
+
+    def test_orders_working_for_symbol(self):
+        PerformanceHarness.profile_function(self.orders_working_for_symbol, 3, 100000)
+        # ~67ms (67496μs) minimum of 3 runs @ 100,000 iterations each run.
+
+    def test_orders_working_for_symbol_and_strategy(self):
+        PerformanceHarness.profile_function(self.orders_working_for_symbol_and_strategy, 3, 100000)
+        # ~69ms (68761μs) minimum of 3 runs @ 100,000 iterations each run.
+
+    def test_orders_working_count_for_symbol(self):
+        PerformanceHarness.profile_function(self.orders_working_count_for_symbol, 3, 100000)
+        # ~30ms (30111μs) minimum of 3 runs @ 100,000 iterations each run.
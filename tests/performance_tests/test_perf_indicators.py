@@ -0,0 +1,55 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2021 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import unittest
+
+from nautilus_trader.indicators.average.sma import SimpleMovingAverage
+from nautilus_trader.indicators.bollinger_bands import BollingerBands
+from nautilus_trader.indicators.donchian_channel import DonchianChannel
+from tests.test_kit.performance import PerformanceHarness
+
+
+class IndicatorPerformanceTests(unittest.TestCase):
+
+    def setUp(self):
+        # Fixture Setup
+        self.sma = SimpleMovingAverage(1000)
+        self.bb = BollingerBands(1000, 2.0)
+        self.dc = DonchianChannel(1000)
+        self.price = 1.00000
+
+    def sma_update(self):
+        self.price += 0.00001
+        self.sma.update_raw(self.price)
+
+    def bb_update(self):
+        self.price += 0.00001
+        self.bb.update_raw(self.price, self.price, self.price)
+
+    def dc_update(self):
+        self.price += 0.00001
+        self.dc.update_raw(self.price, self.price)
+
+    def test_sma_update_raw_with_long_period(self):
+        PerformanceHarness.profile_function(self.sma_update, 3, 100000)
+        # ~28ms (28815μs) minimum of 3 runs @ 100,000 iterations each run.
+
+    def test_bollinger_bands_update_raw_with_long_period(self):
+        PerformanceHarness.profile_function(self.bb_update, 3, 100000)
+        # ~93ms (93766μs) minimum of 3 runs @ 100,000 iterations each run.
+
+    def test_donchian_channel_update_raw_with_long_period(self):
+        PerformanceHarness.profile_function(self.dc_update, 3, 100000)
+        # ~104ms (104755μs) minimum of 3 runs @ 100,000 iterations each run.
@@ -0,0 +1,112 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2021 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import unittest
+
+from nautilus_trader.backtest.data_client import BacktestDataClient
+from nautilus_trader.common.clock import TestClock
+from nautilus_trader.common.latency import LatencyHistogram
+from nautilus_trader.common.latency import LatencyRecorder
+from nautilus_trader.common.logging import TestLogger
+from nautilus_trader.common.messages import Subscribe
+from nautilus_trader.common.uuid import UUIDFactory
+from nautilus_trader.data.engine import DataEngine
+from nautilus_trader.model.identifiers import TraderId
+from nautilus_trader.model.tick import QuoteTick
+from nautilus_trader.trading.portfolio import Portfolio
+from nautilus_trader.trading.strategy import TradingStrategy
+from tests.test_kit.performance import PerformanceHarness
+from tests.test_kit.providers import TestInstrumentProvider
+from tests.test_kit.stubs import TestStubs
+
+
+AUDUSD_SIM = TestInstrumentProvider.default_fx_ccy(TestStubs.symbol_audusd_fxcm())
+TICKS = [TestStubs.quote_tick_5decimal(AUDUSD_SIM.symbol) for _ in range(100000)]
+
+
+def build_data_engine(latency_stats: bool) -> DataEngine:
+    clock = TestClock()
+    logger = TestLogger(clock, bypass_logging=True)
+
+    portfolio = Portfolio(clock=clock, logger=logger)
+    engine = DataEngine(portfolio=portfolio, clock=clock, logger=logger)
+    portfolio.register_cache(engine.cache)
+    if latency_stats:
+        engine.register_latency_recorder(LatencyRecorder())
+
+    client = BacktestDataClient(
+        instruments=[AUDUSD_SIM],
+        venue=AUDUSD_SIM.symbol.venue,
+        engine=engine,
+        clock=clock,
+        logger=logger,
+    )
+    engine.register_client(client)
+    client.connect()
+
+    strategy = TradingStrategy(order_id_tag="001")
+    strategy.register_trader(TraderId("TESTER", "000"), clock, logger)
+
+    engine.execute(Subscribe(
+        venue=AUDUSD_SIM.symbol.venue,
+        data_type=QuoteTick,
+        metadata={"Symbol": AUDUSD_SIM.symbol},
+        handler=strategy.handle_quote_tick,
+        command_id=UUIDFactory().generate(),
+        command_timestamp=clock.utc_now(),
+    ))
+
+    return engine
+
+
+disabled_engine = build_data_engine(latency_stats=False)
+enabled_engine = build_data_engine(latency_stats=True)
+histogram = LatencyHistogram()
+
+
+class LatencyTests:
+
+    @staticmethod
+    def process_ticks_latency_stats_disabled():
+        for tick in TICKS:
+            disabled_engine.process(tick)
+
+    @staticmethod
+    def process_ticks_latency_stats_enabled():
+        for tick in TICKS:
+            enabled_engine.process(tick)
+
+    @staticmethod
+    def record_histogram():
+        for value in range(100000):
+            histogram.record(value * 1_000)
+
+
+class LatencyPerformanceTests(unittest.TestCase):
+
+    @staticmethod
+    def test_process_ticks_latency_stats_disabled():
+        PerformanceHarness.profile_function(LatencyTests.process_ticks_latency_stats_disabled, 3, 1)
+        # ~211ms (211267μs) minimum of 3 runs @ 1 iterations each run.
+
+    @staticmethod
+    def test_process_ticks_latency_stats_enabled():
+        PerformanceHarness.profile_function(LatencyTests.process_ticks_latency_stats_enabled, 3, 1)
+        # ~309ms (309629μs) minimum of 3 runs @ 1 iterations each run.
+
+    @staticmethod
+    def test_record_histogram():
+        PerformanceHarness.profile_function(LatencyTests.record_histogram, 3, 1)
+        # ~11ms (11659μs) minimum of 3 runs @ 1 iterations each run.
@@ -0,0 +1,136 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2021 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import asyncio
+import time
+import unittest
+
+from nautilus_trader.common.clock import LiveClock
+from nautilus_trader.common.logging import LogLevel
+from nautilus_trader.common.logging import TestLogger
+from nautilus_trader.live.data import LiveDataEngine
+from nautilus_trader.model.identifiers import Symbol
+from nautilus_trader.model.identifiers import Venue
+from nautilus_trader.trading.portfolio import Portfolio
+from tests.test_kit.stubs import TestStubs
+
+
+BURST_SIZE = 100000
+TRICKLE_SIZE = 10000
+SYMBOLS = [Symbol(f"PAIR{i}", Venue("SIM")) for i in range(10)]
+
+
+class LiveDataEnginePerformanceTests(unittest.TestCase):
+
+    def setUp(self):
+        # Fixture Setup
+        self.clock = LiveClock()
+        self.logger = TestLogger(self.clock, level_console=LogLevel.ERROR)
+
+        self.portfolio = Portfolio(
+            clock=self.clock,
+            logger=self.logger,
+        )
+
+        # Fresh isolated loop testing pattern
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+
+        self.ticks = [TestStubs.quote_tick_5decimal(SYMBOLS[i % len(SYMBOLS)]) for i in range(BURST_SIZE)]
+
+    def tearDown(self):
+        self.loop.stop()
+        self.loop.close()
+
+    def replay_burst(self, config) -> float:
+        engine = LiveDataEngine(
+            loop=self.loop,
+            portfolio=self.portfolio,
+            clock=self.clock,
+            logger=self.logger,
+            config=config,
+        )
+
+        async def run_test():
+            engine.start()
+            start = time.perf_counter()
+
+            # Replay the whole burst before the engine can dispatch anything
+            for tick in self.ticks:
+                engine.process(tick)
+
+            while engine.data_count + sum(engine.coalesced_counts().values()) < BURST_SIZE:
+                await asyncio.sleep(0)
+
+            elapsed = time.perf_counter() - start
+            engine.stop()
+            await asyncio.sleep(0)
+            return elapsed
+
+        elapsed = self.loop.run_until_complete(run_test())
+        engine.dispose()
+
+        print(f"\nPerformance test: replay {BURST_SIZE:,} quote ticks (config={config}) ")
+        print(f"# ~{int(elapsed * 1000)}ms to drain, "
+              f"dispatched={engine.data_count:,}, "
+              f"coalesced={sum(engine.coalesced_counts().values()):,}.")
+
+        return elapsed
+
+    def replay_trickle(self) -> list:
+        engine = LiveDataEngine(
+            loop=self.loop,
+            portfolio=self.portfolio,
+            clock=self.clock,
+            logger=self.logger,
+        )
+
+        async def run_test():
+            engine.start()
+            latencies = []
+
+            # Replay one tick at a time, timing each until it is dispatched
+            for tick in self.ticks[:TRICKLE_SIZE]:
+                count = engine.data_count
+                start = time.perf_counter_ns()
+                engine.process(tick)
+                while engine.data_count == count:
+                    await asyncio.sleep(0)
+                latencies.append(time.perf_counter_ns() - start)
+
+            engine.stop()
+            await asyncio.sleep(0)
+            return sorted(latencies)
+
+        latencies = self.loop.run_until_complete(run_test())
+        engine.dispose()
+
+        print(f"\nPerformance test: replay {TRICKLE_SIZE:,} quote ticks one at a time ")
+        print(f"# ~{latencies[len(latencies) // 2] / 1000:.0f}μs median, "
+              f"~{latencies[int(len(latencies) * 0.99)] / 1000:.0f}μs p99 process to dispatch latency.")
+
+        return latencies
+
+    def test_replay_trickle_latency(self):
+        self.replay_trickle()
+        # ~12μs median, ~24μs p99 process to dispatch latency.
+
+    def test_replay_burst_without_conflation(self):
+        self.replay_burst(config={"conflate_quote_ticks": False})
+        # ~428ms to drain, dispatched=100,000, coalesced=0.
+
+    def test_replay_burst_with_conflation(self):
+        self.replay_burst(config={"conflate_quote_ticks": True})
+        # ~135ms to drain, dispatched=10, coalesced=99,990.
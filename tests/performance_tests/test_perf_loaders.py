@@ -0,0 +1,69 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2021 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from datetime import datetime
+import os
+import tempfile
+import unittest
+
+import pytz
+
+from nautilus_trader.backtest.loaders import CSVBarDataLoader
+from nautilus_trader.backtest.loaders import CSVDataConverter
+from nautilus_trader.backtest.loaders import NumpyDataLoader
+from tests.test_kit import PACKAGE_ROOT
+from tests.test_kit.performance import PerformanceHarness
+
+
+CSV_PATH = PACKAGE_ROOT + "/data/fxcm-gbpusd-m1-bid-2012.csv"
+
+
+class DataLoaderPerformanceTests(unittest.TestCase):
+
+    def setUp(self):
+        # Fixture Setup
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.npy_path = os.path.join(self.tempdir.name, "gbpusd-m1-bid.npy")
+        CSVDataConverter.to_numpy(CSV_PATH, self.npy_path)
+
+    def tearDown(self):
+        self.tempdir.cleanup()
+
+    def test_csv_bar_data_loader_load(self):
+        PerformanceHarness.profile_function(
+            lambda: CSVBarDataLoader.load(CSV_PATH),
+            3,
+            10,
+        )
+        # ~3785ms (3785188μs) minimum of 3 runs @ 10 iterations each run.
+
+    def test_numpy_data_loader_load(self):
+        PerformanceHarness.profile_function(
+            lambda: NumpyDataLoader.load(self.npy_path),
+            3,
+            10,
+        )
+        # ~177ms (177145μs) minimum of 3 runs @ 10 iterations each run.
+
+    def test_numpy_data_loader_load_time_range(self):
+        start = datetime(2012, 2, 2, tzinfo=pytz.utc)
+        stop = datetime(2012, 2, 3, tzinfo=pytz.utc)
+
+        PerformanceHarness.profile_function(
+            lambda: NumpyDataLoader.load(self.npy_path, start, stop),
+            3,
+            10,
+        )
+        # ~12ms (12007μs) minimum of 3 runs @ 10 iterations each run.
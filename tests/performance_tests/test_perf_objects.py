@@ -25,6 +25,8 @@ from tests.test_kit.stubs import UNIX_EPOCH
 
 AUDUSD_SIM = TestStubs.symbol_audusd_fxcm()
 AUDUSD_1MIN_BID = TestStubs.bartype_audusd_1min_bid()
+TICK1 = TestStubs.quote_tick_5decimal()
+TICK2 = TestStubs.trade_tick_5decimal()
 
 
 class ObjectTests:
@@ -57,6 +59,14 @@ class ObjectTests:
             check=True,
         )
 
+    @staticmethod
+    def compare_ticks():
+        TICK1 <= TICK2
+
+    @staticmethod
+    def compare_tick_timestamps():
+        TICK1.timestamp <= TICK2.timestamp
+
 
 class ObjectPerformanceTests(unittest.TestCase):
 
@@ -74,3 +84,13 @@ class ObjectPerformanceTests(unittest.TestCase):
     def test_build_bar_with_checking():
         PerformanceHarness.profile_function(ObjectTests.build_bar_with_checking, 3, 100000)
         # ~302ms (302758μs) minimum of 3 runs @ 100,000 iterations each run.
+
+    @staticmethod
+    def test_compare_ticks():
+        PerformanceHarness.profile_function(ObjectTests.compare_ticks, 3, 1000000)
+        # ~121ms (121756μs) minimum of 3 runs @ 1,000,000 iterations each run.
+
+    @staticmethod
+    def test_compare_tick_timestamps():
+        PerformanceHarness.profile_function(ObjectTests.compare_tick_timestamps, 3, 1000000)
+        # ~101ms (101313μs) minimum of 3 runs @ 1,000,000 iterations each run.
@@ -15,14 +15,81 @@
 
 import unittest
 
+from nautilus_trader.common.c_enums.component_state import ComponentState
+from nautilus_trader.common.c_enums.component_trigger import ComponentTrigger
 from nautilus_trader.common.clock import LiveClock
+from nautilus_trader.common.component import ComponentFSMFactory
 from nautilus_trader.common.generators import OrderIdGenerator
+from nautilus_trader.core.fsm import FiniteStateMachine
+from nautilus_trader.core.uuid import uuid4
+from nautilus_trader.model.enums import OrderSide
+from nautilus_trader.model.enums import TimeInForce
+from nautilus_trader.model.identifiers import ClientOrderId
 from nautilus_trader.model.identifiers import IdTag
+from nautilus_trader.model.identifiers import StrategyId
+from nautilus_trader.model.objects import Quantity
+from nautilus_trader.model.order import MarketOrder
 from tests.test_kit.performance import PerformanceHarness
 from tests.test_kit.stubs import TestStubs
+from tests.test_kit.stubs import UNIX_EPOCH
 
 
 AUDUSD_SIM = TestStubs.symbol_audusd_fxcm()
+ORDER = MarketOrder(
+    ClientOrderId("O-123456"),
+    StrategyId("S", "001"),
+    AUDUSD_SIM,
+    OrderSide.BUY,
+    Quantity(100000),
+    TimeInForce.DAY,
+    uuid4(),
+    UNIX_EPOCH,
+)
+ORDER_EVENTS = [
+    TestStubs.event_order_submitted(ORDER),
+    TestStubs.event_order_accepted(ORDER),
+    TestStubs.event_order_cancelled(ORDER),
+]
+COMPONENT_CYCLE = [
+    ComponentTrigger.START,
+    ComponentTrigger.RUNNING,
+    ComponentTrigger.STOP,
+    ComponentTrigger.STOPPED,
+    ComponentTrigger.RESET,
+    ComponentTrigger.RESET,
+]
+
+
+class OrderTests:
+
+    @staticmethod
+    def apply_order_lifecycle():
+        order = MarketOrder(
+            ORDER.cl_ord_id,
+            ORDER.strategy_id,
+            ORDER.symbol,
+            ORDER.side,
+            ORDER.quantity,
+            ORDER.time_in_force,
+            ORDER.init_id,
+            ORDER.timestamp,
+        )
+
+        for event in ORDER_EVENTS:
+            order.apply(event)
+
+
+class FiniteStateMachineTests:
+
+    fsm = FiniteStateMachine(
+        state_transition_table=ComponentFSMFactory.get_state_transition_table(),
+        initial_state=ComponentState.INITIALIZED,
+    )
+
+    @staticmethod
+    def trigger_component_cycle():
+        for trigger in COMPONENT_CYCLE:
+            FiniteStateMachineTests.fsm.trigger(trigger)
 
 
 class OrderPerformanceTests(unittest.TestCase):
@@ -34,3 +101,11 @@ class OrderPerformanceTests(unittest.TestCase):
     def test_order_id_generator(self):
         PerformanceHarness.profile_function(self.generator.generate, 3, 10000)
         # ~30ms (18831μs) minimum of 5 runs @ 10000 iterations
+
+    def test_apply_order_lifecycle(self):
+        PerformanceHarness.profile_function(OrderTests.apply_order_lifecycle, 3, 100000)
+        # ~1184ms (1184696μs) minimum of 3 runs @ 100000 iterations each run.
+
+    def test_fsm_trigger(self):
+        PerformanceHarness.profile_function(FiniteStateMachineTests.trigger_component_cycle, 3, 100000)
+        # ~57ms (57598μs) minimum of 3 runs @ 100000 iterations each run.
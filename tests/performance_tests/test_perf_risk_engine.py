@@ -0,0 +1,92 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2021 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import unittest
+
+from nautilus_trader.common.clock import LiveClock
+from nautilus_trader.common.logging import TestLogger
+from nautilus_trader.common.uuid import UUIDFactory
+from nautilus_trader.data.cache import DataCache
+from nautilus_trader.model.commands import SubmitOrder
+from nautilus_trader.model.enums import OrderSide
+from nautilus_trader.model.identifiers import PositionId
+from nautilus_trader.model.identifiers import TraderId
+from nautilus_trader.model.identifiers import Venue
+from nautilus_trader.model.objects import Price
+from nautilus_trader.model.objects import Quantity
+from nautilus_trader.risk.engine import RiskEngine
+from nautilus_trader.trading.portfolio import Portfolio
+from nautilus_trader.trading.strategy import TradingStrategy
+from tests.test_kit.performance import PerformanceHarness
+from tests.test_kit.providers import TestInstrumentProvider
+from tests.test_kit.stubs import TestStubs
+
+
+AUDUSD_SIM = TestInstrumentProvider.default_fx_ccy(TestStubs.symbol_audusd_fxcm())
+
+
+class RiskEnginePerformanceTests(unittest.TestCase):
+
+    def setUp(self):
+        # Fixture Setup
+        clock = LiveClock()
+        logger = TestLogger(clock, bypass_logging=True)
+
+        data_cache = DataCache(logger)
+        data_cache.add_instrument(AUDUSD_SIM)
+        data_cache.add_quote_tick(TestStubs.quote_tick_5decimal(AUDUSD_SIM.symbol))
+
+        portfolio = Portfolio(clock=clock, logger=logger)
+        portfolio.register_cache(data_cache)
+
+        self.risk_engine = RiskEngine(
+            cache=data_cache,
+            portfolio=portfolio,
+            clock=clock,
+            logger=logger,
+            config={"max_order_rate": 1_000_000},
+        )
+
+        self.risk_engine.set_max_notional_per_order(AUDUSD_SIM.symbol, 1_000_000)
+        self.risk_engine.set_max_position(AUDUSD_SIM.symbol, 1_000_000)
+        self.risk_engine.set_price_band(AUDUSD_SIM.symbol, "0.05")
+
+        strategy = TradingStrategy(order_id_tag="001")
+        strategy.register_trader(TraderId("TESTER", "000"), clock, logger)
+
+        order = strategy.order_factory.limit(
+            AUDUSD_SIM.symbol,
+            OrderSide.BUY,
+            Quantity(100000),
+            Price("1.00000"),
+        )
+
+        self.command = SubmitOrder(
+            Venue("SIM"),
+            TraderId("TESTER", "000"),
+            TestStubs.account_id(),
+            strategy.id,
+            PositionId.null(),
+            order,
+            UUIDFactory().generate(),
+            clock.utc_now(),
+        )
+
+    def check_submit_order(self):
+        self.risk_engine.check_submit_order(self.command)
+
+    def test_check_submit_order_with_all_checks(self):
+        PerformanceHarness.profile_function(self.check_submit_order, 3, 100000)
+        # ~896ms (896284μs) minimum of 3 runs @ 100,000 iterations each run (~9μs per check).
@@ -18,6 +18,8 @@ import unittest
 
 from nautilus_trader.model.currencies import ETH
 from nautilus_trader.model.currencies import USDT
+from nautilus_trader.model.currency import Currency
+from nautilus_trader.model.enums import CurrencyType
 from nautilus_trader.model.enums import PriceType
 from nautilus_trader.trading.calculators import ExchangeRateCalculator
 from tests.test_kit.performance import PerformanceHarness
@@ -48,9 +50,39 @@ class ExchangeRateOperations:
         )
 
 
+# 32 currencies all quoted against USD, with a handful of crosses
+CODES = [
+    "AUD", "BRL", "CAD", "CHF", "CLP", "CNH", "CZK", "DKK", "EUR", "GBP", "HKD",
+    "HUF", "IDR", "ILS", "INR", "JPY", "KRW", "MXN", "NOK", "NZD", "PHP", "PLN",
+    "RUB", "SEK", "SGD", "THB", "TRY", "TWD", "ZAR", "XAU", "XAG",
+]
+BID_QUOTES = {f"{code}/USD": Decimal(1) / Decimal(i + 2) for i, code in enumerate(CODES)}
+BID_QUOTES.update({"EUR/GBP": Decimal("0.86000"), "AUD/NZD": Decimal("1.07000")})
+ASK_QUOTES = {symbol: quote + Decimal("0.00010") for symbol, quote in BID_QUOTES.items()}
+ZAR = Currency("ZAR", precision=2, currency_type=CurrencyType.FIAT)
+XAG = Currency("XAG", precision=2, currency_type=CurrencyType.FIAT)
+
+
 class ExchangeRateCalculatorPerformanceTests(unittest.TestCase):
 
+    def setUp(self):
+        # Fixture Setup
+        self.calculator = ExchangeRateCalculator()
+
+    def get_xrate_with_many_currencies(self):
+        self.calculator.get_rate(
+            from_currency=ZAR,
+            to_currency=XAG,
+            price_type=PriceType.MID,
+            bid_quotes=BID_QUOTES,
+            ask_quotes=ASK_QUOTES,
+        )
+
     @staticmethod
     def test_get_xrate():
         PerformanceHarness.profile_function(ExchangeRateOperations.get_xrate, 3, 10000)
-        # ~81ms (81022μs) minimum of 3 runs @ 10,000 iterations each run.
+        # ~35ms (35373μs) minimum of 3 runs @ 10,000 iterations each run.
+
+    def test_get_xrate_with_many_currencies(self):
+        PerformanceHarness.profile_function(self.get_xrate_with_many_currencies, 3, 10000)
+        # ~29ms (29533μs) minimum of 3 runs @ 10,000 iterations each run.
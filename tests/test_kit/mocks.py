@@ -306,6 +306,9 @@ class MockDataClient(DataClient):
     def subscribe_bars(self, bar_type: BarType):
         self.calls.append(inspect.currentframe().f_code.co_name)
 
+    def subscribe_order_book(self, symbol: Symbol):
+        self.calls.append(inspect.currentframe().f_code.co_name)
+
     def subscribe_instrument(self, symbol: Symbol):
         self.calls.append(inspect.currentframe().f_code.co_name)
 
@@ -318,6 +321,9 @@ class MockDataClient(DataClient):
     def unsubscribe_bars(self, bar_type: BarType):
         self.calls.append(inspect.currentframe().f_code.co_name)
 
+    def unsubscribe_order_book(self, symbol: Symbol):
+        self.calls.append(inspect.currentframe().f_code.co_name)
+
     def unsubscribe_instrument(self, symbol: Symbol):
         self.calls.append(inspect.currentframe().f_code.co_name)
 
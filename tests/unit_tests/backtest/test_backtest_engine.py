@@ -13,11 +13,15 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+from datetime import timedelta
+from decimal import Decimal
 import unittest
 
 from nautilus_trader.backtest.data_container import BacktestDataContainer
 from nautilus_trader.backtest.engine import BacktestEngine
 from nautilus_trader.backtest.models import FillModel
+from nautilus_trader.backtest.models import LatencyModel
+from nautilus_trader.model.bar import BarSpecification
 from nautilus_trader.model.currencies import USD
 from nautilus_trader.model.enums import BarAggregation
 from nautilus_trader.model.enums import OMSType
@@ -27,6 +31,7 @@ from nautilus_trader.model.objects import Money
 from nautilus_trader.trading.strategy import TradingStrategy
 from tests.test_kit.providers import TestDataProvider
 from tests.test_kit.providers import TestInstrumentProvider
+from tests.test_kit.strategies import EMACross
 from tests.test_kit.stubs import TestStubs
 
 
@@ -91,3 +96,178 @@ class BacktestEngineTests(unittest.TestCase):
 
         # Assert
         self.assertTrue(True)  # No exception raised
+
+
+class BacktestEngineLatencyTests(unittest.TestCase):
+
+    def setUp(self):
+        # Fixture Setup
+        self.usdjpy = TestInstrumentProvider.default_fx_ccy(TestStubs.symbol_usdjpy_fxcm())
+        data = BacktestDataContainer()
+        data.add_instrument(self.usdjpy)
+        data.add_bars(self.usdjpy.symbol, BarAggregation.MINUTE, PriceType.BID, TestDataProvider.usdjpy_1min_bid()[:2000])
+        data.add_bars(self.usdjpy.symbol, BarAggregation.MINUTE, PriceType.ASK, TestDataProvider.usdjpy_1min_ask()[:2000])
+
+        self.engine = BacktestEngine(
+            data=data,
+            strategies=[TradingStrategy("000")],
+            bypass_logging=True,
+        )
+
+        self.engine.add_exchange(
+            venue=Venue("SIM"),
+            oms_type=OMSType.HEDGING,
+            starting_balances=[Money(1_000_000, USD)],
+            latency_model=LatencyModel(
+                base_latency=timedelta(milliseconds=50),
+                event_latency=timedelta(milliseconds=20),
+                jitter=timedelta(milliseconds=10),
+                random_seed=42,
+            ),
+        )
+
+    def tearDown(self):
+        self.engine.reset()
+        self.engine.dispose()
+
+    def test_run_ema_cross_strategy_with_latency_delivers_all_messages(self):
+        # Arrange
+        strategy = EMACross(
+            symbol=self.usdjpy.symbol,
+            bar_spec=BarSpecification(15, BarAggregation.MINUTE, PriceType.BID),
+            trade_size=Decimal(1_000_000),
+            fast_ema=10,
+            slow_ema=20,
+        )
+
+        # Act
+        self.engine.run(strategies=[strategy])
+
+        # Assert
+        orders = strategy.execution.orders()
+        self.assertTrue(len(orders) > 0)
+        self.assertTrue(all(order.is_completed for order in orders))
+        self.assertTrue(all(order.filled_timestamp > order.timestamp for order in orders))
+
+
+class BacktestEngineLatencyStatsTests(unittest.TestCase):
+
+    def setUp(self):
+        # Fixture Setup
+        self.usdjpy = TestInstrumentProvider.default_fx_ccy(TestStubs.symbol_usdjpy_fxcm())
+        data = BacktestDataContainer()
+        data.add_instrument(self.usdjpy)
+        data.add_bars(self.usdjpy.symbol, BarAggregation.MINUTE, PriceType.BID, TestDataProvider.usdjpy_1min_bid()[:2000])
+        data.add_bars(self.usdjpy.symbol, BarAggregation.MINUTE, PriceType.ASK, TestDataProvider.usdjpy_1min_ask()[:2000])
+
+        self.engine = BacktestEngine(
+            data=data,
+            strategies=[TradingStrategy("000")],
+            bypass_logging=True,
+            latency_stats=True,
+        )
+
+        self.engine.add_exchange(
+            venue=Venue("SIM"),
+            oms_type=OMSType.HEDGING,
+            starting_balances=[Money(1_000_000, USD)],
+        )
+
+    def tearDown(self):
+        self.engine.reset()
+        self.engine.dispose()
+
+    def test_get_latency_report_when_not_enabled_returns_none(self):
+        # Arrange
+        usdjpy = TestInstrumentProvider.default_fx_ccy(TestStubs.symbol_usdjpy_fxcm())
+        data = BacktestDataContainer()
+        data.add_instrument(usdjpy)
+        engine = BacktestEngine(data=data, bypass_logging=True)
+
+        # Act
+        # Assert
+        self.assertIsNone(engine.latency_recorder)
+        self.assertIsNone(engine.get_latency_report())
+
+    def test_run_ema_cross_strategy_records_latency_stats(self):
+        # Arrange
+        strategy = EMACross(
+            symbol=self.usdjpy.symbol,
+            bar_spec=BarSpecification(15, BarAggregation.MINUTE, PriceType.BID),
+            trade_size=Decimal(1_000_000),
+            fast_ema=10,
+            slow_ema=20,
+        )
+
+        # Act
+        self.engine.run(strategies=[strategy])
+        report = self.engine.get_latency_report()
+
+        # Assert
+        self.assertEqual(7999, report["stages"]["DATA_DISPATCH"]["count"])
+        self.assertIn("EXEC_ROUTING", report["stages"])
+        self.assertIn("CLIENT_SEND", report["stages"])
+        self.assertIn("EXEC_ROUTING", report["strategies"][strategy.id.value])
+
+    def test_reset_clears_latency_stats(self):
+        # Arrange
+        self.engine.run()
+
+        # Act
+        self.engine.reset()
+
+        # Assert
+        self.assertEqual({"stages": {}, "strategies": {}}, self.engine.get_latency_report())
+
+
+class BacktestEngineBarExecutionTests(unittest.TestCase):
+
+    def setUp(self):
+        # Fixture Setup
+        self.usdjpy = TestInstrumentProvider.default_fx_ccy(TestStubs.symbol_usdjpy_fxcm())
+        data = BacktestDataContainer()
+        data.add_instrument(self.usdjpy)
+        data.add_bars(self.usdjpy.symbol, BarAggregation.MINUTE, PriceType.BID, TestDataProvider.usdjpy_1min_bid()[:2000])
+        data.add_bars(self.usdjpy.symbol, BarAggregation.MINUTE, PriceType.ASK, TestDataProvider.usdjpy_1min_ask()[:2000])
+
+        self.engine = BacktestEngine(
+            data=data,
+            strategies=[TradingStrategy("000")],
+            bypass_logging=True,
+            bar_execution=True,
+        )
+
+        self.engine.add_exchange(
+            venue=Venue("SIM"),
+            oms_type=OMSType.HEDGING,
+            starting_balances=[Money(1_000_000, USD)],
+        )
+
+    def tearDown(self):
+        self.engine.reset()
+        self.engine.dispose()
+
+    def test_run_empty_strategy_iterates_once_per_bar(self):
+        # Arrange
+        # Act
+        self.engine.run()
+
+        # Assert
+        self.assertEqual(2000, self.engine.iteration)
+
+    def test_run_ema_cross_strategy_receives_bars_directly(self):
+        # Arrange
+        strategy = EMACross(
+            symbol=self.usdjpy.symbol,
+            bar_spec=BarSpecification(1, BarAggregation.MINUTE, PriceType.BID),
+            trade_size=Decimal(1_000_000),
+            fast_ema=10,
+            slow_ema=20,
+        )
+
+        # Act
+        self.engine.run(strategies=[strategy])
+
+        # Assert
+        self.assertEqual(2000, strategy.fast_ema.count)
+        self.assertTrue(len(strategy.execution.orders()) > 0)
@@ -21,12 +21,14 @@ from nautilus_trader.analysis.performance import PerformanceAnalyzer
 from nautilus_trader.backtest.exchange import SimulatedExchange
 from nautilus_trader.backtest.execution import BacktestExecClient
 from nautilus_trader.backtest.models import FillModel
+from nautilus_trader.backtest.models import LatencyModel
 from nautilus_trader.common.clock import TestClock
 from nautilus_trader.common.logging import TestLogger
 from nautilus_trader.common.uuid import UUIDFactory
 from nautilus_trader.data.engine import DataEngine
 from nautilus_trader.execution.database import BypassExecutionDatabase
 from nautilus_trader.execution.engine import ExecutionEngine
+from nautilus_trader.model.bar import Bar
 from nautilus_trader.model.commands import CancelOrder
 from nautilus_trader.model.commands import ModifyOrder
 from nautilus_trader.model.currencies import BTC
@@ -38,6 +40,7 @@ from nautilus_trader.model.enums import OrderSide
 from nautilus_trader.model.enums import OrderState
 from nautilus_trader.model.enums import PositionSide
 from nautilus_trader.model.enums import TimeInForce
+from nautilus_trader.model.events import OrderFilled
 from nautilus_trader.model.events import OrderRejected
 from nautilus_trader.model.identifiers import AccountId
 from nautilus_trader.model.identifiers import ClientOrderId
@@ -48,6 +51,7 @@ from nautilus_trader.model.identifiers import Venue
 from nautilus_trader.model.objects import Money
 from nautilus_trader.model.objects import Price
 from nautilus_trader.model.objects import Quantity
+from nautilus_trader.model.order_book import OrderBookDelta
 from nautilus_trader.model.tick import QuoteTick
 from nautilus_trader.model.tick import TradeTick
 from nautilus_trader.trading.portfolio import Portfolio
@@ -891,6 +895,122 @@ class SimulatedExchangeTests(unittest.TestCase):
         # Assert
         self.assertEqual(0, len(self.exchange.get_working_orders()))
 
+    def test_process_bars_fills_buy_limit_order_when_ask_low_crosses(self):
+        # Arrange
+        # Prepare market
+        tick = TestStubs.quote_tick_3decimal(USDJPY_SIM.symbol)
+        self.data_engine.process(tick)
+        self.exchange.process_tick(tick)
+
+        order = self.strategy.order_factory.limit(
+            USDJPY_SIM.symbol,
+            OrderSide.BUY,
+            Quantity(100000),
+            Price("90.000"),
+        )
+
+        self.strategy.submit_order(order)
+
+        bid_bar = Bar(Price("90.002"), Price("90.010"), Price("89.990"), Price("90.005"), Quantity(100000), UNIX_EPOCH)
+        ask_bar = Bar(Price("90.005"), Price("90.013"), Price("89.993"), Price("90.008"), Quantity(100000), UNIX_EPOCH)
+
+        # Act
+        self.exchange.process_bars(USDJPY_SIM.symbol, bid_bar, ask_bar)
+
+        # Assert
+        self.assertEqual(0, len(self.exchange.get_working_orders()))
+        self.assertEqual(OrderState.FILLED, order.state)
+        self.assertEqual(Price("90.000"), order.avg_price)
+
+    def test_process_bars_sets_market_to_closing_prices(self):
+        # Arrange
+        # Prepare market
+        tick = TestStubs.quote_tick_3decimal(USDJPY_SIM.symbol)
+        self.data_engine.process(tick)
+        self.exchange.process_tick(tick)
+
+        bid_bar = Bar(Price("90.002"), Price("90.110"), Price("89.990"), Price("90.100"), Quantity(100000), UNIX_EPOCH)
+        ask_bar = Bar(Price("90.005"), Price("90.113"), Price("89.993"), Price("90.103"), Quantity(100000), UNIX_EPOCH)
+
+        self.exchange.process_bars(USDJPY_SIM.symbol, bid_bar, ask_bar)
+
+        order = self.strategy.order_factory.market(
+            USDJPY_SIM.symbol,
+            OrderSide.BUY,
+            Quantity(100000),
+        )
+
+        # Act
+        self.strategy.submit_order(order)
+
+        # Assert
+        self.assertEqual(OrderState.FILLED, order.state)
+        self.assertEqual(Price("90.103"), order.avg_price)
+
+    def test_process_bars_with_bullish_bar_trades_low_before_high(self):
+        # Arrange
+        # Prepare market
+        tick = TestStubs.quote_tick_3decimal(USDJPY_SIM.symbol)
+        self.data_engine.process(tick)
+        self.exchange.process_tick(tick)
+
+        entry = self.strategy.order_factory.market(
+            USDJPY_SIM.symbol,
+            OrderSide.BUY,
+            Quantity(100000),
+        )
+
+        bracket = self.strategy.order_factory.bracket(
+            entry_order=entry,
+            stop_loss=Price("89.900"),
+            take_profit=Price("90.100"),
+        )
+
+        self.strategy.submit_bracket_order(bracket)
+
+        bid_bar = Bar(Price("90.002"), Price("90.150"), Price("89.850"), Price("90.050"), Quantity(100000), UNIX_EPOCH)
+        ask_bar = Bar(Price("90.005"), Price("90.153"), Price("89.853"), Price("90.053"), Quantity(100000), UNIX_EPOCH)
+
+        # Act
+        self.exchange.process_bars(USDJPY_SIM.symbol, bid_bar, ask_bar)
+
+        # Assert
+        self.assertEqual(OrderState.FILLED, bracket.stop_loss.state)
+        self.assertEqual(OrderState.CANCELLED, bracket.take_profit.state)
+        self.assertEqual(0, len(self.exchange.get_working_orders()))
+
+    def test_process_bars_with_bearish_bar_trades_high_before_low(self):
+        # Arrange
+        # Prepare market
+        tick = TestStubs.quote_tick_3decimal(USDJPY_SIM.symbol)
+        self.data_engine.process(tick)
+        self.exchange.process_tick(tick)
+
+        entry = self.strategy.order_factory.market(
+            USDJPY_SIM.symbol,
+            OrderSide.BUY,
+            Quantity(100000),
+        )
+
+        bracket = self.strategy.order_factory.bracket(
+            entry_order=entry,
+            stop_loss=Price("89.900"),
+            take_profit=Price("90.100"),
+        )
+
+        self.strategy.submit_bracket_order(bracket)
+
+        bid_bar = Bar(Price("90.002"), Price("90.150"), Price("89.850"), Price("89.950"), Quantity(100000), UNIX_EPOCH)
+        ask_bar = Bar(Price("90.005"), Price("90.153"), Price("89.853"), Price("89.953"), Quantity(100000), UNIX_EPOCH)
+
+        # Act
+        self.exchange.process_bars(USDJPY_SIM.symbol, bid_bar, ask_bar)
+
+        # Assert
+        self.assertEqual(OrderState.CANCELLED, bracket.stop_loss.state)
+        self.assertEqual(OrderState.FILLED, bracket.take_profit.state)
+        self.assertEqual(0, len(self.exchange.get_working_orders()))
+
     def test_realized_pnl_contains_commission(self):
         # Arrange
         # Prepare market
@@ -1139,3 +1259,260 @@ class BitmexExchangeTests(unittest.TestCase):
         self.assertEqual(LiquiditySide.MAKER, self.strategy.object_storer.get_store()[7].liquidity_side)
         self.assertEqual(Money("0.00652529", BTC), self.strategy.object_storer.get_store()[2].commission)
         self.assertEqual(Money("-0.00217511", BTC), self.strategy.object_storer.get_store()[7].commission)
+
+
+class OrderBookDepthExchangeTests(unittest.TestCase):
+
+    def setUp(self):
+        # Fixture Setup
+        self.clock = TestClock()
+        self.uuid_factory = UUIDFactory()
+        self.logger = TestLogger(self.clock)
+
+        self.portfolio = Portfolio(
+            clock=self.clock,
+            logger=self.logger,
+        )
+
+        self.data_engine = DataEngine(
+            portfolio=self.portfolio,
+            clock=self.clock,
+            logger=self.logger,
+        )
+
+        self.data_engine.cache.add_instrument(USDJPY_SIM)
+        self.portfolio.register_cache(self.data_engine.cache)
+
+        self.trader_id = TraderId("TESTER", "000")
+        self.account_id = AccountId("SIM", "001")
+
+        exec_db = BypassExecutionDatabase(
+            trader_id=self.trader_id,
+            logger=self.logger,
+        )
+
+        self.exec_engine = ExecutionEngine(
+            database=exec_db,
+            portfolio=self.portfolio,
+            clock=self.clock,
+            logger=self.logger,
+        )
+
+        self.exchange = SimulatedExchange(
+            venue=SIM,
+            oms_type=OMSType.HEDGING,
+            generate_position_ids=True,
+            is_frozen_account=False,
+            starting_balances=[Money(1_000_000, USD)],
+            instruments=[USDJPY_SIM],
+            modules=[],
+            fill_model=FillModel(),
+            exec_cache=self.exec_engine.cache,
+            clock=self.clock,
+            logger=self.logger,
+            fill_on_depth=True,
+        )
+
+        self.exec_client = BacktestExecClient(
+            exchange=self.exchange,
+            account_id=self.account_id,
+            engine=self.exec_engine,
+            clock=self.clock,
+            logger=self.logger,
+        )
+
+        self.exec_engine.register_client(self.exec_client)
+        self.exchange.register_client(self.exec_client)
+
+        self.strategy = MockStrategy(bar_type=TestStubs.bartype_usdjpy_1min_bid())
+        self.strategy.register_trader(
+            self.trader_id,
+            self.clock,
+            self.logger,
+        )
+
+        self.data_engine.register_strategy(self.strategy)
+        self.exec_engine.register_strategy(self.strategy)
+        self.data_engine.start()
+        self.exec_engine.start()
+        self.strategy.start()
+
+        # Prepare order book
+        for side, price, size in [
+            (OrderSide.BUY, "90.002", 200000),
+            (OrderSide.BUY, "90.001", 200000),
+            (OrderSide.SELL, "90.003", 100000),
+            (OrderSide.SELL, "90.004", 100000),
+            (OrderSide.SELL, "90.005", 200000),
+        ]:
+            self.exchange.process_tick(self.delta(side, price, size))
+
+    @staticmethod
+    def delta(side, price, size):
+        return OrderBookDelta(USDJPY_SIM.symbol, side, Price(price), Quantity(size), UNIX_EPOCH)
+
+    @staticmethod
+    def trade(side, price, size):
+        return TradeTick(USDJPY_SIM.symbol, Price(price), Quantity(size), side, TradeMatchId("1"), UNIX_EPOCH)
+
+    def test_market_order_walks_the_book(self):
+        # Arrange
+        order = self.strategy.order_factory.market(
+            USDJPY_SIM.symbol,
+            OrderSide.BUY,
+            Quantity(300000),
+        )
+
+        # Act
+        self.strategy.submit_order(order)
+
+        # Assert
+        fills = [e for e in self.strategy.object_storer.get_store() if isinstance(e, OrderFilled)]
+        self.assertEqual(OrderState.FILLED, order.state)
+        self.assertEqual(Quantity(300000), order.filled_qty)
+        self.assertEqual(3, len(fills))
+        self.assertEqual([Price("90.003"), Price("90.004"), Price("90.005")], [f.fill_price for f in fills])
+        self.assertEqual([Quantity(200000), Quantity(100000), Quantity()], [f.leaves_qty for f in fills])
+
+    def test_market_order_walks_the_book_with_latency(self):
+        # Arrange
+        self.exec_engine.deregister_client(self.exec_client)
+        exec_client = BacktestExecClient(
+            exchange=self.exchange,
+            account_id=self.account_id,
+            engine=self.exec_engine,
+            clock=self.clock,
+            logger=self.logger,
+            latency_model=LatencyModel(
+                insert_latency=timedelta(milliseconds=100),
+                event_latency=timedelta(milliseconds=50),
+            ),
+        )
+        self.exec_engine.register_client(exec_client)
+        self.exchange.register_client(exec_client)
+        exec_client.connect()
+
+        order = self.strategy.order_factory.market(
+            USDJPY_SIM.symbol,
+            OrderSide.BUY,
+            Quantity(300000),
+        )
+
+        # Act
+        self.strategy.submit_order(order)
+        while exec_client.has_inflight():
+            self.clock.set_time(exec_client.next_inflight_time())
+            exec_client.process_next_inflight()
+
+        # Assert
+        fills = [e for e in self.strategy.object_storer.get_store() if isinstance(e, OrderFilled)]
+        self.assertEqual(OrderState.FILLED, order.state)
+        self.assertEqual(Quantity(300000), order.filled_qty)
+        self.assertEqual([Quantity(100000), Quantity(200000), Quantity(300000)], [f.cum_qty for f in fills])
+        self.assertEqual([Quantity(200000), Quantity(100000), Quantity()], [f.leaves_qty for f in fills])
+        self.assertNotIn(order.cl_ord_id, self.exchange.get_working_orders())
+
+    def test_market_order_depletes_exchange_book(self):
+        # Arrange
+        order1 = self.strategy.order_factory.market(
+            USDJPY_SIM.symbol,
+            OrderSide.SELL,
+            Quantity(100000),
+        )
+
+        order2 = self.strategy.order_factory.market(
+            USDJPY_SIM.symbol,
+            OrderSide.SELL,
+            Quantity(200000),
+        )
+
+        # Act
+        self.strategy.submit_order(order1)
+        self.strategy.submit_order(order2)
+
+        # Assert
+        fills = [e for e in self.strategy.object_storer.get_store() if isinstance(e, OrderFilled)]
+        self.assertEqual(Decimal("90.002"), order1.avg_price)
+        self.assertEqual(OrderState.FILLED, order2.state)
+        self.assertEqual([Price("90.002"), Price("90.001")], [f.fill_price for f in fills[1:]])
+        self.assertEqual([Quantity(100000), Quantity(100000)], [f.fill_qty for f in fills[1:]])
+
+    def test_market_order_larger_than_book_fills_remainder_at_last_level(self):
+        # Arrange
+        order = self.strategy.order_factory.market(
+            USDJPY_SIM.symbol,
+            OrderSide.BUY,
+            Quantity(600000),
+        )
+
+        # Act
+        self.strategy.submit_order(order)
+
+        # Assert
+        fills = [e for e in self.strategy.object_storer.get_store() if isinstance(e, OrderFilled)]
+        self.assertEqual(OrderState.FILLED, order.state)
+        self.assertEqual(4, len(fills))
+        self.assertEqual(Price("90.005"), fills[-1].fill_price)
+        self.assertEqual(Quantity(200000), fills[-1].fill_qty)
+
+    def test_marketable_limit_order_fills_to_limit_then_rests(self):
+        # Arrange
+        order = self.strategy.order_factory.limit(
+            USDJPY_SIM.symbol,
+            OrderSide.BUY,
+            Quantity(300000),
+            Price("90.004"),
+            post_only=False,
+        )
+
+        # Act
+        self.strategy.submit_order(order)
+
+        # Assert
+        self.assertEqual(OrderState.PARTIALLY_FILLED, order.state)
+        self.assertEqual(Quantity(200000), order.filled_qty)
+        self.assertIn(order.cl_ord_id, self.exchange.get_working_orders())
+
+    def test_resting_limit_order_fills_after_queue_ahead_is_consumed(self):
+        # Arrange
+        order = self.strategy.order_factory.limit(
+            USDJPY_SIM.symbol,
+            OrderSide.BUY,
+            Quantity(100000),
+            Price("90.002"),
+        )
+
+        self.strategy.submit_order(order)
+
+        # Act
+        self.exchange.process_tick(self.trade(OrderSide.SELL, "90.002", 150000))  # Queue 200000 -> 50000
+        state_after_first_trade = order.state
+        self.exchange.process_tick(self.delta(OrderSide.BUY, "90.002", 20000))    # Level shrinks below queue
+        self.exchange.process_tick(self.trade(OrderSide.SELL, "90.002", 70000))   # Fills 50000
+        filled_after_second_trade = order.filled_qty
+        self.exchange.process_tick(self.trade(OrderSide.SELL, "90.002", 100000))  # Fills remaining
+
+        # Assert
+        self.assertEqual(OrderState.WORKING, state_after_first_trade)
+        self.assertEqual(Quantity(50000), filled_after_second_trade)
+        self.assertEqual(OrderState.FILLED, order.state)
+        self.assertEqual(LiquiditySide.MAKER, order.liquidity_side)
+        self.assertNotIn(order.cl_ord_id, self.exchange.get_working_orders())
+
+    def test_resting_limit_order_fills_when_traded_through(self):
+        # Arrange
+        order = self.strategy.order_factory.limit(
+            USDJPY_SIM.symbol,
+            OrderSide.BUY,
+            Quantity(100000),
+            Price("90.001"),
+        )
+
+        self.strategy.submit_order(order)
+
+        # Act
+        self.exchange.process_tick(self.trade(OrderSide.SELL, "90.000", 1000))
+
+        # Assert
+        self.assertEqual(OrderState.FILLED, order.state)
+        self.assertEqual(Decimal("90.001"), order.avg_price)
@@ -13,12 +13,14 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+from datetime import timedelta
 import unittest
 
 from nautilus_trader.analysis.performance import PerformanceAnalyzer
 from nautilus_trader.backtest.exchange import SimulatedExchange
 from nautilus_trader.backtest.execution import BacktestExecClient
 from nautilus_trader.backtest.models import FillModel
+from nautilus_trader.backtest.models import LatencyModel
 from nautilus_trader.common.clock import TestClock
 from nautilus_trader.common.factories import OrderFactory
 from nautilus_trader.common.logging import TestLogger
@@ -42,6 +44,7 @@ from nautilus_trader.model.identifiers import Venue
 from nautilus_trader.model.objects import Money
 from nautilus_trader.model.objects import Price
 from nautilus_trader.model.objects import Quantity
+from nautilus_trader.model.tick import QuoteTick
 from nautilus_trader.trading.portfolio import Portfolio
 from nautilus_trader.trading.strategy import TradingStrategy
 from tests.test_kit.providers import TestInstrumentProvider
@@ -252,3 +255,216 @@ class BacktestExecClientTests(unittest.TestCase):
 
         # Assert
         self.assertTrue(True)  # No exceptions raised
+
+
+class BacktestExecClientLatencyTests(unittest.TestCase):
+
+    def setUp(self):
+        # Fixture Setup
+        self.clock = TestClock()
+        self.uuid_factory = UUIDFactory()
+        self.logger = TestLogger(self.clock)
+
+        self.trader_id = TraderId("TESTER", "000")
+        self.account_id = AccountId("BINANCE", "000")
+
+        self.portfolio = Portfolio(
+            clock=self.clock,
+            logger=self.logger,
+        )
+        self.portfolio.register_cache(DataCache(self.logger))
+
+        database = BypassExecutionDatabase(
+            trader_id=self.trader_id,
+            logger=self.logger,
+        )
+
+        self.exec_engine = ExecutionEngine(
+            database=database,
+            portfolio=self.portfolio,
+            clock=self.clock,
+            logger=self.logger,
+        )
+
+        self.exchange = SimulatedExchange(
+            venue=Venue("BINANCE"),
+            oms_type=OMSType.NETTING,
+            generate_position_ids=True,
+            is_frozen_account=False,
+            starting_balances=[Money(1_000_000, USD)],
+            instruments=[ETHUSDT_BINANCE],
+            modules=[],
+            exec_cache=self.exec_engine.cache,
+            fill_model=FillModel(),
+            clock=self.clock,
+            logger=self.logger,
+        )
+
+        self.exec_client = BacktestExecClient(
+            exchange=self.exchange,
+            account_id=self.account_id,
+            engine=self.exec_engine,
+            clock=self.clock,
+            logger=self.logger,
+            latency_model=LatencyModel(
+                insert_latency=timedelta(milliseconds=100),
+                cancel_latency=timedelta(milliseconds=10),
+                event_latency=timedelta(milliseconds=50),
+            ),
+        )
+
+        self.exec_engine.register_client(self.exec_client)
+        self.exchange.register_client(self.exec_client)
+        self.exec_client.connect()
+
+        self.order_factory = OrderFactory(
+            trader_id=self.trader_id,
+            strategy_id=StrategyId("SCALPER", "000"),
+            clock=self.clock,
+        )
+
+        self.exchange.process_tick(QuoteTick(
+            ETHUSDT_BINANCE.symbol,
+            Price("500.00000"),
+            Price("501.00000"),
+            Quantity(1),
+            Quantity(1),
+            self.clock.utc_now(),
+        ))
+
+        self.exec_client.process_next_inflight()  # Initial account state
+
+    def submit_order(self, order):
+        self.exec_engine.cache.add_order(order, PositionId.null())
+        command = SubmitOrder(
+            BINANCE,
+            self.trader_id,
+            self.account_id,
+            order.strategy_id,
+            PositionId.null(),
+            order,
+            self.uuid_factory.generate(),
+            self.clock.utc_now(),
+        )
+
+        self.exec_client.submit_order(command)
+
+    def deliver_next(self):
+        self.clock.set_time(self.exec_client.next_inflight_time())
+        self.exec_client.process_next_inflight()
+
+    def test_submit_order_with_latency_is_held_in_flight(self):
+        # Arrange
+        order = self.order_factory.limit(
+            ETHUSDT_BINANCE.symbol,
+            OrderSide.BUY,
+            Quantity(100),
+            Price("400.00000"),
+        )
+
+        # Act
+        self.submit_order(order)
+
+        # Assert
+        self.assertEqual(1, self.exec_client.inflight_count())
+        self.assertEqual(self.clock.utc_now() + timedelta(milliseconds=100), self.exec_client.next_inflight_time())
+        self.assertEqual({}, self.exchange.get_working_orders())
+        self.assertEqual(OrderState.INITIALIZED, order.state)
+
+    def test_command_arrival_sends_events_back_with_event_latency(self):
+        # Arrange
+        order = self.order_factory.limit(
+            ETHUSDT_BINANCE.symbol,
+            OrderSide.BUY,
+            Quantity(100),
+            Price("400.00000"),
+        )
+
+        self.submit_order(order)
+        sent_time = self.clock.utc_now()
+
+        # Act
+        self.deliver_next()  # Command arrives at exchange
+
+        # Assert
+        self.assertIn(order.cl_ord_id, self.exchange.get_working_orders())
+        self.assertEqual(OrderState.INITIALIZED, order.state)
+        self.assertEqual(3, self.exec_client.inflight_count())  # Submitted, accepted, working
+        self.assertEqual(sent_time + timedelta(milliseconds=150), self.exec_client.next_inflight_time())
+
+        while self.exec_client.has_inflight():
+            self.deliver_next()
+
+        self.assertEqual(OrderState.WORKING, order.state)
+
+    def test_market_order_fills_at_market_on_arrival(self):
+        # Arrange
+        order = self.order_factory.market(
+            ETHUSDT_BINANCE.symbol,
+            OrderSide.BUY,
+            Quantity(100),
+        )
+
+        self.submit_order(order)
+        self.clock.set_time(self.clock.utc_now() + timedelta(milliseconds=50))
+        self.exchange.process_tick(QuoteTick(
+            ETHUSDT_BINANCE.symbol,
+            Price("502.00000"),
+            Price("503.00000"),
+            Quantity(1),
+            Quantity(1),
+            self.clock.utc_now(),
+        ))
+
+        # Act
+        while self.exec_client.has_inflight():
+            self.deliver_next()
+
+        # Assert
+        self.assertEqual(OrderState.FILLED, order.state)
+        self.assertEqual(Price("503.00000"), order.avg_price)
+
+    def test_cancel_with_lower_latency_can_overtake_submit(self):
+        # Arrange
+        order = self.order_factory.limit(
+            ETHUSDT_BINANCE.symbol,
+            OrderSide.BUY,
+            Quantity(100),
+            Price("400.00000"),
+        )
+
+        self.submit_order(order)
+        cancel = CancelOrder(
+            BINANCE,
+            self.trader_id,
+            self.account_id,
+            order.cl_ord_id,
+            self.uuid_factory.generate(),
+            self.clock.utc_now(),
+        )
+
+        # Act
+        self.exec_client.cancel_order(cancel)
+        self.deliver_next()
+
+        # Assert
+        self.assertEqual({}, self.exchange.get_working_orders())  # Cancel rejected, order not found
+        self.assertEqual(2, self.exec_client.inflight_count())  # Submit command, cancel reject event
+
+    def test_reset_clears_messages_in_flight(self):
+        # Arrange
+        order = self.order_factory.limit(
+            ETHUSDT_BINANCE.symbol,
+            OrderSide.BUY,
+            Quantity(100),
+            Price("400.00000"),
+        )
+
+        self.submit_order(order)
+
+        # Act
+        self.exec_client.reset()
+
+        # Assert
+        self.assertFalse(self.exec_client.has_inflight())
+        self.assertIsNone(self.exec_client.next_inflight_time())
@@ -13,13 +13,24 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+from datetime import datetime
 from decimal import Decimal
+import os
+import tempfile
 import unittest
 
+import pandas as pd
+import pytz
+
+from nautilus_trader.backtest.loaders import CSVBarDataLoader
+from nautilus_trader.backtest.loaders import CSVDataConverter
+from nautilus_trader.backtest.loaders import NumpyDataLoader
 from nautilus_trader.model.currency import Currency
 from nautilus_trader.model.enums import CurrencyType
 from nautilus_trader.model.identifiers import Symbol
 from nautilus_trader.model.identifiers import Venue
+from tests.test_kit import PACKAGE_ROOT
+from tests.test_kit.providers import TestDataProvider
 from tests.test_kit.providers import TestInstrumentProvider
 
 
@@ -50,3 +61,91 @@ class BacktestLoadersTests(unittest.TestCase):
         self.assertEqual(3, instrument.price_precision)
         self.assertEqual(Decimal("0.001"), instrument.tick_size)
         self.assertEqual(Currency(code='JPY', precision=2, currency_type=CurrencyType.FIAT), instrument.quote_currency)
+
+
+class NumpyDataLoaderTests(unittest.TestCase):
+
+    def setUp(self):
+        # Fixture Setup
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.file_path = os.path.join(self.tempdir.name, "gbpusd-m1-bid.npy")
+        self.bars = TestDataProvider.gbpusd_1min_bid()
+
+    def tearDown(self):
+        self.tempdir.cleanup()
+
+    def test_write_then_load_returns_equal_data(self):
+        # Arrange
+        NumpyDataLoader.write(self.bars, self.file_path)
+
+        # Act
+        data = NumpyDataLoader.load(self.file_path)
+
+        # Assert
+        pd.testing.assert_frame_equal(self.bars, data, check_freq=False)
+
+    def test_load_with_time_range_returns_only_rows_in_range(self):
+        # Arrange
+        NumpyDataLoader.write(self.bars, self.file_path)
+        start = datetime(2012, 2, 2, tzinfo=pytz.utc)
+        stop = datetime(2012, 2, 3, tzinfo=pytz.utc)
+
+        # Act
+        data = NumpyDataLoader.load(self.file_path, start, stop)
+
+        # Assert
+        pd.testing.assert_frame_equal(self.bars.loc[start:stop], data, check_freq=False)
+        self.assertEqual(pd.Timestamp(start), data.index[0])
+        self.assertEqual(pd.Timestamp(stop), data.index[-1])
+
+    def test_load_with_time_range_outside_data_returns_empty_data(self):
+        # Arrange
+        NumpyDataLoader.write(self.bars, self.file_path)
+
+        # Act
+        data = NumpyDataLoader.load(self.file_path, start=datetime(2020, 1, 1, tzinfo=pytz.utc))
+
+        # Assert
+        self.assertTrue(data.empty)
+        self.assertEqual(list(self.bars.columns), list(data.columns))
+
+    def test_write_and_load_string_columns(self):
+        # Arrange
+        trades = pd.DataFrame(
+            {
+                "price": [100.5, 100.6],
+                "quantity": [1.0, 2.0],
+                "buyer_maker": [True, False],
+                "trade_id": ["A1", "B22"],
+            },
+            index=pd.DatetimeIndex(["2021-01-01 00:00:00.001", "2021-01-01 00:00:00.002"], tz="UTC", name="timestamp"),
+        )
+
+        # Act
+        NumpyDataLoader.write(trades, self.file_path)
+        data = NumpyDataLoader.load(self.file_path)
+
+        # Assert
+        self.assertEqual(["A1", "B22"], list(data["trade_id"]))
+        self.assertEqual([True, False], list(data["buyer_maker"]))
+        pd.testing.assert_index_equal(trades.index, data.index)
+
+    def test_write_unsorted_data_raises_value_error(self):
+        # Arrange
+        # Act
+        # Assert
+        self.assertRaises(ValueError, NumpyDataLoader.write, self.bars.iloc[::-1], self.file_path)
+
+    def test_convert_csv_to_numpy_loads_equal_data(self):
+        # Arrange
+        csv_path = PACKAGE_ROOT + "/data/fxcm-usdjpy-m1-bid-2013.csv"
+
+        # Act
+        CSVDataConverter.to_numpy(csv_path, self.file_path)
+
+        # Assert
+        pd.testing.assert_frame_equal(
+            CSVBarDataLoader.load(csv_path),
+            NumpyDataLoader.load(self.file_path),
+            check_freq=False,
+        )
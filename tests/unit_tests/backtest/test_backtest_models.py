@@ -13,9 +13,11 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+from datetime import timedelta
 import unittest
 
 from nautilus_trader.backtest.models import FillModel
+from nautilus_trader.backtest.models import LatencyModel
 
 
 class FillModelTests(unittest.TestCase):
@@ -69,3 +71,55 @@ class FillModelTests(unittest.TestCase):
         # Act
         # Assert
         self.assertFalse(fill_model.is_slipped())
+
+
+class LatencyModelTests(unittest.TestCase):
+
+    def test_instantiate_with_defaults_has_no_latency(self):
+        # Arrange
+        latency_model = LatencyModel()
+
+        # Act
+        # Assert
+        self.assertEqual(timedelta(0), latency_model.insert_delay())
+        self.assertEqual(timedelta(0), latency_model.modify_delay())
+        self.assertEqual(timedelta(0), latency_model.cancel_delay())
+        self.assertEqual(timedelta(0), latency_model.event_delay())
+
+    def test_instantiate_with_negative_latency_raises_value_error(self):
+        # Arrange
+        # Act
+        # Assert
+        self.assertRaises(ValueError, LatencyModel, base_latency=timedelta(milliseconds=-1))
+
+    def test_delays_add_base_latency_to_message_type_latency(self):
+        # Arrange
+        latency_model = LatencyModel(
+            base_latency=timedelta(milliseconds=1),
+            insert_latency=timedelta(milliseconds=2),
+            modify_latency=timedelta(milliseconds=3),
+            cancel_latency=timedelta(milliseconds=4),
+            event_latency=timedelta(milliseconds=5),
+        )
+
+        # Act
+        # Assert
+        self.assertEqual(timedelta(milliseconds=3), latency_model.insert_delay())
+        self.assertEqual(timedelta(milliseconds=4), latency_model.modify_delay())
+        self.assertEqual(timedelta(milliseconds=5), latency_model.cancel_delay())
+        self.assertEqual(timedelta(milliseconds=6), latency_model.event_delay())
+
+    def test_delays_with_jitter_are_within_bounds(self):
+        # Arrange
+        latency_model = LatencyModel(
+            base_latency=timedelta(milliseconds=1),
+            jitter=timedelta(milliseconds=10),
+            random_seed=42,
+        )
+
+        # Act
+        delays = [latency_model.insert_delay() for _ in range(100)]
+
+        # Assert
+        self.assertTrue(all(timedelta(milliseconds=1) <= d < timedelta(milliseconds=11) for d in delays))
+        self.assertTrue(len(set(delays)) > 1)
@@ -0,0 +1,177 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2021 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from datetime import datetime
+from decimal import Decimal
+import unittest
+
+import pandas as pd
+import pytz
+
+from nautilus_trader.backtest.data_container import BacktestDataContainer
+from nautilus_trader.backtest.engine import BacktestEngine
+from nautilus_trader.backtest.sharding import BacktestShard
+from nautilus_trader.backtest.sharding import ShardedBacktestEngine
+from nautilus_trader.backtest.sharding import _merge_account_reports
+from nautilus_trader.model.bar import BarSpecification
+from nautilus_trader.model.currencies import USD
+from nautilus_trader.model.enums import BarAggregation
+from nautilus_trader.model.enums import OMSType
+from nautilus_trader.model.enums import PriceType
+from nautilus_trader.model.identifiers import Symbol
+from nautilus_trader.model.identifiers import Venue
+from nautilus_trader.model.objects import Money
+from nautilus_trader.trading.strategy import TradingStrategy
+from tests.test_kit.providers import TestDataProvider
+from tests.test_kit.providers import TestInstrumentProvider
+from tests.test_kit.strategies import EMACross
+
+
+SIM = Venue("SIM")
+GBPUSD_SIM = Symbol("GBP/USD", SIM)
+EURUSD_SIM = Symbol("EUR/USD", SIM)
+
+# The data for both symbols is from February 2012 (the stop is after the data)
+START = datetime(2012, 2, 27, tzinfo=pytz.utc)
+STOP = datetime(2012, 3, 2, tzinfo=pytz.utc)
+
+
+def ema_cross(symbol, bar_spec, tag):
+    return EMACross(
+        symbol=symbol,
+        bar_spec=bar_spec,
+        trade_size=Decimal(1_000_000),
+        fast_ema=10,
+        slow_ema=20,
+        extra_id_tag=tag,
+    )
+
+
+class ShardedBacktestEngineTests(unittest.TestCase):
+
+    def setUp(self):
+        # Fixture Setup
+        self.data = BacktestDataContainer()
+        self.data.add_instrument(TestInstrumentProvider.default_fx_ccy(GBPUSD_SIM))
+        self.data.add_instrument(TestInstrumentProvider.default_fx_ccy(EURUSD_SIM))
+        self.data.add_bars(GBPUSD_SIM, BarAggregation.MINUTE, PriceType.BID, TestDataProvider.gbpusd_1min_bid())
+        self.data.add_bars(GBPUSD_SIM, BarAggregation.MINUTE, PriceType.ASK, TestDataProvider.gbpusd_1min_ask())
+
+        # Quote ticks over the same range as the GBP/USD bars, offset so that
+        # the shards overlap in time without any data sharing a timestamp.
+        eurusd_ticks = pd.DataFrame({
+            "bid": TestDataProvider.gbpusd_1min_bid()["close"] - 0.25,
+            "ask": TestDataProvider.gbpusd_1min_ask()["close"] - 0.25,
+        })
+        eurusd_ticks.index = eurusd_ticks.index + pd.Timedelta(seconds=30)
+        self.data.add_quote_ticks(EURUSD_SIM, eurusd_ticks)
+
+        self.gbpusd_bar_spec = BarSpecification(15, BarAggregation.MINUTE, PriceType.BID)
+        self.eurusd_bar_spec = BarSpecification(10, BarAggregation.TICK, PriceType.MID)
+
+    def test_instantiate_with_symbol_in_more_than_one_shard_raises_key_error(self):
+        # Arrange
+        shards = [
+            BacktestShard([GBPUSD_SIM], [TradingStrategy("001")]),
+            BacktestShard([GBPUSD_SIM, EURUSD_SIM], [TradingStrategy("002")]),
+        ]
+
+        # Act
+        # Assert
+        self.assertRaises(KeyError, ShardedBacktestEngine, self.data, shards)
+
+    def test_run_with_no_exchange_for_venue_raises_key_error(self):
+        # Arrange
+        engine = ShardedBacktestEngine(
+            data=self.data,
+            shards=[BacktestShard([GBPUSD_SIM], [TradingStrategy("001")])],
+        )
+
+        # Act
+        # Assert
+        self.assertRaises(KeyError, engine.run, START, STOP)
+
+    def test_sharded_run_matches_single_process_run(self):
+        # Arrange
+        single = BacktestEngine(
+            data=self.data,
+            strategies=[
+                ema_cross(GBPUSD_SIM, self.gbpusd_bar_spec, "001"),
+                ema_cross(EURUSD_SIM, self.eurusd_bar_spec, "002"),
+            ],
+            bypass_logging=True,
+        )
+        single.add_exchange(
+            venue=SIM,
+            oms_type=OMSType.HEDGING,
+            starting_balances=[Money(1_000_000, USD)],
+        )
+
+        sharded = ShardedBacktestEngine(
+            data=self.data,
+            shards=[
+                BacktestShard([GBPUSD_SIM], [ema_cross(GBPUSD_SIM, self.gbpusd_bar_spec, "001")]),
+                BacktestShard([EURUSD_SIM], [ema_cross(EURUSD_SIM, self.eurusd_bar_spec, "002")]),
+            ],
+            engine_config={"bypass_logging": True},
+            processes=2,
+        )
+        sharded.add_exchange(
+            venue=SIM,
+            oms_type=OMSType.HEDGING,
+            starting_balances=[Money(1_000_000, USD)],
+        )
+
+        # Act
+        single.run(START, STOP, print_log_store=False, clamp_to_data=False)
+        sharded.run(START, STOP)
+
+        # Assert
+        orders = single.trader.generate_orders_report()
+        self.assertEqual({"GBP/USD", "EUR/USD"}, set(orders["symbol"]))
+        self.assertEqual(single.iteration, sharded.iteration)
+        pd.testing.assert_frame_equal(orders, sharded.generate_orders_report())
+        pd.testing.assert_frame_equal(
+            single.trader.generate_order_fills_report(),
+            sharded.generate_order_fills_report(),
+        )
+        pd.testing.assert_frame_equal(
+            single.trader.generate_positions_report(),
+            sharded.generate_positions_report(),
+        )
+        pd.testing.assert_frame_equal(
+            single.trader.generate_account_report(SIM),
+            sharded.generate_account_report(SIM),
+        )
+
+    def test_merge_account_reports_sums_only_monetary_columns(self):
+        # Arrange
+        index = pd.Index([0, 1], name="timestamp")
+        report1 = pd.DataFrame(
+            data={"balance_USD": [Money(1_000, USD), Money(1_100, USD)], "note": ["start", "shard1"]},
+            index=index,
+        )
+        report2 = pd.DataFrame(
+            data={"balance_USD": [Money(1_000, USD), Money(950, USD)], "note": ["start", "shard2"]},
+            index=pd.Index([0, 2], name="timestamp"),
+        )
+
+        # Act
+        merged = _merge_account_reports([report1, report2])
+
+        # Assert
+        self.assertEqual([0, 1, 2], list(merged.index))
+        self.assertEqual([Money(1_000, USD), Money(1_100, USD), Money(1_050, USD)], list(merged["balance_USD"]))
+        self.assertEqual(["start", "shard1", "shard2"], list(merged["note"]))
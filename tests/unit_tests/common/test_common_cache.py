@@ -0,0 +1,72 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2021 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import unittest
+
+from nautilus_trader.common.cache import IdentifierCache
+from nautilus_trader.model.identifiers import ClientOrderId
+from nautilus_trader.model.identifiers import ExecutionId
+from nautilus_trader.model.identifiers import PositionId
+from nautilus_trader.model.identifiers import StrategyId
+from nautilus_trader.model.identifiers import Symbol
+
+
+class IdentifierCacheTests(unittest.TestCase):
+
+    def setUp(self):
+        # Fixture Setup
+        self.cache = IdentifierCache(capacity=2)
+
+    def test_get_order_related_identifiers_returns_cached_objects(self):
+        # Arrange
+        # Act
+        cl_ord_id = self.cache.get_cl_ord_id("O-123456")
+        position_id = self.cache.get_position_id("P-123456")
+        execution_id = self.cache.get_execution_id("E-123456")
+
+        # Assert
+        self.assertEqual(ClientOrderId("O-123456"), cl_ord_id)
+        self.assertEqual(PositionId("P-123456"), position_id)
+        self.assertEqual(ExecutionId("E-123456"), execution_id)
+        self.assertIs(cl_ord_id, self.cache.get_cl_ord_id("O-123456"))
+
+    def test_get_with_churning_values_remains_bounded(self):
+        # Arrange
+        # Act
+        for i in range(100):
+            self.cache.get_cl_ord_id(f"O-{i}")
+
+        # Assert
+        stats = self.cache.stats()["cl_ord_ids"]
+        self.assertEqual(2, stats["size"])
+        self.assertEqual(100, stats["misses"])
+        self.assertEqual(98, stats["evictions"])
+
+    def test_prewarm_caches_identifiers(self):
+        # Arrange
+        self.cache.prewarm(
+            strategy_ids=["S-001"],
+            symbols=["AUD/USD.SIM"],
+        )
+
+        # Act
+        strategy_id = self.cache.get_strategy_id("S-001")
+        symbol = self.cache.get_symbol("AUD/USD.SIM")
+
+        # Assert
+        self.assertEqual(StrategyId("S", "001"), strategy_id)
+        self.assertEqual(Symbol.from_str("AUD/USD.SIM"), symbol)
+        self.assertEqual(1, self.cache.stats()["strategy_ids"]["hits"])
+        self.assertEqual(0, self.cache.stats()["symbols"]["misses"])
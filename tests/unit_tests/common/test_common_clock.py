@@ -13,8 +13,10 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import asyncio
 from datetime import datetime
 from datetime import timedelta
+import threading
 import time
 import unittest
 
@@ -22,6 +24,7 @@ import pytz
 
 from nautilus_trader.common.clock import LiveClock
 from nautilus_trader.common.clock import TestClock
+from nautilus_trader.common.timer import LoopTimer
 from nautilus_trader.common.timer import TimeEvent
 from tests.test_kit.stubs import UNIX_EPOCH
 
@@ -59,6 +62,21 @@ class TestClockTests(unittest.TestCase):
         self.assertEqual(UNIX_EPOCH + timedelta(minutes=1), clock.utc_now())
         self.assertEqual([], events)
 
+    def test_timestamp_ns_tracks_set_and_advanced_time(self):
+        # Arrange
+        clock = TestClock(UNIX_EPOCH + timedelta(seconds=1))
+        initial_ns = clock.timestamp_ns()
+
+        # Act
+        clock.set_time(UNIX_EPOCH + timedelta(seconds=2))
+        set_ns = clock.timestamp_ns()
+        clock.advance_time(UNIX_EPOCH + timedelta(seconds=3))
+
+        # Assert
+        self.assertEqual(1_000_000_000, initial_ns)
+        self.assertEqual(2_000_000_000, set_ns)
+        self.assertEqual(3_000_000_000, clock.timestamp_ns())
+
     def test_advance_time_given_time_in_past_raises_value_error(self):
         # Arrange
         clock = TestClock(UNIX_EPOCH)
@@ -243,6 +261,8 @@ class TestClockTests(unittest.TestCase):
         # Assert
         self.assertEqual(4, len(event_handlers))
         self.assertEqual("TEST_TIMER", event_handlers[0].event.name)
+        self.assertEqual(120_000_000_000, event_handlers[0].event.timestamp_ns)
+        self.assertEqual(360_000_000_000, clock.next_event_time_ns)
         self.assertEqual(["TEST_TIMER"], clock.timer_names())
         self.assertEqual("TEST_TIMER", clock.timer("TEST_TIMER").name)
         self.assertEqual(1, clock.timer_count)
@@ -524,3 +544,168 @@ class LiveClockTests(unittest.TestCase):
 
         # Assert
         self.assertTrue(len(self.handler) >= 8)
+
+
+class LiveClockWithLoopTests(unittest.TestCase):
+    def setUp(self):
+        # Fixture Setup
+        # Fresh isolated loop testing pattern
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+
+        self.handler = []
+        self.clock = LiveClock(loop=self.loop)
+        self.clock.register_default_handler(self.handler.append)
+
+    def tearDown(self):
+        self.clock.cancel_timers()
+        self.loop.close()
+
+    def test_instantiated_clock(self):
+        # Arrange
+        # Act
+        # Assert
+        self.assertEqual(self.loop, self.clock.loop)
+        self.assertIsNone(LiveClock().loop)
+        self.assertEqual([], self.clock.timer_names())
+
+    def test_set_timer_creates_loop_timer(self):
+        # Arrange
+        # Act
+        self.clock.set_timer("TEST_TIMER", timedelta(milliseconds=100))
+
+        # Assert
+        self.assertEqual(LoopTimer, type(self.clock.timer("TEST_TIMER")))
+        self.assertEqual(["TEST_TIMER"], self.clock.timer_names())
+
+    def test_set_time_alert_handles_event_on_loop_thread(self):
+        # Arrange
+        threads = []
+        alert_time = self.clock.utc_now() + timedelta(milliseconds=50)
+
+        def handler(event):
+            threads.append(threading.current_thread())
+            self.handler.append(event)
+
+        # Act
+        self.clock.set_time_alert("TEST_ALERT", alert_time, handler)
+        self.loop.run_until_complete(asyncio.sleep(0.2))
+
+        # Assert
+        self.assertEqual([], self.clock.timer_names())
+        self.assertEqual(1, len(self.handler))
+        self.assertEqual("TEST_ALERT", self.handler[0].name)
+        self.assertEqual([threading.current_thread()], threads)
+
+    def test_set_multiple_time_alerts_handles_events_in_time_order(self):
+        # Arrange
+        alert_time1 = self.clock.utc_now() + timedelta(milliseconds=100)
+        alert_time2 = self.clock.utc_now() + timedelta(milliseconds=50)
+
+        # Act
+        self.clock.set_time_alert("TEST_ALERT1", alert_time1)
+        self.clock.set_time_alert("TEST_ALERT2", alert_time2)
+        self.loop.run_until_complete(asyncio.sleep(0.3))
+
+        # Assert
+        self.assertEqual([], self.clock.timer_names())
+        self.assertEqual(["TEST_ALERT2", "TEST_ALERT1"], [event.name for event in self.handler])
+
+    def test_cancel_time_alert(self):
+        # Arrange
+        alert_time = self.clock.utc_now() + timedelta(milliseconds=50)
+        self.clock.set_time_alert("TEST_ALERT", alert_time)
+
+        # Act
+        self.clock.cancel_timer("TEST_ALERT")
+        self.loop.run_until_complete(asyncio.sleep(0.2))
+
+        # Assert
+        self.assertEqual([], self.clock.timer_names())
+        self.assertEqual(0, len(self.handler))
+
+    def test_set_repeating_timer(self):
+        # Arrange
+        interval = timedelta(milliseconds=50)
+
+        # Act
+        self.clock.set_timer("TEST_TIMER", interval)
+        self.loop.run_until_complete(asyncio.sleep(0.3))
+
+        # Assert
+        self.assertEqual(["TEST_TIMER"], self.clock.timer_names())
+        self.assertTrue(len(self.handler) >= 3)
+        self.assertTrue(self.handler[0].timestamp_ns < self.handler[1].timestamp_ns)
+        self.assertEqual(self.clock.timer("TEST_TIMER").next_time_ns, self.clock.next_event_time_ns)
+
+    def test_set_timer_with_stop_time(self):
+        # Arrange
+        interval = timedelta(milliseconds=50)
+        start_time = self.clock.utc_now()
+        stop_time = start_time + interval * 2
+
+        # Act
+        self.clock.set_timer(
+            name="TEST_TIMER",
+            interval=interval,
+            start_time=start_time,
+            stop_time=stop_time,
+        )
+        self.loop.run_until_complete(asyncio.sleep(0.3))
+
+        # Assert
+        self.assertEqual([], self.clock.timer_names())
+        self.assertEqual(2, len(self.handler))
+        self.assertEqual(0, self.clock.next_event_time_ns)
+
+    def test_cancel_repeating_timer(self):
+        # Arrange
+        interval = timedelta(milliseconds=50)
+        self.clock.set_timer("TEST_TIMER", interval)
+        self.loop.run_until_complete(asyncio.sleep(0.12))
+        count = len(self.handler)
+
+        # Act
+        self.clock.cancel_timer("TEST_TIMER")
+        self.loop.run_until_complete(asyncio.sleep(0.2))
+
+        # Assert
+        self.assertEqual([], self.clock.timer_names())
+        self.assertTrue(count >= 1)
+        self.assertEqual(count, len(self.handler))
+
+    def test_raising_handler_does_not_stop_other_timers(self):
+        # Arrange
+        errors = []
+        self.loop.set_exception_handler(lambda loop, context: errors.append(context["exception"]))
+        interval = timedelta(milliseconds=10)
+
+        def raising_handler(event):
+            self.handler.append(event)
+            raise RuntimeError(event.name)
+
+        # Act
+        self.clock.set_timer("TEST_TIMER1", interval, handler=raising_handler)
+        self.clock.set_timer("TEST_TIMER2", interval)
+        self.loop.run_until_complete(asyncio.sleep(0.3))
+
+        # Assert
+        names = [event.name for event in self.handler]
+        self.assertEqual(["TEST_TIMER1", "TEST_TIMER2"], self.clock.timer_names())
+        self.assertTrue(names.count("TEST_TIMER1") >= 10)
+        self.assertTrue(names.count("TEST_TIMER2") >= 10)
+        self.assertEqual(names.count("TEST_TIMER1"), len(errors))
+
+    def test_set_two_repeating_timers(self):
+        # Arrange
+        interval = timedelta(milliseconds=50)
+        start_time = self.clock.utc_now() + interval
+
+        # Act
+        self.clock.set_timer("TEST_TIMER1", interval, start_time)
+        self.clock.set_timer("TEST_TIMER2", interval, start_time)
+        self.loop.run_until_complete(asyncio.sleep(0.4))
+
+        # Assert
+        self.assertEqual(["TEST_TIMER1", "TEST_TIMER2"], self.clock.timer_names())
+        self.assertTrue(len(self.handler) >= 8)
@@ -0,0 +1,232 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2021 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import threading
+import unittest
+
+from parameterized import parameterized
+
+from nautilus_trader.common.latency import LatencyHistogram
+from nautilus_trader.common.latency import LatencyRecorder
+from nautilus_trader.common.latency import LatencyStage
+from nautilus_trader.common.latency import latency_stage_to_str
+from nautilus_trader.common.latency import monotonic_ns
+from nautilus_trader.model.identifiers import StrategyId
+
+
+class LatencyHistogramTests(unittest.TestCase):
+
+    def test_instantiate_histogram(self):
+        # Arrange
+        # Act
+        histogram = LatencyHistogram()
+
+        # Assert
+        self.assertEqual(2, histogram.significant_figures)
+        self.assertEqual(0, histogram.count)
+        self.assertEqual(0, histogram.min)
+        self.assertEqual(0, histogram.max)
+        self.assertEqual(0.0, histogram.mean())
+        self.assertEqual(0, histogram.value_at_percentile(99))
+
+    @parameterized.expand([
+        [0],
+        [4],
+    ])
+    def test_instantiate_with_invalid_significant_figures_raises_value_error(self, value):
+        # Arrange
+        # Act
+        # Assert
+        self.assertRaises(ValueError, LatencyHistogram, value)
+
+    def test_record_values_below_sub_bucket_count_are_exact(self):
+        # Arrange
+        histogram = LatencyHistogram()
+
+        # Act
+        for value in range(1, 101):
+            histogram.record(value)
+
+        # Assert
+        self.assertEqual(100, histogram.count)
+        self.assertEqual(1, histogram.min)
+        self.assertEqual(100, histogram.max)
+        self.assertEqual(50.5, histogram.mean())
+        self.assertEqual(50, histogram.value_at_percentile(50))
+        self.assertEqual(99, histogram.value_at_percentile(99))
+        self.assertEqual(100, histogram.value_at_percentile(100))
+
+    @parameterized.expand([
+        [1_234],
+        [56_789],
+        [1_000_000],
+        [987_654_321],
+    ])
+    def test_record_large_values_held_to_significant_figures(self, value):
+        # Arrange
+        histogram = LatencyHistogram()
+        histogram.record(1)  # So the percentile is not capped at the max
+        histogram.record(value)
+        histogram.record(value * 10)
+
+        # Act
+        result = histogram.value_at_percentile(60)
+
+        # Assert
+        self.assertGreaterEqual(result, value)
+        self.assertLess((result - value) / value, 0.01)
+
+    def test_record_negative_value_records_zero(self):
+        # Arrange
+        histogram = LatencyHistogram()
+
+        # Act
+        histogram.record(-5)
+
+        # Assert
+        self.assertEqual(1, histogram.count)
+        self.assertEqual(0, histogram.max)
+
+    def test_record_value_above_highest_trackable_counts_in_highest_bucket(self):
+        # Arrange
+        histogram = LatencyHistogram(highest_trackable=1_000_000)
+
+        # Act
+        histogram.record(5_000_000)
+
+        # Assert
+        self.assertEqual(1, histogram.count)
+        self.assertEqual(5_000_000, histogram.max)
+        self.assertGreaterEqual(histogram.value_at_percentile(50), 1_000_000)
+
+    def test_stats(self):
+        # Arrange
+        histogram = LatencyHistogram()
+        for value in range(1, 1001):
+            histogram.record(value)
+
+        # Act
+        result = histogram.stats()
+
+        # Assert
+        self.assertEqual(["count", "min", "mean", "p50", "p90", "p99", "p99.9", "max"], list(result))
+        self.assertEqual(1000, result["count"])
+        self.assertEqual(1, result["min"])
+        self.assertEqual(500.5, result["mean"])
+        self.assertEqual(1000, result["max"])
+        self.assertAlmostEqual(500, result["p50"], delta=5)
+        self.assertAlmostEqual(990, result["p99"], delta=10)
+
+    def test_reset(self):
+        # Arrange
+        histogram = LatencyHistogram()
+        histogram.record(1_000)
+
+        # Act
+        histogram.reset()
+
+        # Assert
+        self.assertEqual(0, histogram.count)
+        self.assertEqual(0, histogram.max)
+        self.assertEqual(0, histogram.value_at_percentile(50))
+
+
+class LatencyRecorderTests(unittest.TestCase):
+
+    def setUp(self):
+        # Fixture Setup
+        self.recorder = LatencyRecorder()
+        self.strategy_id = StrategyId("S", "001")
+
+    def test_latency_stage_to_str(self):
+        # Arrange
+        # Act
+        # Assert
+        self.assertEqual("ADAPTER_PARSE", latency_stage_to_str(LatencyStage.ADAPTER_PARSE))
+        self.assertEqual("TICK_TO_TRADE", latency_stage_to_str(LatencyStage.TICK_TO_TRADE))
+        self.assertEqual("UNDEFINED", latency_stage_to_str(99))
+
+    def test_monotonic_ns_does_not_go_backwards(self):
+        # Arrange
+        # Act
+        first = monotonic_ns()
+        second = monotonic_ns()
+
+        # Assert
+        self.assertGreaterEqual(second, first)
+
+    def test_report_when_nothing_recorded_returns_empty_report(self):
+        # Arrange
+        # Act
+        # Assert
+        self.assertEqual({"stages": {}, "strategies": {}}, self.recorder.report())
+        self.assertIsNone(self.recorder.histogram(LatencyStage.STRATEGY, self.strategy_id))
+
+    def test_record_aggregates_per_stage_and_per_strategy(self):
+        # Arrange
+        # Act
+        self.recorder.record(LatencyStage.DATA_DISPATCH, 1_000)
+        self.recorder.record(LatencyStage.STRATEGY, 2_000, self.strategy_id)
+        self.recorder.record(LatencyStage.STRATEGY, 4_000)
+
+        report = self.recorder.report()
+
+        # Assert
+        self.assertEqual(["DATA_DISPATCH", "STRATEGY"], list(report["stages"]))
+        self.assertEqual(2, report["stages"]["STRATEGY"]["count"])
+        self.assertEqual(["STRATEGY"], list(report["strategies"]["S-001"]))
+        self.assertEqual(1, report["strategies"]["S-001"]["STRATEGY"]["count"])
+        self.assertEqual(2_000, self.recorder.histogram(LatencyStage.STRATEGY, self.strategy_id).max)
+
+    def test_origin_ns_when_set_returns_stamp(self):
+        # Arrange
+        # Act
+        self.recorder.set_origin_ns(1_000)
+
+        # Assert
+        self.assertEqual(1_000, self.recorder.origin_ns())
+
+    def test_origin_ns_set_on_another_thread_returns_zero(self):
+        # Arrange
+        thread = threading.Thread(target=self.recorder.set_origin_ns, args=(1_000,))
+
+        # Act
+        thread.start()
+        thread.join()
+
+        # Assert
+        self.assertEqual(0, self.recorder.origin_ns())
+
+    def test_origin_ns_is_held_per_recorder(self):
+        # Arrange
+        other = LatencyRecorder()
+
+        # Act
+        self.recorder.set_origin_ns(1_000)
+
+        # Assert
+        self.assertEqual(0, other.origin_ns())
+
+    def test_reset(self):
+        # Arrange
+        self.recorder.record(LatencyStage.STRATEGY, 2_000, self.strategy_id)
+        self.recorder.set_origin_ns(1_000)
+
+        # Act
+        self.recorder.reset()
+
+        # Assert
+        self.assertEqual({"stages": {}, "strategies": {}}, self.recorder.report())
+        self.assertEqual(0, self.recorder.origin_ns())
@@ -97,3 +97,66 @@ class ObjectCacheTests(unittest.TestCase):
 
         # Assert
         self.assertEqual([], cache.keys())
+
+    def test_instantiate_with_invalid_capacity_raises_value_error(self):
+        # Arrange
+        # Act
+        # Assert
+        self.assertRaises(ValueError, ObjectCache, Symbol, Symbol.from_str, 0)
+
+    def test_get_counts_hits_and_misses(self):
+        # Arrange
+        cache = ObjectCache(Symbol, Symbol.from_str)
+
+        # Act
+        cache.get("AUD/USD.SIM")
+        cache.get("AUD/USD.SIM")
+        cache.get("GBP/USD.SIM")
+
+        # Assert
+        self.assertEqual(10000, cache.capacity)
+        self.assertEqual(1, cache.hits)
+        self.assertEqual(2, cache.misses)
+        self.assertEqual(0, cache.evictions)
+
+    def test_get_when_cache_full_evicts_least_recently_used(self):
+        # Arrange
+        cache = ObjectCache(Symbol, Symbol.from_str, capacity=2)
+        cache.get("AUD/USD.SIM")
+        cache.get("GBP/USD.SIM")
+        cache.get("AUD/USD.SIM")  # Now most recently used
+
+        # Act
+        cache.get("USD/JPY.SIM")
+
+        # Assert
+        self.assertEqual(["AUD/USD.SIM", "USD/JPY.SIM"], cache.keys())
+        self.assertEqual(1, cache.evictions)
+
+    def test_prewarm_caches_objects_without_counting_misses(self):
+        # Arrange
+        cache = ObjectCache(Symbol, Symbol.from_str)
+        cache.prewarm(["AUD/USD.SIM", "GBP/USD.SIM"])
+
+        # Act
+        cache.get("AUD/USD.SIM")
+
+        # Assert
+        self.assertEqual(["GBP/USD.SIM", "AUD/USD.SIM"], cache.keys())
+        self.assertEqual(1, cache.hits)
+        self.assertEqual(0, cache.misses)
+
+    def test_clear_resets_counters(self):
+        # Arrange
+        cache = ObjectCache(Symbol, Symbol.from_str, capacity=1)
+        cache.get("AUD/USD.SIM")
+        cache.get("AUD/USD.SIM")
+        cache.get("GBP/USD.SIM")
+
+        # Act
+        cache.clear()
+
+        # Assert
+        self.assertEqual(0, cache.hits)
+        self.assertEqual(0, cache.misses)
+        self.assertEqual(0, cache.evictions)
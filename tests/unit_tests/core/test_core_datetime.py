@@ -25,10 +25,12 @@ from nautilus_trader.core.datetime import as_utc_index
 from nautilus_trader.core.datetime import as_utc_timestamp
 from nautilus_trader.core.datetime import format_iso8601
 from nautilus_trader.core.datetime import from_posix_ms
+from nautilus_trader.core.datetime import from_unix_nanos
 from nautilus_trader.core.datetime import is_datetime_utc
 from nautilus_trader.core.datetime import is_tz_aware
 from nautilus_trader.core.datetime import is_tz_naive
 from nautilus_trader.core.datetime import to_posix_ms
+from nautilus_trader.core.datetime import to_unix_nanos
 from tests.test_kit.stubs import UNIX_EPOCH
 
 
@@ -48,6 +50,67 @@ class TestFunctionsTests(unittest.TestCase):
         # Assert
         self.assertEqual(expected, posix)
 
+    @parameterized.expand([
+        [datetime(1969, 12, 1, 1, 0, tzinfo=pytz.utc), -2674800000000000],
+        [datetime(1970, 1, 1, 0, 0, tzinfo=pytz.utc), 0],
+        [datetime(2013, 1, 1, 1, 0, tzinfo=pytz.utc), 1357002000000000000],
+        [datetime(2020, 1, 2, 3, 2, microsecond=1001, tzinfo=pytz.utc), 1577934120001001000],
+    ])
+    def test_to_unix_nanos_with_various_values_returns_expected_long(self, value, expected):
+        # Arrange
+        # Act
+        nanos = to_unix_nanos(value)
+
+        # Assert
+        self.assertEqual(expected, nanos)
+
+    def test_to_unix_nanos_given_pandas_timestamp_returns_expected_long(self):
+        # Arrange
+        timestamp = pd.Timestamp("2013-02-01 00:01:00.123456", tz="UTC")
+
+        # Act
+        nanos = to_unix_nanos(timestamp)
+
+        # Assert
+        self.assertEqual(timestamp.value, nanos)
+
+    def test_to_unix_nanos_given_tz_naive_datetime_assumes_utc(self):
+        # Arrange
+        timestamp = datetime(2013, 1, 1, 1, 0, microsecond=1001)
+
+        # Act
+        nanos = to_unix_nanos(timestamp)
+
+        # Assert
+        self.assertEqual(to_unix_nanos(timestamp.replace(tzinfo=pytz.utc)), nanos)
+        self.assertEqual(1357002000001001000, nanos)
+
+    def test_to_unix_nanos_given_non_utc_datetime_returns_expected_long(self):
+        # Arrange
+        timestamp = pd.Timestamp("2013-02-01 10:00:00", tz="Australia/Sydney")
+
+        # Act
+        nanos = to_unix_nanos(timestamp)
+
+        # Assert
+        self.assertEqual(timestamp.value, nanos)
+
+    @parameterized.expand([
+        [-2674800000000000, datetime(1969, 12, 1, 1, 0, tzinfo=pytz.utc)],
+        [-1, datetime(1969, 12, 31, 23, 59, 59, 999999, tzinfo=pytz.utc)],
+        [0, datetime(1970, 1, 1, 0, 0, tzinfo=pytz.utc)],
+        [951782400000000000, datetime(2000, 2, 29, 0, 0, tzinfo=pytz.utc)],
+        [1577934120001001999, datetime(2020, 1, 2, 3, 2, 0, 1001, tzinfo=pytz.utc)],
+    ])
+    def test_from_unix_nanos_with_various_values_returns_expected_datetime(self, value, expected):
+        # Arrange
+        # Act
+        dt = from_unix_nanos(value)
+
+        # Assert
+        self.assertEqual(expected, dt)
+        self.assertEqual(pytz.utc, dt.tzinfo)
+
     @parameterized.expand([
         [-2674800000, datetime(1969, 12, 1, 1, 0, tzinfo=pytz.utc)],
         [0, datetime(1970, 1, 1, 0, 0, tzinfo=pytz.utc)],
@@ -21,6 +21,51 @@ from nautilus_trader.common.c_enums.component_trigger import ComponentTrigger
 from nautilus_trader.common.component import ComponentFSMFactory
 from nautilus_trader.core.fsm import FiniteStateMachine
 from nautilus_trader.core.fsm import InvalidStateTrigger
+from nautilus_trader.core.fsm import StateTransitionTable
+
+
+class StateTransitionTableTests(unittest.TestCase):
+
+    def test_compile_table_sizes_to_highest_state_and_trigger(self):
+        # Arrange
+        # Act
+        table = StateTransitionTable({(0, 1): 2, (2, 3): 0})
+
+        # Assert
+        self.assertEqual(3, table.state_count)
+        self.assertEqual(4, table.trigger_count)
+
+    def test_compile_empty_table_raises_value_error(self):
+        # Arrange
+        # Act
+        # Assert
+        self.assertRaises(ValueError, StateTransitionTable, {})
+
+    def test_compile_table_with_negative_trigger_raises_value_error(self):
+        # Arrange
+        # Act
+        # Assert
+        self.assertRaises(ValueError, StateTransitionTable, {(0, -1): 1})
+
+    def test_next_state_for_valid_transition_returns_next_state(self):
+        # Arrange
+        table = StateTransitionTable(ComponentFSMFactory.get_state_transition_table())
+
+        # Act
+        result = table.next_state(ComponentState.INITIALIZED, ComponentTrigger.START)
+
+        # Assert
+        self.assertEqual(ComponentState.STARTING, result)
+
+    def test_next_state_for_invalid_or_out_of_range_transition_returns_minus_one(self):
+        # Arrange
+        table = StateTransitionTable(ComponentFSMFactory.get_state_transition_table())
+
+        # Act
+        # Assert
+        self.assertEqual(-1, table.next_state(ComponentState.INITIALIZED, ComponentTrigger.RUNNING))
+        self.assertEqual(-1, table.next_state(ComponentState.INITIALIZED, 1000))
+        self.assertEqual(-1, table.next_state(-1, ComponentTrigger.START))
 
 
 class FiniteStateMachineTests(unittest.TestCase):
@@ -59,3 +104,27 @@ class FiniteStateMachineTests(unittest.TestCase):
 
         # Assert
         self.assertEqual(ComponentState.STARTING, self.fsm.state)
+
+    def test_fsms_sharing_compiled_table_hold_independent_state(self):
+        # Arrange
+        table = StateTransitionTable(ComponentFSMFactory.get_state_transition_table())
+        fsm1 = FiniteStateMachine(table, ComponentState.INITIALIZED)
+        fsm2 = FiniteStateMachine(table, ComponentState.INITIALIZED)
+
+        # Act
+        fsm1.trigger(ComponentTrigger.START)
+
+        # Assert
+        self.assertEqual(ComponentState.STARTING, fsm1.state)
+        self.assertEqual(ComponentState.INITIALIZED, fsm2.state)
+
+    def test_trigger_from_state_outside_table_raises_exception(self):
+        # Arrange
+        fsm = FiniteStateMachine(
+            state_transition_table=ComponentFSMFactory.get_state_transition_table(),
+            initial_state=1000,
+        )
+
+        # Act
+        # Assert
+        self.assertRaises(InvalidStateTrigger, fsm.trigger, ComponentTrigger.START)
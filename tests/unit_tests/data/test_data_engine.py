@@ -17,6 +17,9 @@ import unittest
 
 from nautilus_trader.backtest.data_client import BacktestDataClient
 from nautilus_trader.common.clock import TestClock
+from nautilus_trader.common.latency import LatencyRecorder
+from nautilus_trader.common.latency import LatencyStage
+from nautilus_trader.common.latency import monotonic_ns
 from nautilus_trader.common.logging import TestLogger
 from nautilus_trader.common.messages import Connect
 from nautilus_trader.common.messages import DataRequest
@@ -37,10 +40,13 @@ from nautilus_trader.model.enums import OrderSide
 from nautilus_trader.model.enums import PriceType
 from nautilus_trader.model.identifiers import Symbol
 from nautilus_trader.model.identifiers import TradeMatchId
+from nautilus_trader.model.identifiers import TraderId
 from nautilus_trader.model.identifiers import Venue
 from nautilus_trader.model.instrument import Instrument
 from nautilus_trader.model.objects import Price
 from nautilus_trader.model.objects import Quantity
+from nautilus_trader.model.order_book import OrderBook
+from nautilus_trader.model.order_book import OrderBookDelta
 from nautilus_trader.model.tick import QuoteTick
 from nautilus_trader.model.tick import TradeTick
 from nautilus_trader.trading.portfolio import Portfolio
@@ -714,6 +720,92 @@ class DataEngineTests(unittest.TestCase):
         self.assertEqual([ETHUSDT_BINANCE.symbol], self.data_engine.subscribed_quote_ticks)
         self.assertEqual([tick], handler)
 
+    def test_process_quote_tick_with_latency_recorder_records_stages_per_strategy(self):
+        # Arrange
+        recorder = LatencyRecorder()
+        self.data_engine.register_latency_recorder(recorder)
+        self.data_engine.register_client(self.binance_client)
+        self.binance_client.connect()
+
+        strategy = TradingStrategy(order_id_tag="001")
+        strategy.register_trader(
+            TraderId("TESTER", "000"),
+            self.clock,
+            self.logger,
+        )
+
+        subscribe = Subscribe(
+            venue=BINANCE,
+            data_type=QuoteTick,
+            metadata={"Symbol": ETHUSDT_BINANCE.symbol},
+            handler=strategy.handle_quote_tick,
+            command_id=self.uuid_factory.generate(),
+            command_timestamp=self.clock.utc_now(),
+        )
+
+        self.data_engine.execute(subscribe)
+
+        tick = QuoteTick(
+            ETHUSDT_BINANCE.symbol,
+            Price("100.003"),
+            Price("100.003"),
+            Quantity(1),
+            Quantity(1),
+            UNIX_EPOCH,
+        )
+
+        # Act
+        self.data_engine.process(tick)
+
+        # Assert
+        report = recorder.report()
+        self.assertEqual(recorder, self.data_engine.latency_recorder)
+        self.assertTrue(tick.recv_ns > 0)  # Stamped on receipt
+        self.assertTrue(tick.stage_ns >= tick.recv_ns)
+        self.assertEqual(["DATA_DISPATCH", "STRATEGY"], list(report["stages"]))
+        self.assertEqual(["STRATEGY"], list(report["strategies"][strategy.id.value]))
+        self.assertEqual(0, recorder.origin_ns())
+
+    def test_process_quote_tick_stamped_by_client_records_adapter_parse(self):
+        # Arrange
+        recorder = LatencyRecorder()
+        self.data_engine.register_latency_recorder(recorder)
+
+        tick = QuoteTick(
+            ETHUSDT_BINANCE.symbol,
+            Price("100.003"),
+            Price("100.003"),
+            Quantity(1),
+            Quantity(1),
+            UNIX_EPOCH,
+        )
+        tick.recv_ns = monotonic_ns()
+
+        # Act
+        self.data_engine.process(tick)
+
+        # Assert
+        self.assertEqual(1, recorder.histogram(LatencyStage.ADAPTER_PARSE).count)
+
+    def test_process_quote_tick_without_latency_recorder_does_not_stamp(self):
+        # Arrange
+        tick = QuoteTick(
+            ETHUSDT_BINANCE.symbol,
+            Price("100.003"),
+            Price("100.003"),
+            Quantity(1),
+            Quantity(1),
+            UNIX_EPOCH,
+        )
+
+        # Act
+        self.data_engine.process(tick)
+
+        # Assert
+        self.assertIsNone(self.data_engine.latency_recorder)
+        self.assertEqual(0, tick.recv_ns)
+        self.assertEqual(0, tick.stage_ns)
+
     def test_process_quote_tick_when_subscribers_then_sends_to_registered_handlers(self):
         # Arrange
         self.data_engine.register_client(self.binance_client)
@@ -888,6 +980,104 @@ class DataEngineTests(unittest.TestCase):
         self.assertEqual([tick], handler1)
         self.assertEqual([tick], handler2)
 
+    def test_subscribe_order_book_then_subscribes(self):
+        # Arrange
+        self.data_engine.register_client(self.binance_client)
+        self.binance_client.connect()
+
+        handler = []
+        subscribe = Subscribe(
+            venue=BINANCE,
+            data_type=OrderBook,
+            metadata={"Symbol": ETHUSDT_BINANCE.symbol},
+            handler=handler.append,
+            command_id=self.uuid_factory.generate(),
+            command_timestamp=self.clock.utc_now(),
+        )
+
+        # Act
+        self.data_engine.execute(subscribe)
+
+        # Assert
+        self.assertEqual([ETHUSDT_BINANCE.symbol], self.data_engine.subscribed_order_books)
+
+    def test_unsubscribe_order_book_then_unsubscribes(self):
+        # Arrange
+        self.data_engine.register_client(self.binance_client)
+        self.binance_client.connect()
+
+        handler = []
+        subscribe = Subscribe(
+            venue=BINANCE,
+            data_type=OrderBook,
+            metadata={"Symbol": ETHUSDT_BINANCE.symbol},
+            handler=handler.append,
+            command_id=self.uuid_factory.generate(),
+            command_timestamp=self.clock.utc_now(),
+        )
+
+        self.data_engine.execute(subscribe)
+
+        unsubscribe = Unsubscribe(
+            venue=BINANCE,
+            data_type=OrderBook,
+            metadata={"Symbol": ETHUSDT_BINANCE.symbol},
+            handler=handler.append,
+            command_id=self.uuid_factory.generate(),
+            command_timestamp=self.clock.utc_now(),
+        )
+
+        # Act
+        self.data_engine.execute(unsubscribe)
+
+        # Assert
+        self.assertEqual([], self.data_engine.subscribed_order_books)
+
+    def test_process_order_book_delta_updates_cache_and_sends_book_to_handler(self):
+        # Arrange
+        self.data_engine.register_client(self.binance_client)
+        self.binance_client.connect()
+
+        handler = []
+        subscribe = Subscribe(
+            venue=BINANCE,
+            data_type=OrderBook,
+            metadata={"Symbol": ETHUSDT_BINANCE.symbol},
+            handler=handler.append,
+            command_id=self.uuid_factory.generate(),
+            command_timestamp=self.clock.utc_now(),
+        )
+
+        self.data_engine.execute(subscribe)
+
+        delta1 = OrderBookDelta(
+            ETHUSDT_BINANCE.symbol,
+            OrderSide.BUY,
+            Price("1050.00000"),
+            Quantity(100),
+            UNIX_EPOCH,
+        )
+
+        delta2 = OrderBookDelta(
+            ETHUSDT_BINANCE.symbol,
+            OrderSide.SELL,
+            Price("1051.00000"),
+            Quantity(50),
+            UNIX_EPOCH,
+        )
+
+        # Act
+        self.data_engine.process(delta1)
+        self.data_engine.process(delta2)
+
+        # Assert
+        order_book = self.data_engine.cache.order_book(ETHUSDT_BINANCE.symbol)
+        self.assertTrue(self.data_engine.cache.has_order_book(ETHUSDT_BINANCE.symbol))
+        self.assertEqual([order_book, order_book], handler)
+        self.assertEqual(Price("1050.00000"), order_book.best_bid_price())
+        self.assertEqual(Price("1051.00000"), order_book.best_ask_price())
+        self.assertEqual(2, self.data_engine.data_count)
+
     def test_subscribe_bar_type_then_subscribes(self):
         # Arrange
         self.data_engine.register_client(self.binance_client)
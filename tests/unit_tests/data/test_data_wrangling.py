@@ -99,6 +99,29 @@ class QuoteTickDataWranglerTests(unittest.TestCase):
         self.assertEqual("1", tick_data.iloc[3]["bid_size"])
         self.assertEqual("1", tick_data.iloc[3]["ask_size"])
 
+    def test_pre_process_bars_with_bar_data(self):
+        # Arrange
+        bid_data = TestDataProvider.usdjpy_1min_bid()
+        ask_data = TestDataProvider.usdjpy_1min_ask()
+        self.tick_builder = QuoteTickDataWrangler(
+            instrument=TestInstrumentProvider.default_fx_ccy(TestStubs.symbol_usdjpy_fxcm()),
+            data_quotes=None,
+            data_bars_bid={BarAggregation.MINUTE: bid_data},
+            data_bars_ask={BarAggregation.MINUTE: ask_data},
+        )
+
+        # Act
+        self.tick_builder.pre_process_bars(0)
+        bar_data = self.tick_builder.processed_data
+
+        # Assert
+        self.assertEqual(BarAggregation.MINUTE, self.tick_builder.resolution)
+        self.assertEqual(28761, len(bar_data))
+        self.assertEqual(Timestamp("2013-02-01 00:00:00+0000", tz="UTC"), bar_data.iloc[0].name)
+        self.assertEqual(0, bar_data.iloc[0]["symbol"])
+        self.assertEqual("91.715", bar_data.iloc[0]["bid_open"])
+        self.assertEqual("91.717", bar_data.iloc[0]["ask_open"])
+
     def test_build_ticks_with_tick_data(self):
         # Arrange
         tick_data = TestDataProvider.audusd_ticks()
@@ -13,14 +13,19 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+from datetime import timedelta
+import sys
 import unittest
 
 from nautilus_trader.common.clock import TestClock
 from nautilus_trader.common.logging import TestLogger
+from nautilus_trader.core.uuid import uuid4
 from nautilus_trader.execution.cache import ExecutionCache
 from nautilus_trader.execution.database import BypassExecutionDatabase
 from nautilus_trader.model.enums import OrderSide
+from nautilus_trader.model.events import OrderCancelled
 from nautilus_trader.model.identifiers import ClientOrderId
+from nautilus_trader.model.identifiers import OrderId
 from nautilus_trader.model.identifiers import PositionId
 from nautilus_trader.model.identifiers import TraderId
 from nautilus_trader.model.identifiers import Venue
@@ -31,12 +36,33 @@ from nautilus_trader.trading.account import Account
 from nautilus_trader.trading.strategy import TradingStrategy
 from tests.test_kit.providers import TestInstrumentProvider
 from tests.test_kit.stubs import TestStubs
+from tests.test_kit.stubs import UNIX_EPOCH
 
 
 AUDUSD_SIM = TestInstrumentProvider.default_fx_ccy(TestStubs.symbol_audusd_fxcm())
 GBPUSD_SIM = TestInstrumentProvider.default_fx_ccy(TestStubs.symbol_gbpusd_fxcm())
 
 
+class InMemoryExecutionDatabase(BypassExecutionDatabase):
+
+    def __init__(self, trader_id, logger):
+        super().__init__(trader_id, logger)
+        self.orders = {}
+        self.positions = {}
+
+    def load_order(self, cl_ord_id):
+        return self.orders.get(cl_ord_id)
+
+    def load_position(self, position_id):
+        return self.positions.get(position_id)
+
+    def add_order(self, order):
+        self.orders[order.cl_ord_id] = order
+
+    def add_position(self, position):
+        self.positions[position.id] = position
+
+
 class ExecutionCacheTests(unittest.TestCase):
 
     def setUp(self):
@@ -474,6 +500,97 @@ class ExecutionCacheTests(unittest.TestCase):
         self.assertEqual(1, self.cache.positions_closed_count())
         self.assertEqual(1, self.cache.positions_total_count())
 
+    def test_order_queries_with_unknown_symbol_fall_back_to_all_orders(self):
+        # Arrange
+        order = self.strategy.order_factory.market(
+            AUDUSD_SIM.symbol,
+            OrderSide.BUY,
+            Quantity(100000),
+        )
+
+        self.cache.add_order(order, PositionId.null())
+
+        # Act
+        # Assert
+        self.assertEqual({order.cl_ord_id}, self.cache.order_ids(symbol=GBPUSD_SIM.symbol))
+        self.assertEqual([order], self.cache.orders(symbol=GBPUSD_SIM.symbol))
+        self.assertEqual([order], self.cache.orders(symbol=GBPUSD_SIM.symbol, strategy_id=self.strategy.id))
+        self.assertEqual([], self.cache.orders_working(symbol=GBPUSD_SIM.symbol))
+        self.assertEqual(1, self.cache.orders_total_count(symbol=GBPUSD_SIM.symbol))
+        self.assertEqual(1, self.cache.orders_total_count(symbol=AUDUSD_SIM.symbol))
+
+    def test_order_queries_with_composite_filters(self):
+        # Arrange
+        order1 = self.strategy.order_factory.stop_market(
+            AUDUSD_SIM.symbol,
+            OrderSide.BUY,
+            Quantity(100000),
+            Price("1.00000"),
+        )
+
+        order2 = self.strategy.order_factory.stop_market(
+            GBPUSD_SIM.symbol,
+            OrderSide.BUY,
+            Quantity(100000),
+            Price("1.00000"),
+        )
+
+        order3 = self.strategy.order_factory.market(
+            AUDUSD_SIM.symbol,
+            OrderSide.SELL,
+            Quantity(100000),
+        )
+
+        self.cache.add_order(order1, PositionId.null())
+        self.cache.add_order(order2, PositionId.null())
+        self.cache.add_order(order3, PositionId.null())
+
+        for order in [order1, order2]:
+            order.apply(TestStubs.event_order_submitted(order))
+            order.apply(TestStubs.event_order_accepted(order))
+            order.apply(TestStubs.event_order_working(order))
+            self.cache.update_order(order)
+
+        order3.apply(TestStubs.event_order_submitted(order3))
+        order3.apply(TestStubs.event_order_accepted(order3))
+        order3.apply(TestStubs.event_order_filled(order3, instrument=AUDUSD_SIM))
+        self.cache.update_order(order3)
+
+        # Act
+        order1.apply(TestStubs.event_order_cancelled(order1))
+        self.cache.update_order(order1)
+
+        # Assert
+        self.assertEqual([order2], self.cache.orders_working())
+        self.assertEqual([], self.cache.orders_working(symbol=AUDUSD_SIM.symbol))
+        self.assertEqual([order2], self.cache.orders_working(GBPUSD_SIM.symbol, self.strategy.id))
+        self.assertEqual([order3, order1], self.cache.orders_completed(AUDUSD_SIM.symbol, self.strategy.id))
+        self.assertEqual({order1.cl_ord_id, order3.cl_ord_id}, self.cache.order_completed_ids(AUDUSD_SIM.symbol))
+        self.assertEqual(2, self.cache.orders_total_count(symbol=AUDUSD_SIM.symbol))
+        self.assertEqual(1, self.cache.orders_working_count(strategy_id=self.strategy.id))
+        self.assertEqual(0, self.cache.orders_working_count(symbol=AUDUSD_SIM.symbol))
+        self.assertEqual(2, self.cache.orders_completed_count(AUDUSD_SIM.symbol, self.strategy.id))
+
+    def test_delete_strategy_removes_strategy_from_query_indexes(self):
+        # Arrange
+        order = self.strategy.order_factory.market(
+            AUDUSD_SIM.symbol,
+            OrderSide.BUY,
+            Quantity(100000),
+        )
+
+        self.cache.add_order(order, PositionId.null())
+        self.cache.update_strategy(self.strategy)
+
+        # Act
+        self.cache.delete_strategy(self.strategy)
+
+        # Assert
+        # Unknown strategy filters fall back to all orders
+        self.assertEqual([order], self.cache.orders(strategy_id=self.strategy.id))
+        self.assertEqual(1, self.cache.orders_total_count(AUDUSD_SIM.symbol, self.strategy.id))
+        self.assertEqual([order], self.cache.orders(symbol=AUDUSD_SIM.symbol))
+
     def test_update_account(self):
         # Arrange
         event = TestStubs.event_account_state()
@@ -658,3 +775,246 @@ class ExecutionCacheTests(unittest.TestCase):
 
         # Assert
         self.assertTrue(True)  # No exception raised
+
+
+class ExecutionCacheRetentionTests(unittest.TestCase):
+
+    def setUp(self):
+        # Fixture Setup
+        clock = TestClock()
+        self.logger = TestLogger(clock)
+
+        self.trader_id = TraderId("TESTER", "000")
+
+        self.strategy = TradingStrategy(order_id_tag="001")
+        self.strategy.register_trader(self.trader_id, clock, self.logger)
+
+        self.database = InMemoryExecutionDatabase(trader_id=self.trader_id, logger=self.logger)
+
+    def create_cache(self, config):
+        return ExecutionCache(database=self.database, logger=self.logger, config=config)
+
+    def cancelled_order(self, cache, timestamp=UNIX_EPOCH):
+        order = self.strategy.order_factory.stop_market(
+            AUDUSD_SIM.symbol,
+            OrderSide.BUY,
+            Quantity(100000),
+            Price("1.00000"),
+        )
+
+        cache.add_order(order, PositionId.null())
+        order.apply(TestStubs.event_order_submitted(order))
+        order.apply(TestStubs.event_order_accepted(order))
+        order.apply(TestStubs.event_order_working(order))
+        cache.update_order(order)
+
+        order.apply(OrderCancelled(
+            TestStubs.account_id(),
+            order.cl_ord_id,
+            OrderId("1"),
+            timestamp,
+            uuid4(),
+            timestamp,
+        ))
+        cache.update_order(order)
+
+        return order
+
+    def test_instantiate_with_negative_max_completed_orders_raises_value_error(self):
+        # Arrange
+        # Act
+        # Assert
+        self.assertRaises(ValueError, self.create_cache, {"max_completed_orders": -1})
+
+    def test_completed_orders_retained_when_unlimited(self):
+        # Arrange
+        cache = self.create_cache({})
+
+        # Act
+        orders = [self.cancelled_order(cache) for _i in range(3)]
+
+        # Assert
+        self.assertEqual(orders, cache.orders_completed())
+        self.assertEqual(0, cache.orders_archived_count())
+
+    def test_completed_orders_beyond_max_completed_orders_are_archived(self):
+        # Arrange
+        cache = self.create_cache({"max_completed_orders": 2})
+
+        # Act
+        orders = [self.cancelled_order(cache) for _i in range(3)]
+
+        # Assert
+        self.assertEqual(orders[1:], cache.orders_completed())
+        self.assertEqual(orders[1:], cache.orders_completed(AUDUSD_SIM.symbol, self.strategy.id))
+        self.assertEqual(2, cache.orders_completed_count(symbol=AUDUSD_SIM.symbol))
+        self.assertEqual(2, cache.orders_total_count())
+        self.assertEqual(1, cache.orders_archived_count())
+        self.assertTrue(cache.order_exists(orders[0].cl_ord_id))
+        self.assertTrue(cache.is_order_completed(orders[0].cl_ord_id))
+
+    def test_working_orders_are_not_archived(self):
+        # Arrange
+        cache = self.create_cache({"max_completed_orders": 1})
+        order = self.strategy.order_factory.stop_market(
+            AUDUSD_SIM.symbol,
+            OrderSide.BUY,
+            Quantity(100000),
+            Price("1.00000"),
+        )
+
+        cache.add_order(order, PositionId.null())
+        order.apply(TestStubs.event_order_submitted(order))
+        order.apply(TestStubs.event_order_accepted(order))
+        order.apply(TestStubs.event_order_working(order))
+        cache.update_order(order)
+
+        # Act
+        self.cancelled_order(cache)
+        self.cancelled_order(cache)
+
+        # Assert
+        self.assertEqual([order], cache.orders_working())
+        self.assertEqual(1, cache.orders_completed_count())
+        self.assertEqual(3 - 1, cache.orders_total_count())
+
+    def test_completed_orders_older_than_retention_age_are_archived(self):
+        # Arrange
+        cache = self.create_cache({"retention_age": 60})
+
+        # Act
+        order1 = self.cancelled_order(cache, UNIX_EPOCH)
+        order2 = self.cancelled_order(cache, UNIX_EPOCH + timedelta(seconds=30))
+        order3 = self.cancelled_order(cache, UNIX_EPOCH + timedelta(seconds=90))
+
+        # Assert
+        self.assertEqual([order2, order3], cache.orders_completed())
+        self.assertEqual(1, cache.orders_archived_count())
+        self.assertNotIn(order1.cl_ord_id, cache.order_ids())
+
+    def test_archived_order_is_reloaded_on_lookup(self):
+        # Arrange
+        cache = self.create_cache({"max_completed_orders": 1})
+        order1 = self.cancelled_order(cache)
+        self.cancelled_order(cache)
+
+        # Act
+        result = cache.order(order1.cl_ord_id)
+
+        # Assert
+        self.assertEqual(order1, result)
+        self.assertIn(order1, cache.orders_completed())
+        self.assertEqual(0, cache.orders_archived_count())
+
+    def test_archived_order_missing_from_database_returns_none(self):
+        # Arrange
+        cache = self.create_cache({"max_completed_orders": 1})
+        order1 = self.cancelled_order(cache)
+        self.cancelled_order(cache)
+        self.database.orders.clear()
+
+        # Act
+        result = cache.order(order1.cl_ord_id)
+
+        # Assert
+        self.assertIsNone(result)
+        self.assertTrue(cache.order_exists(order1.cl_ord_id))
+
+    def test_late_event_for_archived_order_is_routed_to_strategy(self):
+        # Arrange
+        cache = self.create_cache({"max_completed_orders": 1})
+        order1 = self.cancelled_order(cache)
+        self.cancelled_order(cache)
+
+        # Act
+        strategy_id = cache.strategy_id_for_order(order1.cl_ord_id)  # Routes e.g. OrderCancelReject
+        order = cache.order(order1.cl_ord_id)
+
+        # Assert
+        self.assertEqual(self.strategy.id, strategy_id)
+        self.assertEqual(order1, order)
+
+    def test_archived_order_with_bypass_database_is_discarded(self):
+        # Arrange
+        database = BypassExecutionDatabase(trader_id=self.trader_id, logger=self.logger)
+        cache = ExecutionCache(database=database, logger=self.logger, config={"max_completed_orders": 1})
+        order1 = self.cancelled_order(cache)
+
+        # Act
+        order2 = self.cancelled_order(cache)
+
+        # Assert
+        self.assertEqual([], cache.orders_archived())
+        self.assertEqual([order2], cache.orders_completed())
+        self.assertEqual(1, cache.orders_archived_count())
+        self.assertIsNone(cache.order(order1.cl_ord_id))
+        self.assertIsNone(cache.strategy_id_for_order(order1.cl_ord_id))
+        self.assertFalse(cache.order_exists(order1.cl_ord_id))
+
+    def test_archived_order_with_bypass_database_is_released(self):
+        # Arrange
+        database = BypassExecutionDatabase(trader_id=self.trader_id, logger=self.logger)
+        cache = ExecutionCache(database=database, logger=self.logger, config={"max_completed_orders": 1})
+        order1 = self.cancelled_order(cache)
+        unheld = self.strategy.order_factory.market(
+            AUDUSD_SIM.symbol,
+            OrderSide.BUY,
+            Quantity(100000),
+        )
+        held_refs = sys.getrefcount(order1)
+
+        # Act
+        self.cancelled_order(cache)
+
+        # Assert
+        self.assertTrue(held_refs > sys.getrefcount(unheld))
+        self.assertEqual(sys.getrefcount(unheld), sys.getrefcount(order1))  # No references left in the cache
+
+    def test_closed_positions_beyond_max_closed_positions_are_archived_and_reloaded(self):
+        # Arrange
+        cache = self.create_cache({"max_closed_positions": 1})
+
+        positions = []
+        for i in range(2):
+            position_id = PositionId(f"P-{i}")
+            order1 = self.strategy.order_factory.market(
+                AUDUSD_SIM.symbol,
+                OrderSide.BUY,
+                Quantity(100000),
+            )
+
+            cache.add_order(order1, position_id)
+            position = Position(TestStubs.event_order_filled(
+                order1,
+                instrument=AUDUSD_SIM,
+                position_id=position_id,
+                fill_price=Price("1.00000"),
+            ))
+            cache.add_position(position)
+
+            order2 = self.strategy.order_factory.market(
+                AUDUSD_SIM.symbol,
+                OrderSide.SELL,
+                Quantity(100000),
+            )
+
+            cache.add_order(order2, position_id)
+            position.apply(TestStubs.event_order_filled(
+                order2,
+                instrument=AUDUSD_SIM,
+                position_id=position_id,
+                fill_price=Price("1.00000"),
+            ))
+
+            # Act
+            cache.update_position(position)
+            positions.append(position)
+
+        # Assert
+        self.assertEqual([positions[1]], cache.positions_closed())
+        self.assertEqual(1, cache.positions_archived_count())
+        self.assertEqual([positions[0]], cache.positions_archived())
+        self.assertTrue(cache.position_exists(positions[0].id))
+        self.assertTrue(cache.is_position_closed(positions[0].id))
+        self.assertEqual(positions[0], cache.position(positions[0].id))
+        self.assertEqual(2, cache.positions_closed_count())
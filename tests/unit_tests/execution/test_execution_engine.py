@@ -16,11 +16,16 @@
 import unittest
 
 from nautilus_trader.analysis.performance import PerformanceAnalyzer
+from nautilus_trader.backtest.data_client import BacktestDataClient
 from nautilus_trader.common.clock import TestClock
 from nautilus_trader.common.factories import OrderFactory
+from nautilus_trader.common.latency import LatencyRecorder
+from nautilus_trader.common.latency import LatencyStage
 from nautilus_trader.common.logging import TestLogger
+from nautilus_trader.common.messages import Subscribe
 from nautilus_trader.common.uuid import UUIDFactory
 from nautilus_trader.data.cache import DataCache
+from nautilus_trader.data.engine import DataEngine
 from nautilus_trader.execution.database import BypassExecutionDatabase
 from nautilus_trader.execution.engine import ExecutionEngine
 from nautilus_trader.model.commands import SubmitOrder
@@ -32,6 +37,7 @@ from nautilus_trader.model.identifiers import Venue
 from nautilus_trader.model.objects import Price
 from nautilus_trader.model.objects import Quantity
 from nautilus_trader.model.position import Position
+from nautilus_trader.model.tick import QuoteTick
 from nautilus_trader.trading.portfolio import Portfolio
 from nautilus_trader.trading.strategy import TradingStrategy
 from tests.test_kit.mocks import MockExecutionClient
@@ -200,6 +206,122 @@ class ExecutionEngineTests(unittest.TestCase):
         self.assertIn(submit_order, self.exec_client.commands)
         self.assertTrue(self.cache.order_exists(order.cl_ord_id))
 
+    def test_submit_order_with_latency_recorder_records_routing_and_send(self):
+        # Arrange
+        recorder = LatencyRecorder()
+        self.exec_engine.register_latency_recorder(recorder)
+        self.exec_engine.start()
+
+        strategy = TradingStrategy(order_id_tag="001")
+        strategy.register_trader(
+            TraderId("TESTER", "000"),
+            self.clock,
+            self.logger,
+        )
+
+        self.exec_engine.register_strategy(strategy)
+
+        order = strategy.order_factory.market(
+            AUDUSD_SIM.symbol,
+            OrderSide.BUY,
+            Quantity(100000),
+        )
+
+        submit_order = SubmitOrder(
+            self.venue,
+            self.trader_id,
+            self.account_id,
+            strategy.id,
+            PositionId.null(),
+            order,
+            self.uuid_factory.generate(),
+            self.clock.utc_now(),
+        )
+
+        # Act
+        self.exec_engine.execute(submit_order)
+
+        # Assert
+        report = recorder.report()
+        self.assertEqual(recorder, self.exec_engine.latency_recorder)
+        self.assertEqual(0, submit_order.origin_ns)  # Not sent from a tick handler
+        self.assertEqual(["EXEC_ROUTING", "CLIENT_SEND"], list(report["stages"]))
+        self.assertEqual(["EXEC_ROUTING", "CLIENT_SEND"], list(report["strategies"][strategy.id.value]))
+
+    def test_submit_order_from_tick_handler_with_latency_recorder_records_tick_to_trade(self):
+        # Arrange
+        recorder = LatencyRecorder()
+        self.exec_engine.register_latency_recorder(recorder)
+        self.exec_engine.start()
+
+        data_engine = DataEngine(
+            portfolio=self.portfolio,
+            clock=self.clock,
+            logger=self.logger,
+        )
+        data_engine.register_latency_recorder(recorder)
+
+        data_client = BacktestDataClient(
+            instruments=[AUDUSD_SIM],
+            venue=self.venue,
+            engine=data_engine,
+            clock=self.clock,
+            logger=self.logger,
+        )
+        data_engine.register_client(data_client)
+        data_client.connect()
+
+        strategy = TradingStrategy(order_id_tag="001")
+        strategy.register_trader(
+            TraderId("TESTER", "000"),
+            self.clock,
+            self.logger,
+        )
+
+        self.exec_engine.register_strategy(strategy)
+
+        order = strategy.order_factory.market(
+            AUDUSD_SIM.symbol,
+            OrderSide.BUY,
+            Quantity(100000),
+        )
+
+        submit_order = SubmitOrder(
+            self.venue,
+            self.trader_id,
+            self.account_id,
+            strategy.id,
+            PositionId.null(),
+            order,
+            self.uuid_factory.generate(),
+            self.clock.utc_now(),
+        )
+
+        def on_quote_tick(tick):
+            self.exec_engine.execute(submit_order)
+
+        data_engine.execute(Subscribe(
+            venue=self.venue,
+            data_type=QuoteTick,
+            metadata={"Symbol": AUDUSD_SIM.symbol},
+            handler=on_quote_tick,
+            command_id=self.uuid_factory.generate(),
+            command_timestamp=self.clock.utc_now(),
+        ))
+
+        tick = TestStubs.quote_tick_5decimal(AUDUSD_SIM.symbol)
+
+        # Act
+        data_engine.process(tick)
+
+        # Assert
+        histogram = recorder.histogram(LatencyStage.TICK_TO_TRADE, strategy.id)
+        self.assertIn(submit_order, self.exec_client.commands)
+        self.assertEqual(tick.recv_ns, submit_order.origin_ns)
+        self.assertEqual(0, recorder.origin_ns())
+        self.assertEqual(1, histogram.count)
+        self.assertGreaterEqual(histogram.min, recorder.histogram(LatencyStage.CLIENT_SEND).min)
+
     def test_handle_order_fill_event(self):
         # Arrange
         self.exec_engine.start()
@@ -70,7 +70,7 @@ class BidAskMinMaxTests(unittest.TestCase):
         # Assert
         self.assertEqual(Price("0.9"), indicator.bids.min_price)
         self.assertEqual(Price("1.0"), indicator.bids.max_price)
-        self.assertEqual(Price("2.1"), indicator.asks.min_price)
+        self.assertEqual(Price("2.0"), indicator.asks.min_price)
         self.assertEqual(Price("2.1"), indicator.asks.max_price)
 
     def test_reset(self):
@@ -153,14 +153,14 @@ class WindowedMinMaxPricesTests(unittest.TestCase):
             Price("0.9"),
         )
         # Allow the first item to expire out
-        # This also tests that the new tick is the new min/max
+        # This also tests that the new tick is the new max
         instance.add_price(
             datetime(2020, 1, 1, 0, 5, 1, tzinfo=pytz.utc),
             Price("0.95"),
         )
 
         # Assert
-        self.assertEqual(Price("0.95"), instance.min_price)
+        self.assertEqual(Price("0.9"), instance.min_price)
         self.assertEqual(Price("0.95"), instance.max_price)
 
     def test_reset(self):
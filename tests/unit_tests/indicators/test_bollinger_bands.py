@@ -13,8 +13,10 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import random
 import unittest
 
+from nautilus_trader.core.functions import fast_std_with_mean
 from nautilus_trader.indicators.bollinger_bands import BollingerBands
 from tests.test_kit.providers import TestInstrumentProvider
 from tests.test_kit.stubs import TestStubs
@@ -133,6 +135,22 @@ class BollingerBandsTests(unittest.TestCase):
         self.assertEqual(1.0001900000000001, indicator.middle)
         self.assertEqual(1.0000644493609618, indicator.lower)
 
+    def test_values_match_full_recalculation_over_long_series(self):
+        # Arrange
+        random.seed(1)
+        indicator = BollingerBands(20, 2.0)
+        prices = []
+
+        # Act
+        # Assert
+        for _i in range(500):
+            price = 1.0 + random.uniform(-0.01, 0.01)
+            indicator.update_raw(price + 0.0001, price - 0.0001, price)
+            prices.append(price)
+            std = fast_std_with_mean(prices[-20:], indicator.middle)
+            self.assertAlmostEqual(indicator.middle + 2.0 * std, indicator.upper, places=12)
+            self.assertAlmostEqual(indicator.middle - 2.0 * std, indicator.lower, places=12)
+
     def test_reset_successfully_returns_indicator_to_fresh_state(self):
         # Arrange
         indicator = BollingerBands(5, 2.0)
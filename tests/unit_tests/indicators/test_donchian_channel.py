@@ -13,6 +13,7 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import random
 import unittest
 
 from nautilus_trader.indicators.donchian_channel import DonchianChannel
@@ -132,6 +133,23 @@ class DonchianChannelTests(unittest.TestCase):
         self.assertEqual(1.00020, self.dc.middle)
         self.assertEqual(1.00000, self.dc.lower)
 
+    def test_values_match_window_extremes_over_long_series(self):
+        # Arrange
+        random.seed(1)
+        highs = []
+        lows = []
+
+        # Act
+        # Assert
+        for _i in range(500):
+            low = 1.0 + random.uniform(-0.01, 0.01)
+            high = low + random.uniform(0, 0.001)
+            self.dc.update_raw(high, low)
+            highs.append(high)
+            lows.append(low)
+            self.assertEqual(max(highs[-10:]), self.dc.upper)
+            self.assertEqual(min(lows[-10:]), self.dc.lower)
+
     def test_reset_successfully_returns_indicator_to_fresh_state(self):
         # Arrange
         self.dc.update_raw(1.00020, 1.00000)
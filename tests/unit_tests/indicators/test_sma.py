@@ -13,6 +13,7 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import random
 import unittest
 
 from nautilus_trader.indicators.average.sma import SimpleMovingAverage
@@ -175,6 +176,19 @@ class SimpleMovingAverageTests(unittest.TestCase):
         self.assertTrue(sma_for_ticks.has_inputs)
         self.assertEqual(1.00001, sma_for_ticks.value)
 
+    def test_value_matches_full_recalculation_over_long_series(self):
+        # Arrange
+        random.seed(1)
+        prices = []
+
+        # Act
+        # Assert
+        for _i in range(500):
+            price = 1.0 + random.uniform(-0.01, 0.01)
+            self.sma.update_raw(price)
+            prices.append(price)
+            self.assertAlmostEqual(sum(prices[-10:]) / len(prices[-10:]), self.sma.value, places=12)
+
     def test_reset_successfully_returns_indicator_to_fresh_state(self):
         # Arrange
         for _i in range(1000):
@@ -0,0 +1,113 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2021 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import random
+import unittest
+
+from nautilus_trader.core.functions import fast_mean
+from nautilus_trader.core.functions import fast_std_with_mean
+from nautilus_trader.indicators.base.window import RollingWindow
+
+
+class RollingWindowTests(unittest.TestCase):
+
+    def setUp(self):
+        # Fixture Setup
+        self.window = RollingWindow(3)
+
+    def test_instantiate_with_invalid_period_raises_value_error(self):
+        # Arrange
+        # Act
+        # Assert
+        self.assertRaises(ValueError, RollingWindow, 0)
+
+    def test_empty_window_returns_zero_statistics(self):
+        # Arrange
+        # Act
+        # Assert
+        self.assertEqual(3, self.window.period)
+        self.assertEqual(0, self.window.count())
+        self.assertEqual(0, len(self.window))
+        self.assertEqual(0, self.window.sum())
+        self.assertEqual(0, self.window.mean())
+        self.assertEqual(0, self.window.std())
+
+    def test_update_with_partial_window_returns_expected_statistics(self):
+        # Arrange
+        # Act
+        self.window.update(1.0)
+        self.window.update(2.0)
+
+        # Assert
+        self.assertEqual(2, self.window.count())
+        self.assertEqual(1.0, self.window.first())
+        self.assertEqual(2.0, self.window.last())
+        self.assertEqual(3.0, self.window.sum())
+        self.assertEqual(1.5, self.window.mean())
+        self.assertEqual(0.5, self.window.std())
+
+    def test_update_with_full_window_drops_oldest_value(self):
+        # Arrange
+        # Act
+        for value in [1.0, 2.0, 3.0, 4.0]:
+            self.window.update(value)
+
+        # Assert
+        self.assertEqual(3, self.window.count())
+        self.assertEqual(2.0, self.window.first())
+        self.assertEqual(4.0, self.window.last())
+        self.assertEqual(9.0, self.window.sum())
+        self.assertEqual(3.0, self.window.mean())
+
+    def test_std_with_mean_measures_deviation_from_given_mean(self):
+        # Arrange
+        for value in [1.0, 2.0, 3.0]:
+            self.window.update(value)
+
+        # Act
+        result = self.window.std_with_mean(1.0)
+
+        # Assert
+        self.assertAlmostEqual(fast_std_with_mean([1.0, 2.0, 3.0], 1.0), result)
+
+    def test_statistics_match_full_recalculation_over_long_series(self):
+        # Arrange
+        random.seed(1)
+        window = RollingWindow(20)
+        values = []
+
+        # Act
+        # Assert
+        for _i in range(1000):
+            value = 1.1 + random.uniform(-0.01, 0.01)
+            window.update(value)
+            values.append(value)
+            values = values[-20:]
+            self.assertAlmostEqual(sum(values), window.sum(), places=10)
+            self.assertAlmostEqual(fast_mean(values), window.mean(), places=12)
+            self.assertAlmostEqual(fast_std_with_mean(values, fast_mean(values)), window.std(), places=12)
+
+    def test_reset_successfully_returns_window_to_fresh_state(self):
+        # Arrange
+        for value in [1.0, 2.0, 3.0]:
+            self.window.update(value)
+
+        # Act
+        self.window.reset()
+
+        # Assert
+        self.assertEqual(0, self.window.count())
+        self.assertEqual(0, self.window.sum())
+        self.assertEqual(0, self.window.mean())
@@ -14,11 +14,14 @@
 # -------------------------------------------------------------------------------------------------
 
 import asyncio
+import threading
 import time
 import unittest
 
 from nautilus_trader.common.clock import LiveClock
 from nautilus_trader.common.enums import ComponentState
+from nautilus_trader.common.latency import LatencyRecorder
+from nautilus_trader.common.latency import LatencyStage
 from nautilus_trader.common.logging import LogLevel
 from nautilus_trader.common.logging import TestLogger
 from nautilus_trader.common.messages import Connect
@@ -27,12 +30,16 @@ from nautilus_trader.common.messages import DataResponse
 from nautilus_trader.common.uuid import UUIDFactory
 from nautilus_trader.live.data import LiveDataClient
 from nautilus_trader.live.data import LiveDataEngine
+from nautilus_trader.live.scheduler import LiveScheduler
 from nautilus_trader.model.identifiers import Symbol
 from nautilus_trader.model.identifiers import Venue
+from nautilus_trader.model.objects import Price
+from nautilus_trader.model.objects import Quantity
 from nautilus_trader.model.tick import QuoteTick
 from nautilus_trader.trading.portfolio import Portfolio
 from tests.test_kit.providers import TestInstrumentProvider
 from tests.test_kit.stubs import TestStubs
+from tests.test_kit.stubs import UNIX_EPOCH
 
 
 BITMEX = Venue("BITMEX")
@@ -42,6 +49,24 @@ BTCUSDT_BINANCE = TestInstrumentProvider.btcusdt_binance()
 ETHUSDT_BINANCE = TestInstrumentProvider.ethusdt_binance()
 
 
+class HandledOrderLiveDataEngine(LiveDataEngine):
+    """
+    Records the order in which queued data and messages are handled.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.handled = []
+
+    def _handle_queued_data(self, data):
+        self.handled.append(data)
+        super()._handle_queued_data(data)
+
+    def _handle_queued_message(self, message):
+        self.handled.append(message)
+        super()._handle_queued_message(message)
+
+
 class LiveDataEngineTests(unittest.TestCase):
 
     def setUp(self):
@@ -94,6 +119,22 @@ class LiveDataEngineTests(unittest.TestCase):
 
         self.loop.run_until_complete(run_test())
 
+    def test_get_initialized_future_with_no_clients_is_done(self):
+        # Arrange
+        # Act
+        future = self.data_engine.get_initialized_future()
+
+        # Assert
+        self.assertTrue(future.done())
+
+    def test_get_disconnected_future_with_no_clients_is_done(self):
+        # Arrange
+        # Act
+        future = self.data_engine.get_disconnected_future()
+
+        # Assert
+        self.assertTrue(future.done())
+
     def test_execute_command_processes_message(self):
         async def run_test():
             # Arrange
@@ -200,6 +241,501 @@ class LiveDataEngineTests(unittest.TestCase):
 
         self.loop.run_until_complete(run_test())
 
+    def test_process_data_with_latency_recorder_records_queue_wait(self):
+        async def run_test():
+            # Arrange
+            recorder = LatencyRecorder()
+            self.data_engine.register_latency_recorder(recorder)
+            self.data_engine.start()
+
+            tick = TestStubs.trade_tick_5decimal()
+
+            # Act
+            self.data_engine.process(tick)
+            await asyncio.sleep(0.1)
+
+            # Assert
+            self.assertTrue(tick.recv_ns > 0)
+            self.assertEqual(1, recorder.histogram(LatencyStage.QUEUE_WAIT).count)
+
+            # Tear Down
+            self.data_engine.stop()
+
+        self.loop.run_until_complete(run_test())
+
+    def test_instantiate_with_invalid_queue_batch_size_raises_value_error(self):
+        # Arrange
+        # Act
+        # Assert
+        self.assertRaises(
+            ValueError,
+            LiveDataEngine,
+            self.loop,
+            self.portfolio,
+            self.clock,
+            self.logger,
+            {"queue_batch_size": 0},
+        )
+
+    def test_process_data_on_loop_thread_enqueues_directly(self):
+        async def run_test():
+            # Arrange
+            self.data_engine.start()
+
+            tick = TestStubs.trade_tick_5decimal()
+
+            # Act
+            self.data_engine.process(tick)
+
+            # Assert
+            self.assertEqual(1, self.data_engine.data_qsize())
+            await asyncio.sleep(0.1)
+            self.assertEqual(0, self.data_engine.data_qsize())
+            self.assertEqual(1, self.data_engine.data_count)
+
+            # Tear Down
+            self.data_engine.stop()
+
+        self.loop.run_until_complete(run_test())
+
+    def test_process_data_from_other_thread_schedules_onto_loop(self):
+        async def run_test():
+            # Arrange
+            self.data_engine.start()
+
+            tick = TestStubs.trade_tick_5decimal()
+            thread = threading.Thread(target=self.data_engine.process, args=(tick,))
+
+            # Act
+            thread.start()
+            thread.join()
+
+            # Assert
+            self.assertEqual(0, self.data_engine.data_qsize())  # Not yet on the loop thread
+            await asyncio.sleep(0.1)
+            self.assertEqual(1, self.data_engine.data_count)
+
+            # Tear Down
+            self.data_engine.stop()
+
+        self.loop.run_until_complete(run_test())
+
+    def test_process_batch_on_loop_thread_enqueues_all_directly(self):
+        async def run_test():
+            # Arrange
+            self.data_engine.start()
+
+            tick = TestStubs.trade_tick_5decimal()
+
+            # Act
+            self.data_engine.process_batch([tick, tick, tick])
+
+            # Assert
+            self.assertEqual(3, self.data_engine.data_qsize())
+            await asyncio.sleep(0.1)
+            self.assertEqual(3, self.data_engine.data_count)
+
+            # Tear Down
+            self.data_engine.stop()
+
+        self.loop.run_until_complete(run_test())
+
+    def test_process_batch_from_other_thread_schedules_onto_loop(self):
+        async def run_test():
+            # Arrange
+            self.data_engine.start()
+
+            tick = TestStubs.trade_tick_5decimal()
+            thread = threading.Thread(target=self.data_engine.process_batch, args=([tick, tick],))
+
+            # Act
+            thread.start()
+            thread.join()
+
+            # Assert
+            self.assertEqual(0, self.data_engine.data_qsize())  # Not yet on the loop thread
+            await asyncio.sleep(0.1)
+            self.assertEqual(2, self.data_engine.data_count)
+
+            # Tear Down
+            self.data_engine.stop()
+
+        self.loop.run_until_complete(run_test())
+
+    def test_process_data_with_small_queue_batch_size_dispatches_all(self):
+        async def run_test():
+            # Arrange
+            data_engine = LiveDataEngine(
+                loop=self.loop,
+                portfolio=self.portfolio,
+                clock=self.clock,
+                logger=self.logger,
+                config={"queue_batch_size": 2},
+            )
+            data_engine.start()
+
+            tick = TestStubs.trade_tick_5decimal()
+
+            # Act
+            for _ in range(5):
+                data_engine.process(tick)
+            await asyncio.sleep(0.1)
+
+            # Assert
+            self.assertEqual(0, data_engine.data_qsize())
+            self.assertEqual(5, data_engine.data_count)
+
+            # Tear Down
+            data_engine.stop()
+            await asyncio.sleep(0)
+            data_engine.dispose()
+
+        self.loop.run_until_complete(run_test())
+
+    def test_instantiate_with_negative_queue_maxsize_raises_value_error(self):
+        # Arrange
+        # Act
+        # Assert
+        self.assertRaises(
+            ValueError,
+            LiveDataEngine,
+            self.loop,
+            self.portfolio,
+            self.clock,
+            self.logger,
+            {"data_queue_maxsize": -1},
+        )
+
+    def test_process_data_when_data_queue_full_with_drop_oldest_drops_oldest(self):
+        async def run_test():
+            # Arrange
+            data_engine = LiveDataEngine(
+                loop=self.loop,
+                portfolio=self.portfolio,
+                clock=self.clock,
+                logger=self.logger,
+                config={"data_queue_maxsize": 2, "data_queue_drop_oldest": True},
+            )
+
+            tick = TestStubs.trade_tick_5decimal()
+
+            # Act
+            for _ in range(5):
+                data_engine.process(tick)
+
+            # Assert
+            self.assertEqual(2, data_engine.data_qsize())
+            self.assertEqual(2, data_engine.data_qsize_hwm())
+            self.assertEqual(3, data_engine.dropped_data_count())
+
+            data_engine.start()
+            await asyncio.sleep(0.1)
+            self.assertEqual(2, data_engine.data_count)
+
+            # Tear Down
+            data_engine.stop()
+            await asyncio.sleep(0)
+            data_engine.dispose()
+
+        self.loop.run_until_complete(run_test())
+
+    def test_process_batch_wait_when_data_queue_full_holds_back_producer(self):
+        async def run_test():
+            # Arrange
+            data_engine = LiveDataEngine(
+                loop=self.loop,
+                portfolio=self.portfolio,
+                clock=self.clock,
+                logger=self.logger,
+                config={"data_queue_maxsize": 10},
+            )
+
+            tick = TestStubs.trade_tick_5decimal()
+
+            # Act
+            producer = self.loop.create_task(data_engine.process_batch_wait([tick] * 1000))
+            await asyncio.sleep(0.01)
+            blocked_qsize = data_engine.data_qsize()
+            data_engine.start()
+            await producer
+            await asyncio.sleep(0.1)
+
+            # Assert
+            self.assertEqual(10, blocked_qsize)
+            self.assertEqual(10, data_engine.data_qsize_hwm())
+            self.assertEqual(0, data_engine.dropped_data_count())
+            self.assertEqual(1000, data_engine.data_count)
+
+            # Tear Down
+            data_engine.stop()
+            await asyncio.sleep(0)
+            data_engine.dispose()
+
+        self.loop.run_until_complete(run_test())
+
+    def test_dropped_conflated_quote_tick_marker_clears_pending_tick(self):
+        async def run_test():
+            # Arrange
+            data_engine = LiveDataEngine(
+                loop=self.loop,
+                portfolio=self.portfolio,
+                clock=self.clock,
+                logger=self.logger,
+                config={"data_queue_maxsize": 1, "data_queue_drop_oldest": True},
+            )
+            data_engine.set_quote_tick_conflation(ETHUSDT_BINANCE.symbol, True)
+
+            # Act
+            data_engine.process(TestStubs.quote_tick_5decimal(ETHUSDT_BINANCE.symbol))
+            data_engine.process(TestStubs.trade_tick_5decimal())
+            data_engine.process(TestStubs.quote_tick_5decimal(ETHUSDT_BINANCE.symbol))
+
+            # Assert
+            self.assertEqual(2, data_engine.dropped_data_count())
+
+            data_engine.start()
+            await asyncio.sleep(0.1)
+            self.assertEqual(1, data_engine.data_count)
+            self.assertIsNotNone(data_engine.cache.quote_tick(ETHUSDT_BINANCE.symbol))
+
+            # Tear Down
+            data_engine.stop()
+            await asyncio.sleep(0)
+            data_engine.dispose()
+
+        self.loop.run_until_complete(run_test())
+
+    def test_execute_commands_when_message_queue_full_holds_commands(self):
+        async def run_test():
+            # Arrange
+            data_engine = LiveDataEngine(
+                loop=self.loop,
+                portfolio=self.portfolio,
+                clock=self.clock,
+                logger=self.logger,
+                config={"message_queue_maxsize": 1},
+            )
+
+            # Act
+            for _ in range(3):
+                data_engine.execute(
+                    Connect(
+                        venue=BINANCE,
+                        command_id=self.uuid_factory.generate(),
+                        command_timestamp=self.clock.utc_now(),
+                    ),
+                )
+
+            # Assert
+            self.assertEqual(3, data_engine.message_qsize())
+            self.assertEqual(3, data_engine.message_qsize_hwm())
+
+            data_engine.start()
+            await asyncio.sleep(0.1)
+            self.assertEqual(0, data_engine.message_qsize())
+            self.assertEqual(3, data_engine.command_count)
+
+            # Tear Down
+            data_engine.stop()
+            await asyncio.sleep(0)
+            data_engine.dispose()
+
+        self.loop.run_until_complete(run_test())
+
+    def test_process_data_from_other_thread_when_data_queue_full_blocks_producer(self):
+        async def run_test():
+            # Arrange
+            data_engine = LiveDataEngine(
+                loop=self.loop,
+                portfolio=self.portfolio,
+                clock=self.clock,
+                logger=self.logger,
+                config={"data_queue_maxsize": 1},
+            )
+
+            tick = TestStubs.trade_tick_5decimal()
+            data_engine.process(tick)  # Fills the queue
+            thread = threading.Thread(target=data_engine.process, args=(tick,))
+
+            # Act
+            thread.start()
+            await asyncio.sleep(0.1)
+            blocked = thread.is_alive()
+
+            data_engine.start()
+            await asyncio.sleep(0.1)
+            thread.join(timeout=1)
+
+            # Assert
+            self.assertTrue(blocked)
+            self.assertFalse(thread.is_alive())
+            self.assertEqual(2, data_engine.data_count)
+            self.assertEqual(0, data_engine.dropped_data_count())
+
+            # Tear Down
+            data_engine.stop()
+            await asyncio.sleep(0)
+            data_engine.dispose()
+
+        self.loop.run_until_complete(run_test())
+
+    def test_start_with_registered_scheduler_runs_queues_on_scheduler(self):
+        async def run_test():
+            # Arrange
+            scheduler = LiveScheduler(loop=self.loop, logger=self.logger)
+            self.data_engine.register_scheduler(scheduler)
+            scheduler.start()
+
+            # Act
+            self.data_engine.start()
+            self.data_engine.process(TestStubs.trade_tick_5decimal())
+            await asyncio.sleep(0.1)
+
+            # Assert
+            self.assertIsNone(self.data_engine.get_run_queue_task())
+            self.assertEqual(1, self.data_engine.data_count)
+            self.assertEqual(1, scheduler.handled_count)
+
+            # Tear Down
+            self.data_engine.stop()
+            scheduler.stop()
+            await scheduler.get_run_task()
+
+        self.loop.run_until_complete(run_test())
+
+    def test_receive_response_with_registered_scheduler_handles_response_before_data(self):
+        async def run_test():
+            # Arrange
+            data_engine = HandledOrderLiveDataEngine(
+                loop=self.loop,
+                portfolio=self.portfolio,
+                clock=self.clock,
+                logger=self.logger,
+            )
+            scheduler = LiveScheduler(loop=self.loop, logger=self.logger)
+            data_engine.register_scheduler(scheduler)
+            data_engine.start()
+
+            tick = TestStubs.trade_tick_5decimal()
+            response = DataResponse(
+                venue=Venue("BINANCE"),
+                data_type=QuoteTick,
+                metadata={},
+                data=[],
+                correlation_id=self.uuid_factory.generate(),
+                response_id=self.uuid_factory.generate(),
+                response_timestamp=self.clock.utc_now(),
+            )
+
+            # Act
+            data_engine.process(tick)
+            data_engine.receive(response)
+            scheduler.start()
+            await asyncio.sleep(0.1)
+
+            # Assert
+            self.assertEqual([response, tick], data_engine.handled)
+            self.assertEqual(1, data_engine.response_count)
+            self.assertEqual(0, data_engine.message_qsize())
+
+            # Tear Down
+            data_engine.stop()
+            scheduler.stop()
+            await scheduler.get_run_task()
+
+        self.loop.run_until_complete(run_test())
+
+    def test_quote_tick_conflation_defaults_to_off(self):
+        # Arrange
+        # Act
+        # Assert
+        self.assertFalse(self.data_engine.is_quote_tick_conflated(ETHUSDT_BINANCE.symbol))
+        self.assertEqual(0, self.data_engine.coalesced_count(ETHUSDT_BINANCE.symbol))
+        self.assertEqual({}, self.data_engine.coalesced_counts())
+
+    def test_set_quote_tick_conflation_for_symbol(self):
+        # Arrange
+        # Act
+        self.data_engine.set_quote_tick_conflation(ETHUSDT_BINANCE.symbol, True)
+
+        # Assert
+        self.assertTrue(self.data_engine.is_quote_tick_conflated(ETHUSDT_BINANCE.symbol))
+        self.assertFalse(self.data_engine.is_quote_tick_conflated(BTCUSDT_BINANCE.symbol))
+
+    def test_conflate_quote_ticks_config_applies_to_all_symbols(self):
+        # Arrange
+        data_engine = LiveDataEngine(
+            loop=self.loop,
+            portfolio=self.portfolio,
+            clock=self.clock,
+            logger=self.logger,
+            config={"conflate_quote_ticks": True},
+        )
+
+        # Act
+        data_engine.set_quote_tick_conflation(BTCUSDT_BINANCE.symbol, False)
+
+        # Assert
+        self.assertTrue(data_engine.is_quote_tick_conflated(ETHUSDT_BINANCE.symbol))
+        self.assertFalse(data_engine.is_quote_tick_conflated(BTCUSDT_BINANCE.symbol))
+
+    def test_process_conflated_quote_ticks_dispatches_latest_only(self):
+        async def run_test():
+            # Arrange
+            self.data_engine.set_quote_tick_conflation(ETHUSDT_BINANCE.symbol, True)
+            self.data_engine.start()
+
+            ticks = [
+                QuoteTick(
+                    ETHUSDT_BINANCE.symbol,
+                    Price(f"{100 + i}.00"),
+                    Price(f"{101 + i}.00"),
+                    Quantity(1),
+                    Quantity(1),
+                    UNIX_EPOCH,
+                ) for i in range(3)
+            ]
+
+            # Act
+            for tick in ticks:
+                self.data_engine.process(tick)
+            await asyncio.sleep(0.1)
+
+            # Assert
+            self.assertEqual(0, self.data_engine.data_qsize())
+            self.assertEqual(1, self.data_engine.data_count)
+            self.assertEqual(2, self.data_engine.coalesced_count(ETHUSDT_BINANCE.symbol))
+            self.assertEqual({ETHUSDT_BINANCE.symbol: 2}, self.data_engine.coalesced_counts())
+            self.assertEqual(Price("102.00"), self.data_engine.cache.quote_tick(ETHUSDT_BINANCE.symbol).bid)
+
+            # Tear Down
+            self.data_engine.stop()
+
+        self.loop.run_until_complete(run_test())
+
+    def test_process_quote_ticks_for_unconflated_symbol_dispatches_all(self):
+        async def run_test():
+            # Arrange
+            self.data_engine.set_quote_tick_conflation(ETHUSDT_BINANCE.symbol, True)
+            self.data_engine.start()
+
+            tick = TestStubs.quote_tick_5decimal(BTCUSDT_BINANCE.symbol)
+
+            # Act
+            self.data_engine.process(tick)
+            self.data_engine.process(tick)
+            self.data_engine.process(tick)
+            await asyncio.sleep(0.1)
+
+            # Assert
+            self.assertEqual(3, self.data_engine.data_count)
+            self.assertEqual(0, self.data_engine.coalesced_count(BTCUSDT_BINANCE.symbol))
+
+            # Tear Down
+            self.data_engine.stop()
+
+        self.loop.run_until_complete(run_test())
+
 
 class LiveDataClientTests(unittest.TestCase):
 
@@ -237,3 +773,21 @@ class LiveDataClientTests(unittest.TestCase):
         # Act
         # Assert
         self.assertTrue(True)  # No exception raised
+
+    def test_futures_when_not_connected(self):
+        # Arrange
+        # Act
+        # Assert
+        self.assertFalse(self.client.is_connected())
+        self.assertFalse(self.client.get_initialized_future().done())
+        self.assertTrue(self.client.get_disconnected_future().done())
+
+    def test_engine_get_initialized_future_when_client_not_initialized_is_pending(self):
+        # Arrange
+        self.engine.register_client(self.client)
+
+        # Act
+        future = self.engine.get_initialized_future()
+
+        # Assert
+        self.assertFalse(future.done())
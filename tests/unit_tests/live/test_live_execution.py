@@ -26,6 +26,7 @@ from nautilus_trader.data.cache import DataCache
 from nautilus_trader.execution.database import BypassExecutionDatabase
 from nautilus_trader.live.execution import LiveExecutionClient
 from nautilus_trader.live.execution import LiveExecutionEngine
+from nautilus_trader.live.scheduler import LiveScheduler
 from nautilus_trader.model.commands import SubmitOrder
 from nautilus_trader.model.enums import OrderSide
 from nautilus_trader.model.identifiers import PositionId
@@ -44,6 +45,20 @@ AUDUSD_SIM = TestInstrumentProvider.default_fx_ccy(TestStubs.symbol_audusd_fxcm(
 GBPUSD_SIM = TestInstrumentProvider.default_fx_ccy(TestStubs.symbol_gbpusd_fxcm())
 
 
+class HandledOrderLiveExecutionEngine(LiveExecutionEngine):
+    """
+    Records the order in which queued messages are handled.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.handled = []
+
+    def _handle_queued_message(self, message):
+        self.handled.append(message)
+        super()._handle_queued_message(message)
+
+
 class ExecutionEngineTests(unittest.TestCase):
 
     def setUp(self):
@@ -110,6 +125,116 @@ class ExecutionEngineTests(unittest.TestCase):
 
         self.loop.run_until_complete(run_test())
 
+    def test_instantiate_with_invalid_queue_batch_size_raises_value_error(self):
+        # Arrange
+        database = BypassExecutionDatabase(trader_id=self.trader_id, logger=self.logger)
+
+        # Act
+        # Assert
+        self.assertRaises(
+            ValueError,
+            LiveExecutionEngine,
+            self.loop,
+            database,
+            self.portfolio,
+            self.clock,
+            self.logger,
+            {"queue_batch_size": 0},
+        )
+
+    def test_instantiate_with_negative_queue_maxsize_raises_value_error(self):
+        # Arrange
+        database = BypassExecutionDatabase(trader_id=self.trader_id, logger=self.logger)
+
+        # Act
+        # Assert
+        self.assertRaises(
+            ValueError,
+            LiveExecutionEngine,
+            self.loop,
+            database,
+            self.portfolio,
+            self.clock,
+            self.logger,
+            {"queue_maxsize": -1},
+        )
+
+    def test_start_with_registered_scheduler_runs_queue_on_scheduler(self):
+        async def run_test():
+            # Arrange
+            scheduler = LiveScheduler(loop=self.loop, logger=self.logger)
+            self.exec_engine.register_scheduler(scheduler)
+            scheduler.start()
+
+            # Act
+            self.exec_engine.start()
+            await asyncio.sleep(0.1)
+
+            # Assert
+            self.assertEqual(ComponentState.RUNNING, self.exec_engine.state)
+            self.assertIsNone(self.exec_engine.get_run_queue_task())
+
+            # Tear Down
+            self.exec_engine.stop()
+            scheduler.stop()
+            await scheduler.get_run_task()
+
+        self.loop.run_until_complete(run_test())
+
+    def test_process_event_with_registered_scheduler_handles_event_before_command(self):
+        async def run_test():
+            # Arrange
+            exec_engine = HandledOrderLiveExecutionEngine(
+                loop=self.loop,
+                database=BypassExecutionDatabase(trader_id=self.trader_id, logger=self.logger),
+                portfolio=self.portfolio,
+                clock=self.clock,
+                logger=self.logger,
+            )
+            scheduler = LiveScheduler(loop=self.loop, logger=self.logger)
+            exec_engine.register_scheduler(scheduler)
+            exec_engine.start()
+
+            strategy = TradingStrategy(order_id_tag="001")
+            strategy.register_trader(self.trader_id, self.clock, self.logger)
+            exec_engine.register_strategy(strategy)
+
+            order = strategy.order_factory.market(
+                AUDUSD_SIM.symbol,
+                OrderSide.BUY,
+                Quantity(100000),
+            )
+
+            submit_order = SubmitOrder(
+                Venue("SIM"),
+                self.trader_id,
+                self.account_id,
+                strategy.id,
+                PositionId.null(),
+                order,
+                self.uuid_factory.generate(),
+                self.clock.utc_now(),
+            )
+            event = TestStubs.event_account_state(self.account_id)
+
+            # Act
+            exec_engine.execute(submit_order)
+            exec_engine.process(event)
+            self.assertEqual(2, exec_engine.qsize())
+            scheduler.start()
+            await asyncio.sleep(0.1)
+
+            # Assert
+            self.assertEqual([event, submit_order], exec_engine.handled)
+            self.assertEqual(0, exec_engine.qsize())
+
+            # Tear Down
+            exec_engine.stop()
+            scheduler.stop()
+            await scheduler.get_run_task()
+
+        self.loop.run_until_complete(run_test())
+
     def test_execute_command_places_command_on_queue(self):
         async def run_test():
             # Arrange
@@ -154,6 +279,49 @@ class ExecutionEngineTests(unittest.TestCase):
 
         self.loop.run_until_complete(run_test())
 
+    def test_get_settled_future_with_nothing_in_flight_is_done(self):
+        # Arrange
+        # Act
+        future = self.exec_engine.get_settled_future()
+
+        # Assert
+        self.assertTrue(future.done())
+
+    def test_get_settled_future_completes_when_queue_drained(self):
+        async def run_test():
+            # Arrange
+            self.exec_engine.start()
+
+            strategy = TradingStrategy(order_id_tag="001")
+            strategy.register_trader(
+                TraderId("TESTER", "000"),
+                self.clock,
+                self.logger,
+            )
+
+            self.exec_engine.register_strategy(strategy)
+
+            order = strategy.order_factory.market(
+                AUDUSD_SIM.symbol,
+                OrderSide.BUY,
+                Quantity(100000),
+            )
+
+            self.exec_engine.process(TestStubs.event_order_submitted(order))
+
+            # Act
+            future = self.exec_engine.get_settled_future()
+
+            # Assert
+            self.assertFalse(future.done())  # Event still on the queue
+            await asyncio.wait_for(future, timeout=1)
+            self.assertEqual(0, self.exec_engine.qsize())
+
+            # Tear Down
+            self.exec_engine.stop()
+
+        self.loop.run_until_complete(run_test())
+
     def test_handle_position_opening_with_position_id_none(self):
         async def run_test():
             # Arrange
@@ -178,10 +346,12 @@ class ExecutionEngineTests(unittest.TestCase):
 
             # Act
             self.exec_engine.process(event)
-            await asyncio.sleep(0.1)
 
             # Assert
+            self.assertEqual(1, self.exec_engine.qsize())  # Enqueued directly on the loop thread
+            await asyncio.sleep(0.1)
             self.assertEqual(0, self.exec_engine.qsize())
+            self.assertEqual(1, self.exec_engine.qsize_hwm())
             self.assertEqual(1, self.exec_engine.event_count)
 
             # Tear Down
@@ -241,3 +411,26 @@ class LiveExecutionClientTests(unittest.TestCase):
         # Act
         # Assert
         self.assertTrue(True)
+
+    def test_engine_get_initialized_future_when_client_initialized_is_done(self):
+        # Arrange
+        self.engine.register_client(self.client)
+
+        # Act
+        future = self.engine.get_initialized_future()
+
+        # Assert
+        self.assertTrue(self.client.get_initialized_future().done())
+        self.assertTrue(future.done())
+
+    def test_engine_get_disconnected_future_when_client_not_connected_is_done(self):
+        # Arrange
+        self.engine.register_client(self.client)
+
+        # Act
+        future = self.engine.get_disconnected_future()
+
+        # Assert
+        self.assertFalse(self.client.is_connected())
+        self.assertTrue(self.client.get_disconnected_future().done())
+        self.assertTrue(future.done())
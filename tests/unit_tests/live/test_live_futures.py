@@ -0,0 +1,85 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2021 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import asyncio
+import threading
+import unittest
+
+from nautilus_trader.live.futures import complete_future
+from nautilus_trader.live.futures import gather_futures
+
+
+class LiveFuturesTests(unittest.TestCase):
+
+    def setUp(self):
+        # Fresh isolated loop testing pattern
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+
+    def tearDown(self):
+        self.loop.close()
+
+    def test_gather_futures_with_no_futures_is_done(self):
+        # Arrange
+        # Act
+        future = gather_futures(self.loop, [])
+
+        # Assert
+        self.assertTrue(future.done())
+        self.assertEqual([], future.result())
+
+    def test_gather_futures_when_all_done_is_done(self):
+        # Arrange
+        future1 = self.loop.create_future()
+        future2 = self.loop.create_future()
+        complete_future(self.loop, future1)
+        complete_future(self.loop, future2)
+
+        # Act
+        future = gather_futures(self.loop, [future1, future2])
+
+        # Assert
+        self.assertTrue(future.done())
+        self.assertEqual([True, True], future.result())
+
+    def test_gather_futures_when_pending_completes_with_futures(self):
+        # Arrange
+        future1 = self.loop.create_future()
+        future2 = self.loop.create_future()
+        complete_future(self.loop, future1)
+
+        # Act
+        future = gather_futures(self.loop, [future1, future2])
+
+        # Assert
+        self.assertFalse(future.done())
+        complete_future(self.loop, future2)
+        self.assertEqual([True, True], self.loop.run_until_complete(future))
+
+    def test_complete_future_from_other_thread_completes_on_loop_thread(self):
+        async def run_test():
+            # Arrange
+            future = self.loop.create_future()
+            thread = threading.Thread(target=complete_future, args=(self.loop, future))
+
+            # Act
+            thread.start()
+            thread.join()
+            await asyncio.wait_for(future, timeout=1)
+
+            # Assert
+            self.assertTrue(future.result())
+
+        self.loop.run_until_complete(run_test())
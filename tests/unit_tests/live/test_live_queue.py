@@ -0,0 +1,189 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2021 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import asyncio
+import unittest
+
+from nautilus_trader.live.queue import LiveQueue
+
+
+class LiveQueueTests(unittest.TestCase):
+
+    def setUp(self):
+        # Fixture Setup
+        # Fresh isolated loop testing pattern
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+
+    def tearDown(self):
+        self.loop.stop()
+        self.loop.close()
+
+    def test_instantiate_queue(self):
+        # Arrange
+        # Act
+        queue = LiveQueue(maxsize=10)
+
+        # Assert
+        self.assertEqual(10, queue.maxsize)
+        self.assertFalse(queue.drop_oldest)
+        self.assertEqual(0, queue.depth())
+        self.assertEqual(0, queue.held_count())
+        self.assertEqual(0, queue.high_water_mark)
+        self.assertEqual(0, queue.dropped_count)
+
+    def test_instantiate_with_negative_maxsize_raises_value_error(self):
+        # Arrange
+        # Act
+        # Assert
+        self.assertRaises(ValueError, LiveQueue, -1)
+
+    def test_enqueue_within_bound_updates_high_water_mark(self):
+        # Arrange
+        queue = LiveQueue(maxsize=10)
+
+        # Act
+        queue.enqueue(1)
+        queue.enqueue(2)
+        queue.enqueue(3)
+        queue.get_nowait()
+
+        # Assert
+        self.assertEqual(2, queue.depth())
+        self.assertEqual(3, queue.high_water_mark)
+
+    def test_enqueue_when_full_with_drop_oldest_drops_oldest_item(self):
+        # Arrange
+        dropped = []
+        queue = LiveQueue(maxsize=2, drop_oldest=True, on_drop=dropped.append)
+
+        # Act
+        for i in range(5):
+            queue.enqueue(i)
+
+        # Assert
+        self.assertEqual([0, 1, 2], dropped)
+        self.assertEqual(3, queue.dropped_count)
+        self.assertEqual(2, queue.high_water_mark)
+        self.assertEqual(3, queue.get_nowait())
+        self.assertEqual(4, queue.get_nowait())
+
+    def test_enqueue_when_full_holds_items_in_order_until_space(self):
+        async def run_test():
+            # Arrange
+            queue = LiveQueue(maxsize=2)
+
+            # Act
+            for i in range(5):
+                queue.enqueue(i)
+
+            held = queue.held_count()
+            depth = queue.depth()
+
+            items = []
+            while len(items) < 5:
+                items.append(await queue.get())
+
+            # Assert
+            self.assertEqual(3, held)
+            self.assertEqual(5, depth)
+            self.assertEqual(5, queue.high_water_mark)
+            self.assertEqual([0, 1, 2, 3, 4], items)
+            self.assertEqual(0, queue.dropped_count)
+            self.assertEqual(0, queue.depth())
+
+        self.loop.run_until_complete(run_test())
+
+    def test_enqueue_wait_waits_until_item_is_on_queue(self):
+        async def run_test():
+            # Arrange
+            queue = LiveQueue(maxsize=1)
+            queue.enqueue(0)
+
+            # Act
+            task = self.loop.create_task(queue.enqueue_wait(1))
+            await asyncio.sleep(0.01)
+            blocked = not task.done()
+            first = queue.get_nowait()
+            await asyncio.sleep(0.01)
+
+            # Assert
+            self.assertTrue(blocked)
+            self.assertTrue(task.done())
+            self.assertEqual(0, first)
+            self.assertEqual(1, queue.get_nowait())
+
+        self.loop.run_until_complete(run_test())
+
+    def test_enqueue_wait_from_loop_thread_producers_keeps_depth_within_maxsize(self):
+        async def run_test():
+            # Arrange
+            queue = LiveQueue(maxsize=10)
+            depths = []
+
+            async def produce(start):
+                for i in range(start, start + 1000):
+                    await queue.enqueue_wait(i)
+                    depths.append(queue.depth())
+
+            # Act
+            producers = [self.loop.create_task(produce(i * 1000)) for i in range(3)]
+            items = []
+            while len(items) < 3000:
+                items.append(await queue.get())
+            await asyncio.gather(*producers)
+
+            # Assert
+            self.assertTrue(max(depths) <= 10)
+            self.assertEqual(10, queue.high_water_mark)
+            self.assertEqual(0, queue.held_count())
+            self.assertEqual(list(range(1000)), [item for item in items if item < 1000])
+            self.assertEqual(0, queue.dropped_count)
+
+        self.loop.run_until_complete(run_test())
+
+    def test_enqueue_wait_when_items_held_waits_behind_them(self):
+        async def run_test():
+            # Arrange
+            queue = LiveQueue(maxsize=1)
+            queue.enqueue(0)
+            queue.enqueue(1)  # Held
+
+            # Act
+            task = self.loop.create_task(queue.enqueue_wait(2))
+            items = []
+            while len(items) < 3:
+                items.append(await queue.get())
+            await task
+
+            # Assert
+            self.assertEqual([0, 1, 2], items)
+            self.assertEqual(0, queue.depth())
+
+        self.loop.run_until_complete(run_test())
+
+    def test_reset_gauges(self):
+        # Arrange
+        queue = LiveQueue(maxsize=1, drop_oldest=True)
+        queue.enqueue(0)
+        queue.enqueue(1)
+        queue.get_nowait()
+
+        # Act
+        queue.reset_gauges()
+
+        # Assert
+        self.assertEqual(0, queue.high_water_mark)
+        self.assertEqual(0, queue.dropped_count)
@@ -0,0 +1,421 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2021 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import asyncio
+import os
+import tempfile
+import threading
+import unittest
+
+from nautilus_trader.common.clock import LiveClock
+from nautilus_trader.common.logging import LogLevel
+from nautilus_trader.common.logging import TestLogger
+from nautilus_trader.live.data import LiveDataEngine
+from nautilus_trader.live.recorder import DataRecorder
+from nautilus_trader.live.recorder import RecordType
+from nautilus_trader.live.replay import ReplayDataClient
+from nautilus_trader.live.replay import read_records
+from nautilus_trader.live.replay import record_files
+from nautilus_trader.model.bar import BarData
+from nautilus_trader.model.enums import OrderSide
+from nautilus_trader.model.identifiers import Venue
+from nautilus_trader.model.objects import Price
+from nautilus_trader.model.objects import Quantity
+from nautilus_trader.model.order_book import OrderBookDelta
+from nautilus_trader.trading.portfolio import Portfolio
+from tests.test_kit.providers import TestInstrumentProvider
+from tests.test_kit.stubs import TestStubs
+from tests.test_kit.stubs import UNIX_EPOCH
+
+
+BINANCE = Venue("BINANCE")
+BITMEX = Venue("BITMEX")
+BTCUSDT_BINANCE = TestInstrumentProvider.btcusdt_binance()
+XBTUSD_BITMEX = TestInstrumentProvider.xbtusd_bitmex()
+
+
+class DataRecorderTests(unittest.TestCase):
+
+    def setUp(self):
+        # Fixture Setup
+        self.clock = LiveClock()
+        self.logger = TestLogger(self.clock, level_console=LogLevel.DEBUG)
+
+        self.portfolio = Portfolio(
+            clock=self.clock,
+            logger=self.logger,
+        )
+
+        # Fresh isolated loop testing pattern
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+
+        self.data_engine = LiveDataEngine(
+            loop=self.loop,
+            portfolio=self.portfolio,
+            clock=self.clock,
+            logger=self.logger,
+        )
+
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.recorder = DataRecorder(
+            path=self.tempdir.name,
+            clock=self.clock,
+            logger=self.logger,
+            buffer_size=2,
+        )
+
+    def tearDown(self):
+        self.data_engine.dispose()
+        self.loop.stop()
+        self.loop.close()
+        self.tempdir.cleanup()
+
+    def test_instantiate_recorder(self):
+        # Arrange
+        # Act
+        # Assert
+        self.assertEqual("data", self.recorder.name)
+        self.assertEqual([], self.recorder.files)
+        self.assertEqual(0, self.recorder.record_count)
+
+    def test_instantiate_with_invalid_buffer_size_raises_value_error(self):
+        # Arrange
+        # Act
+        # Assert
+        self.assertRaises(
+            ValueError,
+            DataRecorder,
+            self.tempdir.name,
+            self.clock,
+            self.logger,
+            "data",
+            0,
+        )
+
+    def test_record_buffers_until_buffer_size_reached(self):
+        # Arrange
+        tick = TestStubs.quote_tick_5decimal(BTCUSDT_BINANCE.symbol)
+
+        # Act
+        self.recorder.record(tick)
+
+        # Assert
+        self.assertEqual(1, self.recorder.record_count)
+        self.assertEqual([], self.recorder.files)
+
+    def test_record_then_close_round_trips_records(self):
+        # Arrange
+        quote = TestStubs.quote_tick_5decimal(BTCUSDT_BINANCE.symbol)
+        trade = TestStubs.trade_tick_5decimal(BTCUSDT_BINANCE.symbol)
+        bar_data = BarData(TestStubs.bartype_btcusdt_binance_1min_bid(), TestStubs.bar_5decimal())
+
+        # Act
+        self.recorder.record(BTCUSDT_BINANCE)
+        self.recorder.record(quote)
+        self.recorder.record(trade)
+        self.recorder.record(bar_data)
+        self.recorder.close()
+
+        records = list(read_records(record_files(self.tempdir.name)))
+
+        # Assert
+        self.assertEqual(4, self.recorder.record_count)
+        self.assertEqual(record_files(self.tempdir.name), self.recorder.files)
+        self.assertEqual(
+            [RecordType.INSTRUMENT, RecordType.QUOTE_TICK, RecordType.TRADE_TICK, RecordType.BAR_INTERNAL],
+            [record[1] for record in records],
+        )
+        self.assertEqual(BTCUSDT_BINANCE.symbol.value, records[0][2])
+        self.assertEqual(quote.to_serializable_string(), records[1][3])
+        self.assertEqual(str(bar_data.bar_type), records[3][2])
+        self.assertTrue(records[0][0] <= records[3][0])
+
+    def test_record_order_book_delta_round_trips_record(self):
+        # Arrange
+        delta = OrderBookDelta(
+            BTCUSDT_BINANCE.symbol,
+            OrderSide.BUY,
+            Price("10000.00"),
+            Quantity("1.500000"),
+            UNIX_EPOCH,
+        )
+
+        # Act
+        self.recorder.record(delta)
+        self.recorder.close()
+
+        records = list(read_records(self.recorder.files))
+
+        # Assert
+        self.assertEqual(RecordType.ORDER_BOOK_DELTA, records[0][1])
+        self.assertEqual(delta.to_serializable_string(), records[0][3])
+
+    def test_record_unsupported_data_does_not_record(self):
+        # Arrange
+        # Act
+        self.recorder.record("NOT_DATA")
+        self.recorder.close()
+
+        # Assert
+        self.assertEqual(0, self.recorder.record_count)
+        self.assertEqual([], self.recorder.files)
+
+    def test_flush_writes_buffered_records_to_file(self):
+        # Arrange
+        self.recorder.record(TestStubs.quote_tick_5decimal(BTCUSDT_BINANCE.symbol))
+
+        # Act
+        self.recorder.flush()
+
+        # Assert
+        self.assertEqual(1, len(self.recorder.files))
+        self.assertTrue(os.path.getsize(self.recorder.files[0]) > 0)
+
+        # Tear Down
+        self.recorder.close()
+
+    def test_record_rolls_to_new_file_after_max_file_size(self):
+        # Arrange
+        recorder = DataRecorder(
+            path=self.tempdir.name,
+            clock=self.clock,
+            logger=self.logger,
+            name="small",
+            buffer_size=1,
+            max_file_size=1,
+        )
+        tick = TestStubs.quote_tick_5decimal(BTCUSDT_BINANCE.symbol)
+
+        # Act
+        recorder.record(tick)
+        recorder.record(tick)
+        recorder.record(tick)
+        recorder.close()
+
+        # Assert
+        self.assertEqual(3, len(recorder.files))
+        self.assertEqual(recorder.files, record_files(self.tempdir.name, "small"))
+        self.assertEqual(3, len(list(read_records(recorder.files))))
+
+    def test_registered_recorder_records_processed_data(self):
+        async def run_test():
+            # Arrange
+            self.data_engine.register_recorder(self.recorder)
+            self.data_engine.start()
+
+            tick = TestStubs.quote_tick_5decimal(BTCUSDT_BINANCE.symbol)
+
+            # Act
+            self.data_engine.process(tick)
+            self.data_engine.process(tick)
+            self.data_engine.process(tick)
+            await asyncio.sleep(0.1)
+
+            # Assert
+            self.assertEqual(3, self.recorder.record_count)
+            self.assertEqual(3, self.data_engine.data_count)
+
+            # Tear Down
+            self.data_engine.stop()
+            self.recorder.close()
+
+        self.loop.run_until_complete(run_test())
+
+    def test_deregister_recorder_stops_recording(self):
+        # Arrange
+        self.data_engine.register_recorder(self.recorder)
+
+        # Act
+        self.data_engine.deregister_recorder()
+        self.data_engine.process(TestStubs.quote_tick_5decimal(BTCUSDT_BINANCE.symbol))
+
+        # Assert
+        self.assertEqual(0, self.recorder.record_count)
+
+
+class ReplayDataClientTests(unittest.TestCase):
+
+    def setUp(self):
+        # Fixture Setup
+        self.clock = LiveClock()
+        self.logger = TestLogger(self.clock, level_console=LogLevel.DEBUG)
+
+        self.portfolio = Portfolio(
+            clock=self.clock,
+            logger=self.logger,
+        )
+
+        # Fresh isolated loop testing pattern
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+
+        self.data_engine = LiveDataEngine(
+            loop=self.loop,
+            portfolio=self.portfolio,
+            clock=self.clock,
+            logger=self.logger,
+        )
+
+        # Record a session with data for two venues
+        self.tempdir = tempfile.TemporaryDirectory()
+        recorder = DataRecorder(
+            path=self.tempdir.name,
+            clock=self.clock,
+            logger=self.logger,
+        )
+        recorder.record(BTCUSDT_BINANCE)
+        recorder.record(XBTUSD_BITMEX)
+        for _ in range(5):
+            recorder.record(TestStubs.quote_tick_5decimal(BTCUSDT_BINANCE.symbol))
+            recorder.record(TestStubs.trade_tick_5decimal(XBTUSD_BITMEX.symbol))
+        recorder.record(BarData(TestStubs.bartype_btcusdt_binance_1min_bid(), TestStubs.bar_5decimal()))
+        recorder.close()
+
+        self.client = ReplayDataClient(
+            files=record_files(self.tempdir.name),
+            venue=BINANCE,
+            engine=self.data_engine,
+            clock=self.clock,
+            logger=self.logger,
+        )
+        self.data_engine.register_client(self.client)
+
+    def tearDown(self):
+        self.data_engine.dispose()
+        self.loop.stop()
+        self.loop.close()
+        self.tempdir.cleanup()
+
+    def test_instantiate_with_no_files_raises_value_error(self):
+        # Arrange
+        # Act
+        # Assert
+        self.assertRaises(
+            ValueError,
+            ReplayDataClient,
+            [],
+            BINANCE,
+            self.data_engine,
+            self.clock,
+            self.logger,
+        )
+
+    def test_connect_loads_recorded_instruments_for_venue(self):
+        async def run_test():
+            # Arrange
+            self.data_engine.start()
+
+            # Act
+            self.client.connect()
+            await asyncio.sleep(0.1)
+
+            # Assert
+            self.assertTrue(self.client.is_connected())
+            self.assertTrue(self.client.initialized)
+            self.assertEqual([BTCUSDT_BINANCE.symbol], self.data_engine.cache.symbols())
+            self.assertEqual(0, self.client.replay_count)
+
+            # Tear Down
+            self.data_engine.stop()
+            self.client.disconnect()
+
+        self.loop.run_until_complete(run_test())
+
+    def test_replay_processes_recorded_data_for_venue(self):
+        async def run_test():
+            # Arrange
+            self.data_engine.start()
+            self.client.connect()
+
+            # Act
+            self.client.start_replay()
+            await asyncio.sleep(0.1)
+
+            # Assert
+            self.assertFalse(self.client.is_replaying)
+            self.assertEqual(7, self.client.replay_count)  # Instrument, 5 quotes and a bar
+            self.assertEqual(
+                TestStubs.quote_tick_5decimal(BTCUSDT_BINANCE.symbol),
+                self.data_engine.cache.quote_tick(BTCUSDT_BINANCE.symbol),
+            )
+            self.assertEqual(0, self.data_engine.cache.trade_tick_count(XBTUSD_BITMEX.symbol))
+
+            # Tear Down
+            self.data_engine.stop()
+            self.client.disconnect()
+
+        self.loop.run_until_complete(run_test())
+
+    def test_subscribe_starts_replay(self):
+        async def run_test():
+            # Arrange
+            self.data_engine.start()
+            self.client.connect()
+
+            # Act
+            self.client.subscribe_quote_ticks(BTCUSDT_BINANCE.symbol)
+            self.client.subscribe_bars(TestStubs.bartype_btcusdt_binance_1min_bid())
+            await asyncio.sleep(0.1)
+
+            # Assert
+            self.assertEqual(7, self.client.replay_count)
+
+            # Tear Down
+            self.data_engine.stop()
+            self.client.disconnect()
+
+        self.loop.run_until_complete(run_test())
+
+    def test_connect_completes_engine_initialized_future(self):
+        async def run_test():
+            # Arrange
+            self.data_engine.start()
+            initialized = self.data_engine.get_initialized_future()
+
+            # Act
+            self.client.connect()
+            await asyncio.wait_for(initialized, timeout=1)
+
+            # Assert
+            self.assertTrue(self.client.initialized)
+            self.assertFalse(self.data_engine.get_disconnected_future().done())
+
+            # Tear Down
+            self.data_engine.stop()
+            self.client.disconnect()
+
+        self.loop.run_until_complete(run_test())
+
+    def test_disconnect_from_other_thread_completes_engine_disconnected_future(self):
+        async def run_test():
+            # Arrange
+            self.data_engine.start()
+            self.client.connect()
+            disconnected = self.data_engine.get_disconnected_future()
+            thread = threading.Thread(target=self.client.disconnect)
+
+            # Act
+            thread.start()
+            thread.join()
+            await asyncio.wait_for(disconnected, timeout=1)
+
+            # Assert
+            self.assertFalse(self.client.is_connected())
+
+            # Tear Down
+            self.data_engine.stop()
+
+        self.loop.run_until_complete(run_test())
@@ -0,0 +1,201 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2021 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import asyncio
+import unittest
+
+from nautilus_trader.common.clock import LiveClock
+from nautilus_trader.common.logging import TestLogger
+from nautilus_trader.live.queue import LiveQueue
+from nautilus_trader.live.scheduler import LiveScheduler
+from nautilus_trader.live.scheduler import QueuePriority
+
+
+class LiveSchedulerTests(unittest.TestCase):
+
+    def setUp(self):
+        # Fixture Setup
+        self.clock = LiveClock()
+        self.logger = TestLogger(self.clock)
+
+        # Fresh isolated loop testing pattern
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+
+        self.scheduler = LiveScheduler(loop=self.loop, logger=self.logger)
+        self.handled = []
+
+    def tearDown(self):
+        self.loop.stop()
+        self.loop.close()
+
+    def test_instantiate_scheduler(self):
+        # Arrange
+        # Act
+        # Assert
+        self.assertFalse(self.scheduler.is_running)
+        self.assertEqual(0, self.scheduler.handled_count)
+        self.assertIsNone(self.scheduler.get_run_task())
+        self.assertEqual(0.01, self.scheduler.time_slice(QueuePriority.EXECUTION))
+        self.assertEqual(0.005, self.scheduler.time_slice(QueuePriority.COMMAND))
+        self.assertEqual(0.002, self.scheduler.time_slice(QueuePriority.DATA_RESPONSE))
+        self.assertEqual(0.001, self.scheduler.time_slice(QueuePriority.MARKET_DATA))
+
+    def test_instantiate_with_invalid_time_slice_raises_value_error(self):
+        # Arrange
+        # Act
+        # Assert
+        self.assertRaises(
+            ValueError,
+            LiveScheduler,
+            self.loop,
+            self.logger,
+            {"market_data_time_slice_ms": 0},
+        )
+
+    def test_register_queue_twice_raises_value_error(self):
+        # Arrange
+        queue = LiveQueue()
+        self.scheduler.register_queue(queue, self.handled.append, QueuePriority.MARKET_DATA)
+
+        # Act
+        # Assert
+        self.assertRaises(
+            ValueError,
+            self.scheduler.register_queue,
+            queue,
+            self.handled.append,
+            QueuePriority.EXECUTION,
+        )
+
+    def test_run_handles_queues_in_priority_order(self):
+        async def run_test():
+            # Arrange
+            data_queue = LiveQueue()
+            response_queue = LiveQueue()
+            command_queue = LiveQueue()
+            exec_queue = LiveQueue()
+            self.scheduler.register_queue(data_queue, self.handled.append, QueuePriority.MARKET_DATA)
+            self.scheduler.register_queue(response_queue, self.handled.append, QueuePriority.DATA_RESPONSE)
+            self.scheduler.register_queue(command_queue, self.handled.append, QueuePriority.COMMAND)
+            self.scheduler.register_queue(exec_queue, self.handled.append, QueuePriority.EXECUTION)
+
+            data_queue.enqueue("D1")
+            data_queue.enqueue("D2")
+            response_queue.enqueue("R1")
+            command_queue.enqueue("C1")
+            exec_queue.enqueue("E1")
+
+            # Act
+            self.scheduler.start()
+            await asyncio.sleep(0.1)
+
+            # Assert
+            self.assertEqual(["E1", "C1", "R1", "D1", "D2"], self.handled)
+            self.assertEqual(5, self.scheduler.handled_count)
+
+            # Tear Down
+            self.scheduler.stop()
+            await self.scheduler.get_run_task()
+
+        self.loop.run_until_complete(run_test())
+
+    def test_higher_priority_item_preempts_market_data(self):
+        async def run_test():
+            # Arrange
+            data_queue = LiveQueue()
+            exec_queue = LiveQueue()
+
+            def handle_data(item):
+                self.handled.append(item)
+                if item == "D1":
+                    exec_queue.enqueue("E1")  # For example a strategy submitting an order
+
+            self.scheduler.register_queue(data_queue, handle_data, QueuePriority.MARKET_DATA)
+            self.scheduler.register_queue(exec_queue, self.handled.append, QueuePriority.EXECUTION)
+            self.scheduler.start()
+
+            # Act
+            for item in ["D1", "D2", "D3"]:
+                data_queue.enqueue(item)
+            await asyncio.sleep(0.1)
+
+            # Assert
+            self.assertEqual(["D1", "E1", "D2", "D3"], self.handled)
+
+            # Tear Down
+            self.scheduler.stop()
+            await self.scheduler.get_run_task()
+
+        self.loop.run_until_complete(run_test())
+
+    def test_run_wakes_when_items_arrive(self):
+        async def run_test():
+            # Arrange
+            queue = LiveQueue()
+            self.scheduler.register_queue(queue, self.handled.append, QueuePriority.MARKET_DATA)
+            self.scheduler.start()
+            await asyncio.sleep(0.05)
+
+            # Act
+            queue.enqueue("D1")
+            await asyncio.sleep(0.05)
+
+            # Assert
+            self.assertEqual(["D1"], self.handled)
+
+            # Tear Down
+            self.scheduler.stop()
+            await self.scheduler.get_run_task()
+
+        self.loop.run_until_complete(run_test())
+
+    def test_deregister_queue_stops_handling_queue(self):
+        async def run_test():
+            # Arrange
+            queue = LiveQueue()
+            self.scheduler.register_queue(queue, self.handled.append, QueuePriority.MARKET_DATA)
+            self.scheduler.start()
+
+            # Act
+            self.scheduler.deregister_queue(queue)
+            queue.enqueue("D1")
+            await asyncio.sleep(0.05)
+
+            # Assert
+            self.assertEqual([], self.handled)
+            self.assertEqual(1, queue.qsize())
+
+            # Tear Down
+            self.scheduler.stop()
+            await self.scheduler.get_run_task()
+
+        self.loop.run_until_complete(run_test())
+
+    def test_stop_completes_run_task(self):
+        async def run_test():
+            # Arrange
+            self.scheduler.start()
+            await asyncio.sleep(0)
+
+            # Act
+            self.scheduler.stop()
+            await asyncio.sleep(0.01)
+
+            # Assert
+            self.assertFalse(self.scheduler.is_running)
+            self.assertTrue(self.scheduler.get_run_task().done())
+
+        self.loop.run_until_complete(run_test())
@@ -0,0 +1,219 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2021 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import os
+import pickle
+import tempfile
+import unittest
+
+import msgpack
+
+from nautilus_trader.common.clock import LiveClock
+from nautilus_trader.common.logging import LogLevel
+from nautilus_trader.common.logging import TestLogger
+from nautilus_trader.live.snapshot import InstrumentSnapshotCache
+from nautilus_trader.live.snapshot import SNAPSHOT_VERSION
+from nautilus_trader.live.snapshot import changed_instruments
+from nautilus_trader.live.snapshot import removed_instruments
+from nautilus_trader.model.identifiers import Venue
+from tests.test_kit.providers import TestInstrumentProvider
+
+
+BINANCE = Venue("BINANCE")
+BTCUSDT_BINANCE = TestInstrumentProvider.btcusdt_binance()
+ETHUSDT_BINANCE = TestInstrumentProvider.ethusdt_binance()
+
+
+class ChangedInstrumentsTests(unittest.TestCase):
+
+    def test_changed_instruments_when_unchanged_returns_empty_list(self):
+        # Arrange
+        previous = {BTCUSDT_BINANCE.symbol: BTCUSDT_BINANCE}
+        current = {BTCUSDT_BINANCE.symbol: TestInstrumentProvider.btcusdt_binance()}
+
+        # Act
+        result = changed_instruments(previous, current)
+
+        # Assert
+        self.assertEqual([], result)
+
+    def test_changed_instruments_returns_new_and_changed_instruments(self):
+        # Arrange
+        btcusdt = TestInstrumentProvider.btcusdt_binance()
+        btcusdt.info["status"] = "BREAK"
+
+        previous = {BTCUSDT_BINANCE.symbol: BTCUSDT_BINANCE}
+        current = {
+            BTCUSDT_BINANCE.symbol: btcusdt,
+            ETHUSDT_BINANCE.symbol: ETHUSDT_BINANCE,
+        }
+
+        # Act
+        result = changed_instruments(previous, current)
+
+        # Assert
+        self.assertEqual([btcusdt, ETHUSDT_BINANCE], result)
+        self.assertEqual({"status": "BREAK"}, result[0].info)
+
+
+class RemovedInstrumentsTests(unittest.TestCase):
+
+    def test_removed_instruments_when_none_removed_returns_empty_list(self):
+        # Arrange
+        previous = {BTCUSDT_BINANCE.symbol: BTCUSDT_BINANCE}
+        current = {
+            BTCUSDT_BINANCE.symbol: BTCUSDT_BINANCE,
+            ETHUSDT_BINANCE.symbol: ETHUSDT_BINANCE,
+        }
+
+        # Act
+        result = removed_instruments(previous, current)
+
+        # Assert
+        self.assertEqual([], result)
+
+    def test_removed_instruments_returns_delisted_symbols(self):
+        # Arrange
+        previous = {
+            BTCUSDT_BINANCE.symbol: BTCUSDT_BINANCE,
+            ETHUSDT_BINANCE.symbol: ETHUSDT_BINANCE,
+        }
+        current = {BTCUSDT_BINANCE.symbol: BTCUSDT_BINANCE}
+
+        # Act
+        result = removed_instruments(previous, current)
+
+        # Assert
+        self.assertEqual([ETHUSDT_BINANCE.symbol], result)
+
+
+class InstrumentSnapshotCacheTests(unittest.TestCase):
+
+    def setUp(self):
+        # Fixture Setup
+        self.clock = LiveClock()
+        self.logger = TestLogger(self.clock, level_console=LogLevel.DEBUG)
+
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.cache = InstrumentSnapshotCache(
+            path=self.tempdir.name,
+            venue=BINANCE,
+            logger=self.logger,
+        )
+
+    def tearDown(self):
+        self.tempdir.cleanup()
+
+    def test_instantiate_cache(self):
+        # Arrange
+        # Act
+        # Assert
+        self.assertEqual(BINANCE, self.cache.venue)
+        self.assertEqual(os.path.join(self.tempdir.name, "binance.instruments.msgpack"), self.cache.file_path)
+
+    def test_instantiate_with_empty_path_raises_value_error(self):
+        # Arrange
+        # Act
+        # Assert
+        self.assertRaises(ValueError, InstrumentSnapshotCache, "", BINANCE, self.logger)
+
+    def test_load_when_no_snapshot_returns_empty_dict(self):
+        # Arrange
+        # Act
+        result = self.cache.load()
+
+        # Assert
+        self.assertEqual({}, result)
+
+    def test_save_then_load_returns_instruments(self):
+        # Arrange
+        instruments = {
+            BTCUSDT_BINANCE.symbol: BTCUSDT_BINANCE,
+            ETHUSDT_BINANCE.symbol: ETHUSDT_BINANCE,
+        }
+
+        # Act
+        self.cache.save(instruments)
+        result = self.cache.load()
+
+        # Assert
+        self.assertEqual(instruments, result)
+        self.assertEqual(BTCUSDT_BINANCE.price_precision, result[BTCUSDT_BINANCE.symbol].price_precision)
+        self.assertEqual(["binance.instruments.msgpack"], os.listdir(self.tempdir.name))
+
+    def test_save_creates_missing_directory(self):
+        # Arrange
+        cache = InstrumentSnapshotCache(
+            path=os.path.join(self.tempdir.name, "instruments"),
+            venue=BINANCE,
+            logger=self.logger,
+        )
+
+        # Act
+        cache.save({BTCUSDT_BINANCE.symbol: BTCUSDT_BINANCE})
+
+        # Assert
+        self.assertEqual([BTCUSDT_BINANCE.symbol], list(cache.load()))
+
+    def test_load_when_snapshot_from_other_version_returns_empty_dict(self):
+        # Arrange
+        snapshot = {
+            "version": SNAPSHOT_VERSION + 1,
+            "nautilus_trader": "0.0.0",
+            "venue": BINANCE.value,
+            "instruments": [],
+        }
+
+        with open(self.cache.file_path, "wb") as snapshot_file:
+            snapshot_file.write(msgpack.packb(snapshot))
+
+        # Act
+        result = self.cache.load()
+
+        # Assert
+        self.assertEqual({}, result)
+
+    def test_load_when_snapshot_corrupt_returns_empty_dict(self):
+        # Arrange
+        with open(self.cache.file_path, "wb") as snapshot_file:
+            snapshot_file.write(b"not a snapshot")
+
+        # Act
+        result = self.cache.load()
+
+        # Assert
+        self.assertEqual({}, result)
+
+    def test_load_when_snapshot_is_pickle_returns_empty_dict(self):
+        # Arrange
+        with open(self.cache.file_path, "wb") as snapshot_file:
+            pickle.dump({BTCUSDT_BINANCE.symbol: BTCUSDT_BINANCE}, snapshot_file)
+
+        # Act
+        result = self.cache.load()
+
+        # Assert
+        self.assertEqual({}, result)
+
+    def test_clear_removes_snapshot(self):
+        # Arrange
+        self.cache.save({BTCUSDT_BINANCE.symbol: BTCUSDT_BINANCE})
+
+        # Act
+        self.cache.clear()
+
+        # Assert
+        self.assertEqual({}, self.cache.load())
+        self.assertEqual([], os.listdir(self.tempdir.name))
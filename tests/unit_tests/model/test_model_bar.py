@@ -13,6 +13,7 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+from datetime import timedelta
 import unittest
 
 from parameterized import parameterized
@@ -234,6 +235,22 @@ class BarTests(unittest.TestCase):
         self.assertEqual(bar1, bar1)
         self.assertNotEqual(bar1, bar2)
 
+    def test_timestamp_given_timestamp_ns_is_created_from_nanoseconds(self):
+        # Arrange
+        bar = Bar(
+            Price("1.00001"),
+            Price("1.00004"),
+            Price("1.00002"),
+            Price("1.00003"),
+            Quantity(100000),
+            timestamp_ns=60_000_000_000,
+        )
+
+        # Act
+        # Assert
+        self.assertEqual(UNIX_EPOCH + timedelta(minutes=1), bar.timestamp)
+        self.assertEqual(60_000_000_000, bar.timestamp_ns)
+
     def test_str_repr(self):
         # Arrange
         bar = Bar(
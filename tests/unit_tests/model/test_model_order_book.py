@@ -0,0 +1,289 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2021 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import unittest
+
+from nautilus_trader.model.enums import OrderSide
+from nautilus_trader.model.objects import Price
+from nautilus_trader.model.objects import Quantity
+from nautilus_trader.model.order_book import OrderBook
+from nautilus_trader.model.order_book import OrderBookDelta
+from tests.test_kit.stubs import TestStubs
+from tests.test_kit.stubs import UNIX_EPOCH
+
+
+AUDUSD_SIM = TestStubs.symbol_audusd_fxcm()
+GBPUSD_SIM = TestStubs.symbol_gbpusd_fxcm()
+
+
+class OrderBookDeltaTests(unittest.TestCase):
+
+    def test_delta_str_and_repr(self):
+        # Arrange
+        delta = OrderBookDelta(
+            AUDUSD_SIM,
+            OrderSide.BUY,
+            Price("1.00000"),
+            Quantity(100000),
+            UNIX_EPOCH,
+        )
+
+        # Act
+        # Assert
+        self.assertEqual("AUD/USD.SIM,BUY,1.00000,100000,1970-01-01T00:00:00.000Z", str(delta))
+        self.assertEqual("OrderBookDelta(AUD/USD.SIM,BUY,1.00000,100000,1970-01-01T00:00:00.000Z)", repr(delta))
+
+    def test_instantiate_with_undefined_side_raises_value_error(self):
+        # Arrange
+        # Act
+        # Assert
+        self.assertRaises(
+            ValueError,
+            OrderBookDelta,
+            AUDUSD_SIM,
+            OrderSide.UNDEFINED,
+            Price("1.00000"),
+            Quantity(100000),
+            UNIX_EPOCH,
+        )
+
+    def test_from_serializable_given_malformed_string_raises_value_error(self):
+        # Arrange
+        # Act
+        # Assert
+        self.assertRaises(
+            ValueError,
+            OrderBookDelta.from_serializable_string,
+            AUDUSD_SIM,
+            "NOT_A_DELTA",
+        )
+
+    def test_from_serializable_string_given_valid_string_returns_expected_delta(self):
+        # Arrange
+        delta = OrderBookDelta(
+            AUDUSD_SIM,
+            OrderSide.SELL,
+            Price("1.00001"),
+            Quantity(0),
+            UNIX_EPOCH,
+        )
+
+        # Act
+        result = OrderBookDelta.from_serializable_string(AUDUSD_SIM, delta.to_serializable_string())
+
+        # Assert
+        self.assertEqual(str(delta), str(result))
+
+    def test_to_serializable_returns_expected_string(self):
+        # Arrange
+        delta = OrderBookDelta(
+            AUDUSD_SIM,
+            OrderSide.BUY,
+            Price("1.00000"),
+            Quantity(100000),
+            UNIX_EPOCH,
+        )
+
+        # Act
+        result = delta.to_serializable_string()
+
+        # Assert
+        self.assertEqual("BUY,1.00000,100000,0", result)
+
+
+class OrderBookTests(unittest.TestCase):
+
+    def setUp(self):
+        # Fixture Setup
+        self.order_book = OrderBook(AUDUSD_SIM)
+
+    def test_instantiate_order_book(self):
+        # Arrange
+        # Act
+        # Assert
+        self.assertEqual(AUDUSD_SIM, self.order_book.symbol)
+        self.assertIsNone(self.order_book.timestamp)
+        self.assertEqual(0, self.order_book.update_count)
+        self.assertEqual(0, self.order_book.bid_depth())
+        self.assertEqual(0, self.order_book.ask_depth())
+        self.assertIsNone(self.order_book.best_bid_price())
+        self.assertIsNone(self.order_book.best_ask_price())
+        self.assertIsNone(self.order_book.best_bid_qty())
+        self.assertIsNone(self.order_book.best_ask_qty())
+        self.assertEqual([], self.order_book.bids())
+        self.assertEqual([], self.order_book.asks())
+
+    def test_update_orders_levels_best_price_first(self):
+        # Arrange
+        # Act
+        self.order_book.update(OrderSide.BUY, Price("0.99998"), Quantity(300000))
+        self.order_book.update(OrderSide.BUY, Price("1.00000"), Quantity(100000))
+        self.order_book.update(OrderSide.BUY, Price("0.99999"), Quantity(200000))
+        self.order_book.update(OrderSide.SELL, Price("1.00003"), Quantity(300000))
+        self.order_book.update(OrderSide.SELL, Price("1.00001"), Quantity(100000))
+        self.order_book.update(OrderSide.SELL, Price("1.00002"), Quantity(200000))
+
+        # Assert
+        self.assertEqual(Price("1.00000"), self.order_book.best_bid_price())
+        self.assertEqual(Price("1.00001"), self.order_book.best_ask_price())
+        self.assertEqual(Quantity(100000), self.order_book.best_bid_qty())
+        self.assertEqual(Quantity(100000), self.order_book.best_ask_qty())
+        self.assertEqual(
+            [
+                (Price("1.00000"), Quantity(100000)),
+                (Price("0.99999"), Quantity(200000)),
+                (Price("0.99998"), Quantity(300000)),
+            ],
+            self.order_book.bids(),
+        )
+        self.assertEqual(
+            [
+                (Price("1.00001"), Quantity(100000)),
+                (Price("1.00002"), Quantity(200000)),
+                (Price("1.00003"), Quantity(300000)),
+            ],
+            self.order_book.asks(),
+        )
+        self.assertEqual(6, self.order_book.update_count)
+
+    def test_update_existing_level_replaces_size(self):
+        # Arrange
+        self.order_book.update(OrderSide.BUY, Price("1.00000"), Quantity(100000))
+
+        # Act
+        self.order_book.update(OrderSide.BUY, Price("1.00000"), Quantity(50000))
+
+        # Assert
+        self.assertEqual(1, self.order_book.bid_depth())
+        self.assertEqual(Quantity(50000), self.order_book.best_bid_qty())
+
+    def test_update_with_zero_size_removes_level(self):
+        # Arrange
+        self.order_book.update(OrderSide.SELL, Price("1.00001"), Quantity(100000))
+        self.order_book.update(OrderSide.SELL, Price("1.00002"), Quantity(200000))
+
+        # Act
+        self.order_book.update(OrderSide.SELL, Price("1.00001"), Quantity())
+
+        # Assert
+        self.assertEqual(1, self.order_book.ask_depth())
+        self.assertEqual(Price("1.00002"), self.order_book.best_ask_price())
+        self.assertEqual(Quantity(), self.order_book.level_qty(OrderSide.SELL, Price("1.00001")))
+
+    def test_update_removed_best_level_again_restores_best_price(self):
+        # Arrange
+        self.order_book.update(OrderSide.BUY, Price("1.00000"), Quantity(100000))
+        self.order_book.update(OrderSide.BUY, Price("0.99999"), Quantity(200000))
+        self.order_book.update(OrderSide.BUY, Price("1.00000"), Quantity())
+
+        # Act
+        self.order_book.update(OrderSide.BUY, Price("1.00000"), Quantity(50000))
+
+        # Assert
+        self.assertEqual(2, self.order_book.bid_depth())
+        self.assertEqual(Price("1.00000"), self.order_book.best_bid_price())
+        self.assertEqual(Quantity(50000), self.order_book.best_bid_qty())
+        self.assertEqual(
+            [
+                (Price("1.00000"), Quantity(50000)),
+                (Price("0.99999"), Quantity(200000)),
+            ],
+            self.order_book.bids(),
+        )
+
+    def test_update_with_many_removed_levels_keeps_best_prices(self):
+        # Arrange
+        for i in range(100):
+            self.order_book.update(OrderSide.BUY, Price(f"0.{99900 + i}"), Quantity(100000))
+            self.order_book.update(OrderSide.SELL, Price(f"1.{i:05d}"), Quantity(100000))
+
+        # Act
+        for i in range(99):
+            self.order_book.update(OrderSide.BUY, Price(f"0.{99900 + i}"), Quantity())
+            self.order_book.update(OrderSide.SELL, Price(f"1.{i + 1:05d}"), Quantity())
+
+        # Assert
+        self.assertEqual(1, self.order_book.bid_depth())
+        self.assertEqual(1, self.order_book.ask_depth())
+        self.assertEqual(Price("0.99999"), self.order_book.best_bid_price())
+        self.assertEqual(Price("1.00000"), self.order_book.best_ask_price())
+        self.assertEqual([(Price("0.99999"), Quantity(100000))], self.order_book.bids())
+        self.assertEqual([(Price("1.00000"), Quantity(100000))], self.order_book.asks())
+
+    def test_update_with_zero_size_for_missing_level_does_nothing(self):
+        # Arrange
+        self.order_book.update(OrderSide.BUY, Price("1.00000"), Quantity(100000))
+
+        # Act
+        self.order_book.update(OrderSide.BUY, Price("0.99999"), Quantity())
+
+        # Assert
+        self.assertEqual([(Price("1.00000"), Quantity(100000))], self.order_book.bids())
+
+    def test_level_qty(self):
+        # Arrange
+        self.order_book.update(OrderSide.BUY, Price("1.00000"), Quantity(100000))
+        self.order_book.update(OrderSide.SELL, Price("1.00001"), Quantity(200000))
+
+        # Act
+        # Assert
+        self.assertEqual(Quantity(100000), self.order_book.level_qty(OrderSide.BUY, Price("1.00000")))
+        self.assertEqual(Quantity(200000), self.order_book.level_qty(OrderSide.SELL, Price("1.00001")))
+        self.assertEqual(Quantity(), self.order_book.level_qty(OrderSide.SELL, Price("1.00000")))
+
+    def test_apply_delta_updates_book_and_timestamp(self):
+        # Arrange
+        delta = OrderBookDelta(
+            AUDUSD_SIM,
+            OrderSide.SELL,
+            Price("1.00001"),
+            Quantity(100000),
+            UNIX_EPOCH,
+        )
+
+        # Act
+        self.order_book.apply(delta)
+
+        # Assert
+        self.assertEqual(Price("1.00001"), self.order_book.best_ask_price())
+        self.assertEqual(UNIX_EPOCH, self.order_book.timestamp)
+
+    def test_apply_delta_for_different_symbol_raises_value_error(self):
+        # Arrange
+        delta = OrderBookDelta(
+            GBPUSD_SIM,
+            OrderSide.SELL,
+            Price("1.00001"),
+            Quantity(100000),
+            UNIX_EPOCH,
+        )
+
+        # Act
+        # Assert
+        self.assertRaises(ValueError, self.order_book.apply, delta)
+
+    def test_clear(self):
+        # Arrange
+        self.order_book.update(OrderSide.BUY, Price("1.00000"), Quantity(100000))
+        self.order_book.update(OrderSide.SELL, Price("1.00001"), Quantity(100000))
+
+        # Act
+        self.order_book.clear()
+
+        # Assert
+        self.assertEqual(0, self.order_book.bid_depth())
+        self.assertEqual(0, self.order_book.ask_depth())
+        self.assertIsNone(self.order_book.best_bid_price())
+        self.assertIsNone(self.order_book.best_ask_price())
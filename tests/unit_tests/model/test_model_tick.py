@@ -73,6 +73,40 @@ class QuoteTickTests(unittest.TestCase):
         self.assertTrue(tick3 >= tick3)
         self.assertEqual([tick1, tick2, tick3], sorted([tick2, tick3, tick1]))
 
+    def test_timestamp_ns_returns_unix_nanoseconds_of_timestamp(self):
+        # Arrange
+        tick = QuoteTick(
+            AUDUSD_SIM.symbol,
+            Price("1.00000"),
+            Price("1.00001"),
+            Quantity(1),
+            Quantity(1),
+            UNIX_EPOCH + timedelta(seconds=1, microseconds=1),
+        )
+
+        # Act
+        # Assert
+        self.assertEqual(1_000_001_000, tick.timestamp_ns)
+
+    def test_timestamp_given_timestamp_ns_is_created_from_nanoseconds(self):
+        # Arrange
+        tick = QuoteTick(
+            AUDUSD_SIM.symbol,
+            Price("1.00000"),
+            Price("1.00001"),
+            Quantity(1),
+            Quantity(1),
+            timestamp_ns=1_000_001_000,
+        )
+
+        # Act
+        timestamp = tick.timestamp
+
+        # Assert
+        self.assertEqual(UNIX_EPOCH + timedelta(seconds=1, microseconds=1), timestamp)
+        self.assertIs(timestamp, tick.timestamp)  # Created once
+        self.assertEqual(1_000_001_000, tick.timestamp_ns)
+
     def test_tick_str_and_repr(self):
         # Arrange
         tick = QuoteTick(
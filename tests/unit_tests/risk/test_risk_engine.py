@@ -0,0 +1,531 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2021 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from datetime import timedelta
+from decimal import Decimal
+import unittest
+
+from nautilus_trader.common.clock import TestClock
+from nautilus_trader.common.logging import TestLogger
+from nautilus_trader.common.uuid import UUIDFactory
+from nautilus_trader.data.cache import DataCache
+from nautilus_trader.execution.database import BypassExecutionDatabase
+from nautilus_trader.execution.engine import ExecutionEngine
+from nautilus_trader.model.commands import SubmitBracketOrder
+from nautilus_trader.model.commands import SubmitOrder
+from nautilus_trader.model.enums import OrderSide
+from nautilus_trader.model.enums import OrderState
+from nautilus_trader.model.identifiers import PositionId
+from nautilus_trader.model.identifiers import TraderId
+from nautilus_trader.model.identifiers import Venue
+from nautilus_trader.model.objects import Price
+from nautilus_trader.model.objects import Quantity
+from nautilus_trader.risk.engine import RiskEngine
+from nautilus_trader.trading.portfolio import Portfolio
+from nautilus_trader.trading.strategy import TradingStrategy
+from tests.test_kit.mocks import MockExecutionClient
+from tests.test_kit.providers import TestInstrumentProvider
+from tests.test_kit.stubs import TestStubs
+
+
+AUDUSD_SIM = TestInstrumentProvider.default_fx_ccy(TestStubs.symbol_audusd_fxcm())
+GBPUSD_SIM = TestInstrumentProvider.default_fx_ccy(TestStubs.symbol_gbpusd_fxcm())
+
+
+class RiskEngineTests(unittest.TestCase):
+
+    def setUp(self):
+        # Fixture Setup
+        self.clock = TestClock()
+        self.uuid_factory = UUIDFactory()
+        self.logger = TestLogger(self.clock)
+
+        self.trader_id = TraderId("TESTER", "000")
+        self.account_id = TestStubs.account_id()
+        self.venue = Venue("SIM")
+
+        self.data_cache = DataCache(self.logger)
+        self.data_cache.add_instrument(AUDUSD_SIM)
+        self.data_cache.add_quote_tick(TestStubs.quote_tick_5decimal(AUDUSD_SIM.symbol))
+
+        self.portfolio = Portfolio(
+            clock=self.clock,
+            logger=self.logger,
+        )
+        self.portfolio.register_cache(self.data_cache)
+
+        self.risk_engine = RiskEngine(
+            cache=self.data_cache,
+            portfolio=self.portfolio,
+            clock=self.clock,
+            logger=self.logger,
+        )
+
+        self.strategy = TradingStrategy(order_id_tag="001")
+        self.strategy.register_trader(
+            self.trader_id,
+            self.clock,
+            self.logger,
+        )
+
+    def submit_order(self, order):
+        return SubmitOrder(
+            self.venue,
+            self.trader_id,
+            self.account_id,
+            self.strategy.id,
+            PositionId.null(),
+            order,
+            self.uuid_factory.generate(),
+            self.clock.utc_now(),
+        )
+
+    def test_instantiate_with_no_limits(self):
+        # Arrange
+        # Act
+        # Assert
+        self.assertEqual(0, self.risk_engine.max_order_rate)
+        self.assertIsNone(self.risk_engine.max_notional_per_order(AUDUSD_SIM.symbol))
+        self.assertIsNone(self.risk_engine.max_position(AUDUSD_SIM.symbol))
+        self.assertIsNone(self.risk_engine.price_band(AUDUSD_SIM.symbol))
+
+    def test_instantiate_with_negative_max_order_rate_raises_value_error(self):
+        # Arrange
+        # Act
+        # Assert
+        self.assertRaises(
+            ValueError,
+            RiskEngine,
+            self.data_cache,
+            self.portfolio,
+            self.clock,
+            self.logger,
+            {"max_order_rate": -1},
+        )
+
+    def test_set_limits(self):
+        # Arrange
+        # Act
+        self.risk_engine.set_max_notional_per_order(AUDUSD_SIM.symbol, 1_000_000)
+        self.risk_engine.set_max_position(AUDUSD_SIM.symbol, "500000")
+        self.risk_engine.set_price_band(AUDUSD_SIM.symbol, "0.05")
+
+        # Assert
+        self.assertEqual(Decimal(1_000_000), self.risk_engine.max_notional_per_order(AUDUSD_SIM.symbol))
+        self.assertEqual(Decimal(500_000), self.risk_engine.max_position(AUDUSD_SIM.symbol))
+        self.assertEqual(Decimal("0.05"), self.risk_engine.price_band(AUDUSD_SIM.symbol))
+
+    def test_set_limit_to_none_removes_limit(self):
+        # Arrange
+        self.risk_engine.set_max_notional_per_order(AUDUSD_SIM.symbol, 1_000_000)
+
+        # Act
+        self.risk_engine.set_max_notional_per_order(AUDUSD_SIM.symbol, None)
+
+        # Assert
+        self.assertIsNone(self.risk_engine.max_notional_per_order(AUDUSD_SIM.symbol))
+
+    def test_set_max_notional_per_order_with_zero_raises_value_error(self):
+        # Arrange
+        # Act
+        # Assert
+        self.assertRaises(ValueError, self.risk_engine.set_max_notional_per_order, AUDUSD_SIM.symbol, 0)
+
+    def test_check_submit_order_with_no_limits_passes(self):
+        # Arrange
+        order = self.strategy.order_factory.market(
+            AUDUSD_SIM.symbol,
+            OrderSide.BUY,
+            Quantity(100000),
+        )
+
+        # Act
+        result = self.risk_engine.check_submit_order(self.submit_order(order))
+
+        # Assert
+        self.assertIsNone(result)
+        self.assertEqual(1, self.risk_engine.check_count)
+        self.assertEqual(0, self.risk_engine.denied_count)
+
+    def test_check_submit_order_within_max_notional_passes(self):
+        # Arrange
+        self.risk_engine.set_max_notional_per_order(AUDUSD_SIM.symbol, 200_000)
+
+        order = self.strategy.order_factory.market(
+            AUDUSD_SIM.symbol,
+            OrderSide.BUY,
+            Quantity(100000),
+        )
+
+        # Act
+        result = self.risk_engine.check_submit_order(self.submit_order(order))
+
+        # Assert
+        self.assertIsNone(result)
+
+    def test_check_submit_order_exceeding_max_notional_denies(self):
+        # Arrange
+        self.risk_engine.set_max_notional_per_order(AUDUSD_SIM.symbol, 50_000)
+
+        order = self.strategy.order_factory.market(
+            AUDUSD_SIM.symbol,
+            OrderSide.BUY,
+            Quantity(100000),
+        )
+
+        # Act
+        result = self.risk_engine.check_submit_order(self.submit_order(order))
+
+        # Assert
+        self.assertIn("max_notional_per_order", result)
+        self.assertEqual(1, self.risk_engine.denied_count)
+
+    def test_check_submit_order_with_max_notional_and_no_quote_denies(self):
+        # Arrange
+        self.risk_engine.set_max_notional_per_order(GBPUSD_SIM.symbol, 1_000_000)
+
+        order = self.strategy.order_factory.market(
+            GBPUSD_SIM.symbol,
+            OrderSide.BUY,
+            Quantity(100000),
+        )
+
+        # Act
+        result = self.risk_engine.check_submit_order(self.submit_order(order))
+
+        # Assert
+        self.assertIn("no quote", result)
+
+    def test_check_submit_order_exceeding_max_position_denies(self):
+        # Arrange
+        self.risk_engine.set_max_position(AUDUSD_SIM.symbol, 100_000)
+
+        order = self.strategy.order_factory.market(
+            AUDUSD_SIM.symbol,
+            OrderSide.SELL,
+            Quantity(200000),
+        )
+
+        # Act
+        result = self.risk_engine.check_submit_order(self.submit_order(order))
+
+        # Assert
+        self.assertIn("max_position", result)
+
+    def test_check_submit_order_within_max_position_passes(self):
+        # Arrange
+        self.risk_engine.set_max_position(AUDUSD_SIM.symbol, 100_000)
+
+        order = self.strategy.order_factory.market(
+            AUDUSD_SIM.symbol,
+            OrderSide.SELL,
+            Quantity(100000),
+        )
+
+        # Act
+        result = self.risk_engine.check_submit_order(self.submit_order(order))
+
+        # Assert
+        self.assertIsNone(result)
+
+    def test_check_submit_order_with_price_outside_band_denies(self):
+        # Arrange
+        self.risk_engine.set_price_band(AUDUSD_SIM.symbol, "0.05")
+
+        order = self.strategy.order_factory.limit(
+            AUDUSD_SIM.symbol,
+            OrderSide.BUY,
+            Quantity(100000),
+            Price("1.10000"),
+        )
+
+        # Act
+        result = self.risk_engine.check_submit_order(self.submit_order(order))
+
+        # Assert
+        self.assertIn("price_band", result)
+
+    def test_check_submit_order_with_price_inside_band_passes(self):
+        # Arrange
+        self.risk_engine.set_price_band(AUDUSD_SIM.symbol, "0.05")
+
+        order = self.strategy.order_factory.limit(
+            AUDUSD_SIM.symbol,
+            OrderSide.BUY,
+            Quantity(100000),
+            Price("0.99000"),
+        )
+
+        # Act
+        result = self.risk_engine.check_submit_order(self.submit_order(order))
+
+        # Assert
+        self.assertIsNone(result)
+
+    def test_check_submit_order_exceeding_order_rate_denies(self):
+        # Arrange
+        risk_engine = RiskEngine(
+            cache=self.data_cache,
+            portfolio=self.portfolio,
+            clock=self.clock,
+            logger=self.logger,
+            config={"max_order_rate": 2, "max_order_rate_interval": 1},
+        )
+
+        orders = [
+            self.strategy.order_factory.market(
+                AUDUSD_SIM.symbol,
+                OrderSide.BUY,
+                Quantity(100000),
+            ) for _ in range(3)
+        ]
+
+        # Act
+        result1 = risk_engine.check_submit_order(self.submit_order(orders[0]))
+        result2 = risk_engine.check_submit_order(self.submit_order(orders[1]))
+        result3 = risk_engine.check_submit_order(self.submit_order(orders[2]))
+
+        # Assert
+        self.assertIsNone(result1)
+        self.assertIsNone(result2)
+        self.assertIn("order rate", result3)
+
+    def test_check_submit_order_after_order_rate_interval_passes(self):
+        # Arrange
+        risk_engine = RiskEngine(
+            cache=self.data_cache,
+            portfolio=self.portfolio,
+            clock=self.clock,
+            logger=self.logger,
+            config={"max_order_rate": 1, "max_order_rate_interval": 1},
+        )
+
+        order1 = self.strategy.order_factory.market(
+            AUDUSD_SIM.symbol,
+            OrderSide.BUY,
+            Quantity(100000),
+        )
+
+        order2 = self.strategy.order_factory.market(
+            AUDUSD_SIM.symbol,
+            OrderSide.BUY,
+            Quantity(100000),
+        )
+
+        risk_engine.check_submit_order(self.submit_order(order1))
+
+        # Act
+        self.clock.set_time(self.clock.utc_now() + timedelta(seconds=1))
+        result = risk_engine.check_submit_order(self.submit_order(order2))
+
+        # Assert
+        self.assertIsNone(result)
+
+    def test_check_submit_bracket_order_checks_entry(self):
+        # Arrange
+        self.risk_engine.set_max_notional_per_order(AUDUSD_SIM.symbol, 50_000)
+
+        entry = self.strategy.order_factory.market(
+            AUDUSD_SIM.symbol,
+            OrderSide.BUY,
+            Quantity(100000),
+        )
+
+        bracket_order = self.strategy.order_factory.bracket(entry, Price("0.99000"))
+
+        command = SubmitBracketOrder(
+            self.venue,
+            self.trader_id,
+            self.account_id,
+            self.strategy.id,
+            bracket_order,
+            self.uuid_factory.generate(),
+            self.clock.utc_now(),
+        )
+
+        # Act
+        result = self.risk_engine.check_submit_bracket_order(command)
+
+        # Assert
+        self.assertIn("max_notional_per_order", result)
+
+    def test_reset_clears_counters(self):
+        # Arrange
+        order = self.strategy.order_factory.market(
+            AUDUSD_SIM.symbol,
+            OrderSide.BUY,
+            Quantity(100000),
+        )
+
+        self.risk_engine.check_submit_order(self.submit_order(order))
+
+        # Act
+        self.risk_engine.reset()
+
+        # Assert
+        self.assertEqual(0, self.risk_engine.check_count)
+        self.assertEqual(0, self.risk_engine.denied_count)
+
+
+class RiskEngineWithExecutionEngineTests(unittest.TestCase):
+
+    def setUp(self):
+        # Fixture Setup
+        self.clock = TestClock()
+        self.uuid_factory = UUIDFactory()
+        self.logger = TestLogger(self.clock)
+
+        self.trader_id = TraderId("TESTER", "000")
+        self.account_id = TestStubs.account_id()
+        self.venue = Venue("SIM")
+
+        self.data_cache = DataCache(self.logger)
+        self.data_cache.add_instrument(AUDUSD_SIM)
+        self.data_cache.add_quote_tick(TestStubs.quote_tick_5decimal(AUDUSD_SIM.symbol))
+
+        self.portfolio = Portfolio(
+            clock=self.clock,
+            logger=self.logger,
+        )
+        self.portfolio.register_cache(self.data_cache)
+
+        database = BypassExecutionDatabase(trader_id=self.trader_id, logger=self.logger)
+        self.exec_engine = ExecutionEngine(
+            database=database,
+            portfolio=self.portfolio,
+            clock=self.clock,
+            logger=self.logger,
+        )
+
+        self.exec_engine.process(TestStubs.event_account_state())
+
+        self.exec_client = MockExecutionClient(
+            self.venue,
+            self.account_id,
+            self.exec_engine,
+            self.clock,
+            self.logger,
+        )
+
+        self.exec_engine.register_client(self.exec_client)
+
+        self.risk_engine = RiskEngine(
+            cache=self.data_cache,
+            portfolio=self.portfolio,
+            clock=self.clock,
+            logger=self.logger,
+        )
+
+        self.exec_engine.register_risk_engine(self.risk_engine)
+
+        self.strategy = TradingStrategy(order_id_tag="001")
+        self.strategy.register_trader(
+            self.trader_id,
+            self.clock,
+            self.logger,
+        )
+
+        self.exec_engine.register_strategy(self.strategy)
+        self.exec_engine.start()
+
+    def test_submit_order_passing_checks_sends_to_client(self):
+        # Arrange
+        order = self.strategy.order_factory.market(
+            AUDUSD_SIM.symbol,
+            OrderSide.BUY,
+            Quantity(100000),
+        )
+
+        submit_order = SubmitOrder(
+            self.venue,
+            self.trader_id,
+            self.account_id,
+            self.strategy.id,
+            PositionId.null(),
+            order,
+            self.uuid_factory.generate(),
+            self.clock.utc_now(),
+        )
+
+        # Act
+        self.exec_engine.execute(submit_order)
+
+        # Assert
+        self.assertIn(submit_order, self.exec_client.commands)
+        self.assertEqual(OrderState.INITIALIZED, order.state)
+
+    def test_submit_order_failing_checks_denies_order(self):
+        # Arrange
+        self.risk_engine.set_max_notional_per_order(AUDUSD_SIM.symbol, 50_000)
+
+        order = self.strategy.order_factory.market(
+            AUDUSD_SIM.symbol,
+            OrderSide.BUY,
+            Quantity(100000),
+        )
+
+        submit_order = SubmitOrder(
+            self.venue,
+            self.trader_id,
+            self.account_id,
+            self.strategy.id,
+            PositionId.null(),
+            order,
+            self.uuid_factory.generate(),
+            self.clock.utc_now(),
+        )
+
+        # Act
+        self.exec_engine.execute(submit_order)
+
+        # Assert
+        self.assertNotIn(submit_order, self.exec_client.commands)
+        self.assertTrue(self.exec_engine.cache.order_exists(order.cl_ord_id))
+        self.assertEqual(OrderState.DENIED, order.state)
+
+    def test_submit_bracket_order_failing_checks_denies_all_orders(self):
+        # Arrange
+        self.risk_engine.set_max_notional_per_order(AUDUSD_SIM.symbol, 50_000)
+
+        entry = self.strategy.order_factory.market(
+            AUDUSD_SIM.symbol,
+            OrderSide.BUY,
+            Quantity(100000),
+        )
+
+        bracket_order = self.strategy.order_factory.bracket(
+            entry,
+            Price("0.99000"),
+            Price("1.01000"),
+        )
+
+        command = SubmitBracketOrder(
+            self.venue,
+            self.trader_id,
+            self.account_id,
+            self.strategy.id,
+            bracket_order,
+            self.uuid_factory.generate(),
+            self.clock.utc_now(),
+        )
+
+        # Act
+        self.exec_engine.execute(command)
+
+        # Assert
+        self.assertNotIn(command, self.exec_client.commands)
+        self.assertEqual(OrderState.DENIED, bracket_order.entry.state)
+        self.assertEqual(OrderState.DENIED, bracket_order.stop_loss.state)
+        self.assertEqual(OrderState.DENIED, bracket_order.take_profit.state)
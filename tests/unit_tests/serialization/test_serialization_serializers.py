@@ -57,6 +57,7 @@ from nautilus_trader.model.order import StopMarketOrder
 from nautilus_trader.serialization.base import Serializer
 from nautilus_trader.serialization.serializers import MsgPackCommandSerializer
 from nautilus_trader.serialization.serializers import MsgPackEventSerializer
+from nautilus_trader.serialization.serializers import MsgPackInstrumentSerializer
 from nautilus_trader.serialization.serializers import MsgPackOrderSerializer
 from tests.test_kit.providers import TestInstrumentProvider
 from tests.test_kit.stubs import TestStubs
@@ -678,3 +679,41 @@ class MsgPackEventSerializerTests(unittest.TestCase):
 
         # Assert
         self.assertEqual(deserialized, event)
+
+
+class MsgPackInstrumentSerializerTests(unittest.TestCase):
+
+    def setUp(self):
+        # Fixture Setup
+        self.serializer = MsgPackInstrumentSerializer()
+
+    def test_serialize_and_deserialize_fx_instrument(self):
+        # Arrange
+        # Act
+        serialized = self.serializer.serialize(AUDUSD_SIM)
+        deserialized = self.serializer.deserialize(serialized)
+
+        # Assert
+        self.assertEqual(AUDUSD_SIM, deserialized)
+        self.assertEqual(AUDUSD_SIM.leverage, deserialized.leverage)
+        self.assertEqual(AUDUSD_SIM.tick_size, deserialized.tick_size)
+        self.assertEqual(AUDUSD_SIM.min_quantity, deserialized.min_quantity)
+
+    def test_serialize_and_deserialize_crypto_instrument(self):
+        # Arrange
+        instrument = TestInstrumentProvider.btcusdt_binance()
+        instrument.info["status"] = "TRADING"
+
+        # Act
+        serialized = self.serializer.serialize(instrument)
+        deserialized = self.serializer.deserialize(serialized)
+
+        # Assert
+        self.assertEqual(instrument, deserialized)
+        self.assertEqual(instrument.base_currency, deserialized.base_currency)
+        self.assertEqual(instrument.min_notional, deserialized.min_notional)
+        self.assertIsNone(deserialized.max_notional)
+        self.assertEqual(instrument.max_price, deserialized.max_price)
+        self.assertEqual(instrument.taker_fee, deserialized.taker_fee)
+        self.assertEqual(instrument.timestamp, deserialized.timestamp)
+        self.assertEqual({"status": "TRADING"}, deserialized.info)
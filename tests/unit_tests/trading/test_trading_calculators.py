@@ -198,6 +198,67 @@ class ExchangeRateCalculatorTests(unittest.TestCase):
         # Assert
         self.assertEqual(Decimal("110.115"), result)
 
+    def test_calculate_exchange_rate_through_multiple_currencies(self):
+        # Arrange
+        converter = ExchangeRateCalculator()
+        bid_rates = {
+            "BTC/USDT": Decimal("10000.0"),
+            "USDT/USD": Decimal("1.0000"),
+            "AUD/USD": Decimal("0.80000"),
+        }
+        ask_rates = {
+            "BTC/USDT": Decimal("10001.0"),
+            "USDT/USD": Decimal("1.0001"),
+            "AUD/USD": Decimal("0.80010"),
+        }
+
+        # Act
+        result = converter.get_rate(
+            BTC,
+            AUD,
+            PriceType.BID,
+            bid_rates,
+            ask_rates,
+        )
+
+        # Assert
+        self.assertEqual(Decimal("12500"), result)
+
+    def test_get_rate_after_new_symbol_quoted_recalculates_paths(self):
+        # Arrange
+        converter = ExchangeRateCalculator()
+        bid_rates = {"AUD/USD": Decimal("0.80000")}
+        ask_rates = {"AUD/USD": Decimal("0.80010")}
+
+        result1 = converter.get_rate(AUD, JPY, PriceType.BID, bid_rates, ask_rates)
+
+        bid_rates["USD/JPY"] = Decimal("110.000")
+        ask_rates["USD/JPY"] = Decimal("110.030")
+
+        # Act
+        result2 = converter.get_rate(AUD, JPY, PriceType.BID, bid_rates, ask_rates)
+
+        # Assert
+        self.assertEqual(0, result1)
+        self.assertEqual(Decimal("88.00000000"), result2)
+
+    def test_get_rate_uses_current_quotes_for_precomputed_path(self):
+        # Arrange
+        converter = ExchangeRateCalculator()
+        bid_rates = {"USD/JPY": Decimal("110.100")}
+        ask_rates = {"USD/JPY": Decimal("110.130")}
+
+        result1 = converter.get_rate(USD, JPY, PriceType.BID, bid_rates, ask_rates)
+
+        bid_rates["USD/JPY"] = Decimal("111.000")
+
+        # Act
+        result2 = converter.get_rate(USD, JPY, PriceType.BID, bid_rates, ask_rates)
+
+        # Assert
+        self.assertEqual(Decimal("110.100"), result1)
+        self.assertEqual(Decimal("111.000"), result2)
+
 
 class RolloverInterestCalculatorTests(unittest.TestCase):
 
@@ -235,6 +296,16 @@ class RolloverInterestCalculatorTests(unittest.TestCase):
         # Assert
         self.assertEqual(-2.739726027397263e-07, rate)
 
+    def test_calc_overnight_fx_rate_with_only_quarterly_rate_returns_correct_rate(self):
+        # Arrange
+        calculator = RolloverInterestCalculator(data=self.data)
+
+        # Act
+        rate = calculator.calc_overnight_rate(AUDUSD_SIM, datetime.date(2020, 4, 1))
+
+        # Assert
+        self.assertAlmostEqual(-4.109589041095887e-07, float(rate))
+
     def test_calc_overnight_fx_rate_with_audusd_on_impossible_dates_returns_zero(self):
         # Arrange
         calculator = RolloverInterestCalculator(data=self.data)